@@ -7,14 +7,15 @@ Endpoints include generating health insights, retrieving cached results,
 and health status monitoring with proper authentication.
 """
 
+import asyncio
 from datetime import UTC, datetime
 from decimal import Decimal
+from functools import lru_cache
 import logging
 import os
 from typing import Any, NoReturn
 import uuid
 
-from boto3.dynamodb.conditions import Key
 from fastapi import APIRouter, Depends, HTTPException, status
 from pydantic import BaseModel, Field
 
@@ -27,7 +28,10 @@ from clarity.ml.gemini_service import (
 )
 from clarity.ports.auth_ports import IAuthProvider
 from clarity.ports.config_ports import IConfigProvider
-from clarity.storage.dynamodb_client import DynamoDBHealthDataRepository
+from clarity.storage.dynamodb_client import (
+    DynamoDBHealthDataRepository,
+    InvalidCursorError,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -307,33 +311,16 @@ async def generate_insights(
         # Generate insights
         insight_response = await gemini_service.generate_health_insights(gemini_request)
 
-        # Save insight to DynamoDB
-        dynamodb_client = _get_dynamodb_client()
-        insight_id = f"insight_{uuid.uuid4().hex[:8]}"
-        timestamp = datetime.now(UTC)
-
-        insight_item: dict[str, Any] = {
-            "pk": f"USER#{current_user.user_id}",
-            "sk": f"INSIGHT#{timestamp.isoformat()}",
-            "id": insight_id,
-            "data_id": insight_id,  # Add required data_id field for health data table compatibility
-            "user_id": current_user.user_id,
-            "narrative": insight_response.narrative,
-            "key_insights": insight_response.key_insights,
-            "recommendations": insight_response.recommendations,
-            "confidence_score": Decimal(str(insight_response.confidence_score)),
-            "generated_at": insight_response.generated_at,
-            "created_at": timestamp.isoformat(),
-        }
-
-        # Also store with direct insight ID access
-        dynamodb_client.table.put_item(Item=insight_item)
-        dynamodb_client.table.put_item(
-            Item={
-                "pk": f"INSIGHT#{insight_id}",
-                "sk": f"INSIGHT#{insight_id}",
-                **insight_item,
-            }
+        # Save insight to DynamoDB (also updates the user's insight counters)
+        await _get_dynamodb_client().save_insight(
+            current_user.user_id,
+            {
+                "narrative": insight_response.narrative,
+                "key_insights": insight_response.key_insights,
+                "recommendations": insight_response.recommendations,
+                "confidence_score": insight_response.confidence_score,
+                "generated_at": insight_response.generated_at,
+            },
         )
 
         # Calculate processing time
@@ -408,7 +395,7 @@ async def get_insight(
 
         # Get insight from DynamoDB
         dynamodb_client = _get_dynamodb_client()
-        response = dynamodb_client.table.get_item(
+        response = await dynamodb_client.async_table.get_item(
             Key={"pk": f"INSIGHT#{insight_id}", "sk": f"INSIGHT#{insight_id}"}
         )
         insight_doc = response.get("Item")
@@ -467,13 +454,18 @@ async def get_insight_history(
     current_user: AuthenticatedUser,
     limit: int = 10,
     offset: int = 0,
+    cursor: str | None = None,
 ) -> InsightHistoryResponse:
     """Get insight history for a user from DynamoDB.
 
+    ``total_count`` comes from the user's insight summary item, so the cost
+    of a history page does not grow with the number of stored insights.
+
     Args:
         user_id: User ID to get history for
         limit: Maximum number of insights to return
-        offset: Number of insights to skip
+        offset: Number of insights to skip (ignored when ``cursor`` is given)
+        cursor: ``next_cursor`` from the previous page
         current_user: Authenticated user context
 
     Returns:
@@ -495,32 +487,16 @@ async def get_insight_history(
         if current_user.user_id != user_id:
             _raise_access_denied_error(user_id, current_user.user_id, request_id)
 
-        # Get insights from DynamoDB
+        # Get one page of insights and the maintained counters from DynamoDB
         dynamodb_client = _get_dynamodb_client()
-        # Query insights for user
-        response = dynamodb_client.table.query(
-            KeyConditionExpression=Key("pk").eq(f"USER#{user_id}")
-            & Key("sk").begins_with("INSIGHT#"),
-            Limit=limit + offset,
-            ScanIndexForward=False,  # Most recent first
+        page, summary = await asyncio.gather(
+            dynamodb_client.list_insights(
+                user_id, limit=limit, offset=0 if cursor else offset, cursor=cursor
+            ),
+            dynamodb_client.get_insight_summary(user_id),
         )
-
-        all_insights = response.get("Items", [])
-        # Apply offset
-        insights = (
-            all_insights[offset : offset + limit] if offset < len(all_insights) else []
-        )
-
-        # Get total count
-        total_count = len(all_insights)
-        while "LastEvaluatedKey" in response:
-            response = dynamodb_client.table.query(
-                KeyConditionExpression=Key("pk").eq(f"USER#{user_id}")
-                & Key("sk").begins_with("INSIGHT#"),
-                ExclusiveStartKey=response["LastEvaluatedKey"],
-                Select="COUNT",
-            )
-            total_count += response.get("Count", 0)
+        insights = page["items"]
+        total_count = summary["total_count"]
 
         # Format insights for response
         formatted_insights = []
@@ -550,12 +526,13 @@ async def get_insight_history(
         history_data = {
             "insights": formatted_insights,
             "total_count": total_count,
-            "has_more": offset + len(insights) < total_count,
+            "has_more": page["next_cursor"] is not None,
             "pagination": {
                 "limit": limit,
                 "offset": offset,
                 "current_page": (offset // limit) + 1,
                 "total_pages": (total_count + limit - 1) // limit,
+                "next_cursor": page["next_cursor"],
             },
         }
 
@@ -565,6 +542,15 @@ async def get_insight_history(
 
     except HTTPException:
         raise
+    except InvalidCursorError as e:
+        raise create_error_response(
+            error_code="INVALID_CURSOR",
+            message=str(e),
+            request_id=request_id,
+            status_code=status.HTTP_400_BAD_REQUEST,
+            details={"user_id": user_id},
+            suggested_action="restart_pagination",
+        ) from e
     except Exception as e:
         logger.exception(
             "💥 Failed to retrieve insight history for user %s (request: %s)",
@@ -652,8 +638,12 @@ async def get_service_status(
         ) from e
 
 
+@lru_cache(maxsize=1)
 def _get_dynamodb_client() -> DynamoDBHealthDataRepository:
-    """Get DynamoDB client for storing/retrieving insights."""
+    """Get DynamoDB client for storing/retrieving insights.
+
+    Cached so requests reuse one boto3 resource and its connection pool.
+    """
     table_name = os.getenv("DYNAMODB_TABLE_NAME", "clarity-health-data")
     region = os.getenv("AWS_REGION", "us-east-1")
     return DynamoDBHealthDataRepository(table_name=table_name, region=region)
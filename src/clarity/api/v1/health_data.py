@@ -495,29 +495,39 @@ async def list_health_data(
         if source:
             filters["source"] = source
 
-        # Get health data from service (fallback to legacy method for now)
-        # TODO: Implement get_user_health_data_paginated in HealthDataService
+        # Get health data from service; cursors take precedence over offsets
         legacy_data = await service.get_user_health_data(
             user_id=current_user.user_id,
             limit=pagination_params.limit,
-            offset=pagination_params.offset or 0,
+            offset=0 if pagination_params.cursor else pagination_params.offset or 0,
             metric_type=filters.get("data_type"),
             start_date=start_date,
             end_date=end_date,
+            cursor=pagination_params.cursor,
         )
 
-        # Convert legacy format to paginated format
-        data_items = legacy_data.get("metrics", [])
-        has_next = len(data_items) == pagination_params.limit  # Simple heuristic
-        has_previous = (pagination_params.offset or 0) > 0
+        # Repositories report page info under "pagination" or "page_info"
+        data_items = legacy_data.get("data", legacy_data.get("metrics", []))
+        page_info = (
+            legacy_data.get("pagination") or legacy_data.get("page_info") or {}
+        )
+        has_more = page_info.get("has_more")
+        has_next = (
+            bool(has_more)
+            if has_more is not None
+            else len(data_items) == pagination_params.limit  # Simple heuristic
+        )
+        has_previous = (
+            bool(pagination_params.cursor) or (pagination_params.offset or 0) > 0
+        )
 
         health_data_result = {
             "data": data_items,
             "has_next": has_next,
             "has_previous": has_previous,
-            "total_count": None,  # Not available in legacy format
-            "next_cursor": None,  # Not implemented yet
-            "previous_cursor": None,  # Not implemented yet
+            "total_count": legacy_data.get("total_count"),
+            "next_cursor": page_info.get("next_cursor"),
+            "previous_cursor": None,  # Pages are forward-only
         }
 
         # Extract base URL for pagination links
@@ -602,6 +612,58 @@ async def query_health_data_legacy() -> dict[str, str]:
     )
 
 
+@router.delete(
+    "/",
+    summary="Erase All Health Data",
+    description="""
+    Erase all of the authenticated user's health data (GDPR/CCPA erasure).
+
+    **Scope:**
+    - Raw uploads and analysis results in S3
+    - Every health record and insight stored for the user
+    - Audit trail of the erasure
+
+    **Note:** This action cannot be undone. Consider data export before deletion.
+    """,
+    responses={
+        200: {"description": "All health data erased"},
+        503: {"description": "Erasure incomplete - retry the request"},
+    },
+)
+async def erase_health_data(
+    current_user: AuthenticatedUser,
+    service: HealthDataService = Depends(get_health_data_service),
+) -> dict[str, str]:
+    """🔥 Erase all of the user's health data across storage backends."""
+    try:
+        logger.info("Health data erasure requested by user: %s", current_user.user_id)
+
+        success = await service.erase_user_data(current_user.user_id)
+        if not success:
+            # Objects or records were left behind; erasure is safe to repeat
+            raise ServiceUnavailableProblem(
+                service_name="Health data erasure", retry_after=60
+            )
+
+        logger.info("Health data erased for user: %s", current_user.user_id)
+        return {
+            "message": "All health data erased",
+            "user_id": current_user.user_id,
+            "deleted_at": datetime.now(UTC).isoformat(),
+        }
+
+    except HTTPException:
+        raise
+    except HealthDataServiceError as e:
+        logger.exception("Health data service error")
+        raise ValidationProblem(detail=str(e)) from e
+    except Exception as e:
+        logger.exception("Unexpected error erasing health data")
+        raise InternalServerProblem(
+            detail="An unexpected error occurred while erasing health data"
+        ) from e
+
+
 @router.delete(
     "/{processing_id}",
     summary="Delete Health Data",
@@ -87,6 +87,17 @@ pat_inference_duration_seconds = Histogram(
     "clarity_pat_inference_duration_seconds", "PAT model inference duration in seconds"
 )
 
+pat_inference_queue_depth = Gauge(
+    "clarity_pat_inference_queue_depth",
+    "Number of PAT inference tasks waiting for an executor thread",
+)
+
+pat_inference_queue_wait_seconds = Histogram(
+    "clarity_pat_inference_queue_wait_seconds",
+    "Time PAT inference tasks wait in the executor queue in seconds",
+    buckets=(0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+
 pat_model_loading_time_seconds = Gauge(
     "clarity_pat_model_loading_time_seconds", "Time taken to load PAT model weights"
 )
@@ -104,6 +115,33 @@ insight_generation_duration_seconds = Histogram(
     ["model"],
 )
 
+insight_generation_queue_depth = Gauge(
+    "clarity_insight_generation_queue_depth",
+    "Number of insight generation calls waiting for a concurrency slot",
+)
+
+insight_generation_in_flight = Gauge(
+    "clarity_insight_generation_in_flight",
+    "Number of insight generation calls currently running against the model",
+)
+
+insight_generation_queue_wait_seconds = Histogram(
+    "clarity_insight_generation_queue_wait_seconds",
+    "Time insight generation calls wait for a concurrency slot in seconds",
+    buckets=(0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30),
+)
+
+insight_generation_coalesced_total = Counter(
+    "clarity_insight_generation_coalesced_total",
+    "Insight requests served by joining an identical in-flight model call",
+)
+
+chat_time_to_first_token_seconds = Histogram(
+    "clarity_chat_time_to_first_token_seconds",
+    "Time from receiving a chat message to streaming the first response token",
+    buckets=(0.05, 0.1, 0.25, 0.5, 1, 2, 3, 5, 10, 20, 30),
+)
+
 # System health metrics
 system_memory_usage_bytes = Gauge(
     "clarity_system_memory_usage_bytes", "Current system memory usage in bytes"
@@ -132,6 +170,36 @@ dynamodb_operation_duration_seconds = Histogram(
     ["operation", "collection"],
 )
 
+# Auth metrics
+auth_user_context_cache_total = Counter(
+    "clarity_auth_user_context_cache_total",
+    "User context cache lookups in the auth path",
+    ["result"],
+)
+
+auth_login_activity_flushed_total = Counter(
+    "clarity_auth_login_activity_flushed_total",
+    "Users whose buffered login activity was written back",
+    ["status"],
+)
+
+auth_login_activity_flushes_total = Counter(
+    "clarity_auth_login_activity_flushes_total",
+    "Write-behind flushes of buffered login activity",
+    ["status"],
+)
+
+auth_token_cache_events_total = Counter(
+    "clarity_auth_token_cache_events_total",
+    "Verified token cache events",
+    ["event"],
+)
+
+auth_token_cache_entries = Gauge(
+    "clarity_auth_token_cache_entries",
+    "Number of verified tokens currently cached",
+)
+
 # Pub/Sub metrics
 pubsub_messages_total = Counter(
     "clarity_pubsub_messages_total", "Total Pub/Sub messages", ["topic", "status"]
@@ -269,6 +337,24 @@ def record_pat_inference(status: str, duration: float | None = None) -> None:
         pat_inference_duration_seconds.observe(duration)
 
 
+def record_inference_queue_depth(depth: int) -> None:
+    """Record the current PAT inference executor queue depth.
+
+    Args:
+        depth: Number of tasks waiting for a worker thread
+    """
+    pat_inference_queue_depth.set(depth)
+
+
+def record_inference_queue_wait(wait_seconds: float) -> None:
+    """Record how long a PAT inference task waited for a worker thread.
+
+    Args:
+        wait_seconds: Queue wait time in seconds
+    """
+    pat_inference_queue_wait_seconds.observe(wait_seconds)
+
+
 def record_pat_model_loading(duration: float) -> None:
     """Record PAT model loading time.
 
@@ -294,6 +380,40 @@ def record_insight_generation(
         insight_generation_duration_seconds.labels(model=model).observe(duration)
 
 
+def record_insight_queue(depth: int, in_flight: int) -> None:
+    """Record the insight generation concurrency limiter state.
+
+    Args:
+        depth: Number of calls waiting for a slot
+        in_flight: Number of calls currently holding a slot
+    """
+    insight_generation_queue_depth.set(depth)
+    insight_generation_in_flight.set(in_flight)
+
+
+def record_insight_queue_wait(wait_seconds: float) -> None:
+    """Record how long an insight generation call waited for a slot.
+
+    Args:
+        wait_seconds: Queue wait time in seconds
+    """
+    insight_generation_queue_wait_seconds.observe(wait_seconds)
+
+
+def record_insight_coalesced() -> None:
+    """Record an insight request that joined an identical in-flight call."""
+    insight_generation_coalesced_total.inc()
+
+
+def record_chat_time_to_first_token(seconds: float) -> None:
+    """Record the time to first token of a streamed chat response.
+
+    Args:
+        seconds: Time from receiving the message to the first chunk
+    """
+    chat_time_to_first_token_seconds.observe(seconds)
+
+
 def record_processing_job_status(active_count: int) -> None:
     """Record active processing job count.
 
@@ -334,6 +454,45 @@ def record_dynamodb_operation(
         ).observe(duration)
 
 
+def record_user_context_cache_lookup(result: str) -> None:
+    """Record a user context cache lookup.
+
+    Args:
+        result: Lookup result (hit or miss)
+    """
+    auth_user_context_cache_total.labels(result=result).inc()
+
+
+def record_login_activity_flush(status: str, users: int) -> None:
+    """Record a write-behind flush of login activity.
+
+    Args:
+        status: Outcome of the written updates (success or failed)
+        users: Number of users whose updates had that outcome
+    """
+    auth_login_activity_flushes_total.labels(status=status).inc()
+    auth_login_activity_flushed_total.labels(status=status).inc(users)
+
+
+def record_token_cache_event(event: str, count: int = 1) -> None:
+    """Record verified token cache events.
+
+    Args:
+        event: Event type (hit, miss, eviction, expiration)
+        count: Number of events
+    """
+    auth_token_cache_events_total.labels(event=event).inc(count)
+
+
+def record_token_cache_size(entries: int) -> None:
+    """Record the number of cached verified tokens.
+
+    Args:
+        entries: Current cache size
+    """
+    auth_token_cache_entries.set(entries)
+
+
 def record_pubsub_message(
     topic: str, status: str, processing_duration: float | None = None
 ) -> None:
@@ -396,16 +555,26 @@ class MetricsContext:
 # Export router and helper functions
 __all__ = [
     "MetricsContext",
+    "record_chat_time_to_first_token",
     "record_dynamodb_operation",
     "record_failed_job",
     "record_health_data_processing",
     "record_health_data_upload",
     "record_health_metric_processed",
     "record_http_request",
+    "record_inference_queue_depth",
+    "record_inference_queue_wait",
+    "record_insight_coalesced",
     "record_insight_generation",
+    "record_insight_queue",
+    "record_insight_queue_wait",
+    "record_login_activity_flush",
     "record_pat_inference",
     "record_pat_model_loading",
     "record_processing_job_status",
     "record_pubsub_message",
+    "record_token_cache_event",
+    "record_token_cache_size",
+    "record_user_context_cache_lookup",
     "router",
 ]
@@ -13,6 +13,7 @@ Endpoints:
 # removed - breaks FastAPI
 
 from datetime import UTC, datetime
+from functools import lru_cache
 import logging
 import os
 from typing import Any, cast
@@ -30,7 +31,7 @@ from clarity.ml.pat_service import ActigraphyAnalysis, ActigraphyInput
 from clarity.ml.preprocessing import ActigraphyDataPoint
 from clarity.ml.proxy_actigraphy import (
     StepCountData,
-    create_proxy_actigraphy_transformer,
+    get_proxy_actigraphy_transformer,
 )
 from clarity.storage.dynamodb_client import DynamoDBHealthDataRepository
 
@@ -180,7 +181,7 @@ async def analyze_step_data(
         )
 
         # Transform step data to proxy actigraphy
-        transformer = create_proxy_actigraphy_transformer()
+        transformer = get_proxy_actigraphy_transformer()
 
         step_data = StepCountData(
             user_id=current_user.user_id,
@@ -379,7 +380,7 @@ async def get_pat_analysis(
 
         # Try to get analysis results from DynamoDB
         # Query for analysis results
-        response = dynamodb_client.table.query(
+        response = await dynamodb_client.async_table.query(
             KeyConditionExpression=Key("pk").eq(f"USER#{current_user.user_id}")
             & Key("sk").eq(f"ANALYSIS#{processing_id}")
         )
@@ -412,7 +413,7 @@ async def get_pat_analysis(
             )
 
         # If not found in analysis_results, check processing_jobs in DynamoDB
-        job_response = dynamodb_client.table.get_item(
+        job_response = await dynamodb_client.async_table.get_item(
             Key={"pk": f"JOB#{processing_id}", "sk": f"JOB#{processing_id}"}
         )
         processing_status = job_response.get("Item")
@@ -476,8 +477,12 @@ async def get_pat_analysis(
         )
 
 
+@lru_cache(maxsize=1)
 def _get_analysis_repository() -> DynamoDBHealthDataRepository:
-    """Get analysis repository for retrieving stored results."""
+    """Get analysis repository for retrieving stored results.
+
+    Cached so requests reuse one boto3 resource and its connection pool.
+    """
     # TODO: Replace with proper dependency injection
     table_name = os.getenv("DYNAMODB_TABLE_NAME", "clarity-health-data")
     region = os.getenv("AWS_REGION", "us-east-1")
@@ -502,7 +507,7 @@ async def health_check(
     """
     try:
         # Get inference engine stats
-        engine_stats = inference_engine.get_stats()
+        engine_stats = await inference_engine.get_stats_async()
 
         # Get PAT model info
         pat_service = inference_engine.pat_service
@@ -546,7 +551,7 @@ async def get_model_info(
         pat_service = inference_engine.pat_service
 
         # Get inference engine stats
-        engine_stats = inference_engine.get_stats()
+        engine_stats = await inference_engine.get_stats_async()
 
         model_info = {
             "model_type": "PAT",
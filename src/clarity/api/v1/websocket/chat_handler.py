@@ -2,11 +2,16 @@
 
 # removed - breaks FastAPI
 
+from collections.abc import AsyncIterator
+from contextlib import aclosing
 from datetime import UTC, datetime
+from functools import lru_cache
 import json
 import logging
 import os
+import time
 from typing import Any
+import uuid
 
 from fastapi import (
     APIRouter,
@@ -17,9 +22,12 @@ from fastapi import (
 )
 from pydantic import ValidationError
 
+from clarity.api.v1.metrics import record_chat_time_to_first_token
 from clarity.api.v1.websocket.connection_manager import ConnectionManager
 from clarity.api.v1.websocket.lifespan import get_connection_manager
 from clarity.api.v1.websocket.models import (
+    ChatChunkMessage,
+    ChatDoneMessage,
     ChatMessage,
     ErrorMessage,
     HeartbeatAckMessage,
@@ -28,6 +36,7 @@ from clarity.api.v1.websocket.models import (
     SystemMessage,
     TypingMessage,
     WebSocketHealthDataPayload,
+    WebSocketMessage,
 )
 from clarity.auth.aws_cognito_provider import CognitoAuthProvider
 from clarity.core.config_aws import get_settings
@@ -47,13 +56,20 @@ from clarity.ml.preprocessing import ActigraphyDataPoint
 from clarity.models.auth import UserContext, UserRole
 
 logger = logging.getLogger(__name__)
+
+CHAT_FALLBACK_RESPONSE = "I am sorry, I could not generate a response at this time."
 settings = get_settings()
 
 router = APIRouter()
 
 
+@lru_cache(maxsize=1)
 def get_gemini_service() -> GeminiService:
-    """Get Gemini service instance with proper GCP project ID."""
+    """Get the shared Gemini service instance with proper GCP project ID.
+
+    One instance per process so chat connections share its response cache,
+    in-flight request coalescing and concurrency limit.
+    """
     from clarity.services.gcp_credentials import get_gcp_credentials_manager
 
     credentials_manager = get_gcp_credentials_manager()
@@ -81,9 +97,13 @@ class WebSocketChatHandler:
         self,
         gemini_service: GeminiService,
         pat_service: PATModelService,
+        *,
+        stream_responses: bool = False,
     ) -> None:
         self.gemini_service = gemini_service
         self.pat_service = pat_service
+        # Default for messages that do not set metadata["stream"]
+        self.stream_responses = stream_responses
 
     async def process_chat_message(
         self,
@@ -101,6 +121,14 @@ class WebSocketChatHandler:
             context=user_query,
             insight_type="chat_response",
         )
+
+        metadata = chat_message.metadata or {}
+        if metadata.get("stream", self.stream_responses):
+            await connection_manager.stream_to_user(
+                chat_message.user_id, self._stream_chat_response(gemini_request)
+            )
+            return
+
         try:
             gemini_response = await self.gemini_service.generate_health_insights(
                 gemini_request
@@ -109,9 +137,7 @@ class WebSocketChatHandler:
             ai_response_content = gemini_response.narrative
         except Exception:
             logger.exception("Error generating Gemini response")
-            ai_response_content = (
-                "I am sorry, I could not generate a response at this time."
-            )
+            ai_response_content = CHAT_FALLBACK_RESPONSE
 
         response_message = ChatMessage(
             user_id="AI",
@@ -121,6 +147,50 @@ class WebSocketChatHandler:
         )
         await connection_manager.send_to_user(chat_message.user_id, response_message)
 
+    async def _stream_chat_response(
+        self, gemini_request: HealthInsightRequest
+    ) -> AsyncIterator[WebSocketMessage]:
+        """Yield chunk frames as Gemini generates them, then a final done frame.
+
+        The done frame carries the full text so clients that dropped chunks
+        can reconcile, and records whether generation failed midway.
+        """
+        stream_id = str(uuid.uuid4())
+        started_at = time.perf_counter()
+        time_to_first_token: float | None = None
+        parts: list[str] = []
+        status = "completed"
+
+        try:
+            async with aclosing(
+                self.gemini_service.stream_health_insights(gemini_request)
+            ) as chunks:
+                async for delta in chunks:
+                    if time_to_first_token is None:
+                        time_to_first_token = time.perf_counter() - started_at
+                        record_chat_time_to_first_token(time_to_first_token)
+                    parts.append(delta)
+                    yield ChatChunkMessage(
+                        user_id="AI",
+                        stream_id=stream_id,
+                        sequence=len(parts) - 1,
+                        delta=delta,
+                    )
+        except Exception:
+            logger.exception("Error streaming Gemini response")
+            status = "failed"
+
+        yield ChatDoneMessage(
+            user_id="AI",
+            stream_id=stream_id,
+            content="".join(parts) or CHAT_FALLBACK_RESPONSE,
+            chunk_count=len(parts),
+            status=status,
+            time_to_first_token_ms=(
+                time_to_first_token * 1000 if time_to_first_token is not None else None
+            ),
+        )
+
     @staticmethod
     async def process_typing_message(
         typing_message: TypingMessage,
@@ -238,6 +308,19 @@ class WebSocketChatHandler:
             await connection_manager.send_to_user(user_id, error_msg)
 
 
+def create_chat_handler(
+    gemini_service: GeminiService, pat_service: PATModelService
+) -> WebSocketChatHandler:
+    """Create the handler used by the chat endpoints.
+
+    Responses arrive as a single ``message`` frame unless the client opts in
+    with ``metadata["stream"] = True``, in which case the reply is sent as
+    ``message_chunk`` frames followed by one ``message_done`` frame holding
+    the full text.
+    """
+    return WebSocketChatHandler(gemini_service=gemini_service, pat_service=pat_service)
+
+
 @router.websocket("/{room_id}")
 async def websocket_chat_endpoint(
     websocket: WebSocket,
@@ -263,9 +346,7 @@ async def websocket_chat_endpoint(
         # _authenticate_websocket_user already closed the connection
         return
 
-    handler = WebSocketChatHandler(
-        gemini_service=gemini_service, pat_service=pat_service
-    )
+    handler = create_chat_handler(gemini_service, pat_service)
     user_id = current_user.user_id
     username = str(current_user.email)  # Ensure username is string
 
@@ -567,9 +648,7 @@ async def websocket_health_analysis_endpoint(
         await websocket.close(code=4003, reason="Unauthorized")
         return
 
-    handler = WebSocketChatHandler(
-        gemini_service=gemini_service, pat_service=pat_service
-    )
+    handler = create_chat_handler(gemini_service, pat_service)
     logger.info("WebSocket connection attempt: %s", token)
     try:
         await websocket.accept()
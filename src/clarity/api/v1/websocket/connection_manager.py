@@ -4,6 +4,7 @@
 
 import asyncio
 from collections import defaultdict
+from collections.abc import AsyncIterable
 import contextlib
 from datetime import UTC, datetime
 import logging
@@ -37,6 +38,7 @@ class ConnectionManager:
         connection_timeout: int = 300,  # 5 minutes
         message_rate_limit: int = 60,  # messages per minute
         max_message_size: int = 64 * 1024,  # 64KB
+        stream_buffer_size: int = 16,  # frames buffered per connection
     ) -> None:
         # Core connection storage
         self.connections: dict[str, WebSocket] = {}  # user_id -> websocket
@@ -54,6 +56,7 @@ class ConnectionManager:
         self.connection_timeout = connection_timeout
         self.message_rate_limit = message_rate_limit
         self.max_message_size = max_message_size
+        self.stream_buffer_size = stream_buffer_size
 
         # Rate limiting and monitoring
         self.message_counts: dict[str, list[float]] = defaultdict(
@@ -337,6 +340,48 @@ class ConnectionManager:
         ]
         await asyncio.gather(*tasks, return_exceptions=True)
 
+    async def stream_to_user(
+        self, user_id: str, messages: AsyncIterable[WebSocketMessage]
+    ) -> None:
+        """Stream messages to all connections of a user in order.
+
+        Each connection drains its own bounded buffer. When a connection falls
+        ``stream_buffer_size`` frames behind, producing the next frame waits
+        for it instead of buffering without limit.
+        """
+        connections = list(self.user_connections.get(user_id, []))
+        if not connections:
+            return
+
+        buffers: list[asyncio.Queue[WebSocketMessage | None]] = [
+            asyncio.Queue(maxsize=self.stream_buffer_size) for _ in connections
+        ]
+        senders = [
+            asyncio.create_task(self._drain_stream(websocket, buffer))
+            for websocket, buffer in zip(connections, buffers, strict=True)
+        ]
+        try:
+            async for message in messages:
+                for buffer in buffers:
+                    await buffer.put(message)
+        except BaseException:
+            for sender in senders:
+                sender.cancel()
+            raise
+
+        for buffer in buffers:
+            await buffer.put(None)
+        await asyncio.gather(*senders, return_exceptions=True)
+
+    async def _drain_stream(
+        self, websocket: WebSocket, buffer: asyncio.Queue[WebSocketMessage | None]
+    ) -> None:
+        """Send buffered stream frames to one connection until the end marker."""
+        while (message := await buffer.get()) is not None:
+            # Keep draining after a disconnect so the producer never stalls
+            if websocket.client_state == WebSocketState.CONNECTED:
+                await self.send_to_connection(websocket, message)
+
     async def broadcast_to_room(
         self, room_id: str, message: WebSocketMessage, exclude_user: str | None = None
     ) -> None:
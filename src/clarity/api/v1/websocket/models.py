@@ -14,6 +14,8 @@ class MessageType(StrEnum):
 
     # Chat messages
     MESSAGE = "message"
+    MESSAGE_CHUNK = "message_chunk"
+    MESSAGE_DONE = "message_done"
     SYSTEM = "system"
     ERROR = "error"
 
@@ -52,6 +54,31 @@ class ChatMessage(BaseMessage):
     metadata: dict[str, Any] | None = None
 
 
+class ChatChunkMessage(BaseMessage):
+    """Incremental piece of a streamed chat response."""
+
+    # Chunks are concatenated by the client, so whitespace is significant
+    model_config = ConfigDict(str_strip_whitespace=False)
+
+    type: MessageType = MessageType.MESSAGE_CHUNK
+    stream_id: str
+    sequence: int = Field(..., ge=0)
+    delta: str = Field(..., min_length=1, max_length=5000)
+    user_id: str = Field(..., min_length=1, max_length=100)
+
+
+class ChatDoneMessage(BaseMessage):
+    """Final frame of a streamed chat response carrying the full text."""
+
+    type: MessageType = MessageType.MESSAGE_DONE
+    stream_id: str
+    content: str = Field(..., min_length=1)
+    user_id: str = Field(..., min_length=1, max_length=100)
+    chunk_count: int = Field(..., ge=0)
+    status: str = "completed"  # completed, failed
+    time_to_first_token_ms: float | None = None
+
+
 class SystemMessage(BaseMessage):
     """System notification message."""
 
@@ -136,6 +163,8 @@ class HeartbeatAckMessage(BaseMessage):
 # Union type for all possible WebSocket messages
 WebSocketMessage = (
     ChatMessage
+    | ChatChunkMessage
+    | ChatDoneMessage
     | SystemMessage
     | ErrorMessage
     | HealthInsightMessage
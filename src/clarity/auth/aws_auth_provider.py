@@ -5,6 +5,7 @@ This module provides AWS Cognito integration with AWS-native solutions.
 
 # removed - breaks FastAPI
 
+import asyncio
 from datetime import UTC, datetime
 import json
 import logging
@@ -15,12 +16,21 @@ import urllib.request
 
 import boto3
 from botocore.exceptions import ClientError
-from jose import JWTError, jwt
+from jose import JWTError, jwk, jwt
+from jose.exceptions import JWKError
 from mypy_boto3_cognito_idp import CognitoIdentityProviderClient
 
 if TYPE_CHECKING:
     pass  # Only for type stubs now
 
+from clarity.auth.token_cache import VerifiedTokenCache
+from clarity.auth.user_context_cache import (
+    DEFAULT_CONTEXT_MAX_ENTRIES,
+    DEFAULT_CONTEXT_TTL_SECONDS,
+    DEFAULT_FLUSH_INTERVAL_SECONDS,
+    LoginActivityBuffer,
+    UserContextCache,
+)
 from clarity.models.auth import (
     AuthError,
     Permission,
@@ -32,6 +42,13 @@ from clarity.ports.auth_ports import IAuthProvider
 
 logger = logging.getLogger(__name__)
 
+JWT_ALGORITHM = "RS256"
+# Refresh the key set in the background this long before it expires
+JWKS_REFRESH_AHEAD_SECONDS = 300
+# Minimum spacing of refetches triggered by tokens with an unknown key id
+JWKS_MIN_REFETCH_INTERVAL_SECONDS = 60
+JWKS_FETCH_TIMEOUT_SECONDS = 10
+
 
 class CognitoAuthProvider(IAuthProvider):
     """AWS Cognito authentication provider.
@@ -81,10 +98,39 @@ class CognitoAuthProvider(IAuthProvider):
             "cache_ttl_seconds", 300
         )
         self._token_cache_max_size = auth_provider_config.get("cache_max_size", 1000)
-        self._token_cache: dict[str, dict[str, Any]] = {}
+        self._token_cache = VerifiedTokenCache(
+            max_entries=self._token_cache_max_size,
+            ttl_seconds=self._token_cache_ttl_seconds,
+        )
         self._jwks_cache: dict[str, Any] | None = None
         self._jwks_cache_time: float = 0
         self._jwks_cache_ttl = 3600  # 1 hour
+        self._jwks_refresh_task: asyncio.Task[dict[str, Any]] | None = None
+        self._jwks_last_refetch: float = 0
+        # Pre-built signing keys by kid, and the JWKS document they came from
+        self._jwks_keys: dict[str, Any] = {}
+        self._jwks_keys_source: dict[str, Any] | None = None
+
+        # Resolved user contexts and write-behind last_login/login_count updates
+        self.user_context_cache = UserContextCache(
+            ttl_seconds=auth_provider_config.get(
+                "user_context_cache_ttl_seconds", DEFAULT_CONTEXT_TTL_SECONDS
+            ),
+            max_entries=auth_provider_config.get(
+                "user_context_cache_max_size", DEFAULT_CONTEXT_MAX_ENTRIES
+            ),
+        )
+        self._login_activity = (
+            LoginActivityBuffer(
+                dynamodb_service,
+                self.users_table,
+                flush_interval=auth_provider_config.get(
+                    "login_flush_interval_seconds", DEFAULT_FLUSH_INTERVAL_SECONDS
+                ),
+            )
+            if dynamodb_service
+            else None
+        )
 
         self._initialized = False
         logger.info("Cognito Authentication Provider initialized.")
@@ -120,17 +166,38 @@ class CognitoAuthProvider(IAuthProvider):
             msg = "Could not initialize Cognito Auth Provider"
             raise RuntimeError(msg) from e
 
-    async def _get_jwks(self) -> dict[str, Any]:
-        """Get JSON Web Key Set from Cognito for token verification."""
-        current_time = time.time()
+    async def _get_jwks(self, *, force_refresh: bool = False) -> dict[str, Any]:
+        """Get JSON Web Key Set from Cognito for token verification.
+
+        The cached set is served while valid; within
+        ``JWKS_REFRESH_AHEAD_SECONDS`` of expiry a refresh starts in the
+        background. Concurrent callers share a single in-flight fetch.
+
+        Args:
+            force_refresh: Fetch even if the cached set is still valid
+
+        Returns:
+            The JWKS document
+        """
+        if self._jwks_cache and not force_refresh:
+            age = time.time() - self._jwks_cache_time
+            if age < self._jwks_cache_ttl - JWKS_REFRESH_AHEAD_SECONDS:
+                return self._jwks_cache
+            if age < self._jwks_cache_ttl:
+                self._start_jwks_refresh()
+                return self._jwks_cache
 
-        # Check cache
-        if (
-            self._jwks_cache
-            and (current_time - self._jwks_cache_time) < self._jwks_cache_ttl
-        ):
-            return self._jwks_cache
+        # Shielded so a cancelled request does not abort the shared fetch
+        return await asyncio.shield(self._start_jwks_refresh())
 
+    def _start_jwks_refresh(self) -> asyncio.Task[dict[str, Any]]:
+        """Return the in-flight JWKS fetch, starting one if none is running."""
+        if self._jwks_refresh_task is None or self._jwks_refresh_task.done():
+            self._jwks_refresh_task = asyncio.create_task(self._refresh_jwks())
+        return self._jwks_refresh_task
+
+    async def _refresh_jwks(self) -> dict[str, Any]:
+        """Fetch the JWKS document and pre-build its keys."""
         try:
             # Validate URL scheme before opening
             parsed_url = urllib.parse.urlparse(self.jwks_url)
@@ -138,11 +205,7 @@ class CognitoAuthProvider(IAuthProvider):
                 msg = f"Invalid URL scheme: {parsed_url.scheme}. Only HTTPS is allowed."
                 raise ValueError(msg)
 
-            with urllib.request.urlopen(self.jwks_url) as response:  # noqa: S310
-                jwks = json.loads(response.read())
-                self._jwks_cache = jwks
-                self._jwks_cache_time = current_time
-                return cast("dict[str, Any]", jwks)
+            jwks = await asyncio.to_thread(self._fetch_jwks)
         except Exception as e:
             logger.exception("Failed to fetch JWKS: %s", e)
             if self._jwks_cache:
@@ -150,20 +213,58 @@ class CognitoAuthProvider(IAuthProvider):
                 return self._jwks_cache
             raise
 
-    def _remove_expired_tokens(self) -> None:
-        """Remove expired tokens from the cache based on TTL."""
-        if not self.cache_is_enabled:
-            return
-        current_time = time.time()
-        expired_tokens = [
-            t
-            for t, data in self._token_cache.items()
-            if current_time - data["timestamp"] > self._token_cache_ttl_seconds
-        ]
-        for t in expired_tokens:
-            if t in self._token_cache:
-                del self._token_cache[t]
-                logger.debug("Removed expired token from cache")
+        self._jwks_cache = jwks
+        self._jwks_cache_time = time.time()
+        self._signing_keys(jwks)
+        return jwks
+
+    def _fetch_jwks(self) -> dict[str, Any]:
+        """Download the JWKS document (blocking, run in a worker thread)."""
+        with urllib.request.urlopen(  # noqa: S310 - scheme validated by caller
+            self.jwks_url, timeout=JWKS_FETCH_TIMEOUT_SECONDS
+        ) as response:
+            return cast("dict[str, Any]", json.loads(response.read()))
+
+    def _signing_keys(self, jwks: dict[str, Any]) -> dict[str, Any]:
+        """Keys of a JWKS document by ``kid``, built once per document."""
+        if jwks is not self._jwks_keys_source:
+            keys: dict[str, Any] = {}
+            for key_data in jwks.get("keys", []):
+                kid = key_data.get("kid")
+                if kid is None:
+                    continue
+                try:
+                    keys[kid] = jwk.construct(
+                        key_data, algorithm=key_data.get("alg", JWT_ALGORITHM)
+                    )
+                except JWKError:
+                    # Left to jwt.decode, which rejects it on use
+                    keys[kid] = key_data
+            self._jwks_keys = keys
+            self._jwks_keys_source = jwks
+        return self._jwks_keys
+
+    async def _get_signing_key(self, jwks: dict[str, Any], kid: str | None) -> Any:
+        """Look up the key a token was signed with.
+
+        An unknown ``kid`` may mean Cognito rotated its keys, so it triggers
+        one refetch at most every ``JWKS_MIN_REFETCH_INTERVAL_SECONDS``.
+
+        Args:
+            jwks: Current JWKS document
+            kid: Key id from the token header
+
+        Returns:
+            The pre-built key, or None if the key set has no such key
+        """
+        signing_key = self._signing_keys(jwks).get(kid)
+        if signing_key is None:
+            now = time.time()
+            if now - self._jwks_last_refetch >= JWKS_MIN_REFETCH_INTERVAL_SECONDS:
+                self._jwks_last_refetch = now
+                jwks = await self._get_jwks(force_refresh=True)
+                signing_key = self._signing_keys(jwks).get(kid)
+        return signing_key
 
     async def verify_token(self, token: str) -> dict[str, Any] | None:
         """Verify Cognito ID token and return user information.
@@ -177,12 +278,12 @@ class CognitoAuthProvider(IAuthProvider):
         if not self._initialized:
             await self.initialize()
 
-        self._remove_expired_tokens()
-
         # Check cache first if enabled
-        if self.cache_is_enabled and token in self._token_cache:
-            logger.debug("Token found in cache")
-            return cast("dict[str, Any]", self._token_cache[token]["user_data"])
+        if self.cache_is_enabled:
+            cached_user_data = self._token_cache.get(token)
+            if cached_user_data is not None:
+                logger.debug("Token found in cache")
+                return cached_user_data
 
         logger.debug("🔐 COGNITO VERIFY_TOKEN CALLED")
 
@@ -195,13 +296,9 @@ class CognitoAuthProvider(IAuthProvider):
             unverified_header = jwt.get_unverified_header(token)
 
             # Find the correct key
-            rsa_key = None
-            for key in jwks["keys"]:
-                if key["kid"] == unverified_header["kid"]:
-                    rsa_key = key
-                    break
+            rsa_key = await self._get_signing_key(jwks, unverified_header.get("kid"))
 
-            if not rsa_key:
+            if rsa_key is None:
                 raise AuthError(
                     message="Unable to find appropriate key",
                     status_code=401,
@@ -212,7 +309,7 @@ class CognitoAuthProvider(IAuthProvider):
             payload = jwt.decode(
                 token,
                 rsa_key,
-                algorithms=["RS256"],
+                algorithms=[JWT_ALGORITHM],
                 audience=self.client_id,
                 issuer=f"https://cognito-idp.{self.region}.amazonaws.com/{self.user_pool_id}",
             )
@@ -227,12 +324,9 @@ class CognitoAuthProvider(IAuthProvider):
                 "token_use": payload.get("token_use"),
             }
 
-            # Cache the result
+            # Cache the result until the token expires
             if self.cache_is_enabled:
-                self._token_cache[token] = {
-                    "user_data": user_info,
-                    "timestamp": time.time(),
-                }
+                self._token_cache.set(token, user_info, expires_at=payload.get("exp"))
 
             logger.debug("✅ COGNITO TOKEN VERIFIED SUCCESSFULLY")
             return user_info
@@ -334,6 +428,9 @@ class CognitoAuthProvider(IAuthProvider):
     ) -> UserContext:
         """Get user context, creating DynamoDB record if needed.
 
+        Contexts are cached per user for a short TTL. Login activity is
+        buffered and written back periodically (see ``LoginActivityBuffer``).
+
         Args:
             cognito_user_info: User info from Cognito token verification
 
@@ -346,6 +443,12 @@ class CognitoAuthProvider(IAuthProvider):
 
         user_id = cognito_user_info["user_id"]
 
+        if self.cache_is_enabled:
+            cached_context = self.user_context_cache.get(user_id)
+            if cached_context is not None:
+                self._record_login(user_id)
+                return cached_context
+
         try:
             # Try to get existing user record
             user_data = await self.dynamodb_service.get_item(
@@ -358,26 +461,38 @@ class CognitoAuthProvider(IAuthProvider):
                 logger.info("Creating new DynamoDB user record for %s", user_id)
                 user_data = await self._create_user_record(cognito_user_info)
             else:
-                # Update last login
-                await self.dynamodb_service.update_item(
-                    table_name=self.users_table,
-                    key={"user_id": user_id},
-                    update_expression="SET last_login = :login_time, login_count = login_count + :inc",
-                    expression_attribute_values={
-                        ":login_time": datetime.now(UTC).isoformat(),
-                        ":inc": 1,
-                    },
-                    user_id=user_id,
-                )
+                # Update last login (written behind)
+                self._record_login(user_id)
 
             # Create UserContext from database record
-            return self._create_user_context_from_db(user_data, cognito_user_info)
+            user_context = self._create_user_context_from_db(
+                user_data, cognito_user_info
+            )
 
         except Exception:
             logger.exception("Error creating/fetching user context")
             # Fall back to basic context creation
             return self._create_basic_user_context(cognito_user_info)
 
+        if self.cache_is_enabled:
+            self.user_context_cache.set(user_id, user_context)
+        return user_context
+
+    def _record_login(self, user_id: str) -> None:
+        """Buffer a last_login/login_count update for the user."""
+        if self._login_activity is not None:
+            self._login_activity.record(user_id, datetime.now(UTC))
+
+    async def flush_login_activity(self) -> int:
+        """Write buffered login activity to DynamoDB now.
+
+        Returns:
+            Number of users whose activity was written
+        """
+        if self._login_activity is None:
+            return 0
+        return await self._login_activity.flush()
+
     def _create_basic_user_context(self, user_info: dict[str, Any]) -> UserContext:
         """Create basic UserContext from Cognito user info."""
         # Extract user role from custom claims
@@ -553,8 +668,16 @@ class CognitoAuthProvider(IAuthProvider):
 
     async def cleanup(self) -> None:
         """Cleanup resources when shutting down."""
+        if self._login_activity is not None:
+            await self._login_activity.close()
+        self.user_context_cache.clear()
         self._token_cache.clear()
+        if self._jwks_refresh_task is not None and not self._jwks_refresh_task.done():
+            self._jwks_refresh_task.cancel()
+        self._jwks_refresh_task = None
         self._jwks_cache = None
+        self._jwks_keys = {}
+        self._jwks_keys_source = None
         logger.info("Cognito authentication provider cleanup complete")
         self._initialized = False
 
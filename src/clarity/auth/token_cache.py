@@ -0,0 +1,192 @@
+"""Bounded cache of verified access tokens.
+
+``VerifiedTokenCache`` remembers the claims of tokens that passed signature
+verification so repeated requests with the same token skip the JWT checks.
+
+- entries are keyed by a 128-bit BLAKE2b digest of the token, so raw bearer
+  tokens are never held as dictionary keys
+- an entry lives until the token's own ``exp`` claim or the cache TTL,
+  whichever comes first
+- ``get`` / ``set`` are O(1) plus an amortized O(log n) for expiry: deadlines
+  sit in a min-heap that is popped only as far as entries have expired,
+  instead of scanning every entry on every request
+- the least recently used entries are evicted beyond ``max_entries``
+"""
+
+# removed - breaks FastAPI
+
+from collections import OrderedDict
+from dataclasses import dataclass
+import hashlib
+import heapq
+import time
+from typing import Any
+
+from clarity.api.v1.metrics import record_token_cache_event, record_token_cache_size
+
+TOKEN_DIGEST_SIZE = 16
+DEFAULT_TTL_SECONDS = 300.0
+DEFAULT_MAX_ENTRIES = 1000
+# Rebuild the heap once stale deadlines outnumber live entries this much
+HEAP_COMPACTION_FACTOR = 2
+
+
+@dataclass(slots=True)
+class _TokenEntry:
+    """Verified claims with their expiry deadline (epoch seconds)."""
+
+    user_data: dict[str, Any]
+    expires_at: float
+
+
+def token_digest(token: str) -> bytes:
+    """Digest identifying a token in the cache."""
+    return hashlib.blake2b(token.encode(), digest_size=TOKEN_DIGEST_SIZE).digest()
+
+
+class VerifiedTokenCache:
+    """LRU of verified token claims, expired by the token's ``exp`` claim."""
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of tokens kept
+            ttl_seconds: Upper bound on how long a token is trusted without
+                re-verification
+        """
+        if max_entries < 1:
+            msg = f"max_entries must be at least 1, got {max_entries}"
+            raise ValueError(msg)
+
+        self.max_entries = max_entries
+        self.ttl = ttl_seconds
+        self._entries: OrderedDict[bytes, _TokenEntry] = OrderedDict()
+        self._deadlines: list[tuple[float, bytes]] = []
+
+        # Statistics
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def __len__(self) -> int:
+        """Number of cached tokens (including not yet evicted expired ones)."""
+        return len(self._entries)
+
+    def __contains__(self, token: object) -> bool:
+        """Check for a live entry without touching LRU order or statistics."""
+        if not isinstance(token, str):
+            return False
+        entry = self._entries.get(token_digest(token))
+        return entry is not None and entry.expires_at > time.time()
+
+    def get(self, token: str) -> dict[str, Any] | None:
+        """Get the verified claims of a token.
+
+        Args:
+            token: Raw bearer token
+
+        Returns:
+            Cached user data, or None if the token is unknown or expired
+        """
+        now = time.time()
+        self._expire(now)
+
+        key = token_digest(token)
+        entry = self._entries.get(key)
+        if entry is None or entry.expires_at <= now:
+            self.misses += 1
+            record_token_cache_event("miss")
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        record_token_cache_event("hit")
+        return entry.user_data
+
+    def set(
+        self,
+        token: str,
+        user_data: dict[str, Any],
+        expires_at: float | None = None,
+    ) -> None:
+        """Cache the claims of a token that passed verification.
+
+        Args:
+            token: Raw bearer token
+            user_data: User information extracted from the token
+            expires_at: The token's ``exp`` claim (epoch seconds), if any
+        """
+        now = time.time()
+        deadline = now + self.ttl
+        if expires_at is not None:
+            deadline = min(deadline, float(expires_at))
+        if deadline <= now:
+            return
+
+        key = token_digest(token)
+        self._entries[key] = _TokenEntry(user_data, deadline)
+        self._entries.move_to_end(key)
+        heapq.heappush(self._deadlines, (deadline, key))
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+            record_token_cache_event("eviction")
+
+        if len(self._deadlines) > HEAP_COMPACTION_FACTOR * len(self._entries) + 1:
+            self._compact()
+        record_token_cache_size(len(self._entries))
+
+    def _expire(self, now: float) -> None:
+        """Drop entries whose deadline has passed, earliest first."""
+        deadlines = self._deadlines
+        expired = 0
+        while deadlines and deadlines[0][0] <= now:
+            deadline, key = heapq.heappop(deadlines)
+            entry = self._entries.get(key)
+            # Skip deadlines of evicted or since re-cached tokens
+            if entry is not None and entry.expires_at == deadline:
+                del self._entries[key]
+                expired += 1
+
+        if expired:
+            self.expirations += expired
+            record_token_cache_event("expiration", expired)
+            record_token_cache_size(len(self._entries))
+
+    def _compact(self) -> None:
+        """Rebuild the heap from live entries, discarding stale deadlines."""
+        self._deadlines = [
+            (entry.expires_at, key) for key, entry in self._entries.items()
+        ]
+        heapq.heapify(self._deadlines)
+
+    def clear(self) -> None:
+        """Remove all entries (statistics are kept)."""
+        self._entries.clear()
+        self._deadlines.clear()
+        record_token_cache_size(0)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache statistics.
+
+        Returns:
+            Dictionary with occupancy and hit/miss/eviction counters
+        """
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
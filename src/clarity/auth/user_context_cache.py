@@ -0,0 +1,259 @@
+"""User context caching and write-behind login tracking for Cognito auth.
+
+Every authenticated request resolves a ``UserContext``. Without caching that
+costs a DynamoDB read for the user record plus a write bumping
+``last_login``/``login_count``, before the handler runs.
+
+- ``UserContextCache`` keeps recently resolved contexts, keyed by the token
+  ``sub``, in a bounded ``ResultCache`` LRU with a short TTL so role/status changes in the
+  user table still propagate quickly
+- ``LoginActivityBuffer`` coalesces login activity per user in memory and
+  writes it back periodically, one ``UpdateItem`` per user per flush instead
+  of one per request
+"""
+
+# removed - breaks FastAPI
+
+import asyncio
+import contextlib
+from dataclasses import dataclass
+from datetime import datetime
+import logging
+from typing import Any
+
+from clarity.api.v1.metrics import (
+    record_login_activity_flush,
+    record_user_context_cache_lookup,
+)
+from clarity.ml.result_cache import ResultCache
+from clarity.models.auth import UserContext
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CONTEXT_TTL_SECONDS = 60.0
+DEFAULT_CONTEXT_MAX_ENTRIES = 1000
+DEFAULT_FLUSH_INTERVAL_SECONDS = 30.0
+# Flush early once this many users have unwritten activity
+DEFAULT_MAX_PENDING_USERS = 500
+# Concurrent UpdateItem calls per flush
+FLUSH_CONCURRENCY = 8
+
+LOGIN_UPDATE_EXPRESSION = (
+    "SET last_login = :login_time, "
+    "login_count = if_not_exists(login_count, :zero) + :inc"
+)
+
+
+class UserContextCache:
+    """LRU cache of resolved user contexts with a per-entry TTL.
+
+    Backed by ``ResultCache``; this wrapper only records lookup metrics.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = DEFAULT_CONTEXT_TTL_SECONDS,
+        max_entries: int = DEFAULT_CONTEXT_MAX_ENTRIES,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            ttl_seconds: How long a context is served before re-reading it
+            max_entries: Maximum number of users kept
+        """
+        self._cache: ResultCache[UserContext] = ResultCache(
+            max_entries, max_bytes=None, ttl_seconds=ttl_seconds, name="user_context"
+        )
+
+    def __len__(self) -> int:
+        """Number of cached contexts (including not yet evicted expired ones)."""
+        return len(self._cache)
+
+    def get(self, user_id: str) -> UserContext | None:
+        """Get a live context, refreshing its LRU position.
+
+        Args:
+            user_id: Cognito ``sub`` of the user
+
+        Returns:
+            Cached context, or None if missing or expired
+        """
+        context = self._cache.get(user_id)
+        record_user_context_cache_lookup("miss" if context is None else "hit")
+        return context
+
+    def set(self, user_id: str, context: UserContext) -> None:
+        """Store a context as the most recently used entry."""
+        # Only the entry count is bounded, so skip size estimation
+        self._cache.set(user_id, context, size_bytes=0)
+
+    def invalidate(self, user_id: str) -> None:
+        """Drop a user's context so the next request re-reads the user record."""
+        self._cache.pop(user_id)
+
+    def clear(self) -> None:
+        """Remove all entries (statistics are kept)."""
+        self._cache.clear()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache statistics."""
+        return self._cache.get_stats()
+
+
+@dataclass(slots=True)
+class _LoginActivity:
+    """Unwritten login activity of one user."""
+
+    last_login: datetime
+    count: int
+
+
+class LoginActivityBuffer:
+    """Write-behind buffer for ``last_login``/``login_count`` updates.
+
+    ``record`` only touches memory. Activity is written by a background task
+    every ``flush_interval`` seconds (started on the first record), when more
+    than ``max_pending_users`` users are waiting, and on ``close``. Updates
+    that fail are merged back and retried on the next flush; activity is lost
+    only if the process dies between flushes.
+    """
+
+    def __init__(
+        self,
+        dynamodb_service: Any,
+        table_name: str,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL_SECONDS,
+        max_pending_users: int = DEFAULT_MAX_PENDING_USERS,
+    ) -> None:
+        """Initialize the buffer.
+
+        Args:
+            dynamodb_service: ``DynamoDBService`` used for the updates
+            table_name: Users table
+            flush_interval: Seconds between periodic flushes
+            max_pending_users: Pending users that trigger an early flush
+        """
+        self.dynamodb_service = dynamodb_service
+        self.table_name = table_name
+        self.flush_interval = flush_interval
+        self.max_pending_users = max_pending_users
+        self._pending: dict[str, _LoginActivity] = {}
+        self._flush_lock = asyncio.Lock()
+        self._flush_task: asyncio.Task[None] | None = None
+        self._early_flush: asyncio.Task[int] | None = None
+
+    @property
+    def pending_users(self) -> int:
+        """Number of users with unwritten activity."""
+        return len(self._pending)
+
+    def record(self, user_id: str, login_time: datetime) -> None:
+        """Record one login/request of a user.
+
+        Args:
+            user_id: User whose activity to record
+            login_time: When the user was seen
+        """
+        activity = self._pending.get(user_id)
+        if activity is None:
+            self._pending[user_id] = _LoginActivity(login_time, 1)
+        else:
+            activity.last_login = max(activity.last_login, login_time)
+            activity.count += 1
+
+        self._ensure_flush_task()
+        if len(self._pending) >= self.max_pending_users and (
+            self._early_flush is None or self._early_flush.done()
+        ):
+            self._early_flush = asyncio.create_task(self.flush())
+
+    def _ensure_flush_task(self) -> None:
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_loop())
+
+    async def _flush_loop(self) -> None:
+        """Background task flushing pending activity periodically."""
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                # Shielded so stopping the loop never drops a batch mid-write
+                await asyncio.shield(self.flush())
+            except Exception:
+                logger.exception("Error flushing login activity")
+
+    async def flush(self) -> int:
+        """Write all pending activity.
+
+        Returns:
+            Number of users whose activity was written
+        """
+        async with self._flush_lock:
+            if not self._pending:
+                return 0
+
+            batch, self._pending = self._pending, {}
+            semaphore = asyncio.Semaphore(FLUSH_CONCURRENCY)
+
+            async def write(user_id: str, activity: _LoginActivity) -> bool:
+                async with semaphore:
+                    return await self._write(user_id, activity)
+
+            results = await asyncio.gather(
+                *(write(user_id, activity) for user_id, activity in batch.items())
+            )
+
+            written = 0
+            for (user_id, activity), ok in zip(batch.items(), results, strict=True):
+                if ok:
+                    written += 1
+                else:
+                    self._merge_back(user_id, activity)
+
+            failed = len(batch) - written
+            if written:
+                record_login_activity_flush("success", written)
+            if failed:
+                record_login_activity_flush("failed", failed)
+                logger.warning(
+                    "Login activity flush failed for %d users, will retry", failed
+                )
+            return written
+
+    async def _write(self, user_id: str, activity: _LoginActivity) -> bool:
+        try:
+            await self.dynamodb_service.update_item(
+                table_name=self.table_name,
+                key={"user_id": user_id},
+                update_expression=LOGIN_UPDATE_EXPRESSION,
+                expression_attribute_values={
+                    ":login_time": activity.last_login.isoformat(),
+                    ":inc": activity.count,
+                    ":zero": 0,
+                },
+                user_id=user_id,
+            )
+        except Exception:  # noqa: BLE001 - retried on the next flush
+            logger.debug("Login activity update failed for %s", user_id)
+            return False
+        return True
+
+    def _merge_back(self, user_id: str, activity: _LoginActivity) -> None:
+        """Return failed activity to the buffer, combined with newer activity."""
+        newer = self._pending.get(user_id)
+        if newer is None:
+            self._pending[user_id] = activity
+        else:
+            newer.last_login = max(newer.last_login, activity.last_login)
+            newer.count += activity.count
+
+    async def close(self) -> None:
+        """Stop the background task and write what is still pending."""
+        if self._flush_task is not None and not self._flush_task.done():
+            self._flush_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._flush_task
+        self._flush_task = None
+        if self._early_flush is not None:
+            await self._early_flush
+            self._early_flush = None
+        await self.flush()
@@ -154,6 +154,32 @@ class Settings(BaseSettings):
         le=10000,
     )
 
+    # ML inference settings
+    pat_inference_workers: int = Field(
+        default=1,
+        alias="PAT_INFERENCE_WORKERS",
+        description="Number of threads in the PAT inference executor pool",
+        ge=1,
+        le=32,
+    )
+    pat_torch_num_threads: int = Field(
+        default=0,
+        alias="PAT_TORCH_NUM_THREADS",
+        description="PyTorch intra-op threads for inference (0 keeps torch default)",
+        ge=0,
+    )
+    inference_shared_cache_path: str = Field(
+        default="",
+        alias="INFERENCE_SHARED_CACHE_PATH",
+        description="SQLite file for the inference cache shared by all workers on a host (empty disables)",
+    )
+    inference_shared_cache_max_mb: int = Field(
+        default=256,
+        alias="INFERENCE_SHARED_CACHE_MAX_MB",
+        description="Maximum size of cached results in the shared inference cache",
+        ge=1,
+    )
+
     # AWS settings
     aws_region: str = Field(default="us-east-1", alias="AWS_REGION")
     aws_access_key_id: str = Field(default="", alias="AWS_ACCESS_KEY_ID")
@@ -169,6 +195,13 @@ class Settings(BaseSettings):
         default="clarity-health-data", alias="DYNAMODB_TABLE_NAME"
     )
     dynamodb_region: str = Field(default="us-east-1", alias="DYNAMODB_REGION")
+    dynamodb_executor_workers: int = Field(
+        default=16,
+        alias="DYNAMODB_EXECUTOR_WORKERS",
+        description="Threads (and pooled HTTP connections) for non-blocking DynamoDB calls",
+        ge=1,
+        le=128,
+    )
 
     # AWS S3 settings
     s3_bucket_name: str = Field(
@@ -151,6 +151,15 @@ class Settings(BaseSettings):
     gemini_model: str = Field(default="gemini-1.5-flash", alias="GEMINI_MODEL")
     gemini_temperature: float = Field(default=0.7, alias="GEMINI_TEMPERATURE")
     gemini_max_tokens: int = Field(default=1000, alias="GEMINI_MAX_TOKENS")
+    gemini_max_concurrency: int = Field(
+        default=8, alias="GEMINI_MAX_CONCURRENCY", ge=1
+    )
+    gemini_cache_ttl_seconds: float = Field(
+        default=900.0, alias="GEMINI_CACHE_TTL_SECONDS", ge=0
+    )
+    gemini_cache_max_entries: int = Field(
+        default=256, alias="GEMINI_CACHE_MAX_ENTRIES", ge=1
+    )
 
     # Middleware configuration
     middleware_config: MiddlewareConfig = Field(default_factory=MiddlewareConfig)
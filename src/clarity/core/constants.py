@@ -38,6 +38,8 @@ CIRCADIAN_PADDING_VARIATION_STD: Final[float] = 0.1
 CIRCADIAN_PATTERN_AMPLITUDE: Final[float] = 0.2
 CIRCADIAN_DECAY_FACTOR: Final[float] = -0.5
 SMOOTHING_WINDOW_SIZE: Final[int] = 5
+PROXY_TRANSFORM_CACHE_MAX_ENTRIES: Final[int] = 512
+PROXY_TRANSFORM_CACHE_MAX_BYTES: Final[int] = 64 * 1024 * 1024  # 64 MiB
 
 # Quality scoring thresholds
 EXTREME_VALUE_LOWER_THRESHOLD: Final[float] = -3.0
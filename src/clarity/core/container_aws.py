@@ -238,8 +238,12 @@ class DependencyContainer:
         """Gracefully shutdown all services."""
         logger.info("Shutting down AWS dependency container...")
 
-        # Add any cleanup logic here
-        # For example, closing database connections, flushing queues, etc.
+        # Flush buffered login activity before the process exits
+        if self._auth_provider is not None:
+            try:
+                await self._auth_provider.cleanup()
+            except Exception:
+                logger.exception("Error cleaning up auth provider")
 
         self._initialized = False
         logger.info("AWS dependency container shutdown complete")
@@ -8,6 +8,8 @@ configurable log levels for development and production environments.
 
 import logging
 import logging.config
+import logging.handlers
+import queue
 import sys
 from typing import Any
 
@@ -19,6 +21,12 @@ logger = logging.getLogger(__name__)
 # Track if logging has been configured
 _logging_configured = False
 
+# Queue listeners started by enable_queue_logging, by logger name, with the
+# handlers and propagate flag the logger had before
+_queue_listeners: dict[
+    str, tuple[logging.handlers.QueueListener, list[logging.Handler], bool]
+] = {}
+
 
 def setup_logging(force: bool = False) -> None:
     """Configure logging for the application based on environment settings.
@@ -150,3 +158,62 @@ def configure_basic_logging(
         root_logger.setLevel(level)
         for handler in root_logger.handlers:
             handler.setLevel(level)
+
+
+def _effective_handlers(target: logging.Logger) -> list[logging.Handler]:
+    """Handlers a record logged on ``target`` would reach, in order."""
+    handlers: list[logging.Handler] = []
+    current: logging.Logger | None = target
+    while current is not None:
+        handlers.extend(h for h in current.handlers if h not in handlers)
+        if not current.propagate:
+            break
+        current = current.parent
+    return handlers
+
+
+def enable_queue_logging(name: str) -> logging.Logger:
+    """Route a logger through a queue so emitting never blocks on I/O.
+
+    The logger's current effective handlers are moved behind a
+    ``QueueListener`` thread; callers (e.g. the event loop) only enqueue
+    records. Idempotent per logger name.
+
+    Args:
+        name: Name of the logger to decouple
+
+    Returns:
+        The configured logger
+    """
+    target = logging.getLogger(name)
+    if name in _queue_listeners:
+        return target
+
+    handlers = _effective_handlers(target)
+    if not handlers:
+        return target
+
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(
+        log_queue, *handlers, respect_handler_level=True
+    )
+    _queue_listeners[name] = (listener, target.handlers[:], target.propagate)
+    for handler in target.handlers[:]:
+        target.removeHandler(handler)
+    target.addHandler(logging.handlers.QueueHandler(log_queue))
+    target.propagate = False
+    listener.start()
+    return target
+
+
+def stop_queue_logging() -> None:
+    """Flush and stop all queue listeners, restoring direct handlers."""
+    while _queue_listeners:
+        name, (listener, handlers, propagate) = _queue_listeners.popitem()
+        listener.stop()
+        target = logging.getLogger(name)
+        for handler in target.handlers[:]:
+            target.removeHandler(handler)
+        for handler in handlers:
+            target.addHandler(handler)
+        target.propagate = propagate
@@ -2,10 +2,18 @@
 
 Specialized processing and transformation of Apple Watch data
 for optimal integration with PAT (Pretrained Actigraphy Transformer) models.
+
+Minute-level modalities (heart rate, HRV, respiratory rate, steps) are
+resampled together by ``ResamplingEngine`` into one ``(modalities, minutes)``
+float32 matrix; the per-modality series on ``ProcessedHealthData`` are views
+of its rows.
 """
 
 # removed - breaks FastAPI
 
+import asyncio
+from collections.abc import Mapping, Sequence
+from concurrent.futures import Executor, ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 from enum import StrEnum
@@ -15,18 +23,32 @@ from typing import TYPE_CHECKING, Any
 
 import numpy as np
 import numpy.typing as npt
-import pandas as pd  # type: ignore[import-untyped]
-from scipy.interpolate import interp1d
-import scipy.signal
 
 from clarity.core.exceptions import ProcessingError
 from clarity.integrations.healthkit import HealthDataBatch, HealthDataPoint
+from clarity.integrations.resampling import (
+    ResampledSeries,
+    ResamplingEngine,
+    SampleSource,
+    SeriesModality,
+    minute_grid,
+)
 
 if TYPE_CHECKING:
     pass  # Only for type stubs now
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_BATCH_WORKERS = 4
+
+# ProcessedHealthData attribute holding each resampled modality
+SERIES_FIELDS = {
+    SeriesModality.HEART_RATE: "heart_rate_series",
+    SeriesModality.HRV: "hrv_series",
+    SeriesModality.RESPIRATORY_RATE: "respiratory_rate_series",
+    SeriesModality.STEPS: "movement_proxy_vector",
+}
+
 
 class ActivityLevel(StrEnum):
     """Apple Watch activity levels."""
@@ -56,6 +78,9 @@ class ProcessedHealthData:
     respiratory_rate_series: npt.NDArray[np.floating[Any]] | None = None
     movement_proxy_vector: npt.NDArray[np.floating[Any]] | None = None  # For PAT model
 
+    # All minute-level series as rows of one float32 matrix (SeriesModality order)
+    minute_matrix: npt.NDArray[np.float32] | None = None
+
     # Summary statistics
     resting_hr: float | None = None
     max_hr: float | None = None
@@ -125,15 +150,24 @@ class AppleWatchDataProcessor:
 
     def __init__(self) -> None:
         self.logger = logging.getLogger(__name__)
+        self.engine = ResamplingEngine(
+            hr_bounds=(self.HR_MIN, self.HR_MAX),
+            rr_bounds=(self.RR_MIN, self.RR_MAX),
+            step_stats=(self.NHANES_STEP_MEAN, self.NHANES_STEP_STD),
+        )
 
     async def process_health_batch(
-        self, batch: HealthDataBatch, target_duration_days: int = 7
+        self,
+        batch: HealthDataBatch,
+        target_duration_days: int = 7,
+        executor: Executor | None = None,
     ) -> ProcessedHealthData:
         """Process a batch of health data into ML-ready format.
 
         Args:
             batch: Raw health data batch from HealthKit
             target_duration_days: Target duration for time series (default 7 days)
+            executor: Pool to run resampling on (default: inline)
 
         Returns:
             ProcessedHealthData with all modalities processed and aligned
@@ -146,24 +180,23 @@ class AppleWatchDataProcessor:
             # Initialize result
             result = ProcessedHealthData(start_time=start_time, end_time=end_time)
 
-            # Process each modality
-            if batch.heart_rate_samples:
-                await self._process_heart_rate(
-                    batch.heart_rate_samples, result, start_time, end_time
+            # Resample all minute-level modalities in one pass
+            sources: dict[SeriesModality, SampleSource] = {
+                modality: samples
+                for modality, samples in (
+                    (SeriesModality.HEART_RATE, batch.heart_rate_samples),
+                    (SeriesModality.HRV, batch.hrv_samples),
+                    (SeriesModality.RESPIRATORY_RATE, batch.respiratory_rate_samples),
+                    (SeriesModality.STEPS, batch.step_count_samples),
                 )
-
-            if batch.hrv_samples:
-                await self._process_hrv(batch.hrv_samples, result, start_time, end_time)
-
-            if batch.respiratory_rate_samples:
-                await self._process_respiratory_rate(
-                    batch.respiratory_rate_samples, result, start_time, end_time
-                )
-
-            if batch.step_count_samples:
-                await self._process_steps(
-                    batch.step_count_samples, result, start_time, end_time
+                if samples
+            }
+            if sources:
+                resampled = await self._resample(
+                    sources, start_time, end_time, executor
                 )
+                result.minute_matrix = resampled.matrix
+                self._apply_resampled(resampled, result)
 
             if batch.blood_oxygen_samples:
                 await self._process_spo2(batch.blood_oxygen_samples, result)
@@ -192,6 +225,94 @@ class AppleWatchDataProcessor:
             result.data_completeness = self._calculate_completeness(result)
             return result
 
+    async def process_health_batches(
+        self,
+        batches: Sequence[HealthDataBatch],
+        target_duration_days: int = 7,
+        max_workers: int = DEFAULT_BATCH_WORKERS,
+    ) -> list[ProcessedHealthData | ProcessingError]:
+        """Process many users' batches, resampling them on a worker pool.
+
+        Args:
+            batches: Raw health data batches, typically one per user
+            target_duration_days: Target duration for time series (default 7 days)
+            max_workers: Number of resampling worker threads
+
+        Returns:
+            Results in input order; a batch that failed yields its
+            ``ProcessingError`` instead of aborting the others
+        """
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="apple-watch-resample"
+        ) as executor:
+            outcomes = await asyncio.gather(
+                *(
+                    self.process_health_batch(batch, target_duration_days, executor)
+                    for batch in batches
+                ),
+                return_exceptions=True,
+            )
+
+        results: list[ProcessedHealthData | ProcessingError] = []
+        for outcome in outcomes:
+            if isinstance(outcome, BaseException) and not isinstance(
+                outcome, ProcessingError
+            ):
+                raise outcome
+            results.append(outcome)
+        return results
+
+    async def _resample(
+        self,
+        sources: Mapping[SeriesModality, SampleSource],
+        start_time: datetime,
+        end_time: datetime,
+        executor: Executor | None = None,
+    ) -> ResampledSeries:
+        """Resample modalities onto the minute grid of a time range."""
+        grid = minute_grid(start_time, end_time)
+        if executor is None:
+            return self.engine.resample(sources, grid)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, self.engine.resample, sources, grid)
+
+    def _apply_resampled(
+        self, resampled: ResampledSeries, result: ProcessedHealthData
+    ) -> None:
+        """Set resampled series (matrix row views) and statistics on a result."""
+        for modality in resampled.modalities:
+            setattr(result, SERIES_FIELDS[modality], resampled.series(modality))
+        for name, value in resampled.stats.items():
+            if name != "total_steps":
+                setattr(result, name, value)
+
+        if SeriesModality.STEPS in resampled.modalities:
+            # Calculate days from time range
+            days = (
+                (result.end_time - result.start_time).days
+                if result.start_time and result.end_time
+                else 7
+            )
+            self.logger.info(
+                "Processed steps over period",
+                extra={
+                    "total_steps": int(resampled.stats["total_steps"]),
+                    "days": days,
+                },
+            )
+
+    async def _process_series(
+        self,
+        modality: SeriesModality,
+        samples: list[HealthDataPoint],
+        result: ProcessedHealthData,
+        start_time: datetime,
+        end_time: datetime,
+    ) -> None:
+        """Resample a single modality onto ``result``."""
+        resampled = await self._resample({modality: samples}, start_time, end_time)
+        self._apply_resampled(resampled, result)
+
     async def _process_heart_rate(
         self,
         samples: list[HealthDataPoint],
@@ -200,67 +321,10 @@ class AppleWatchDataProcessor:
         end_time: datetime,
     ) -> None:
         """Process heart rate data with advanced filtering."""
-        # Extract time series
-        times = np.array([s.timestamp.timestamp() for s in samples])
-        values = np.array([s.value for s in samples])
-
-        # Remove outliers using physiological bounds
-        mask = (values >= self.HR_MIN) & (values <= self.HR_MAX)
-        times = times[mask]
-        values = values[mask]
-
-        if len(values) == 0:
-            return
-
-        # Resample to minute-level (1440 points per day)
-        minute_timestamps = np.arange(
-            start_time.timestamp(),
-            end_time.timestamp(),
-            60,  # 60 seconds
+        await self._process_series(
+            SeriesModality.HEART_RATE, samples, result, start_time, end_time
         )
 
-        # Interpolate to regular grid
-        if len(values) > 1:
-            # Use linear interpolation for gaps < 5 minutes
-            f = interp1d(
-                times, values, kind="linear", bounds_error=False, fill_value=np.nan
-            )
-            minute_values = f(minute_timestamps)
-
-            # Forward fill for small gaps (< 5 minutes)
-            minute_values = pd.Series(minute_values).ffill(limit=5).to_numpy()
-
-            # Apply Butterworth low-pass filter to remove motion artifacts
-            # Cutoff at 0.5 Hz (30 bpm variation)
-            if not np.all(np.isnan(minute_values)):
-                b, a = scipy.signal.butter(4, 0.5 / (0.5 * 60), btype="low")
-                valid_mask = ~np.isnan(minute_values)
-                min_filter_points = 12
-                if (
-                    np.sum(valid_mask) > min_filter_points
-                ):  # Need at least 12 points for filter
-                    minute_values[valid_mask] = scipy.signal.filtfilt(
-                        b, a, minute_values[valid_mask]
-                    )
-        else:
-            minute_values = np.full(len(minute_timestamps), values[0])
-
-        # Calculate summary statistics
-        valid_values = minute_values[~np.isnan(minute_values)]
-        if len(valid_values) > 0:
-            result.avg_hr = float(np.mean(valid_values))
-            result.max_hr = float(np.max(valid_values))
-            # Resting HR as 5th percentile
-            result.resting_hr = float(np.percentile(valid_values, 5))
-
-        # Z-score normalization
-        if len(valid_values) > 1:
-            hr_mean = 70  # Population average
-            hr_std = 12  # Population std
-            minute_values = (minute_values - hr_mean) / hr_std
-
-        result.heart_rate_series = minute_values
-
     async def _process_hrv(
         self,
         samples: list[HealthDataPoint],
@@ -269,46 +333,9 @@ class AppleWatchDataProcessor:
         end_time: datetime,
     ) -> None:
         """Process HRV data with outlier removal and normalization."""
-        # Extract time series
-        times = np.array([s.timestamp.timestamp() for s in samples])
-        values = np.array([s.value for s in samples])  # SDNN in ms
-
-        # Remove outliers (5x median filter)
-        min_outlier_points = 3
-        if len(values) > min_outlier_points:
-            median_val = np.median(values)
-            mask = values < 5 * median_val
-            times = times[mask]
-            values = values[mask]
-
-        if len(values) == 0:
-            return
-
-        # Resample to minute-level
-        minute_timestamps = np.arange(start_time.timestamp(), end_time.timestamp(), 60)
-
-        # Interpolate (HRV changes slowly, so interpolation is reasonable)
-        if len(values) > 1:
-            f = interp1d(
-                times, values, kind="linear", bounds_error=False, fill_value=np.nan
-            )
-            minute_values = f(minute_timestamps)
-
-            # Fill small gaps only
-            minute_values = pd.Series(minute_values).ffill(limit=10).to_numpy()
-        else:
-            minute_values = np.full(len(minute_timestamps), np.nan)
-
-        # Calculate summary statistics
-        valid_values = minute_values[~np.isnan(minute_values)]
-        if len(valid_values) > 0:
-            result.hrv_median = float(np.median(valid_values))
-
-        # Log transform for normalization (HRV is often log-normal)
-        if len(valid_values) > 0:
-            minute_values = np.log1p(minute_values)  # log(1 + x) to handle zeros
-
-        result.hrv_series = minute_values
+        await self._process_series(
+            SeriesModality.HRV, samples, result, start_time, end_time
+        )
 
     async def _process_respiratory_rate(
         self,
@@ -318,65 +345,10 @@ class AppleWatchDataProcessor:
         end_time: datetime,
     ) -> None:
         """Process respiratory rate with median filtering."""
-        # Extract time series
-        times = np.array([s.timestamp.timestamp() for s in samples])
-        values = np.array([s.value for s in samples])
-
-        # Remove physiologically implausible values
-        mask = (values >= self.RR_MIN) & (values <= self.RR_MAX)
-        times = times[mask]
-        values = values[mask]
-
-        if len(values) == 0:
-            return
-
-        # Resample to 5-minute intervals (respiratory rate changes slowly)
-        five_min_timestamps = np.arange(
-            start_time.timestamp(),
-            end_time.timestamp(),
-            300,  # 5 minutes
+        await self._process_series(
+            SeriesModality.RESPIRATORY_RATE, samples, result, start_time, end_time
         )
 
-        if len(values) > 1:
-            # Interpolate
-            f = interp1d(
-                times, values, kind="linear", bounds_error=False, fill_value=np.nan
-            )
-            five_min_values = f(five_min_timestamps)
-
-            # Apply 3-point median filter to remove transient spikes
-            min_median_points = 3
-            if len(five_min_values) > min_median_points:
-                five_min_values = scipy.signal.medfilt(five_min_values, kernel_size=3)
-        else:
-            five_min_values = np.full(len(five_min_timestamps), values[0])
-
-        # Calculate average
-        valid_values = five_min_values[~np.isnan(five_min_values)]
-        if len(valid_values) > 0:
-            result.avg_respiratory_rate = float(np.mean(valid_values))
-
-        # Z-score normalization
-        rr_mean = 15  # Population average
-        rr_std = 3  # Population std
-        five_min_values = (five_min_values - rr_mean) / rr_std
-
-        # Upsample to minute-level for consistency
-        minute_timestamps = np.arange(start_time.timestamp(), end_time.timestamp(), 60)
-        if len(five_min_values) > 1:
-            f = interp1d(
-                five_min_timestamps,
-                five_min_values,
-                kind="linear",
-                bounds_error=False,
-                fill_value=np.nan,
-            )
-            minute_values = f(minute_timestamps)
-        else:
-            minute_values = np.full(len(minute_timestamps), np.nan)
-
-        result.respiratory_rate_series = minute_values
-
     async def _process_steps(
         self,
         samples: list[HealthDataPoint],
@@ -385,38 +357,8 @@ class AppleWatchDataProcessor:
         end_time: datetime,
     ) -> None:
         """Process steps into PAT-compatible movement proxy vector."""
-        # Create minute-level step array
-        minutes_in_week = 7 * 24 * 60
-        minute_steps = np.zeros(minutes_in_week)
-
-        # Aggregate steps by minute
-        for sample in samples:
-            if start_time <= sample.timestamp <= end_time:
-                minute_idx = int((sample.timestamp - start_time).total_seconds() / 60)
-                if 0 <= minute_idx < minutes_in_week:
-                    minute_steps[minute_idx] += sample.value
-
-        # Apply sqrt transformation (variance stabilization)
-        movement_vector = np.sqrt(minute_steps)
-
-        # Z-score using NHANES population statistics
-        movement_vector = (
-            movement_vector - self.NHANES_STEP_MEAN
-        ) / self.NHANES_STEP_STD
-
-        result.movement_proxy_vector = movement_vector
-
-        # Log weekly step summary
-        total_steps = np.sum(minute_steps)
-        # Calculate days from time range
-        days = (
-            (result.end_time - result.start_time).days
-            if result.start_time and result.end_time
-            else 7
-        )
-        self.logger.info(
-            "Processed steps over period",
-            extra={"total_steps": int(total_steps), "days": days},
+        await self._process_series(
+            SeriesModality.STEPS, samples, result, start_time, end_time
         )
 
     async def _process_spo2(
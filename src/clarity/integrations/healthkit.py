@@ -2,19 +2,33 @@
 
 Handles OAuth 2.0 authorization, data fetching, and normalization
 for Apple Watch health metrics including activity, sleep, and heart rate.
+
+Data endpoints are paginated (``limit`` samples per page, ``next_page_token``
+in the response, ``page_token`` on the next request). Long date ranges are
+split into time chunks that are fetched in parallel over the client's shared
+connection pool, with at most ``max_requests_per_host`` requests in flight per
+host. Response bodies are decoded as they stream in, one sample at a time, so
+``fetch_health_arrays`` fills NumPy arrays directly instead of materializing
+the whole JSON document and a list of sample objects.
 """
 
 # removed - breaks FastAPI
 
 import asyncio
+from collections.abc import AsyncGenerator, Callable
+from contextlib import asynccontextmanager
 from dataclasses import asdict, dataclass
 from datetime import UTC, datetime, timedelta
-from enum import StrEnum
+from enum import Enum, StrEnum
+import json
 import logging
+import re
 import types
-from typing import TYPE_CHECKING, Any, Self
+from typing import TYPE_CHECKING, Any, Protocol, Self, TypeVar
 
 import httpx
+import numpy as np
+import numpy.typing as npt
 from pydantic import BaseModel, Field, validator
 
 from clarity.core.config_aws import get_settings
@@ -35,6 +49,9 @@ HTTP_STATUS_OK = 200
 DEFAULT_LIMIT = 1000
 DEFAULT_TIMEOUT = 30.0
 DEFAULT_DAYS_BACK = 7
+DEFAULT_CHUNK_DURATION = timedelta(days=1)
+DEFAULT_MAX_CONNECTIONS = 20
+DEFAULT_MAX_REQUESTS_PER_HOST = 8
 
 
 class HealthDataType(StrEnum):
@@ -145,6 +162,243 @@ class HealthKitTokens(BaseModel):
         return datetime.now(UTC) >= self.expires_at
 
 
+@dataclass(frozen=True)
+class HealthSampleArrays:
+    """Samples of one data type as parallel NumPy arrays.
+
+    ``timestamps`` are ``datetime64[ms]`` in UTC, sorted ascending, with
+    ``values`` aligned to them.
+    """
+
+    user_id: str
+    data_type: HealthDataType
+    start_date: datetime
+    end_date: datetime
+    timestamps: npt.NDArray[np.datetime64]
+    values: npt.NDArray[np.float64]
+    unit: str = ""
+
+    def __len__(self) -> int:
+        """Number of samples."""
+        return len(self.values)
+
+
+class _SampleSink(Protocol):
+    def add(self, sample: dict[str, Any]) -> None: ...
+
+
+SinkT = TypeVar("SinkT", bound=_SampleSink)
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+_MILLISECOND = timedelta(milliseconds=1)
+
+
+def _epoch_millis(timestamp: str) -> int:
+    """Convert an ISO 8601 timestamp to epoch milliseconds (naive means UTC)."""
+    parsed = datetime.fromisoformat(timestamp)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=UTC)
+    return (parsed - _EPOCH) // _MILLISECOND
+
+
+class _SampleArrayBuilder:
+    """Append samples into growable timestamp and value arrays."""
+
+    def __init__(self, capacity: int = DEFAULT_LIMIT) -> None:
+        self._timestamps = np.empty(max(capacity, 1), dtype=np.int64)
+        self._values = np.empty(max(capacity, 1), dtype=np.float64)
+        self._size = 0
+        self.unit = ""
+
+    def add(self, sample: dict[str, Any]) -> None:
+        if self._size == len(self._values):
+            self._timestamps = np.resize(self._timestamps, 2 * self._size)
+            self._values = np.resize(self._values, 2 * self._size)
+        self._timestamps[self._size] = _epoch_millis(sample["timestamp"])
+        self._values[self._size] = float(sample["value"])
+        self._size += 1
+        if not self.unit:
+            self.unit = sample.get("unit", "")
+
+    @property
+    def timestamps(self) -> npt.NDArray[np.int64]:
+        return self._timestamps[: self._size]
+
+    @property
+    def values(self) -> npt.NDArray[np.float64]:
+        return self._values[: self._size]
+
+
+class _DataPointCollector:
+    """Collect samples as ``HealthDataPoint`` objects."""
+
+    def __init__(self) -> None:
+        self.points: list[HealthDataPoint] = []
+
+    def add(self, sample: dict[str, Any]) -> None:
+        self.points.append(
+            HealthDataPoint(
+                timestamp=datetime.fromisoformat(sample["timestamp"]),
+                value=sample["value"],
+                unit=sample.get("unit", ""),
+                source=sample.get("source", "apple_watch"),
+                metadata=sample.get("metadata"),
+            )
+        )
+
+
+class _DecodeState(Enum):
+    OBJECT_START = "object_start"
+    KEY = "key"
+    COLON = "colon"
+    VALUE = "value"
+    AFTER_VALUE = "after_value"
+    SAMPLE = "sample"
+    AFTER_SAMPLE = "after_sample"
+    DONE = "done"
+
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+class _IncompleteValueError(Exception):
+    """The buffer ends inside a JSON value."""
+
+
+class _PageDecoder:
+    """Incrementally decode one data page as its text arrives.
+
+    Elements of the top-level ``data`` array are passed to ``on_sample`` one
+    by one as soon as they are complete; all other top-level fields (such as
+    ``user_id`` and ``next_page_token``) are collected in ``envelope``.
+    """
+
+    def __init__(self, on_sample: Callable[[dict[str, Any]], None]) -> None:
+        self._on_sample = on_sample
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        self._state = _DecodeState.OBJECT_START
+        self._key = ""
+        self.envelope: dict[str, Any] = {}
+
+    def feed(self, text: str) -> None:
+        """Consume the next piece of the response body."""
+        self._buffer = self._buffer[self._pos :] + text
+        self._pos = 0
+        self._parse(final=False)
+
+    def close(self) -> dict[str, Any]:
+        """Finish decoding and return the page's top-level fields.
+
+        Raises:
+            ValueError: If the body is truncated or not a JSON object
+        """
+        self._parse(final=True)
+        if self._state is not _DecodeState.DONE:
+            msg = "Truncated HealthKit response body"
+            raise ValueError(msg)
+        return self.envelope
+
+    def _decode_value(self, *, final: bool) -> Any:
+        try:
+            value, end = self._decoder.raw_decode(self._buffer, self._pos)
+        except json.JSONDecodeError as e:
+            if final:
+                msg = f"Malformed HealthKit response body: {e}"
+                raise ValueError(msg) from e
+            raise _IncompleteValueError from e
+        # A number at the end of the buffer may continue in the next chunk
+        if (
+            end == len(self._buffer)
+            and not final
+            and isinstance(value, int | float)
+            and not isinstance(value, bool)
+        ):
+            raise _IncompleteValueError
+        self._pos = end
+        return value
+
+    def _expect(self, char: str, expected: str) -> None:
+        if char not in expected:
+            msg = f"Malformed HealthKit response body: unexpected {char!r}"
+            raise ValueError(msg)
+        self._pos += 1
+
+    def _parse(self, *, final: bool) -> None:
+        while True:
+            match = _WHITESPACE.match(self._buffer, self._pos)
+            self._pos = match.end() if match else self._pos
+            if self._pos == len(self._buffer):
+                return
+            char = self._buffer[self._pos]
+
+            try:
+                self._step(char, final=final)
+            except _IncompleteValueError:
+                return
+
+    def _step(self, char: str, *, final: bool) -> None:
+        state = self._state
+        if state is _DecodeState.OBJECT_START:
+            self._expect(char, "{")
+            self._state = _DecodeState.KEY
+        elif state is _DecodeState.KEY:
+            if char == "}":
+                self._pos += 1
+                self._state = _DecodeState.DONE
+            elif char == '"':
+                self._key = self._decode_value(final=final)
+                self._state = _DecodeState.COLON
+            else:
+                self._expect(char, '"')
+        elif state is _DecodeState.COLON:
+            self._expect(char, ":")
+            self._state = _DecodeState.VALUE
+        elif state is _DecodeState.VALUE:
+            if self._key == "data" and char == "[":
+                self._pos += 1
+                self._state = _DecodeState.SAMPLE
+            else:
+                self.envelope[self._key] = self._decode_value(final=final)
+                self._state = _DecodeState.AFTER_VALUE
+        elif state is _DecodeState.AFTER_VALUE:
+            self._expect(char, ",}")
+            self._state = _DecodeState.KEY if char == "," else _DecodeState.DONE
+        elif state is _DecodeState.SAMPLE:
+            if char == "]":
+                self._pos += 1
+                self._state = _DecodeState.AFTER_VALUE
+            else:
+                self._on_sample(self._decode_value(final=final))
+                self._state = _DecodeState.AFTER_SAMPLE
+        elif state is _DecodeState.AFTER_SAMPLE:
+            self._expect(char, ",]")
+            self._state = (
+                _DecodeState.SAMPLE if char == "," else _DecodeState.AFTER_VALUE
+            )
+        else:
+            msg = "Malformed HealthKit response body: trailing data"
+            raise ValueError(msg)
+
+
+def _split_range(
+    start_date: datetime, end_date: datetime, chunk_duration: timedelta
+) -> list[tuple[datetime, datetime]]:
+    """Split ``[start_date, end_date)`` into consecutive chunks."""
+    if chunk_duration <= timedelta(0):
+        msg = "chunk_duration must be positive"
+        raise DataValidationError(msg)
+
+    chunks = []
+    chunk_start = start_date
+    while chunk_start < end_date:
+        chunk_end = min(chunk_start + chunk_duration, end_date)
+        chunks.append((chunk_start, chunk_end))
+        chunk_start = chunk_end
+    return chunks or [(start_date, end_date)]
+
+
 class HealthKitClient:
     """Apple HealthKit API client for fetching health data.
 
@@ -158,8 +412,23 @@ class HealthKitClient:
         client_secret: str | None = None,
         redirect_uri: str | None = None,
         base_url: str = "https://www.healthkit.apple.com",
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        max_requests_per_host: int = DEFAULT_MAX_REQUESTS_PER_HOST,
     ) -> None:
-        """Initialize HealthKit client with configuration."""
+        """Initialize HealthKit client with configuration.
+
+        Args:
+            client_id: OAuth client ID (defaults to settings)
+            client_secret: OAuth client secret (defaults to settings)
+            redirect_uri: OAuth redirect URI (defaults to settings)
+            base_url: HealthKit API base URL
+            max_connections: Size of the shared HTTP connection pool
+            max_requests_per_host: Maximum concurrent data requests per host
+        """
+        if max_connections < 1 or max_requests_per_host < 1:
+            msg = "max_connections and max_requests_per_host must be at least 1"
+            raise ValueError(msg)
+
         settings = get_settings()
         self.client_id = client_id or getattr(settings, "APPLE_HEALTHKIT_CLIENT_ID", "")
         self.client_secret = client_secret or getattr(
@@ -169,9 +438,15 @@ class HealthKitClient:
             settings, "APPLE_HEALTHKIT_REDIRECT_URI", ""
         )
         self.base_url = base_url
+        self.max_requests_per_host = max_requests_per_host
+        self._host_semaphores: dict[str, asyncio.Semaphore] = {}
 
         self._http_client = httpx.AsyncClient(
             timeout=httpx.Timeout(DEFAULT_TIMEOUT),
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+            ),
             headers={
                 "User-Agent": f"Clarity-Digital-Twin/{getattr(settings, 'VERSION', settings.app_version)}",
                 "Accept": "application/json",
@@ -364,6 +639,134 @@ class HealthKitClient:
 
         return endpoint
 
+    def _host_semaphore(self, url: str) -> asyncio.Semaphore:
+        """Get the request slot limiter for the host serving ``url``."""
+        host = httpx.URL(url).host
+        semaphore = self._host_semaphores.get(host)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.max_requests_per_host)
+            self._host_semaphores[host] = semaphore
+        return semaphore
+
+    @asynccontextmanager
+    async def _stream_page(
+        self, url: str, params: dict[str, str], access_token: str
+    ) -> AsyncGenerator[httpx.Response, None]:
+        """Open one data page as a streamed response within the host limit."""
+        async with (
+            self._host_semaphore(url),
+            self._http_client.stream(
+                "GET",
+                url,
+                params=params,
+                headers={"Authorization": f"Bearer {access_token}"},
+            ) as response,
+        ):
+            if response.status_code != HTTP_STATUS_OK:
+                await response.aread()
+                self._handle_api_error(response)
+            yield response
+
+    async def _fetch_pages(
+        self,
+        url: str,
+        access_token: str,
+        start_date: datetime,
+        end_date: datetime,
+        page_size: int,
+        sink: _SampleSink,
+    ) -> str | None:
+        """Fetch every page of one time chunk into ``sink``.
+
+        Returns:
+            The user ID reported by the API, if any
+        """
+        params = {
+            "start_date": start_date.isoformat(),
+            "end_date": end_date.isoformat(),
+            "limit": str(page_size),
+        }
+        user_id: str | None = None
+        while True:
+            decoder = _PageDecoder(sink.add)
+            async with self._stream_page(url, params, access_token) as response:
+                async for text in response.aiter_text():
+                    decoder.feed(text)
+            envelope = decoder.close()
+
+            user_id = user_id or envelope.get("user_id")
+            page_token = envelope.get("next_page_token")
+            if not page_token:
+                return user_id
+            if page_token == params.get("page_token"):
+                error_msg = "HealthKit pagination did not advance"
+                raise IntegrationError(error_msg)
+            params["page_token"] = str(page_token)
+
+    async def _fetch_chunked(
+        self,
+        tokens: HealthKitTokens,
+        data_type: HealthDataType,
+        start_date: datetime,
+        end_date: datetime,
+        page_size: int,
+        chunk_duration: timedelta,
+        sink_factory: Callable[[], SinkT],
+    ) -> tuple[list[SinkT], str | None]:
+        """Fetch a date range as parallel time chunks, one sink per chunk.
+
+        Returns:
+            Sinks in chronological chunk order and the reported user ID
+        """
+        if tokens.is_expired:
+            error_msg = "Access token has expired"
+            raise AuthorizationError(error_msg)
+
+        try:
+            endpoint = HealthKitClient._validate_data_type_support(data_type)
+            chunks = _split_range(start_date, end_date, chunk_duration)
+            sinks = [sink_factory() for _ in chunks]
+
+            try:
+                async with asyncio.TaskGroup() as task_group:
+                    tasks = [
+                        task_group.create_task(
+                            self._fetch_pages(
+                                f"{self.base_url}{endpoint}",
+                                tokens.access_token,
+                                chunk_start,
+                                chunk_end,
+                                page_size,
+                                sink,
+                            )
+                        )
+                        for (chunk_start, chunk_end), sink in zip(
+                            chunks, sinks, strict=True
+                        )
+                    ]
+            except ExceptionGroup as group:
+                # Surface the first chunk failure as if fetched sequentially
+                raise group.exceptions[0] from None
+
+            user_id = next((task.result() for task in tasks if task.result()), None)
+
+        except (AuthorizationError, DataValidationError, IntegrationError):
+            raise
+        except Exception as e:
+            logger.exception(
+                "Failed to fetch health data",
+                extra={
+                    "data_type": data_type,
+                    "error": str(e),
+                    "start_date": start_date.isoformat(),
+                    "end_date": end_date.isoformat(),
+                },
+            )
+            error_msg = f"Health data fetch failed: {e}"
+            raise IntegrationError(error_msg) from e
+        else:
+            return sinks, user_id
+
     async def fetch_health_data(
         self,
         tokens: HealthKitTokens,
@@ -371,15 +774,20 @@ class HealthKitClient:
         start_date: datetime,
         end_date: datetime,
         limit: int = DEFAULT_LIMIT,
+        chunk_duration: timedelta = DEFAULT_CHUNK_DURATION,
     ) -> HealthDataBatch:
         """Fetch health data from HealthKit API.
 
+        Every page of every time chunk is fetched; use ``fetch_health_arrays``
+        when per-sample objects are not needed.
+
         Args:
             tokens: Valid HealthKit tokens
             data_type: Type of health data to fetch
             start_date: Start of data range
             end_date: End of data range
-            limit: Maximum number of data points
+            limit: Number of data points per page
+            chunk_duration: Length of the time chunks fetched in parallel
 
         Returns:
             Batch of health data points
@@ -389,77 +797,106 @@ class HealthKitClient:
             DataValidationError: If data is invalid
             AuthorizationError: If tokens are expired
         """
-        if tokens.is_expired:
-            error_msg = "Access token has expired"
-            raise AuthorizationError(error_msg)
-
-        try:
-            endpoint = HealthKitClient._validate_data_type_support(data_type)
+        collectors, user_id = await self._fetch_chunked(
+            tokens,
+            data_type,
+            start_date,
+            end_date,
+            limit,
+            chunk_duration,
+            _DataPointCollector,
+        )
+        data_points = [point for collector in collectors for point in collector.points]
 
-            params: dict[str, str | int] = {
+        logger.info(
+            "Successfully fetched health data",
+            extra={
+                "data_type": data_type,
+                "count": len(data_points),
                 "start_date": start_date.isoformat(),
                 "end_date": end_date.isoformat(),
-                "limit": str(limit),
-            }
+            },
+        )
 
-            response = await self._http_client.get(
-                f"{self.base_url}{endpoint}",
-                params=params,
-                headers={"Authorization": f"Bearer {tokens.access_token}"},
-            )
+        return HealthDataBatch(
+            user_id=user_id or "unknown",
+            data_type=data_type,
+            start_date=start_date,
+            end_date=end_date,
+            data_points=data_points,
+            total_count=len(data_points),
+        )
 
-            if response.status_code != HTTP_STATUS_OK:
-                self._handle_api_error(response)
+    async def fetch_health_arrays(
+        self,
+        tokens: HealthKitTokens,
+        data_type: HealthDataType,
+        start_date: datetime,
+        end_date: datetime,
+        page_size: int = DEFAULT_LIMIT,
+        chunk_duration: timedelta = DEFAULT_CHUNK_DURATION,
+    ) -> HealthSampleArrays:
+        """Fetch health data as timestamp and value arrays.
 
-            raw_data = response.json()
-
-            # Transform HealthKit data to our format
-            data_points = []
-            for item in raw_data.get("data", []):
-                point = HealthDataPoint(
-                    timestamp=datetime.fromisoformat(item["timestamp"]),
-                    value=item["value"],
-                    unit=item.get("unit", ""),
-                    source=item.get("source", "apple_watch"),
-                    metadata=item.get("metadata"),
-                )
-                data_points.append(point)
+        Samples are decoded straight into NumPy arrays while each page streams
+        in. Exact duplicates (same timestamp and value, e.g. a sample on a
+        chunk boundary returned for both chunks) are dropped.
 
-            batch = HealthDataBatch(
-                user_id=raw_data.get("user_id", "unknown"),
-                data_type=data_type,
-                start_date=start_date,
-                end_date=end_date,
-                data_points=data_points,
-                total_count=len(data_points),
-            )
+        Args:
+            tokens: Valid HealthKit tokens
+            data_type: Type of health data to fetch
+            start_date: Start of data range
+            end_date: End of data range
+            page_size: Number of data points per page
+            chunk_duration: Length of the time chunks fetched in parallel
 
-            logger.info(
-                "Successfully fetched health data",
-                extra={
-                    "data_type": data_type,
-                    "count": len(data_points),
-                    "start_date": start_date.isoformat(),
-                    "end_date": end_date.isoformat(),
-                },
-            )
+        Returns:
+            Samples sorted by timestamp
 
-        except (AuthorizationError, DataValidationError, IntegrationError):
-            raise
-        except Exception as e:
-            logger.exception(
-                "Failed to fetch health data",
-                extra={
-                    "data_type": data_type,
-                    "error": str(e),
-                    "start_date": start_date.isoformat(),
-                    "end_date": end_date.isoformat(),
-                },
-            )
-            error_msg = f"Health data fetch failed: {e}"
-            raise IntegrationError(error_msg) from e
-        else:
-            return batch
+        Raises:
+            IntegrationError: If data fetch fails
+            DataValidationError: If data is invalid
+            AuthorizationError: If tokens are expired
+        """
+        builders, user_id = await self._fetch_chunked(
+            tokens,
+            data_type,
+            start_date,
+            end_date,
+            page_size,
+            chunk_duration,
+            lambda: _SampleArrayBuilder(page_size),
+        )
+
+        timestamps = np.concatenate([builder.timestamps for builder in builders])
+        values = np.concatenate([builder.values for builder in builders])
+        if len(values) > 1:
+            order = np.lexsort((values, timestamps))
+            timestamps, values = timestamps[order], values[order]
+            keep = np.ones(len(values), dtype=bool)
+            keep[1:] = (timestamps[1:] != timestamps[:-1]) | (values[1:] != values[:-1])
+            timestamps, values = timestamps[keep], values[keep]
+
+        logger.info(
+            "Successfully fetched health data arrays",
+            extra={
+                "data_type": data_type,
+                "count": len(values),
+                "chunks": len(builders),
+                "start_date": start_date.isoformat(),
+                "end_date": end_date.isoformat(),
+            },
+        )
+
+        return HealthSampleArrays(
+            user_id=user_id or "unknown",
+            data_type=data_type,
+            start_date=start_date,
+            end_date=end_date,
+            timestamps=timestamps.astype("datetime64[ms]"),
+            values=values,
+            unit=next((builder.unit for builder in builders if builder.unit), ""),
+        )
 
     async def fetch_latest_7_days(
         self, tokens: HealthKitTokens, data_types: list[HealthDataType]
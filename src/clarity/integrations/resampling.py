@@ -0,0 +1,365 @@
+"""Shared minute-grid resampling engine for Apple Watch time series.
+
+``AppleWatchDataProcessor`` used to resample heart rate, HRV, respiratory rate
+and steps separately: every modality rebuilt its own minute grid, created an
+``interp1d`` object, round-tripped through pandas to forward-fill and
+redesigned the Butterworth filter on every call. ``ResamplingEngine`` does
+all of that in one pass:
+
+- the minute grid is built once per time range (``minute_grid``)
+- samples become ``(times, values)`` arrays once and are interpolated with
+  ``np.interp``; forward fill with a gap limit is a NumPy kernel
+- filter coefficients are designed once per parameter set
+  (``butter_coefficients``)
+- every modality is written into one row of a ``(modalities, minutes)``
+  float32 matrix, so the per-modality series are views of a single buffer
+  that fusion and PAT can consume without copying
+"""
+
+# removed - breaks FastAPI
+
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass, field
+from datetime import datetime
+from enum import StrEnum
+from functools import cached_property, lru_cache
+
+import numpy as np
+import numpy.typing as npt
+import scipy.signal
+
+from clarity.integrations.healthkit import HealthDataPoint, HealthSampleArrays
+
+__all__ = [
+    "MinuteGrid",
+    "ResampledSeries",
+    "ResamplingEngine",
+    "SeriesModality",
+    "butter_coefficients",
+    "minute_grid",
+]
+
+MINUTE_SECONDS = 60
+RESPIRATORY_STEP_SECONDS = 300  # Respiratory rate changes slowly
+
+# Population statistics for normalization
+HR_POPULATION_MEAN = 70
+HR_POPULATION_STD = 12
+RR_POPULATION_MEAN = 15
+RR_POPULATION_STD = 3
+NHANES_STEP_MEAN = 7.49  # sqrt(steps) mean
+NHANES_STEP_STD = 7.71  # sqrt(steps) std
+
+# Heart rate low-pass filter: 4th order, 0.5 Hz cutoff on minute samples
+HR_FILTER_ORDER = 4
+HR_FILTER_CUTOFF = 0.5 / (0.5 * 60)
+HR_MIN_FILTER_POINTS = 12
+HR_FFILL_LIMIT = 5
+HRV_FFILL_LIMIT = 10
+HRV_OUTLIER_FACTOR = 5
+HRV_MIN_OUTLIER_POINTS = 3
+RR_MEDIAN_KERNEL = 3
+
+FloatArray = npt.NDArray[np.float64]
+SampleSource = Sequence[HealthDataPoint] | HealthSampleArrays
+
+
+class SeriesModality(StrEnum):
+    """Minute-level series, in row order of the resampled matrix."""
+
+    HEART_RATE = "heart_rate"
+    HRV = "hrv"
+    RESPIRATORY_RATE = "respiratory_rate"
+    STEPS = "steps"
+
+    @property
+    def row(self) -> int:
+        """Row index of this modality in the resampled matrix."""
+        return _MODALITY_ROWS[self]
+
+
+_MODALITY_ROWS = {modality: row for row, modality in enumerate(SeriesModality)}
+
+
+@lru_cache(maxsize=32)
+def butter_coefficients(
+    order: int, cutoff: float, btype: str = "low"
+) -> tuple[FloatArray, FloatArray]:
+    """Design a Butterworth filter once per parameter set.
+
+    Args:
+        order: Filter order
+        cutoff: Normalized cutoff frequency (Nyquist = 1)
+        btype: Filter type passed to ``scipy.signal.butter``
+
+    Returns:
+        Read-only ``(b, a)`` coefficient arrays
+    """
+    b, a = scipy.signal.butter(order, cutoff, btype=btype)
+    b.setflags(write=False)
+    a.setflags(write=False)
+    return b, a
+
+
+@dataclass(frozen=True)
+class MinuteGrid:
+    """Regular grid of the whole minutes in ``[start_time, end_time)``."""
+
+    start_time: datetime
+    end_time: datetime
+
+    def _arange(self, step: int) -> FloatArray:
+        # Whole steps only, so every modality gets the same length
+        count = int((self.end_time - self.start_time).total_seconds() // step)
+        times = self.start_time.timestamp() + step * np.arange(count, dtype=np.float64)
+        times.setflags(write=False)  # Shared by every user of a cached grid
+        return times
+
+    @cached_property
+    def timestamps(self) -> FloatArray:
+        """Epoch seconds of every grid minute."""
+        return self._arange(MINUTE_SECONDS)
+
+    @cached_property
+    def respiratory_timestamps(self) -> FloatArray:
+        """Epoch seconds of the coarser respiratory rate grid."""
+        return self._arange(RESPIRATORY_STEP_SECONDS)
+
+    @property
+    def n_minutes(self) -> int:
+        """Number of grid minutes."""
+        return len(self.timestamps)
+
+
+@dataclass
+class ResampledSeries:
+    """Output of one resampling pass.
+
+    ``matrix`` has one float32 row per ``SeriesModality``; rows of modalities
+    without usable samples stay NaN and are not listed in ``modalities``.
+    """
+
+    grid: MinuteGrid
+    matrix: npt.NDArray[np.float32]
+    modalities: set[SeriesModality] = field(default_factory=set)
+    stats: dict[str, float] = field(default_factory=dict)
+
+    def series(self, modality: SeriesModality) -> npt.NDArray[np.float32] | None:
+        """View of a modality's row, or ``None`` if it was not produced."""
+        if modality not in self.modalities:
+            return None
+        return self.matrix[modality.row]
+
+
+@lru_cache(maxsize=64)
+def minute_grid(start_time: datetime, end_time: datetime) -> MinuteGrid:
+    """Get a shared grid for a time range, built at most once while cached."""
+    return MinuteGrid(start_time, end_time)
+
+
+def _forward_fill(values: FloatArray, limit: int) -> FloatArray:
+    """Forward-fill NaN runs in place, at most ``limit`` steps past a value."""
+    positions = np.arange(len(values))
+    last_valid = np.where(np.isnan(values), -1, positions)
+    np.maximum.accumulate(last_valid, out=last_valid)
+    fill = (last_valid >= 0) & (positions - last_valid <= limit) & np.isnan(values)
+    values[fill] = values[last_valid[fill]]
+    return values
+
+
+def _interpolate(
+    grid_times: FloatArray, times: FloatArray, values: FloatArray
+) -> FloatArray:
+    """Linear interpolation onto a grid, NaN outside the sampled range."""
+    order = np.argsort(times, kind="stable")
+    return np.interp(grid_times, times[order], values[order], left=np.nan, right=np.nan)
+
+
+def _sample_arrays(source: SampleSource) -> tuple[FloatArray, FloatArray]:
+    """Epoch-second timestamps and values of a modality's samples."""
+    if isinstance(source, HealthSampleArrays):
+        millis = source.timestamps.astype("datetime64[ms]").astype(np.int64)
+        return millis / 1000.0, source.values.astype(np.float64, copy=False)
+
+    count = len(source)
+    times = np.fromiter(
+        (sample.timestamp.timestamp() for sample in source), np.float64, count
+    )
+    values = np.fromiter((sample.value for sample in source), np.float64, count)
+    return times, values
+
+
+class ResamplingEngine:
+    """Resample minute-level modalities onto one shared grid."""
+
+    def __init__(
+        self,
+        hr_bounds: tuple[float, float] = (30, 220),
+        rr_bounds: tuple[float, float] = (5, 60),
+        step_stats: tuple[float, float] = (NHANES_STEP_MEAN, NHANES_STEP_STD),
+    ) -> None:
+        """Initialize the engine.
+
+        Args:
+            hr_bounds: Physiologically plausible heart rate range (bpm)
+            rr_bounds: Physiologically plausible respiratory rate range
+            step_stats: Population mean and std of sqrt(steps per minute)
+        """
+        self.hr_bounds = hr_bounds
+        self.rr_bounds = rr_bounds
+        self.step_stats = step_stats
+
+    def resample(
+        self, sources: Mapping[SeriesModality, SampleSource], grid: MinuteGrid
+    ) -> ResampledSeries:
+        """Resample every modality with samples onto ``grid``.
+
+        Args:
+            sources: Samples per modality (lists of ``HealthDataPoint`` or
+                ``HealthSampleArrays``)
+            grid: Shared minute grid
+
+        Returns:
+            Aligned float32 matrix plus summary statistics
+        """
+        result = ResampledSeries(
+            grid=grid,
+            matrix=np.full(
+                (len(SeriesModality), grid.n_minutes), np.nan, dtype=np.float32
+            ),
+        )
+        kernels = {
+            SeriesModality.HEART_RATE: self._heart_rate,
+            SeriesModality.HRV: self._hrv,
+            SeriesModality.RESPIRATORY_RATE: self._respiratory_rate,
+            SeriesModality.STEPS: self._steps,
+        }
+
+        for modality, source in sources.items():
+            if not len(source):
+                continue
+            times, values = _sample_arrays(source)
+            series = kernels[modality](times, values, grid, result.stats)
+            if series is not None:
+                result.matrix[modality.row] = series
+                result.modalities.add(modality)
+
+        return result
+
+    def _heart_rate(
+        self,
+        times: FloatArray,
+        values: FloatArray,
+        grid: MinuteGrid,
+        stats: dict[str, float],
+    ) -> FloatArray | None:
+        """Bounds filter, interpolation, short-gap fill and low-pass filter."""
+        mask = (values >= self.hr_bounds[0]) & (values <= self.hr_bounds[1])
+        times, values = times[mask], values[mask]
+        if len(values) == 0:
+            return None
+
+        if len(values) > 1:
+            minute_values = _interpolate(grid.timestamps, times, values)
+            _forward_fill(minute_values, HR_FFILL_LIMIT)
+
+            # Butterworth low-pass to remove motion artifacts
+            valid_mask = ~np.isnan(minute_values)
+            if np.sum(valid_mask) > HR_MIN_FILTER_POINTS:
+                b, a = butter_coefficients(HR_FILTER_ORDER, HR_FILTER_CUTOFF)
+                minute_values[valid_mask] = scipy.signal.filtfilt(
+                    b, a, minute_values[valid_mask]
+                )
+        else:
+            minute_values = np.full(grid.n_minutes, values[0])
+
+        valid_values = minute_values[~np.isnan(minute_values)]
+        if len(valid_values) > 0:
+            stats["avg_hr"] = float(np.mean(valid_values))
+            stats["max_hr"] = float(np.max(valid_values))
+            # Resting HR as 5th percentile
+            stats["resting_hr"] = float(np.percentile(valid_values, 5))
+        if len(valid_values) > 1:
+            minute_values = (minute_values - HR_POPULATION_MEAN) / HR_POPULATION_STD
+        return minute_values
+
+    @staticmethod
+    def _hrv(
+        times: FloatArray,
+        values: FloatArray,
+        grid: MinuteGrid,
+        stats: dict[str, float],
+    ) -> FloatArray | None:
+        """Outlier removal, interpolation, gap fill and log transform."""
+        if len(values) > HRV_MIN_OUTLIER_POINTS:
+            mask = values < HRV_OUTLIER_FACTOR * np.median(values)
+            times, values = times[mask], values[mask]
+        if len(values) == 0:
+            return None
+
+        if len(values) > 1:
+            minute_values = _interpolate(grid.timestamps, times, values)
+            _forward_fill(minute_values, HRV_FFILL_LIMIT)
+        else:
+            minute_values = np.full(grid.n_minutes, np.nan)
+
+        valid_values = minute_values[~np.isnan(minute_values)]
+        if len(valid_values) > 0:
+            stats["hrv_median"] = float(np.median(valid_values))
+            # HRV is roughly log-normal; log1p handles zeros
+            minute_values = np.log1p(minute_values)
+        return minute_values
+
+    def _respiratory_rate(
+        self,
+        times: FloatArray,
+        values: FloatArray,
+        grid: MinuteGrid,
+        stats: dict[str, float],
+    ) -> FloatArray | None:
+        """Median-filtered 5-minute series, normalized and upsampled."""
+        mask = (values >= self.rr_bounds[0]) & (values <= self.rr_bounds[1])
+        times, values = times[mask], values[mask]
+        if len(values) == 0:
+            return None
+
+        coarse_times = grid.respiratory_timestamps
+        if len(values) > 1:
+            coarse_values = _interpolate(coarse_times, times, values)
+            if len(coarse_values) > RR_MEDIAN_KERNEL:
+                coarse_values = scipy.signal.medfilt(
+                    coarse_values, kernel_size=RR_MEDIAN_KERNEL
+                )
+        else:
+            coarse_values = np.full(len(coarse_times), values[0])
+
+        valid_values = coarse_values[~np.isnan(coarse_values)]
+        if len(valid_values) > 0:
+            stats["avg_respiratory_rate"] = float(np.mean(valid_values))
+        coarse_values = (coarse_values - RR_POPULATION_MEAN) / RR_POPULATION_STD
+
+        if len(coarse_values) > 1:
+            return _interpolate(grid.timestamps, coarse_times, coarse_values)
+        return np.full(grid.n_minutes, np.nan)
+
+    def _steps(
+        self,
+        times: FloatArray,
+        values: FloatArray,
+        grid: MinuteGrid,
+        stats: dict[str, float],
+    ) -> FloatArray:
+        """Per-minute step totals as a PAT movement proxy."""
+        start, end = grid.start_time.timestamp(), grid.end_time.timestamp()
+        in_range = (times >= start) & (times <= end)
+        minutes = np.floor((times[in_range] - start) / MINUTE_SECONDS).astype(np.intp)
+        weights = values[in_range]
+        keep = minutes < grid.n_minutes
+        minute_steps = np.bincount(
+            minutes[keep], weights=weights[keep], minlength=grid.n_minutes
+        )
+
+        stats["total_steps"] = float(np.sum(minute_steps))
+        # sqrt for variance stabilization, then z-score with NHANES statistics
+        step_mean, step_std = self.step_stats
+        return (np.sqrt(minute_steps) - step_mean) / step_std
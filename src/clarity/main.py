@@ -26,13 +26,20 @@ from clarity.api.v1.health_data import set_dependencies as set_health_data_deps
 from clarity.core.config_adapter import clarity_config_to_settings
 from clarity.core.config_aws import MiddlewareConfig
 from clarity.core.container_aws import get_container, initialize_container
-from clarity.core.logging_config import configure_basic_logging
+from clarity.core.logging_config import (
+    configure_basic_logging,
+    enable_queue_logging,
+    stop_queue_logging,
+)
 from clarity.core.openapi import custom_openapi
+from clarity.middleware.request_logger import ACCESS_LOGGER_NAME
+from clarity.ml.inference_executor import shutdown_inference_executor
 from clarity.ports.config_ports import IConfigProvider
 from clarity.services.gcp_credentials import initialize_gcp_credentials
 from clarity.startup.config_schema import ClarityConfig
 from clarity.startup.orchestrator import StartupOrchestrator
 from clarity.startup.progress_reporter import StartupProgressReporter
+from clarity.storage.async_dynamodb import shutdown_dynamodb_executor
 from clarity.version import get_version
 
 if TYPE_CHECKING:
@@ -189,12 +196,18 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:  # noqa: ARG001
         msg = f"Router dependency configuration failed: {e}"
         raise RuntimeError(msg) from e
 
+    # Access log records are written by a listener thread, not the event loop
+    enable_queue_logging(ACCESS_LOGGER_NAME)
+
     logger.info("✅ CLARITY backend started successfully")
 
     yield
 
     # Cleanup
     logger.info("Shutting down CLARITY backend...")
+    shutdown_inference_executor(wait=False)
+    shutdown_dynamodb_executor(wait=False)
+    stop_queue_logging()
     if _container:
         # Add any cleanup logic here
         pass
@@ -216,13 +229,19 @@ def configure_middleware_from_env(app: FastAPI) -> None:
     # NOTE: Middleware is executed in REVERSE order of registration
     # So SecurityHeadersMiddleware should be added LAST to ensure it runs FIRST
 
-    # Development middleware (runs last)
-    if environment == "development":
-        from clarity.middleware.request_logger import (  # noqa: PLC0415
-            RequestLoggingMiddleware,
-        )
+    # Access log (runs last) - sampled outside development, bodies summarized
+    # only in development
+    from clarity.middleware.request_logger import (  # noqa: PLC0415
+        RequestLoggingMiddleware,
+    )
 
-        app.add_middleware(RequestLoggingMiddleware)
+    default_sample_rate = "1.0" if environment == "development" else "0.1"
+    app.add_middleware(
+        RequestLoggingMiddleware,
+        sample_rate=float(os.getenv("REQUEST_LOG_SAMPLE_RATE", default_sample_rate)),
+        log_bodies=environment == "development",
+        max_body_bytes=int(os.getenv("REQUEST_LOG_MAX_BODY_BYTES", "4096")),
+    )
 
     # Auth middleware if enabled
     if enable_auth:
@@ -2,22 +2,24 @@
 
 This middleware validates Cognito JWT tokens and populates request.state.user
 with the authenticated user context.
+
+It is plain ASGI middleware: the user context is written to the request's
+``scope["state"]`` and the downstream app runs in the same task, so the
+context variable set for Modal compatibility is visible to handlers too.
 """
 
 # removed - breaks FastAPI
 
 import logging
 import os
-from typing import TYPE_CHECKING, Any, cast
+from typing import TYPE_CHECKING
 
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-from starlette.responses import Response
-from starlette.types import ASGIApp
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from clarity.auth.aws_auth_provider import CognitoAuthProvider
 from clarity.auth.modal_auth_fix import set_user_context
-from clarity.models.auth import AuthError
+from clarity.models.auth import AuthError, UserContext
 from clarity.services.dynamodb_service import DynamoDBService
 
 if TYPE_CHECKING:
@@ -46,7 +48,7 @@ PUBLIC_PATHS = {
 }
 
 
-class CognitoAuthMiddleware(BaseHTTPMiddleware):
+class CognitoAuthMiddleware:
     """Middleware to validate Cognito JWT tokens and populate user context."""
 
     def __init__(self, app: ASGIApp) -> None:
@@ -55,7 +57,7 @@ class CognitoAuthMiddleware(BaseHTTPMiddleware):
         Args:
             app: The ASGI application
         """
-        super().__init__(app)
+        self.app = app
 
         # Get configuration from environment
         self.enable_auth = os.getenv("ENABLE_AUTH", "true").lower() == "true"
@@ -84,32 +86,56 @@ class CognitoAuthMiddleware(BaseHTTPMiddleware):
         else:
             logger.warning("Authentication disabled or not configured")
 
-    async def dispatch(self, request: Request, call_next: Any) -> Response:
-        """Process the request and validate JWT token if present.
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Authenticate an HTTP request and continue with the next app.
 
         Args:
-            request: The incoming request
-            call_next: The next middleware or route handler
-
-        Returns:
-            The response from the next handler
+            scope: ASGI connection scope
+            receive: ASGI receive channel
+            send: ASGI send channel
         """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
         # Initialize request state
-        request.state.user = None
+        state = scope.setdefault("state", {})
+        state["user"] = None
+
+        user_context = await self.authenticate(scope)
+        if user_context is not None:
+            # Set user context in request state
+            state["user"] = user_context
+
+            # Also set in contextvars for Modal compatibility
+            set_user_context(user_context)
+
+        # Continue to the next handler
+        await self.app(scope, receive, send)
+
+    async def authenticate(self, scope: Scope) -> UserContext | None:
+        """Validate the request's bearer token, if any.
 
+        Args:
+            scope: ASGI connection scope of the request
+
+        Returns:
+            The authenticated user context, or None if the request carries no
+            valid token or does not need one
+        """
         # Skip auth for public paths
-        if request.url.path in PUBLIC_PATHS:
-            return cast(Response, await call_next(request))
+        if scope["path"] in PUBLIC_PATHS:
+            return None
 
         # Skip auth if disabled
         if not self.enable_auth or not self.auth_provider:
-            return cast(Response, await call_next(request))
+            return None
 
         # Extract token from Authorization header
-        auth_header = request.headers.get("Authorization", "")
+        auth_header = Headers(scope=scope).get("authorization", "")
         if not auth_header.startswith("Bearer "):
             # No auth header, continue without user context
-            return cast(Response, await call_next(request))
+            return None
 
         token = auth_header[7:]  # Remove "Bearer " prefix
 
@@ -128,14 +154,8 @@ class CognitoAuthMiddleware(BaseHTTPMiddleware):
                 user_context = await self.auth_provider.get_or_create_user_context(
                     user_info
                 )
-
-                # Set user context in request state
-                request.state.user = user_context
-
-                # Also set in contextvars for Modal compatibility
-                set_user_context(user_context)
-
                 logger.debug("User authenticated: %s", user_context.user_id)
+                return user_context
 
         except AuthError as e:
             # Log authentication errors but continue
@@ -145,5 +165,4 @@ class CognitoAuthMiddleware(BaseHTTPMiddleware):
             # Log unexpected errors but continue
             logger.exception("Unexpected error during authentication: %s", e)
 
-        # Continue to the next handler
-        return cast(Response, await call_next(request))
+        return None
@@ -1,67 +1,170 @@
-"""Request logging middleware for debugging."""
+"""Sampled, PHI-safe access logging middleware.
+
+Emits one structured ``clarity.access`` record per sampled request (method,
+path, status, duration, request/response sizes) instead of dumping headers
+and bodies.
+
+- the request body is never buffered: bytes are counted as the endpoint
+  reads them, and at most ``max_body_bytes`` are kept for a summary when
+  body logging is enabled
+- body summaries keep only the JSON structure (keys and value types) and go
+  through ``sanitize_for_logging``, so values never reach the log
+- server errors are logged regardless of sampling
+- the app lifespan routes ``clarity.access`` through a ``QueueHandler`` so
+  log I/O happens on a listener thread, not on the event loop
+"""
 
 # removed - breaks FastAPI
 
 import json
 import logging
-from typing import TYPE_CHECKING
-
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
-
-if TYPE_CHECKING:
-    pass
-
-logger = logging.getLogger(__name__)
-
-
-class RequestLoggingMiddleware(BaseHTTPMiddleware):
-    """Middleware to log all incoming requests for debugging."""
-
-    async def dispatch(
-        self, request: Request, call_next: RequestResponseEndpoint
-    ) -> Response:
-        """Log request details before processing."""
-        # Log basic request info
-        logger.warning("🔍 REQUEST: %s %s", request.method, request.url.path)
-        logger.warning("  Headers: %s", dict(request.headers))
-
-        # For POST/PUT/PATCH requests, try to log the body
-        if request.method in {"POST", "PUT", "PATCH"}:
-            try:
-                # Note: After reading body here, we need to make it available to the endpoint
-                body_bytes = await request.body()
-                logger.warning("  Body length: %s bytes", len(body_bytes))
-
-                # Try to decode as UTF-8
-                try:
-                    body_str = body_bytes.decode("utf-8")
-                    logger.warning("  Body preview: %s...", body_str[:200])
-
-                    # Try to parse as JSON
-                    try:
-                        body_json = json.loads(body_str)
-                        logger.warning(
-                            "  Parsed JSON: %s", json.dumps(body_json, indent=2)
-                        )
-                    except json.JSONDecodeError:
-                        logger.warning("  Body is not valid JSON")
-                except UnicodeDecodeError:
-                    logger.warning(
-                        "  Body is not UTF-8, hex preview: %s...",
-                        body_bytes.hex()[:100],
+import random
+import time
+from typing import Any
+
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from clarity.core.secure_logging import sanitize_for_logging
+
+ACCESS_LOGGER_NAME = "clarity.access"
+access_logger = logging.getLogger(ACCESS_LOGGER_NAME)
+
+BODY_METHODS = frozenset({"POST", "PUT", "PATCH"})
+DEFAULT_MAX_BODY_BYTES = 4096
+MAX_SUMMARY_LENGTH = 500
+# Responses with this status or above are logged even when not sampled
+ALWAYS_LOG_STATUS = 500
+
+
+def _shape(value: object) -> object:
+    """Structure of a parsed JSON value with every scalar replaced by its type."""
+    if isinstance(value, dict):
+        return {key: _shape(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return f"[list:{len(value)}]"
+    return type(value).__name__
+
+
+def summarize_body(body: bytes, total_bytes: int, content_type: str) -> str:
+    """PHI-safe summary of a request body.
+
+    Args:
+        body: Captured prefix of the body
+        total_bytes: Full size of the body
+        content_type: Request content type
+
+    Returns:
+        Structure of a JSON object body, otherwise only its size
+    """
+    if total_bytes > len(body) or "json" not in content_type:
+        return f"[{total_bytes} bytes]"
+
+    try:
+        parsed = json.loads(body)
+    except ValueError:
+        return f"[{total_bytes} bytes, invalid JSON]"
+
+    return sanitize_for_logging(_shape(parsed))[:MAX_SUMMARY_LENGTH]
+
+
+class RequestLoggingMiddleware:
+    """Middleware writing a sampled access log."""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        *,
+        sample_rate: float = 1.0,
+        log_bodies: bool = False,
+        max_body_bytes: int = DEFAULT_MAX_BODY_BYTES,
+    ) -> None:
+        """Initialize the request logging middleware.
+
+        Args:
+            app: The ASGI application
+            sample_rate: Fraction of requests logged (0.0 - 1.0)
+            log_bodies: Whether sampled POST/PUT/PATCH bodies are summarized
+            max_body_bytes: Largest body kept for a summary; bigger bodies
+                are only counted
+        """
+        if not 0.0 <= sample_rate <= 1.0:
+            msg = f"sample_rate must be between 0 and 1, got {sample_rate}"
+            raise ValueError(msg)
+
+        self.app = app
+        self.sample_rate = sample_rate
+        self.log_bodies = log_bodies
+        self.max_body_bytes = max_body_bytes
+
+    def _sampled(self) -> bool:
+        if self.sample_rate >= 1.0:
+            return True
+        return random.random() < self.sample_rate  # noqa: S311 - not security
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Process the request and log it once it has completed."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        sampled = self._sampled()
+        capture = sampled and self.log_bodies and scope["method"] in BODY_METHODS
+        start = time.perf_counter()
+        request_bytes = 0
+        response_bytes = 0
+        status = ALWAYS_LOG_STATUS
+        captured = bytearray()
+
+        async def counting_receive() -> Message:
+            nonlocal request_bytes
+            message = await receive()
+            if message["type"] == "http.request":
+                chunk = message.get("body", b"")
+                request_bytes += len(chunk)
+                if capture and len(captured) <= self.max_body_bytes:
+                    captured.extend(chunk[: self.max_body_bytes + 1 - len(captured)])
+            return message
+
+        async def counting_send(message: Message) -> None:
+            nonlocal status, response_bytes
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            elif message["type"] == "http.response.body":
+                response_bytes += len(message.get("body", b""))
+            await send(message)
+
+        try:
+            await self.app(scope, counting_receive, counting_send)
+        finally:
+            if sampled or status >= ALWAYS_LOG_STATUS:
+                fields: dict[str, Any] = {
+                    "method": scope["method"],
+                    "path": scope["path"],
+                    "status": status,
+                    "duration_ms": round((time.perf_counter() - start) * 1000, 2),
+                    "request_bytes": request_bytes,
+                    "response_bytes": response_bytes,
+                }
+                if capture:
+                    content_type = Headers(scope=scope).get("content-type", "")
+                    fields["body"] = summarize_body(
+                        bytes(captured[: self.max_body_bytes]),
+                        request_bytes,
+                        content_type,
                     )
-
-                # Store body for the endpoint to use
-                request._body = body_bytes  # noqa: SLF001
-
-            except Exception as e:
-                logger.exception("  Failed to read request body: %s", e)
-
-        # Process the request
-        response = await call_next(request)
-
-        # Log response status
-        logger.warning("  Response: %s", response.status_code)
-
-        return response
+                self._log(fields)
+
+    @staticmethod
+    def _log(fields: dict[str, Any]) -> None:
+        access_logger.info(
+            "%s %s %d %.2fms in=%dB out=%dB%s",
+            fields["method"],
+            fields["path"],
+            fields["status"],
+            fields["duration_ms"],
+            fields["request_bytes"],
+            fields["response_bytes"],
+            f" body={fields['body']}" if "body" in fields else "",
+            extra={"access": fields},
+        )
@@ -2,6 +2,10 @@
 
 Prevents denial-of-service attacks by enforcing request body size limits
 across all endpoints. Configurable limits based on content type and environment.
+
+Limits are enforced twice: up front from ``Content-Length`` and while the body
+streams in, so chunked uploads and understated lengths are cut off once they
+pass the limit instead of being read into memory first.
 """
 
 # removed - breaks FastAPI
@@ -9,18 +13,44 @@ across all endpoints. Configurable limits based on content type and environment.
 import logging
 from typing import TYPE_CHECKING
 
-from fastapi import Request, Response, status
+from fastapi import status
 from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
-from starlette.types import ASGIApp
+from starlette.datastructures import Headers
+from starlette.exceptions import HTTPException
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 if TYPE_CHECKING:
     pass
 
 logger = logging.getLogger(__name__)
 
+BODY_METHODS = frozenset({"POST", "PUT", "PATCH"})
+BYTES_PER_MB = 1024 * 1024
+
+
+class PayloadTooLargeError(HTTPException):
+    """Raised from ``receive`` once a streamed body exceeds its limit.
+
+    An ``HTTPException`` so FastAPI's body parsing re-raises it and the app's
+    exception handlers answer with 413.
+    """
+
+    def __init__(self, limit: int, received: int) -> None:
+        """Initialize the error.
+
+        Args:
+            limit: Size limit in bytes
+            received: Bytes received when the limit was crossed
+        """
+        super().__init__(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"Request payload too large: limit is {limit / BYTES_PER_MB:.1f}MB",
+        )
+        self.limit = limit
+        self.received = received
+
 
-class RequestSizeLimiterMiddleware(BaseHTTPMiddleware):
+class RequestSizeLimiterMiddleware:
     """Middleware to enforce request body size limits for DoS protection.
 
     Prevents attackers from overwhelming the server with massive request payloads.
@@ -44,7 +74,7 @@ class RequestSizeLimiterMiddleware(BaseHTTPMiddleware):
             max_upload_size: Maximum size for file uploads in bytes
             max_form_size: Maximum size for form data in bytes
         """
-        super().__init__(app)
+        self.app = app
         self.max_request_size = max_request_size
         self.max_json_size = max_json_size
         self.max_upload_size = max_upload_size
@@ -67,16 +97,16 @@ class RequestSizeLimiterMiddleware(BaseHTTPMiddleware):
             "🔒 Request Size Limiter: Form max size: %d KB", max_form_size // 1024
         )
 
-    def _get_size_limit(self, request: Request) -> int:
+    def _get_size_limit(self, headers: Headers) -> int:
         """Determine the appropriate size limit based on request content type.
 
         Args:
-            request: Incoming HTTP request
+            headers: Incoming HTTP request headers
 
         Returns:
             Maximum allowed size in bytes for this request type
         """
-        content_type = request.headers.get("content-type", "").lower()
+        content_type = headers.get("content-type", "").lower()
 
         # File upload endpoints - higher limit
         if "multipart/form-data" in content_type:
@@ -90,72 +120,109 @@ class RequestSizeLimiterMiddleware(BaseHTTPMiddleware):
         # Default limit for unknown content types
         return self.max_request_size
 
-    async def dispatch(
-        self, request: Request, call_next: RequestResponseEndpoint
-    ) -> Response:
-        """Check request size before processing.
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Check request size before and while the body is received.
 
         Args:
-            request: Incoming HTTP request
-            call_next: Next middleware/endpoint in chain
+            scope: ASGI connection scope
+            receive: ASGI receive channel
+            send: ASGI send channel
+        """
+        # Only check requests with bodies (POST, PUT, PATCH)
+        if scope["type"] != "http" or scope["method"] not in BODY_METHODS:
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
+        limit = self._get_size_limit(headers)
+
+        # Check Content-Length header first (fastest check)
+        content_length = headers.get("content-length")
+        if content_length:
+            try:
+                size = int(content_length)
+            except ValueError:
+                # Invalid Content-Length header
+                logger.warning("Invalid Content-Length header: %s", content_length)
+            else:
+                if size > limit:
+                    response = self._too_large_response(scope, headers, limit, size)
+                    await response(scope, receive, send)
+                    return
+
+        # Count the body as it streams in
+        received = 0
+        response_started = False
+
+        async def limited_receive() -> Message:
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > limit:
+                    raise PayloadTooLargeError(limit, received)
+            return message
+
+        async def tracking_send(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        try:
+            await self.app(scope, limited_receive, tracking_send)
+        except PayloadTooLargeError as e:
+            # Apps without an HTTPException handler let the error through
+            if response_started:
+                raise
+            response = self._too_large_response(scope, headers, e.limit, e.received)
+            await response(scope, receive, send)
+
+    @staticmethod
+    def _too_large_response(
+        scope: Scope, headers: Headers, limit: int, size: int
+    ) -> JSONResponse:
+        """Build the 413 response for an oversized request.
+
+        Args:
+            scope: ASGI connection scope
+            headers: Request headers
+            limit: Size limit in bytes
+            size: Declared or received size in bytes
 
         Returns:
-            HTTP response (413 if payload too large, otherwise normal response)
+            413 Payload Too Large response with security headers
         """
-        # Debug logging to see if middleware is called
-        logger.info("🔍 Request Size Limiter: %s %s", request.method, request.url.path)
+        limit_mb = limit / BYTES_PER_MB
+        size_mb = size / BYTES_PER_MB
+
+        # Log security incident
+        logger.warning(
+            "🚨 Request size limit exceeded: %.2f MB > %.2f MB limit for %s %s",
+            size_mb,
+            limit_mb,
+            scope["method"],
+            scope["path"],
+        )
 
-        # Only check requests with bodies (POST, PUT, PATCH)
-        if request.method in {"POST", "PUT", "PATCH"}:
-            # Check Content-Length header first (fastest check)
-            content_length = request.headers.get("content-length")
-            if content_length:
-                try:
-                    size = int(content_length)
-                    limit = self._get_size_limit(request)
-
-                    if size > limit:
-                        limit_mb = limit / (1024 * 1024)
-                        size_mb = size / (1024 * 1024)
-
-                        # Log security incident
-                        logger.warning(
-                            "🚨 Request size limit exceeded: %.2f MB > %.2f MB limit for %s %s",
-                            size_mb,
-                            limit_mb,
-                            request.method,
-                            request.url.path,
-                        )
-
-                        # Return 413 Payload Too Large with security headers
-                        from clarity.middleware.security_headers import (  # noqa: PLC0415
-                            SecurityHeadersMiddleware,
-                        )
-
-                        response = JSONResponse(
-                            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
-                            content={
-                                "error": "Request payload too large",
-                                "max_size_mb": round(limit_mb, 2),
-                                "received_size_mb": round(size_mb, 2),
-                                "content_type": request.headers.get(
-                                    "content-type", "unknown"
-                                ),
-                                "message": f"Request size {size_mb:.1f}MB exceeds {limit_mb:.1f}MB limit",
-                            },
-                            headers={"Retry-After": "3600"},  # Suggest retry in 1 hour
-                        )
-
-                        # Add security headers to the response
-                        SecurityHeadersMiddleware.add_security_headers_to_response(
-                            response
-                        )
-
-                        return response
-
-                except ValueError:
-                    # Invalid Content-Length header
-                    logger.warning("Invalid Content-Length header: %s", content_length)
-
-        # Process request normally if size is acceptable
-        return await call_next(request)
+        # Return 413 Payload Too Large with security headers
+        from clarity.middleware.security_headers import (  # noqa: PLC0415
+            SecurityHeadersMiddleware,
+        )
+
+        response = JSONResponse(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            content={
+                "error": "Request payload too large",
+                "max_size_mb": round(limit_mb, 2),
+                "received_size_mb": round(size_mb, 2),
+                "content_type": headers.get("content-type", "unknown"),
+                "message": f"Request size {size_mb:.1f}MB exceeds {limit_mb:.1f}MB limit",
+            },
+            headers={"Retry-After": "3600"},  # Suggest retry in 1 hour
+        )
+
+        # Add security headers to the response
+        SecurityHeadersMiddleware.add_security_headers_to_response(response)
+
+        return response
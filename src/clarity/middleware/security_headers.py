@@ -2,6 +2,10 @@
 
 This middleware adds security headers to all HTTP responses to enhance security posture.
 Implements OWASP recommended security headers for API protection.
+
+Implemented as plain ASGI middleware: headers are added to the
+``http.response.start`` message as it passes, so responses (including
+streaming ones) are never buffered or re-wrapped.
 """
 
 # removed - breaks FastAPI
@@ -9,10 +13,9 @@ Implements OWASP recommended security headers for API protection.
 import logging
 from typing import TYPE_CHECKING
 
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
-from starlette.requests import Request
+from starlette.datastructures import MutableHeaders
 from starlette.responses import Response
-from starlette.types import ASGIApp
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 if TYPE_CHECKING:
     pass
@@ -22,8 +25,23 @@ logger = logging.getLogger(__name__)
 # Paths that require relaxed CSP for documentation/UI functionality
 DOCS_AND_STATIC_PATHS = ("/api/v1/docs", "/static/", "/docs", "/redoc")
 
-
-class SecurityHeadersMiddleware(BaseHTTPMiddleware):
+RELAXED_CSP_POLICY = (
+    "default-src 'self'; "
+    "script-src 'self' 'unsafe-inline'; "
+    "style-src 'self' 'unsafe-inline'; "
+    "img-src 'self' data:; "
+    "font-src 'self' data:; "
+    "connect-src 'self'; "
+    "frame-ancestors 'none';"
+)
+PERMISSIONS_POLICY = (
+    "camera=(), microphone=(), geolocation=(), "
+    "payment=(), usb=(), magnetometer=(), "
+    "accelerometer=(), gyroscope=()"
+)
+
+
+class SecurityHeadersMiddleware:
     """Middleware to add security headers to all responses.
 
     Implements industry-standard security headers to protect against common attacks:
@@ -56,7 +74,7 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
             csp_policy: Custom CSP policy (default: API-specific policy)
             cache_control: Cache control header value
         """
-        super().__init__(app)
+        self.app = app
         self.enable_hsts = enable_hsts
         self.hsts_max_age = hsts_max_age
         self.hsts_include_subdomains = hsts_include_subdomains
@@ -64,6 +82,10 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
         self.csp_policy = csp_policy or 'default-src "none"; frame-ancestors "none";'
         self.cache_control = cache_control
 
+        # Header sets are fixed per instance, so build them once
+        self._headers = self._build_headers(self.csp_policy)
+        self._relaxed_headers = self._build_headers(RELAXED_CSP_POLICY)
+
         # Log configuration
         logger.info(
             "SecurityHeadersMiddleware initialized - HSTS: %s, CSP: %s",
@@ -71,25 +93,33 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
             self.enable_csp,
         )
 
-    async def dispatch(
-        self, request: Request, call_next: RequestResponseEndpoint
-    ) -> Response:
-        """Process the request and add security headers to the response.
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Add security headers to the response of an HTTP request.
 
         Args:
-            request: The incoming request
-            call_next: The next middleware or endpoint handler
-
-        Returns:
-            Response with security headers added
+            scope: ASGI connection scope
+            receive: ASGI receive channel
+            send: ASGI send channel
         """
-        # Process the request
-        response = await call_next(request)
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # Docs and static assets need a relaxed CSP to render
+        headers = (
+            self._relaxed_headers
+            if scope["path"].startswith(DOCS_AND_STATIC_PATHS)
+            else self._headers
+        )
 
-        # Add security headers
-        self._add_security_headers(request, response)
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                response_headers = MutableHeaders(scope=message)
+                for name, value in headers:
+                    response_headers[name] = value
+            await send(message)
 
-        return response
+        await self.app(scope, receive, send_with_headers)
 
     @staticmethod
     def add_security_headers_to_response(
@@ -123,15 +153,7 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
                     'default-src "none"; frame-ancestors "none";'
                 )
             else:
-                response.headers["Content-Security-Policy"] = (
-                    "default-src 'self'; "
-                    "script-src 'self' 'unsafe-inline'; "
-                    "style-src 'self' 'unsafe-inline'; "
-                    "img-src 'self' data:; "
-                    "font-src 'self' data:; "
-                    "connect-src 'self'; "
-                    "frame-ancestors 'none';"
-                )
+                response.headers["Content-Security-Policy"] = RELAXED_CSP_POLICY
 
         # XSS Protection (legacy but still useful)
         response.headers["X-XSS-Protection"] = "1; mode=block"
@@ -143,59 +165,37 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
         response.headers["Cache-Control"] = cache_control
 
         # Permissions Policy
-        response.headers["Permissions-Policy"] = (
-            "camera=(), microphone=(), geolocation=(), "
-            "payment=(), usb=(), magnetometer=(), "
-            "accelerometer=(), gyroscope=()"
-        )
+        response.headers["Permissions-Policy"] = PERMISSIONS_POLICY
 
-    def _add_security_headers(self, request: Request, response: Response) -> None:
-        """Add security headers to the response.
+    def _build_headers(self, csp_policy: str) -> list[tuple[str, str]]:
+        """Security headers for responses under the given CSP policy.
 
         Args:
-            request: The request object to check path
-            response: The response object to add headers to
-        """
-        # Determine if this request needs relaxed CSP
-        path = str(request.url.path)
-        needs_relaxed_csp = path.startswith(DOCS_AND_STATIC_PATHS)
+            csp_policy: Content Security Policy to send when CSP is enabled
 
-        # If CSP is enabled, determine the policy to use
+        Returns:
+            Header name/value pairs
+        """
+        headers: list[tuple[str, str]] = []
         if self.enable_csp:
-            if needs_relaxed_csp:
-                # Use relaxed CSP for docs/static paths
-                csp_header = (
-                    "default-src 'self'; "
-                    "script-src 'self' 'unsafe-inline'; "
-                    "style-src 'self' 'unsafe-inline'; "
-                    "img-src 'self' data:; "
-                    "font-src 'self' data:; "
-                    "connect-src 'self'; "
-                    "frame-ancestors 'none';"
-                )
-            else:
-                # Use configured CSP policy for all other paths
-                csp_header = self.csp_policy
-            response.headers["Content-Security-Policy"] = csp_header
+            headers.append(("Content-Security-Policy", csp_policy))
 
-        # Add other security headers
-        response.headers["X-Content-Type-Options"] = "nosniff"
-        response.headers["X-Frame-Options"] = "DENY"
-        response.headers["X-XSS-Protection"] = "1; mode=block"
-        response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
-        response.headers["Cache-Control"] = self.cache_control
-        response.headers["Permissions-Policy"] = (
-            "camera=(), microphone=(), geolocation=(), "
-            "payment=(), usb=(), magnetometer=(), "
-            "accelerometer=(), gyroscope=()"
-        )
+        headers.extend([
+            ("X-Content-Type-Options", "nosniff"),
+            ("X-Frame-Options", "DENY"),
+            ("X-XSS-Protection", "1; mode=block"),
+            ("Referrer-Policy", "strict-origin-when-cross-origin"),
+            ("Cache-Control", self.cache_control),
+            ("Permissions-Policy", PERMISSIONS_POLICY),
+        ])
 
         # Add HSTS if enabled (this is instance-specific)
         if self.enable_hsts:
             hsts_value = f"max-age={self.hsts_max_age}"
             if self.hsts_include_subdomains:
                 hsts_value += "; includeSubDomains"
-            response.headers["Strict-Transport-Security"] = hsts_value
+            headers.append(("Strict-Transport-Security", hsts_value))
+        return headers
 
 
 # Convenience function for easy registration
@@ -6,12 +6,15 @@ Integrates preprocessing, modality processors, fusion, and PAT model.
 
 # removed - breaks FastAPI
 
+import asyncio
+from collections.abc import Awaitable
 from datetime import UTC, datetime, timedelta
 from decimal import Decimal
+from itertools import starmap
 import logging
 import os
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, TypeVar
 
 from boto3.dynamodb.conditions import Key
 import numpy as np
@@ -37,6 +40,7 @@ from clarity.models.health_data import (
     HealthMetricType,
     SleepData,
 )
+from clarity.monitoring.phase_timing import PhaseTimings, collect_phases, phase
 from clarity.storage.dynamodb_client import DynamoDBHealthDataRepository
 
 # Constants
@@ -45,6 +49,8 @@ MIN_METRICS_FOR_TIME_SPAN = 2
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 
 class AnalysisResults:
     """Container for analysis pipeline results."""
@@ -71,6 +77,12 @@ class HealthAnalysisPipeline:
     3. PAT model inference for activity data
     4. Multi-modal fusion
     5. Summary statistics generation
+
+    Modalities are independent, so steps 2 and 3 run concurrently: synchronous
+    feature extraction is offloaded to worker threads and PAT inference goes
+    through the inference executor. Every step is timed as a phase (see
+    ``clarity.monitoring.phase_timing``): durations go to Prometheus and, while
+    phase timing is enabled, into ``processing_metadata["stage_timings_ms"]``.
     """
 
     # Constants
@@ -123,6 +135,27 @@ class HealthAnalysisPipeline:
         Returns:
             AnalysisResults object with all computed features
         """
+        with collect_phases() as timings:
+            with phase("total"):
+                results = await self._run_pipeline(
+                    user_id, health_metrics, processing_id, timings
+                )
+            if timings is not None:
+                # Refresh the breakdown with the phases that ran after it was
+                # stored (DynamoDB write, total)
+                results.processing_metadata["stage_timings_ms"] = (
+                    timings.as_milliseconds()
+                )
+        return results
+
+    async def _run_pipeline(
+        self,
+        user_id: str,
+        health_metrics: list[HealthMetric],
+        processing_id: str | None,
+        timings: PhaseTimings | None,
+    ) -> AnalysisResults:
+        """Run every pipeline step for one upload."""
         try:
             self.logger.info(
                 "🔬 Starting analysis pipeline for user %s with %d metrics",
@@ -134,48 +167,34 @@ class HealthAnalysisPipeline:
             modality_features: dict[str, list[float]] = {}
 
             # Step 1: Organize metrics by modality
-            organized_data = self._organize_metrics_by_modality(health_metrics)
+            with phase("organize"):
+                organized_data = self._organize_metrics_by_modality(health_metrics)
 
-            # Step 2: Process each modality
-            if organized_data["cardio"]:
-                self.logger.info("Processing cardiovascular data...")
-                cardio_features = await self._process_cardio_data(
-                    organized_data["cardio"]
+            # Step 2: Process all modalities concurrently
+            with phase("modalities"):
+                modality_outputs = await self._process_modalities(
+                    user_id, organized_data
                 )
-                results.cardio_features = cardio_features
-                modality_features["cardio"] = cardio_features
 
-            if organized_data["respiratory"]:
-                self.logger.info("Processing respiratory data...")
-                respiratory_features = await self._process_respiratory_data(
-                    organized_data["respiratory"]
-                )
-                results.respiratory_features = respiratory_features
-                modality_features["respiratory"] = respiratory_features
+            # Collect results in a fixed modality order for fusion
+            if "cardio" in modality_outputs:
+                results.cardio_features = modality_outputs["cardio"]
+                modality_features["cardio"] = results.cardio_features
 
-            if organized_data["activity"]:
-                self.logger.info(
-                    "Processing activity data with both basic features and PAT model..."
-                )
+            if "respiratory" in modality_outputs:
+                results.respiratory_features = modality_outputs["respiratory"]
+                modality_features["respiratory"] = results.respiratory_features
 
-                # First, extract basic activity features using ActivityProcessor
-                activity_features = self.activity_processor.process(
-                    organized_data["activity"]
-                )
+            if "activity" in modality_outputs:
+                activity_features, activity_embedding = modality_outputs["activity"]
                 results.activity_features = (
                     activity_features  # 🔥 ADDED: Store basic activity features
                 )
-
-                # Then process with PAT model for advanced analysis
-                activity_embedding = await self._process_activity_data(
-                    user_id, organized_data["activity"]
-                )
                 results.activity_embedding = activity_embedding
                 modality_features["activity"] = activity_embedding
 
-            if organized_data["sleep"]:
-                self.logger.info("🚀 Processing sleep data with SleepProcessor...")
-                sleep_features = self.sleep_processor.process(organized_data["sleep"])
+            if "sleep" in modality_outputs:
+                sleep_features = modality_outputs["sleep"]
                 results.sleep_features = sleep_features.__dict__
 
                 # Convert sleep features to vector for fusion
@@ -185,20 +204,22 @@ class HealthAnalysisPipeline:
                 modality_features["sleep"] = sleep_vector
 
             # Step 3: Fuse modalities if we have multiple
-            if len(modality_features) > 1:
-                self.logger.info("Fusing %d modalities...", len(modality_features))
-                fused_vector = await self._fuse_modalities(modality_features)
-                results.fused_vector = fused_vector
-            elif len(modality_features) == 1:
-                # Single modality - use it as the fused vector
-                results.fused_vector = next(iter(modality_features.values()))
+            with phase("fusion"):
+                if len(modality_features) > 1:
+                    self.logger.info("Fusing %d modalities...", len(modality_features))
+                    fused_vector = await self._fuse_modalities(modality_features)
+                    results.fused_vector = fused_vector
+                elif len(modality_features) == 1:
+                    # Single modality - use it as the fused vector
+                    results.fused_vector = next(iter(modality_features.values()))
 
             # Step 4: Generate summary statistics
-            results.summary_stats = self._generate_summary_stats(
-                organized_data,
-                modality_features,
-                results.activity_features,  # 🔥 Pass activity features
-            )
+            with phase("summary"):
+                results.summary_stats = self._generate_summary_stats(
+                    organized_data,
+                    modality_features,
+                    results.activity_features,  # 🔥 Pass activity features
+                )
 
             # Step 5: Mania risk analysis - ALWAYS include in output for API consistency
 
@@ -213,10 +234,9 @@ class HealthAnalysisPipeline:
             # Check if mania risk analysis is enabled via feature flag
             if is_feature_enabled("mania_risk_analysis", user_id=user_id):
                 try:
-                    mania_result = await self._analyze_mania_risk(
-                        user_id,
-                        results,
-                        organized_data,
+                    mania_result = await self._timed(
+                        "mania_risk",
+                        self._analyze_mania_risk(user_id, results, organized_data),
                     )
 
                     # Update with actual results
@@ -267,6 +287,10 @@ class HealthAnalysisPipeline:
                 ),
                 "processing_id": processing_id,
             }
+            if timings is not None:
+                results.processing_metadata["stage_timings_ms"] = (
+                    timings.as_milliseconds()
+                )
 
             # Step 8: Save analysis results to DynamoDB if processing_id provided
             if processing_id:
@@ -307,7 +331,10 @@ class HealthAnalysisPipeline:
                         "created_at": timestamp.isoformat(),
                     }
 
-                    dynamodb_client.table.put_item(Item=analysis_item)
+                    with phase("dynamodb_write"):
+                        await dynamodb_client.async_table.put_item(
+                            Item=analysis_item
+                        )
                     self.logger.info(
                         "✅ Analysis results saved to DynamoDB: %s", processing_id
                     )
@@ -324,6 +351,69 @@ class HealthAnalysisPipeline:
             )
             return results
 
+    async def _process_modalities(
+        self,
+        user_id: str,
+        organized_data: dict[str, list[HealthMetric]],
+    ) -> dict[str, Any]:
+        """Run feature extraction for every present modality concurrently.
+
+        Each modality is timed as its own phase.
+
+        Args:
+            user_id: User identifier
+            organized_data: Metrics grouped by modality
+
+        Returns:
+            Mapping of modality name to its processor output
+        """
+        stages: dict[str, Awaitable[Any]] = {}
+        if organized_data["cardio"]:
+            stages["cardio"] = self._process_cardio_data(organized_data["cardio"])
+        if organized_data["respiratory"]:
+            stages["respiratory"] = self._process_respiratory_data(
+                organized_data["respiratory"]
+            )
+        if organized_data["activity"]:
+            stages["activity"] = self._process_activity_modality(
+                user_id, organized_data["activity"]
+            )
+        if organized_data["sleep"]:
+            stages["sleep"] = self._process_sleep_data(organized_data["sleep"])
+
+        if not stages:
+            return {}
+
+        self.logger.info("Processing modalities concurrently: %s", ", ".join(stages))
+        outputs = await asyncio.gather(*starmap(self._timed, stages.items()))
+        return dict(zip(stages, outputs, strict=True))
+
+    @staticmethod
+    async def _timed(stage: str, awaitable: Awaitable[T]) -> T:
+        """Await a pipeline stage as a timed phase."""
+        with phase(stage):
+            return await awaitable
+
+    async def _process_activity_modality(
+        self,
+        user_id: str,
+        activity_metrics: list[HealthMetric],
+    ) -> tuple[list[dict[str, Any]], list[float]]:
+        """Extract basic activity features and the PAT embedding concurrently."""
+        return await asyncio.gather(
+            self._timed(
+                "activity_features",
+                asyncio.to_thread(self.activity_processor.process, activity_metrics),
+            ),
+            self._timed("pat", self._process_activity_data(user_id, activity_metrics)),
+        )
+
+    async def _process_sleep_data(
+        self, sleep_metrics: list[HealthMetric]
+    ) -> SleepFeatures:
+        """Process sleep metrics."""
+        return await asyncio.to_thread(self.sleep_processor.process, sleep_metrics)
+
     def _organize_metrics_by_modality(
         self, metrics: list[HealthMetric]
     ) -> dict[str, list[HealthMetric]]:
@@ -421,8 +511,12 @@ class HealthAnalysisPipeline:
                 hrv_timestamps.append(metric.created_at)
                 hrv_values.append(float(metric.biometric_data.heart_rate_variability))
 
-        return self.cardio_processor.process(
-            hr_timestamps, hr_values, hrv_timestamps, hrv_values
+        return await asyncio.to_thread(
+            self.cardio_processor.process,
+            hr_timestamps,
+            hr_values,
+            hrv_timestamps,
+            hrv_values,
         )
 
     async def _process_respiratory_data(
@@ -457,8 +551,12 @@ class HealthAnalysisPipeline:
                 spo2_timestamps.append(metric.created_at)
                 spo2_values.append(float(metric.biometric_data.oxygen_saturation))
 
-        return self.respiratory_processor.process(
-            rr_timestamps, rr_values, spo2_timestamps, spo2_values
+        return await asyncio.to_thread(
+            self.respiratory_processor.process,
+            rr_timestamps,
+            rr_values,
+            spo2_timestamps,
+            spo2_values,
         )
 
     async def _process_activity_data(
@@ -825,14 +923,15 @@ class HealthAnalysisPipeline:
             start_date = end_date - timedelta(days=self.MAX_BASELINE_DAYS)
 
             # Query for the most recent 28 days of analysis data
-            response = dynamodb_client.table.query(
-                KeyConditionExpression=Key("pk").eq(f"USER#{user_id}")
-                & Key("sk").between(
-                    f"ANALYSIS#{start_date.isoformat()}",
-                    f"ANALYSIS#{end_date.isoformat()}",
-                ),
-                ScanIndexForward=False,  # Get most recent items first (descending order)
-            )
+            with phase("baseline_fetch"):
+                response = await dynamodb_client.async_table.query(
+                    KeyConditionExpression=Key("pk").eq(f"USER#{user_id}")
+                    & Key("sk").between(
+                        f"ANALYSIS#{start_date.isoformat()}",
+                        f"ANALYSIS#{end_date.isoformat()}",
+                    ),
+                    ScanIndexForward=False,  # Most recent items first (descending)
+                )
 
             # If we got more than 28 items, take only the most recent 28
             items = response.get("Items", [])
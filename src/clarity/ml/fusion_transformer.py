@@ -6,14 +6,19 @@ using transformer-based attention mechanisms for cross-modal interactions.
 
 # removed - breaks FastAPI
 
+from collections.abc import Mapping, Sequence
 import logging
 
+import numpy as np
+import numpy.typing as npt
 from pydantic import BaseModel, Field
 import torch
 from torch import nn
 
 logger = logging.getLogger(__name__)
 
+FEATURE_MATRIX_NDIM = 2  # (batch_size, feature_dim)
+
 
 class FusionConfig(BaseModel):
     """Configuration for FusionTransformer."""
@@ -45,12 +50,10 @@ class FusionTransformer(nn.Module):
         self.modality_names = list(config.modality_dims.keys())
 
         # Linear projection for each modality to common embedding dimension
-        self.modality_projections = nn.ModuleDict(
-            {
-                name: nn.Linear(dim, config.embed_dim)
-                for name, dim in config.modality_dims.items()
-            }
-        )
+        self.modality_projections = nn.ModuleDict({
+            name: nn.Linear(dim, config.embed_dim)
+            for name, dim in config.modality_dims.items()
+        })
 
         # Learnable [CLS] token embedding
         self.cls_token = nn.Parameter(torch.zeros(1, 1, config.embed_dim))
@@ -60,6 +63,12 @@ class FusionTransformer(nn.Module):
             len(config.modality_dims) + 1,
             config.embed_dim,  # +1 for CLS token
         )
+        # Position 0 is the CLS token, modality i (in config order) is i + 1
+        self.register_buffer(
+            "position_ids",
+            torch.arange(len(config.modality_dims) + 1),
+            persistent=False,
+        )
 
         # Transformer encoder layers
         encoder_layer = nn.TransformerEncoderLayer(
@@ -98,68 +107,78 @@ class FusionTransformer(nn.Module):
         nn.init.xavier_uniform_(self.output_projection.weight)
         nn.init.zeros_(self.output_projection.bias)
 
-    def forward(self, inputs: dict[str, torch.Tensor]) -> torch.Tensor:
+    def forward(
+        self,
+        inputs: Mapping[str, torch.Tensor],
+        present: Mapping[str, torch.Tensor] | None = None,
+    ) -> torch.Tensor:
         """Forward pass through fusion transformer.
 
+        Every configured modality gets a token at a fixed position. Modalities
+        missing from ``inputs``, or marked absent for a row in ``present``, are
+        hidden from attention with a key padding mask; rows without any
+        present modality fuse to a zero vector.
+
         Args:
             inputs: Dictionary mapping modality names to feature tensors
                    Each tensor should have shape (batch_size, feature_dim)
+            present: Optional boolean tensors of shape (batch_size,) per
+                   modality marking which rows carry that modality
 
         Returns:
             Unified health state vector of shape (batch_size, output_dim)
         """
-        batch_size = None
-        modality_tokens = []
-
-        # Process each modality
-        for i, (modality_name, features) in enumerate(inputs.items()):
+        for modality_name in inputs:
             if modality_name not in self.modality_projections:
                 logger.warning("Unknown modality: %s, skipping", modality_name)
-                continue
-
-            if batch_size is None:
-                batch_size = features.size(0)
 
-            # Project modality features to common embedding space
-            projected = self.modality_projections[modality_name](
-                features
-            )  # (batch, embed_dim)
-
-            # Add positional embedding for this modality
-            pos_id = torch.tensor(
-                i + 1, device=features.device
-            )  # +1 because 0 is for CLS
-            pos_embedding = self.modality_embeddings(pos_id)  # (embed_dim,)
-            projected += pos_embedding.unsqueeze(0)  # Broadcast to (batch, embed_dim)
-
-            # Add sequence dimension: (batch, 1, embed_dim)
-            modality_tokens.append(projected.unsqueeze(1))
-
-        if not modality_tokens:
+        known = [name for name in self.modality_names if name in inputs]
+        if not known:
             # No valid modalities, return zero vector
-            return torch.zeros(batch_size or 1, self.config.output_dim)
-
-        # Concatenate all modality tokens
-        modality_sequence = torch.cat(
-            modality_tokens, dim=1
-        )  # (batch, num_modalities, embed_dim)
+            batch_size = next(iter(inputs.values())).size(0) if inputs else 1
+            return torch.zeros(batch_size, self.config.output_dim)
 
-        # Prepare CLS token
-        cls_tokens = self.cls_token.expand(batch_size, 1, -1)  # type: ignore[arg-type]  # (batch, 1, embed_dim)
+        reference = inputs[known[0]]
+        batch_size = reference.size(0)
+        device = reference.device
 
-        # Add CLS positional embedding
-        cls_pos_embedding = self.modality_embeddings(
-            torch.tensor(0, device=cls_tokens.device)
+        # (batch, 1 + num_modalities) - True hides the token from attention
+        padding_mask = torch.ones(
+            batch_size, len(self.modality_names) + 1, dtype=torch.bool, device=device
         )
-        cls_tokens += cls_pos_embedding.unsqueeze(0).unsqueeze(0)
+        padding_mask[:, 0] = False  # CLS token is always attended
+        tokens = torch.zeros(
+            batch_size,
+            len(self.modality_names),
+            self.config.embed_dim,
+            device=device,
+        )
+        for index, modality_name in enumerate(self.modality_names):
+            if modality_name not in inputs:
+                continue
+            rows = torch.ones(batch_size, dtype=torch.bool, device=device)
+            if present is not None and modality_name in present:
+                rows = present[modality_name].to(device=device, dtype=torch.bool)
+            padding_mask[:, index + 1] = ~rows
+
+            # Project modality features to common embedding space; absent rows
+            # are zeroed so placeholder features (e.g. NaN) cannot leak
+            projected = self.modality_projections[modality_name](
+                inputs[modality_name]
+            )  # (batch, embed_dim)
+            tokens[:, index] = torch.where(rows.unsqueeze(1), projected, 0.0)
 
-        # Concatenate CLS token with modality tokens
+        # Prepend CLS token and add positional embeddings
+        cls_tokens = self.cls_token.expand(batch_size, 1, -1)  # (batch, 1, embed_dim)
         sequence = torch.cat(
-            [cls_tokens, modality_sequence], dim=1
+            [cls_tokens, tokens], dim=1
         )  # (batch, 1+num_modalities, embed_dim)
+        sequence += self.modality_embeddings(self.position_ids)
 
         # Apply transformer encoder
-        encoded = self.transformer(sequence)  # (batch, 1+num_modalities, embed_dim)
+        encoded = self.transformer(
+            sequence, src_key_padding_mask=padding_mask
+        )  # (batch, 1+num_modalities, embed_dim)
 
         # Extract CLS token output (first token)
         cls_output = encoded[:, 0, :]  # (batch, embed_dim)
@@ -168,7 +187,11 @@ class FusionTransformer(nn.Module):
         output = self.output_projection(cls_output)  # (batch, output_dim)
 
         # Apply layer normalization
-        return self.layer_norm(output)  # type: ignore[no-any-return]
+        output = self.layer_norm(output)
+
+        # Rows without any modality have nothing to fuse
+        has_modality = ~padding_mask[:, 1:].all(dim=1, keepdim=True)
+        return output * has_modality  # type: ignore[no-any-return]
 
     def get_attention_weights(self, inputs: dict[str, torch.Tensor]) -> torch.Tensor:
         """Get attention weights for interpretability.
@@ -238,38 +261,143 @@ class HealthFusionService:
             msg = "Model not initialized. Call initialize_model() first."
             raise RuntimeError(msg)
 
-        try:
-            # Convert to tensors
-            tensor_inputs = {}
-            for modality, features in modality_features.items():
-                if modality in self.config.modality_dims:  # type: ignore[union-attr]
-                    tensor_inputs[modality] = torch.tensor(
-                        [features], dtype=torch.float32, device=self.device
-                    )  # Add batch dimension
-
-            if not tensor_inputs:
-                self.logger.warning("No valid modalities provided for fusion")
-                return [0.0] * self.config.output_dim  # type: ignore[union-attr]
-
-            # Run fusion
-            with torch.no_grad():
-                fused_vector = self.model(tensor_inputs)
-
-            # Convert back to list
-            result = fused_vector.cpu().numpy().tolist()[0]  # Remove batch dimension
+        known = [
+            modality
+            for modality in modality_features
+            if modality in self.config.modality_dims  # type: ignore[union-attr]
+        ]
+        if not known:
+            self.logger.warning("No valid modalities provided for fusion")
+            return [0.0] * self.config.output_dim  # type: ignore[union-attr]
 
+        try:
+            fused = self.fuse_users([modality_features])
+            result: list[float] = fused[0].tolist()  # Remove batch dimension
         except Exception:
             self.logger.exception("Error during fusion")
             # Return zero vector on error
-            return [0.0] * (self.config.output_dim if self.config else 64)
+            return [0.0] * self.config.output_dim  # type: ignore[union-attr]
         else:
             self.logger.info(
-                "Fused %d modalities into %d-dim vector",
-                len(tensor_inputs),
-                len(result),
+                "Fused %d modalities into %d-dim vector", len(known), len(result)
             )
+            return result
+
+    def fuse_users(
+        self, users: Sequence[Mapping[str, Sequence[float]]]
+    ) -> npt.NDArray[np.float32]:
+        """Fuse many users' modality features in one forward pass.
+
+        Args:
+            users: Per user, a mapping of modality names to feature lists;
+                modalities a user lacks are simply left out
+
+        Returns:
+            Array of shape (num_users, output_dim)
+
+        Raises:
+            ValueError: If a user's features do not match the modality dimension
+        """
+        if self.config is None:
+            msg = "Model not initialized. Call initialize_model() first."
+            raise RuntimeError(msg)
+
+        features: dict[str, npt.NDArray[np.float32]] = {}
+        present: dict[str, npt.NDArray[np.bool_]] = {}
+        for modality, dim in self.config.modality_dims.items():
+            matrix = np.zeros((len(users), dim), dtype=np.float32)
+            rows = np.zeros(len(users), dtype=bool)
+            for row, user_features in enumerate(users):
+                values = user_features.get(modality)
+                if values is None:
+                    continue
+                if len(values) != dim:
+                    msg = (
+                        f"{modality} features must have {dim} values, got {len(values)}"
+                    )
+                    raise ValueError(msg)
+                matrix[row] = values
+                rows[row] = True
+            if rows.any():
+                features[modality] = matrix
+                present[modality] = rows
+        return self.fuse_batch(features, present)
+
+    def fuse_batch(
+        self,
+        modality_features: Mapping[str, npt.ArrayLike],
+        present: Mapping[str, npt.ArrayLike] | None = None,
+    ) -> npt.NDArray[np.float32]:
+        """Fuse feature matrices for a batch of users.
+
+        Args:
+            modality_features: Modality names mapped to feature matrices of
+                shape (batch_size, feature_dim)
+            present: Optional boolean vectors of shape (batch_size,) marking the
+                rows that carry each modality (default: every row)
 
-            return result  # type: ignore[no-any-return]
+        Returns:
+            Array of shape (batch_size, output_dim); rows without any present
+            modality are zero, as is every row if the model fails
+
+        Raises:
+            ValueError: If a matrix does not match its modality dimension or
+                the batch sizes differ
+        """
+        if self.model is None or self.config is None:
+            msg = "Model not initialized. Call initialize_model() first."
+            raise RuntimeError(msg)
+
+        tensor_inputs = {
+            modality: torch.as_tensor(
+                np.asarray(features, dtype=np.float32), device=self.device
+            )
+            for modality, features in modality_features.items()
+            if modality in self.config.modality_dims
+        }
+        tensor_present = {
+            modality: torch.as_tensor(np.asarray(rows, dtype=bool), device=self.device)
+            for modality, rows in (present or {}).items()
+            if modality in tensor_inputs
+        }
+        self._validate_batch(tensor_inputs, tensor_present)
+
+        batch_size = len(next(iter(modality_features.values()), ()))
+        if not tensor_inputs:
+            self.logger.warning("No valid modalities provided for fusion")
+            return np.zeros((batch_size, self.config.output_dim), np.float32)
+
+        try:
+            # Run fusion
+            with torch.no_grad():
+                fused = self.model(tensor_inputs, tensor_present)
+        except RuntimeError:
+            self.logger.exception("Error during fusion")
+            # Return zero vectors on error
+            return np.zeros((batch_size, self.config.output_dim), np.float32)
+
+        return fused.cpu().numpy()  # type: ignore[no-any-return]
+
+    def _validate_batch(
+        self,
+        tensor_inputs: Mapping[str, torch.Tensor],
+        tensor_present: Mapping[str, torch.Tensor],
+    ) -> None:
+        """Check that all matrices share a batch size and match their dims."""
+        batch_sizes = set()
+        for modality, features in tensor_inputs.items():
+            dim = self.config.modality_dims[modality]  # type: ignore[union-attr]
+            if features.ndim != FEATURE_MATRIX_NDIM or features.size(1) != dim:
+                msg = (
+                    f"{modality} features must have shape (batch, {dim}), "
+                    f"got {tuple(features.shape)}"
+                )
+                raise ValueError(msg)
+            batch_sizes.add(features.size(0))
+        batch_sizes.update(rows.size(0) for rows in tensor_present.values())
+        if len(batch_sizes) > 1:
+            msg = f"Modality batch sizes differ: {sorted(batch_sizes)}"
+            raise ValueError(msg)
 
 
 class FusionServiceSingleton:
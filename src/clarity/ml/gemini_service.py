@@ -2,14 +2,28 @@
 
 This service integrates with Google's Vertex AI Gemini 2.5 Pro model
 to generate human-like health insights and narratives from ML analysis results.
+
+Model calls never block the event loop: the async Vertex AI client is used
+when the model provides one, otherwise the call runs in a worker thread.
+Parsed responses are cached by a hash of the sanitized prompt and generation
+config, identical requests already in flight share one model call, and a
+concurrency limiter bounds how many calls reach the model at once.
+``stream_health_insights`` yields a plain-text narrative chunk by chunk for
+streaming chat responses.
 """
 
 # removed - breaks FastAPI
 
+import asyncio
+from collections.abc import AsyncIterator
 from datetime import UTC, datetime
+import hashlib
+import inspect
 import json
 import logging
 import re
+import time
+from types import TracebackType
 from typing import Any, NoReturn
 
 from pydantic import BaseModel, Field
@@ -35,7 +49,17 @@ except ImportError:
     HarmCategory = object
     SafetySetting = object
     VERTEXAI_AVAILABLE = False
+from clarity.api.v1.metrics import (
+    record_insight_coalesced,
+    record_insight_queue,
+    record_insight_queue_wait,
+)
 from clarity.core.config_aws import get_settings
+from clarity.ml.result_cache import ResultCache
+from clarity.monitoring.pat_metrics import (
+    record_result_cache_lookup,
+    update_result_cache_metrics,
+)
 from clarity.utils.decorators import resilient_prediction
 
 logger = logging.getLogger(__name__)
@@ -50,6 +74,29 @@ MAX_NARRATIVE_PREVIEW_LENGTH = 300
 # Error messages
 GEMINI_NOT_INITIALIZED_MSG = "Gemini model not initialized"
 
+GEMINI_MODEL_NAME = "gemini-2.5-pro"
+
+# Generation parameters for health insights (also part of the cache key)
+INSIGHT_GENERATION_CONFIG: dict[str, Any] = {
+    "temperature": 0.3,  # Lower temperature for more consistent medical insights
+    "top_p": 0.8,
+    "top_k": 40,
+    "max_output_tokens": 2048,
+    "response_mime_type": "application/json",
+}
+
+# Streaming chat responses are plain text rather than JSON
+STREAMING_GENERATION_CONFIG: dict[str, Any] = {
+    **INSIGHT_GENERATION_CONFIG,
+    "response_mime_type": "text/plain",
+}
+MAX_STREAMED_RESPONSE_LENGTH = 5000
+
+# Defaults used when settings are unavailable
+DEFAULT_MAX_CONCURRENCY = 8
+DEFAULT_CACHE_TTL_SECONDS = 900.0
+DEFAULT_CACHE_MAX_ENTRIES = 256
+
 # SECURITY: Prompt injection protection patterns
 DANGEROUS_PROMPT_PATTERNS = [
     r"ignore\s+previous\s+instructions",
@@ -97,6 +144,49 @@ class HealthInsightResponse(BaseModel):
     generated_at: str = Field(description="Timestamp of generation")
 
 
+class _ConcurrencyLimiter:
+    """Async semaphore that reports queue depth, in-flight calls and wait time."""
+
+    def __init__(self, max_concurrency: int) -> None:
+        if max_concurrency < 1:
+            msg = f"max_concurrency must be at least 1, got {max_concurrency}"
+            raise ValueError(msg)
+        self.max_concurrency = max_concurrency
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self.waiting = 0
+        self.active = 0
+
+    async def __aenter__(self) -> None:
+        self.waiting += 1
+        record_insight_queue(self.waiting, self.active)
+        queued_at = time.perf_counter()
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self.waiting -= 1
+        self.active += 1
+        record_insight_queue_wait(time.perf_counter() - queued_at)
+        record_insight_queue(self.waiting, self.active)
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        self.active -= 1
+        self._semaphore.release()
+        record_insight_queue(self.waiting, self.active)
+
+
+def _setting(name: str, default: Any) -> Any:
+    """Read a Gemini setting, falling back when settings are unavailable."""
+    try:
+        return getattr(get_settings(), name, default)
+    except (AttributeError, ImportError, RuntimeError):
+        return default
+
+
 class GeminiService:
     """Service for generating health insights using Vertex AI Gemini."""
 
@@ -107,6 +197,9 @@ class GeminiService:
         *,
         testing: bool | None = None,
         model: object = None,
+        max_concurrency: int | None = None,
+        cache_ttl_seconds: float | None = None,
+        cache_max_entries: int | None = None,
     ) -> None:
         self.project_id = project_id
         self.location = location
@@ -120,6 +213,28 @@ class GeminiService:
         self.model: GenerativeModel | Any | None = None
         self.is_initialized = False
 
+        # Parsed responses keyed by sanitized prompt + generation config
+        if cache_ttl_seconds is None:
+            cache_ttl_seconds = _setting(
+                "gemini_cache_ttl_seconds", DEFAULT_CACHE_TTL_SECONDS
+            )
+        self._cache: ResultCache[HealthInsightResponse] | None = (
+            ResultCache(
+                max_entries=cache_max_entries
+                or _setting("gemini_cache_max_entries", DEFAULT_CACHE_MAX_ENTRIES),
+                max_bytes=None,
+                ttl_seconds=cache_ttl_seconds,
+                name="gemini_insights",
+            )
+            if cache_ttl_seconds > 0
+            else None
+        )
+        self._in_flight: dict[str, asyncio.Task[HealthInsightResponse]] = {}
+        self._limiter = _ConcurrencyLimiter(
+            max_concurrency
+            or _setting("gemini_max_concurrency", DEFAULT_MAX_CONCURRENCY)
+        )
+
         if self.testing:
             self.model = model if model is not None else object()
             self.is_initialized = True
@@ -149,13 +264,13 @@ class GeminiService:
             vertexai.init(project=self.project_id, location=self.location)
 
             # Create Gemini 2.5 Pro model instance
-            self.model = GenerativeModel("gemini-2.5-pro")
+            self.model = GenerativeModel(GEMINI_MODEL_NAME)
 
             self.is_initialized = True
             logger.info("Gemini service initialized successfully")
             logger.info("   • Project ID: %s", self.project_id)
             logger.info("   • Location: %s", self.location)
-            logger.info("   • Model: gemini-2.5-pro")
+            logger.info("   • Model: %s", GEMINI_MODEL_NAME)
 
         except Exception:
             logger.exception("Failed to initialize Gemini service")
@@ -181,49 +296,267 @@ class GeminiService:
 
             # Create health-focused prompt for Gemini
             prompt = self._create_health_insight_prompt(request)
+            key = self._insight_cache_key(prompt)
+
+            if self._cache is not None:
+                cached = self._cache.get(key)
+                record_result_cache_lookup(self._cache.name, hit=cached is not None)
+                if cached is not None:
+                    return self._for_request(cached, request)
+
+            # Join an identical call already in flight instead of repeating it
+            task = self._in_flight.get(key)
+            if task is None:
+                task = asyncio.ensure_future(self._generate_and_cache(key, prompt))
+                self._in_flight[key] = task
+                task.add_done_callback(lambda done: self._finish_in_flight(key, done))
+            else:
+                record_insight_coalesced()
+
+            # Shield so a cancelled caller does not cancel the shared call
+            response = await asyncio.shield(task)
+            return self._for_request(response, request)
+
+        except Exception:
+            logger.exception("Failed to generate health insights")
+            raise
+
+    async def _generate_and_cache(self, key: str, prompt: str) -> HealthInsightResponse:
+        """Call the model within the concurrency limit and cache the parsed result."""
+        async with self._limiter:
+            response = await self._generate_content(prompt)
+
+        # Parsed without a user; callers re-label the shared result
+        try:
+            insight = self._parse_gemini_json(response, "")
+        except json.JSONDecodeError:
+            # Degraded answers are returned but never cached, so the next
+            # identical request asks the model again
+            logger.warning("Failed to parse Gemini JSON response, using fallback")
+            return self._create_fallback_response(getattr(response, "text", ""), "")
+
+        if self._cache is not None:
+            self._cache.set(key, insight)
+            update_result_cache_metrics(self._cache.get_stats())
+        return insight
+
+    async def _generate_content(self, prompt: str) -> Any:
+        """Call the model without blocking the event loop.
+
+        Uses the model's native async API when it has one and falls back to
+        running the synchronous ``generate_content`` in a worker thread.
+        """
+        if self.model is None:
+            self._raise_model_not_initialized()
+
+        generation_config = GenerationConfig(**INSIGHT_GENERATION_CONFIG)
+        safety_settings = self._create_safety_settings()
 
-            # Configure generation parameters for health insights
-            generation_config = GenerationConfig(
-                temperature=0.3,  # Lower temperature for more consistent medical insights
-                top_p=0.8,
-                top_k=40,
-                max_output_tokens=2048,
-                response_mime_type="application/json",
+        generate_async = getattr(self.model, "generate_content_async", None)
+        if inspect.iscoroutinefunction(generate_async):
+            return await generate_async(
+                prompt,
+                generation_config=generation_config,
+                safety_settings=safety_settings,
             )
+        return await asyncio.to_thread(
+            self.model.generate_content,
+            prompt,
+            generation_config=generation_config,
+            safety_settings=safety_settings,
+        )
+
+    async def stream_health_insights(
+        self, request: HealthInsightRequest
+    ) -> AsyncIterator[str]:
+        """Stream a plain-text health narrative as the model generates it.
+
+        Chunks are sanitized individually and the stream is cut off at
+        ``MAX_STREAMED_RESPONSE_LENGTH`` characters. The model call holds a
+        concurrency slot until the stream is exhausted or closed.
+
+        Yields:
+            Non-empty text chunks in generation order
+        """
+        if not self.is_initialized:
+            await self.initialize()
+
+        if self.model is None:
+            self._raise_model_not_initialized()
 
-            # Configure safety settings for medical content
-            safety_settings = [
-                SafetySetting(
-                    category=HarmCategory.HARM_CATEGORY_DANGEROUS_CONTENT,
-                    threshold=HarmBlockThreshold.BLOCK_MEDIUM_AND_ABOVE,
-                ),
-                SafetySetting(
-                    category=HarmCategory.HARM_CATEGORY_HARASSMENT,
-                    threshold=HarmBlockThreshold.BLOCK_MEDIUM_AND_ABOVE,
-                ),
-                SafetySetting(
-                    category=HarmCategory.HARM_CATEGORY_HATE_SPEECH,
-                    threshold=HarmBlockThreshold.BLOCK_MEDIUM_AND_ABOVE,
-                ),
-                SafetySetting(
-                    category=HarmCategory.HARM_CATEGORY_SEXUALLY_EXPLICIT,
-                    threshold=HarmBlockThreshold.BLOCK_MEDIUM_AND_ABOVE,
-                ),
-            ]
-
-            # Generate response using Gemini
-            response = self.model.generate_content(
+        if not VERTEXAI_AVAILABLE or self.testing:
+            logger.info("Using fallback mode for streamed health insights")
+            narrative = self._create_fallback_insights_response(request).narrative
+            for chunk in re.findall(r"\S+\s*", narrative):
+                yield chunk
+            return
+
+        prompt = self._create_chat_prompt(request)
+        remaining = MAX_STREAMED_RESPONSE_LENGTH
+        async with self._limiter:
+            async for text in self._generate_content_stream(prompt):
+                chunk = self._sanitize_stream_chunk(text)[:remaining]
+                if not chunk:
+                    continue
+                remaining -= len(chunk)
+                yield chunk
+                if remaining <= 0:
+                    logger.warning("Streamed Gemini response truncated for safety")
+                    return
+
+    async def _generate_content_stream(self, prompt: str) -> AsyncIterator[str]:
+        """Stream response text from the model without blocking the event loop."""
+        if self.model is None:
+            self._raise_model_not_initialized()
+
+        generation_config = GenerationConfig(**STREAMING_GENERATION_CONFIG)
+        safety_settings = self._create_safety_settings()
+
+        generate_async = getattr(self.model, "generate_content_async", None)
+        if inspect.iscoroutinefunction(generate_async):
+            responses = await generate_async(
                 prompt,
                 generation_config=generation_config,
                 safety_settings=safety_settings,
+                stream=True,
             )
+            async for response in responses:
+                yield self._response_text(response)
+            return
 
-            # Parse the structured response
-            return self._parse_gemini_response(response, request.user_id)
+        # Synchronous client: pull each chunk from a worker thread
+        responses = await asyncio.to_thread(
+            self.model.generate_content,
+            prompt,
+            generation_config=generation_config,
+            safety_settings=safety_settings,
+            stream=True,
+        )
+        iterator = iter(responses)
+        while (response := await asyncio.to_thread(next, iterator, None)) is not None:
+            yield self._response_text(response)
 
-        except Exception:
-            logger.exception("Failed to generate health insights")
-            raise
+    @staticmethod
+    def _response_text(response: Any) -> str:
+        """Text of a response chunk (empty when the chunk has no text part)."""
+        try:
+            return str(getattr(response, "text", "") or "")
+        except ValueError:
+            # Chunks blocked by safety filters raise on .text
+            return ""
+
+    @staticmethod
+    def _sanitize_stream_chunk(text: str) -> str:
+        """Sanitize a streamed chunk without collapsing inter-chunk whitespace.
+
+        Angle brackets are dropped outright so markup cannot be reassembled
+        from tags split across chunks.
+        """
+        return re.sub(r"<[^>]*>", "", text).replace("<", "").replace(">", "")
+
+    @staticmethod
+    def _create_chat_prompt(request: HealthInsightRequest) -> str:
+        """Create a plain-text conversational prompt for streamed chat replies."""
+        analysis_data = request.analysis_results
+
+        # SECURITY: Sanitize user input to prevent prompt injection
+        sanitized_message = GeminiService._sanitize_user_input(
+            request.context or "", MAX_USER_INPUT_LENGTH
+        )
+
+        sleep_efficiency = analysis_data.get("sleep_efficiency", 0)
+        circadian_score = analysis_data.get("circadian_rhythm_score", 0)
+        depression_risk = analysis_data.get("depression_risk_score", 0)
+        total_sleep_time = analysis_data.get("total_sleep_time", 0)
+
+        return f"""You are a clinical AI assistant specializing in sleep health and wellness analysis.
+
+PATIENT DATA (0 means not available):
+- Sleep Efficiency: {sleep_efficiency:.1f}%
+- Circadian Rhythm Score: {circadian_score:.2f}
+- Depression Risk Score: {depression_risk:.2f}
+- Total Sleep Time: {total_sleep_time:.1f} hours
+
+USER MESSAGE: {sanitized_message}
+
+Reply to the user's message in plain, empathetic, patient-friendly text of at
+most 300 words. Be medically accurate and evidence-based, and suggest
+consulting a healthcare provider for medical concerns. Do not use JSON,
+markdown or HTML."""
+
+    @staticmethod
+    def _create_safety_settings() -> list[Any]:
+        """Configure safety settings for medical content."""
+        return [
+            SafetySetting(
+                category=HarmCategory.HARM_CATEGORY_DANGEROUS_CONTENT,
+                threshold=HarmBlockThreshold.BLOCK_MEDIUM_AND_ABOVE,
+            ),
+            SafetySetting(
+                category=HarmCategory.HARM_CATEGORY_HARASSMENT,
+                threshold=HarmBlockThreshold.BLOCK_MEDIUM_AND_ABOVE,
+            ),
+            SafetySetting(
+                category=HarmCategory.HARM_CATEGORY_HATE_SPEECH,
+                threshold=HarmBlockThreshold.BLOCK_MEDIUM_AND_ABOVE,
+            ),
+            SafetySetting(
+                category=HarmCategory.HARM_CATEGORY_SEXUALLY_EXPLICIT,
+                threshold=HarmBlockThreshold.BLOCK_MEDIUM_AND_ABOVE,
+            ),
+        ]
+
+    @staticmethod
+    def _insight_cache_key(prompt: str) -> str:
+        """Hash the sanitized prompt together with the model and generation config."""
+        digest = hashlib.blake2b(digest_size=32)
+        digest.update(GEMINI_MODEL_NAME.encode())
+        digest.update(json.dumps(INSIGHT_GENERATION_CONFIG, sort_keys=True).encode())
+        digest.update(prompt.encode())
+        return digest.hexdigest()
+
+    def _finish_in_flight(
+        self, key: str, task: asyncio.Task[HealthInsightResponse]
+    ) -> None:
+        """Drop a completed call from the in-flight map."""
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        # Mark failures as retrieved when every waiter was cancelled
+        if not task.cancelled():
+            task.exception()
+
+    @staticmethod
+    def _for_request(
+        insight: HealthInsightResponse, request: HealthInsightRequest
+    ) -> HealthInsightResponse:
+        """Copy a shared insight for the requesting user."""
+        return insight.model_copy(
+            update={
+                "user_id": request.user_id,
+                "generated_at": datetime.now(UTC).isoformat(),
+            }
+        )
+
+    def get_cache_stats(self) -> dict[str, Any]:
+        """Get response cache, coalescing and concurrency statistics."""
+        stats: dict[str, Any] = (
+            self._cache.get_stats() if self._cache is not None else {}
+        )
+        stats.update(
+            {
+                "enabled": self._cache is not None,
+                "in_flight": len(self._in_flight),
+                "max_concurrency": self._limiter.max_concurrency,
+                "queued": self._limiter.waiting,
+                "active": self._limiter.active,
+            }
+        )
+        return stats
+
+    def clear_cache(self) -> None:
+        """Remove all cached insight responses."""
+        if self._cache is not None:
+            self._cache.clear()
 
     @staticmethod
     def _sanitize_user_input(
@@ -373,43 +706,7 @@ Respond only with valid JSON."""
     def _parse_gemini_response(response: Any, user_id: str) -> HealthInsightResponse:
         """Parse and validate Gemini response."""
         try:
-            # Extract text from response
-            response_text = getattr(response, "text", "").strip()
-
-            # SECURITY: Sanitize the AI response
-            sanitized_response_text = GeminiService._sanitize_ai_response(response_text)
-
-            # Parse JSON response
-            parsed_response = json.loads(sanitized_response_text)
-
-            # Validate required fields and provide defaults
-            raw_narrative = parsed_response.get(
-                "narrative", "Analysis completed successfully."
-            )
-            narrative = GeminiService._sanitize_ai_response(raw_narrative)
-
-            raw_insights = parsed_response.get("key_insights", [])
-            key_insights = [
-                GeminiService._sanitize_ai_response(str(insight))
-                for insight in raw_insights
-            ]
-
-            raw_recommendations = parsed_response.get("recommendations", [])
-            recommendations = [
-                GeminiService._sanitize_ai_response(str(rec))
-                for rec in raw_recommendations
-            ]
-            confidence_score = parsed_response.get("confidence_score", 0.8)
-
-            return HealthInsightResponse(
-                user_id=user_id,
-                narrative=narrative,
-                key_insights=key_insights,
-                recommendations=recommendations,
-                confidence_score=confidence_score,
-                generated_at=datetime.now(UTC).isoformat(),
-            )
-
+            return GeminiService._parse_gemini_json(response, user_id)
         except json.JSONDecodeError:
             logger.warning("Failed to parse Gemini JSON response, using fallback")
             # Fallback to extracting insights from text response
@@ -420,6 +717,46 @@ Respond only with valid JSON."""
             logger.exception("Error parsing Gemini response")
             raise
 
+    @staticmethod
+    def _parse_gemini_json(response: Any, user_id: str) -> HealthInsightResponse:
+        """Parse a Gemini JSON response, raising ``JSONDecodeError`` if invalid."""
+        # Extract text from response
+        response_text = getattr(response, "text", "").strip()
+
+        # SECURITY: Sanitize the AI response
+        sanitized_response_text = GeminiService._sanitize_ai_response(response_text)
+
+        # Parse JSON response
+        parsed_response = json.loads(sanitized_response_text)
+
+        # Validate required fields and provide defaults
+        raw_narrative = parsed_response.get(
+            "narrative", "Analysis completed successfully."
+        )
+        narrative = GeminiService._sanitize_ai_response(raw_narrative)
+
+        raw_insights = parsed_response.get("key_insights", [])
+        key_insights = [
+            GeminiService._sanitize_ai_response(str(insight))
+            for insight in raw_insights
+        ]
+
+        raw_recommendations = parsed_response.get("recommendations", [])
+        recommendations = [
+            GeminiService._sanitize_ai_response(str(rec))
+            for rec in raw_recommendations
+        ]
+        confidence_score = parsed_response.get("confidence_score", 0.8)
+
+        return HealthInsightResponse(
+            user_id=user_id,
+            narrative=narrative,
+            key_insights=key_insights,
+            recommendations=recommendations,
+            confidence_score=confidence_score,
+            generated_at=datetime.now(UTC).isoformat(),
+        )
+
     @staticmethod
     def _create_fallback_insights_response(
         request: HealthInsightRequest,
@@ -528,5 +865,5 @@ Respond only with valid JSON."""
             "project_id": self.project_id or "not_set",
             "location": self.location,
             "initialized": self.is_initialized,
-            "model": "gemini-2.5-pro" if self.model else "not_loaded",
+            "model": GEMINI_MODEL_NAME if self.model else "not_loaded",
         }
@@ -2,7 +2,8 @@
 
 This module provides a production-ready inference engine with:
 - Async batch processing for optimal throughput
-- Intelligent caching with TTL support
+- Bounded, content-addressed result caching with TTL support, optionally
+  backed by a host-local store shared across worker processes
 - Performance monitoring and metrics
 - Graceful error handling and recovery
 - Request queuing and timeout management
@@ -17,14 +18,17 @@ dependency injection, and comprehensive error handling.
 # removed - breaks FastAPI
 
 import asyncio
+from collections import Counter, deque
 from collections.abc import Callable
 from functools import wraps
 import logging
+import sqlite3
 import time
 from typing import TYPE_CHECKING, Any, Self
 
 from pydantic import BaseModel, Field
 
+from clarity.core.config import get_settings
 from clarity.core.constants import (
     BATCH_PROCESSOR_ERROR_SLEEP_SECONDS,
     CACHE_TTL_DEFAULT_SECONDS,
@@ -33,14 +37,24 @@ from clarity.core.constants import (
     DEFAULT_INFERENCE_TIMEOUT_SECONDS,
 )
 from clarity.core.exceptions import InferenceError, InferenceTimeoutError
-from clarity.core.security import create_secure_cache_key
-from clarity.core.types import CacheStorage, LoggerProtocol
+from clarity.core.types import LoggerProtocol
 from clarity.ml.pat_service import (
     ActigraphyAnalysis,
     ActigraphyInput,
     PATModelService,
     get_pat_service,
 )
+from clarity.ml.result_cache import (
+    DEFAULT_MAX_BYTES,
+    DEFAULT_MAX_ENTRIES,
+    ResultCache,
+    service_cache_key,
+)
+from clarity.ml.shared_result_store import (
+    SharedResultStore,
+    decode_model,
+    encode_model,
+)
 from clarity.utils.decorators import resilient_prediction
 
 if TYPE_CHECKING:
@@ -51,6 +65,9 @@ logger: LoggerProtocol = logging.getLogger(__name__)
 # Global inference engine instance
 _inference_engine: "AsyncInferenceEngine | None" = None
 
+# Number of recent batches kept for latency statistics
+BATCH_LATENCY_WINDOW = 1000
+
 
 class InferenceRequest(BaseModel):
     """Request for PAT model inference."""
@@ -73,64 +90,8 @@ class InferenceResponse(BaseModel):
     timestamp: float = Field(description="Response timestamp")
 
 
-class InferenceCache:
-    """Simple in-memory cache with TTL support.
-
-    This class provides efficient caching with automatic cleanup of expired entries,
-    following the Single Responsibility Principle.
-    """
-
-    def __init__(self, ttl_seconds: int = CACHE_TTL_DEFAULT_SECONDS) -> None:
-        """Initialize cache with specified TTL.
-
-        Args:
-            ttl_seconds: Time-to-live for cache entries in seconds
-        """
-        self.cache: CacheStorage = {}
-        self.ttl = ttl_seconds
-
-    def _cleanup_expired(self) -> None:
-        """Remove expired entries from cache.
-
-        This method implements the Strategy pattern for cache cleanup,
-        allowing for different cleanup strategies in the future.
-        """
-        current_time = time.time()
-        expired_keys = [
-            key
-            for key, (_, timestamp) in self.cache.items()
-            if current_time - timestamp > self.ttl
-        ]
-        for key in expired_keys:
-            del self.cache[key]
-
-    async def get(self, key: str) -> object | None:
-        """Get value from cache if not expired.
-
-        Args:
-            key: Cache key to retrieve
-
-        Returns:
-            Cached value if found and not expired, None otherwise
-        """
-        self._cleanup_expired()
-        if key in self.cache:
-            value, _ = self.cache[key]
-            return value  # type: ignore[no-any-return]  # Cache preserves original function's return type
-        return None
-
-    async def set(self, key: str, value: object) -> None:
-        """Set value in cache with current timestamp.
-
-        Args:
-            key: Cache key to set
-            value: Value to cache
-        """
-        self.cache[key] = (value, time.time())
-
-    def clear(self) -> None:
-        """Clear all cache entries."""
-        self.cache.clear()
+# A queued request paired with the future that receives its response
+PendingInference = tuple[InferenceRequest, "asyncio.Future[InferenceResponse]"]
 
 
 def performance_monitor(func: Callable[..., Any]) -> Callable[..., Any]:
@@ -181,6 +142,9 @@ class AsyncInferenceEngine:
         batch_size: int = DEFAULT_BATCH_SIZE,
         batch_timeout_ms: int = DEFAULT_BATCH_TIMEOUT_MS,
         cache_ttl: int = CACHE_TTL_DEFAULT_SECONDS,
+        cache_max_entries: int = DEFAULT_MAX_ENTRIES,
+        cache_max_bytes: int | None = DEFAULT_MAX_BYTES,
+        shared_cache: SharedResultStore | None = None,
     ) -> None:
         """Initialize the inference engine.
 
@@ -189,6 +153,9 @@ class AsyncInferenceEngine:
             batch_size: Maximum batch size for processing
             batch_timeout_ms: Batch timeout in milliseconds
             cache_ttl: Cache time-to-live in seconds
+            cache_max_entries: Maximum number of cached results
+            cache_max_bytes: Maximum accounted size of cached results in bytes
+            shared_cache: Optional host-wide store consulted on in-process misses
         """
         self.pat_service = pat_service
         self.batch_size = batch_size
@@ -197,10 +164,21 @@ class AsyncInferenceEngine:
         # Statistics
         self.request_count = 0
         self.cache_hits = 0
+        self.shared_cache_hits = 0
         self.error_count = 0
+        self.model_calls = 0
+        self.batch_count = 0
+        self.batch_size_histogram: Counter[int] = Counter()
+        self.batch_latencies_ms: deque[float] = deque(maxlen=BATCH_LATENCY_WINDOW)
 
         # Async components
-        self.cache = InferenceCache(ttl_seconds=cache_ttl)
+        self.cache: ResultCache[ActigraphyAnalysis] = ResultCache(
+            max_entries=cache_max_entries,
+            max_bytes=cache_max_bytes,
+            ttl_seconds=cache_ttl,
+            name="inference_engine",
+        )
+        self.shared_cache = shared_cache
         self.request_queue: asyncio.Queue[
             tuple[InferenceRequest, asyncio.Future[InferenceResponse]]
         ] = asyncio.Queue()
@@ -270,103 +248,221 @@ class AsyncInferenceEngine:
 
         logger.info("AsyncInferenceEngine stopped")
 
-    @staticmethod
-    def _generate_cache_key(input_data: ActigraphyInput) -> str:
-        """Generate secure cache key for input data.
-
-        This static method follows the Factory Method pattern to create
-        cache keys with consistent format and security.
-
-        Args:
-            input_data: Actigraphy input data
-
-        Returns:
-            Secure cache key string
-        """
-        # Create components for the cache key
-        data_signature = f"{input_data.user_id}_{len(input_data.data_points)}_{input_data.sampling_rate}"
-
-        # Add first and last data point values for uniqueness
-        if input_data.data_points:
-            first_point = input_data.data_points[0]
-            last_point = input_data.data_points[-1]
-            data_signature += f"_{first_point.timestamp}_{first_point.value}_{last_point.timestamp}_{last_point.value}"
-
-        return create_secure_cache_key(data_signature)
+    def _cache_key(self, input_data: ActigraphyInput) -> str:
+        """Generate the cache key for input data using the engine's PAT service."""
+        return service_cache_key(self.pat_service, input_data)
 
-    async def _check_cache(
-        self, input_data: ActigraphyInput
-    ) -> ActigraphyAnalysis | None:
+    async def _check_cache(self, cache_key: str) -> ActigraphyAnalysis | None:
         """Check cache for existing result.
 
+        The in-process cache is checked first, then the shared store; shared
+        hits are promoted into the in-process cache.
+
         Args:
-            input_data: Input data to check cache for
+            cache_key: Key generated by ``_cache_key``
 
         Returns:
             Cached analysis result if found, None otherwise
         """
-        cache_key = self._generate_cache_key(input_data)
+        cached_result = self.cache.get(cache_key)
+        if cached_result is not None:
+            self.cache_hits += 1
+            logger.debug("Cache hit for key %s", cache_key)
+            return cached_result
+
+        if self.shared_cache is None:
+            return None
+
+        payload = await asyncio.to_thread(self.shared_cache.get, cache_key)
+        if payload is None:
+            return None
 
         try:
-            cached_result = await self.cache.get(cache_key)
-            if cached_result:
-                self.cache_hits += 1
-                logger.debug("Cache hit for key %s", cache_key)
-                return ActigraphyAnalysis(**cached_result)  # type: ignore[arg-type]
-        except (KeyError, ValueError, TypeError) as e:
-            logger.warning("Cache check failed: %s", str(e))
-        return None
+            cached_result = decode_model(ActigraphyAnalysis, payload)
+        except (ValueError, TypeError) as e:
+            logger.warning("Shared cache entry could not be decoded: %s", e)
+            return None
 
-    async def _store_cache(
-        self, input_data: ActigraphyInput, analysis: ActigraphyAnalysis
-    ) -> None:
-        """Store result in cache.
+        self.cache.set(cache_key, cached_result)
+        self.cache_hits += 1
+        self.shared_cache_hits += 1
+        logger.debug("Shared cache hit for key %s", cache_key)
+        return cached_result
+
+    async def _store_cache(self, cache_key: str, analysis: ActigraphyAnalysis) -> None:
+        """Store result in cache (and the shared store when configured).
 
         Args:
-            input_data: Input data used as cache key basis
+            cache_key: Key generated by ``_cache_key``
             analysis: Analysis result to cache
         """
-        cache_key = self._generate_cache_key(input_data)
-
-        try:
-            await self.cache.set(cache_key, analysis.dict())
-            logger.debug("Cached result for key %s", cache_key)
-        except (KeyError, ValueError, TypeError) as e:
-            logger.warning("Cache store failed: %s", str(e))
+        self.cache.set(cache_key, analysis)
+        if self.shared_cache is not None:
+            await asyncio.to_thread(
+                self.shared_cache.set, cache_key, encode_model(analysis)
+            )
+        logger.debug("Cached result for key %s", cache_key)
 
     async def _process_batch(
-        self, requests: list[tuple[InferenceRequest, asyncio.Future[InferenceResponse]]]
+        self, requests: list[PendingInference]
     ) -> None:
         """Process a batch of inference requests.
 
-        This method handles the actual ML inference for a batch of requests,
-        implementing caching and error handling.
+        Cache hits are answered immediately. The remaining requests are
+        deduplicated by cache key and run through a single batched forward
+        pass, then each future receives its own slice of the results.
 
         Args:
             requests: List of request/future pairs to process
         """
-        if not requests:
+        pending = [
+            (request, future) for request, future in requests if not future.done()
+        ]
+        if not pending:
             return
 
         start_time = time.perf_counter()
-        logger.debug("Processing batch of %d requests", len(requests))
+        logger.debug("Processing batch of %d requests", len(pending))
 
-        # Process each request in the batch
-        for request, future in requests:
-            if future.cancelled():
-                continue
+        # Answer cache hits first and group misses by cache key
+        misses: dict[str, list[PendingInference]] = {}
+        for request, future in pending:
+            request_start = time.perf_counter()
+            self.request_count += 1
 
-            try:
-                result = await self._run_single_inference(request)
-                if not future.cancelled():
-                    future.set_result(result)
-            except (ValueError, RuntimeError, OSError) as e:
-                self.error_count += 1
-                if not future.cancelled():
-                    future.set_exception(e)
+            if request.cache_enabled:
+                group_key = self._cache_key(request.input_data)
+                cached_result = await self._check_cache(group_key)
+                if cached_result is not None:
+                    self._resolve(
+                        future,
+                        request,
+                        cached_result,
+                        request_start,
+                        cached=True,
+                    )
+                    continue
+            else:
+                group_key = f"uncached:{request.request_id}:{id(future)}"
+
+            misses.setdefault(group_key, []).append((request, future))
+
+        if misses:
+            await self._run_batched_inference(misses, start_time)
 
         processing_time = (time.perf_counter() - start_time) * 1000
-        logger.debug("Batch processed in %.2fms", processing_time)
+        self._record_batch(len(misses), processing_time)
+        logger.debug(
+            "Batch of %d requests (%d model inputs) processed in %.2fms",
+            len(pending),
+            len(misses),
+            processing_time,
+        )
+
+    async def _run_batched_inference(
+        self,
+        groups: dict[str, list[PendingInference]],
+        start_time: float,
+    ) -> None:
+        """Run one model call for all cache misses and fan results out.
+
+        Each group shares an identical input, so only its first request is sent
+        to the model. If the batched call fails, the groups are retried one by
+        one so a single bad input cannot fail the whole batch.
+
+        Args:
+            groups: Requests grouped by cache key of their identical input
+            start_time: Batch start time used for processing time reporting
+        """
+        if len(groups) == 1:
+            [(cache_key, group)] = groups.items()
+            await self._run_group_inference(cache_key, group)
+            return
+
+        leaders = [group[0][0] for group in groups.values()]
+        try:
+            analyses = await self.pat_service.analyze_actigraphy_batch(
+                [request.input_data for request in leaders]
+            )
+        except Exception:
+            logger.exception(
+                "Batched inference failed for %d inputs, retrying individually",
+                len(groups),
+            )
+            for cache_key, group in groups.items():
+                await self._run_group_inference(cache_key, group)
+            return
+
+        self.model_calls += 1
+        for (cache_key, group), analysis in zip(groups.items(), analyses, strict=True):
+            if group[0][0].cache_enabled:
+                await self._store_cache(cache_key, analysis)
+            for request, future in group:
+                self._resolve(future, request, analysis, start_time, cached=False)
+
+    async def _run_group_inference(
+        self,
+        cache_key: str,
+        group: list[PendingInference],
+    ) -> None:
+        """Run single-input inference and share the result across a group.
+
+        Args:
+            cache_key: Cache key of the group's input
+            group: Requests with an identical input
+        """
+        leader, _ = group[0]
+        try:
+            response = await self._run_single_inference(leader)
+        except (InferenceError, ValueError, RuntimeError, OSError) as e:
+            self.error_count += 1
+            for _, future in group:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        if leader.cache_enabled:
+            await self._store_cache(cache_key, response.analysis)
+
+        for request, future in group:
+            if not future.done():
+                future.set_result(
+                    response.model_copy(update={"request_id": request.request_id})
+                )
+
+    @staticmethod
+    def _resolve(
+        future: asyncio.Future[InferenceResponse],
+        request: InferenceRequest,
+        analysis: ActigraphyAnalysis,
+        start_time: float,
+        *,
+        cached: bool,
+    ) -> None:
+        """Complete a request future with an analysis result."""
+        if future.done():
+            return
+
+        future.set_result(
+            InferenceResponse(
+                request_id=request.request_id,
+                analysis=analysis,
+                processing_time_ms=(time.perf_counter() - start_time) * 1000,
+                cached=cached,
+                timestamp=time.time(),
+            )
+        )
+
+    def _record_batch(self, model_batch_size: int, latency_ms: float) -> None:
+        """Record batch size and latency statistics.
+
+        Args:
+            model_batch_size: Number of distinct inputs sent to the model
+            latency_ms: Wall-clock batch processing time in milliseconds
+        """
+        self.batch_count += 1
+        self.batch_size_histogram[model_batch_size] += 1
+        self.batch_latencies_ms.append(latency_ms)
 
     @performance_monitor
     async def _run_single_inference(
@@ -374,8 +470,8 @@ class AsyncInferenceEngine:
     ) -> InferenceResponse:
         """Run inference for a single request.
 
-        This method implements the Chain of Responsibility pattern for
-        processing steps: cache check -> model inference -> cache store.
+        The request must already have missed the cache; callers store the
+        result in the cache.
 
         Args:
             request: Inference request to process
@@ -387,32 +483,13 @@ class AsyncInferenceEngine:
             InferenceError: If inference fails
         """
         start_time = time.perf_counter()
-        self.request_count += 1
 
         try:
-            # Check cache first if enabled
-            cached_result = None
-            if request.cache_enabled:
-                cached_result = await self._check_cache(request.input_data)
-
-            if cached_result:
-                processing_time = (time.perf_counter() - start_time) * 1000
-                return InferenceResponse(
-                    request_id=request.request_id,
-                    analysis=cached_result,
-                    processing_time_ms=processing_time,
-                    cached=True,
-                    timestamp=time.time(),
-                )
-
             # Use PAT service for analysis
             analysis = await self.pat_service.analyze_actigraphy(request.input_data)
+            self.model_calls += 1
             processing_time = (time.perf_counter() - start_time) * 1000
 
-            # Store in cache if enabled
-            if request.cache_enabled:
-                await self._store_cache(request.input_data, analysis)
-
             return InferenceResponse(
                 request_id=request.request_id,
                 analysis=analysis,
@@ -547,9 +624,15 @@ class AsyncInferenceEngine:
 
         return await self.predict_async(request)
 
-    def get_stats(self) -> dict[str, Any]:
+    def get_stats(self, *, include_shared_cache: bool = True) -> dict[str, Any]:
         """Get performance statistics.
 
+        Reading the shared store's occupancy is file I/O; async callers should
+        use ``get_stats_async``.
+
+        Args:
+            include_shared_cache: Query the shared store for its statistics
+
         Returns:
             Dictionary containing performance metrics
         """
@@ -557,11 +640,30 @@ class AsyncInferenceEngine:
             self.cache_hits / self.request_count * 100 if self.request_count > 0 else 0
         )
 
+        latencies = sorted(self.batch_latencies_ms)
+        batch_latency_ms = {
+            "avg": sum(latencies) / len(latencies) if latencies else 0.0,
+            "p50": latencies[len(latencies) // 2] if latencies else 0.0,
+            "p95": latencies[int(len(latencies) * 0.95)] if latencies else 0.0,
+            "max": latencies[-1] if latencies else 0.0,
+        }
+
         return {
             "requests_processed": self.request_count,
             "cache_hits": self.cache_hits,
             "cache_hit_rate_percent": cache_hit_rate,
+            "cache": self.cache.get_stats(),
+            "shared_cache_hits": self.shared_cache_hits,
+            "shared_cache": (
+                self.shared_cache.get_stats()
+                if self.shared_cache is not None and include_shared_cache
+                else None
+            ),
             "error_count": self.error_count,
+            "model_calls": self.model_calls,
+            "batches_processed": self.batch_count,
+            "batch_size_histogram": dict(sorted(self.batch_size_histogram.items())),
+            "batch_latency_ms": batch_latency_ms,
             "is_running": self.is_running,
             "queue_size": (
                 self.request_queue.qsize()
@@ -570,6 +672,17 @@ class AsyncInferenceEngine:
             ),
         }
 
+    async def get_stats_async(self) -> dict[str, Any]:
+        """Get performance statistics, reading the shared store off the loop.
+
+        Returns:
+            Dictionary containing performance metrics
+        """
+        stats = self.get_stats(include_shared_cache=False)
+        if self.shared_cache is not None:
+            stats["shared_cache"] = await asyncio.to_thread(self.shared_cache.get_stats)
+        return stats
+
 
 # Global inference engine management
 async def get_inference_engine() -> AsyncInferenceEngine:
@@ -585,12 +698,34 @@ async def get_inference_engine() -> AsyncInferenceEngine:
 
     if _inference_engine is None:
         pat_service = await get_pat_service()
-        _inference_engine = AsyncInferenceEngine(pat_service)
+        _inference_engine = AsyncInferenceEngine(
+            pat_service, shared_cache=_create_shared_cache()
+        )
         await _inference_engine.start()
 
     return _inference_engine
 
 
+def _create_shared_cache() -> SharedResultStore | None:
+    """Create the host-wide result store if ``INFERENCE_SHARED_CACHE_PATH`` is set."""
+    settings = get_settings()
+    if not settings.inference_shared_cache_path:
+        return None
+
+    try:
+        return SharedResultStore(
+            settings.inference_shared_cache_path,
+            max_bytes=settings.inference_shared_cache_max_mb * 1024 * 1024,
+            ttl_seconds=CACHE_TTL_DEFAULT_SECONDS,
+        )
+    except (OSError, sqlite3.Error):
+        logger.exception(
+            "Failed to open shared inference cache at %s, continuing without it",
+            settings.inference_shared_cache_path,
+        )
+        return None
+
+
 async def shutdown_inference_engine() -> None:
     """Shutdown the global inference engine.
 
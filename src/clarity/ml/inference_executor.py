@@ -0,0 +1,224 @@
+"""Dedicated executor pool for CPU-bound model inference.
+
+PAT preprocessing, the transformer forward pass and postprocessing are
+synchronous. Running them directly inside ``async def`` handlers blocks the
+event loop for the whole inference and stalls every other request served by
+the same worker (health checks, websocket heartbeats, auth).
+
+This module provides a bounded thread pool that every PAT inference path
+submits to:
+- ``PATModelService.analyze_actigraphy`` / ``analyze_actigraphy_batch``
+- ``AsyncInferenceEngine`` (through the PAT service)
+- ``pat_optimization.PATPerformanceOptimizer`` / ``BatchAnalysisProcessor``
+
+PyTorch releases the GIL inside its kernels, so a small thread pool keeps the
+loop responsive without duplicating the loaded model per process. Queue depth
+and wait time are exported through ``clarity.api.v1.metrics``.
+"""
+
+# removed - breaks FastAPI
+
+import asyncio
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+import contextvars
+import functools
+import logging
+import threading
+import time
+from typing import Any, ParamSpec, TypeVar
+
+import torch
+
+from clarity.api.v1.metrics import (
+    record_inference_queue_depth,
+    record_inference_queue_wait,
+)
+from clarity.core.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+P = ParamSpec("P")
+T = TypeVar("T")
+
+# Global inference executor instance
+_inference_executor: "InferenceExecutor | None" = None
+
+
+class InferenceExecutor:
+    """Bounded thread pool for synchronous model inference work.
+
+    Submitted callables run on dedicated worker threads; the awaiting
+    coroutine is suspended until the result is ready so the event loop keeps
+    serving other requests.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 1,
+        torch_num_threads: int | None = None,
+        thread_name_prefix: str = "pat-inference",
+    ) -> None:
+        """Initialize the executor.
+
+        Args:
+            max_workers: Number of concurrent inference threads
+            torch_num_threads: Intra-op thread count for PyTorch (None keeps default)
+            thread_name_prefix: Prefix for worker thread names
+        """
+        if max_workers < 1:
+            msg = f"max_workers must be at least 1, got {max_workers}"
+            raise ValueError(msg)
+
+        if torch_num_threads:
+            torch.set_num_threads(torch_num_threads)
+
+        self.max_workers = max_workers
+        self.torch_num_threads = torch.get_num_threads()
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix=thread_name_prefix
+        )
+        self._lock = threading.Lock()
+
+        # Statistics
+        self.queued = 0
+        self.running = 0
+        self.completed = 0
+        self.failed = 0
+        self.total_wait_seconds = 0.0
+        self.total_run_seconds = 0.0
+
+        logger.info(
+            "Initialized InferenceExecutor: workers=%d, torch_threads=%d",
+            max_workers,
+            self.torch_num_threads,
+        )
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of submitted tasks waiting for a worker thread."""
+        return self.queued
+
+    def _track(self, func: Callable[P, T], submitted_at: float) -> Callable[P, T]:
+        """Wrap a callable to record queue wait and run time."""
+
+        @functools.wraps(func)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+            started_at = time.perf_counter()
+            wait_seconds = started_at - submitted_at
+            with self._lock:
+                self.queued -= 1
+                self.running += 1
+                self.total_wait_seconds += wait_seconds
+                depth = self.queued
+            record_inference_queue_wait(wait_seconds)
+            record_inference_queue_depth(depth)
+
+            try:
+                result = func(*args, **kwargs)
+            except Exception:
+                with self._lock:
+                    self.failed += 1
+                raise
+            else:
+                with self._lock:
+                    self.completed += 1
+                return result
+            finally:
+                with self._lock:
+                    self.running -= 1
+                    self.total_run_seconds += time.perf_counter() - started_at
+
+        return wrapper
+
+    async def run(self, func: Callable[P, T], *args: P.args, **kwargs: P.kwargs) -> T:
+        """Run a synchronous callable on the inference pool.
+
+        Args:
+            func: Callable to execute
+            *args: Positional arguments for ``func``
+            **kwargs: Keyword arguments for ``func``
+
+        Returns:
+            The callable's return value
+        """
+        with self._lock:
+            self.queued += 1
+            depth = self.queued
+        record_inference_queue_depth(depth)
+
+        tracked = self._track(func, time.perf_counter())
+        loop = asyncio.get_running_loop()
+        # Run in a copy of the caller's context (like asyncio.to_thread) so
+        # context variables such as the request's phase timings carry over
+        context = contextvars.copy_context()
+        return await loop.run_in_executor(
+            self._executor,
+            functools.partial(context.run, tracked, *args, **kwargs),
+        )
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get executor statistics.
+
+        Returns:
+            Dictionary containing queue and timing metrics
+        """
+        with self._lock:
+            finished = self.completed + self.failed
+            return {
+                "max_workers": self.max_workers,
+                "torch_num_threads": self.torch_num_threads,
+                "queue_depth": self.queued,
+                "running": self.running,
+                "completed": self.completed,
+                "failed": self.failed,
+                "avg_wait_ms": (
+                    self.total_wait_seconds / finished * 1000 if finished else 0.0
+                ),
+                "avg_run_ms": (
+                    self.total_run_seconds / finished * 1000 if finished else 0.0
+                ),
+            }
+
+    def shutdown(self, *, wait: bool = True) -> None:
+        """Shut down the worker threads.
+
+        Args:
+            wait: Block until running tasks complete
+        """
+        self._executor.shutdown(wait=wait, cancel_futures=not wait)
+        logger.info("InferenceExecutor shut down")
+
+
+def get_inference_executor() -> InferenceExecutor:
+    """Get or create the global inference executor.
+
+    Pool size and PyTorch thread count come from the ``PAT_INFERENCE_WORKERS``
+    and ``PAT_TORCH_NUM_THREADS`` settings.
+
+    Returns:
+        Global inference executor instance
+    """
+    global _inference_executor  # noqa: PLW0603 - Singleton pattern for shared inference pool
+
+    if _inference_executor is None:
+        settings = get_settings()
+        _inference_executor = InferenceExecutor(
+            max_workers=settings.pat_inference_workers,
+            torch_num_threads=settings.pat_torch_num_threads or None,
+        )
+
+    return _inference_executor
+
+
+def shutdown_inference_executor(*, wait: bool = True) -> None:
+    """Shut down the global inference executor.
+
+    Args:
+        wait: Block until running tasks complete
+    """
+    global _inference_executor  # noqa: PLW0603 - Singleton pattern for shared inference pool
+
+    if _inference_executor is not None:
+        _inference_executor.shutdown(wait=wait)
+        _inference_executor = None
@@ -3,8 +3,10 @@
 This module provides optimization features including:
 - TorchScript compilation for faster inference
 - Model pruning for reduced memory usage
-- Result caching for repeated analyses
+- Content-addressed result caching for repeated analyses
 - Batch processing for multiple requests
+
+All inference runs on the PAT service's shared inference executor.
 """
 
 # removed - breaks FastAPI
@@ -12,7 +14,6 @@ This module provides optimization features including:
 import asyncio
 import contextlib
 from datetime import UTC, datetime, timedelta
-import hashlib
 import logging
 from pathlib import Path
 import time
@@ -23,6 +24,7 @@ from torch.nn.utils import prune
 
 from clarity.ml.pat_service import ActigraphyAnalysis, ActigraphyInput, PATModelService
 from clarity.ml.preprocessing import ActigraphyDataPoint
+from clarity.ml.result_cache import ResultCache, service_cache_key
 
 if TYPE_CHECKING:
     pass  # Only for type stubs now
@@ -43,7 +45,9 @@ class PATPerformanceOptimizer:
         self.pat_service = pat_service
         self.compiled_model: torch.jit.ScriptModule | None = None
         self.optimization_enabled = False
-        self._cache: dict[str, tuple[ActigraphyAnalysis, float]] = {}
+        self._cache: ResultCache[ActigraphyAnalysis] = ResultCache(
+            ttl_seconds=CACHE_EXPIRY_HOURS * 3600, name="pat_optimizer"
+        )
 
     async def optimize_model(
         self,
@@ -153,24 +157,9 @@ class PATPerformanceOptimizer:
         except Exception:
             logger.exception("Failed to save compiled model")
 
-    @staticmethod
-    def _generate_cache_key(input_data: ActigraphyInput) -> str:
-        """Generate a cache key for actigraphy input."""
-        # Create hash from user_id, data points, and parameters
-        data_str = f"{input_data.user_id}_{len(input_data.data_points)}"
-
-        # Add sample of data values for uniqueness
-        if input_data.data_points:
-            first_vals = [dp.value for dp in input_data.data_points[:5]]
-            last_vals = [dp.value for dp in input_data.data_points[-5:]]
-            data_str += f"_{hash(tuple(first_vals + last_vals))}"
-
-        return hashlib.sha256(data_str.encode()).hexdigest()
-
-    @staticmethod
-    def _is_cache_valid(timestamp: float) -> bool:
-        """Check if cached result is still valid."""
-        return (time.time() - timestamp) < (CACHE_EXPIRY_HOURS * 3600)
+    def _generate_cache_key(self, input_data: ActigraphyInput) -> str:
+        """Generate a content-addressed cache key for actigraphy input."""
+        return service_cache_key(self.pat_service, input_data)
 
     async def optimized_analyze(
         self, input_data: ActigraphyInput, *, use_cache: bool = True
@@ -181,28 +170,14 @@ class PATPerformanceOptimizer:
             Tuple of (analysis_result, was_cached)
         """
         # Check cache first
-        if use_cache:
-            cache_key = self._generate_cache_key(input_data)
-            if cache_key in self._cache:
-                try:
-                    cached_result, timestamp = self._cache[cache_key]
-                    if self._is_cache_valid(timestamp):
-                        logger.info(
-                            "Cache hit for analysis %s",
-                            cache_key[:HASH_TRUNCATE_LENGTH],
-                        )
-                        return cached_result, True
-                    # Remove expired entry
-                    del self._cache[cache_key]
-                except (ValueError, TypeError, AttributeError) as e:
-                    # Handle corrupted cache entries gracefully
-                    logger.warning(
-                        "Cache corruption detected for key %s: %s",
-                        cache_key[:HASH_TRUNCATE_LENGTH],
-                        e,
-                    )
-                    # Remove corrupted entry
-                    self._cache.pop(cache_key, None)
+        cache_key = self._generate_cache_key(input_data) if use_cache else None
+        if cache_key is not None:
+            cached_result = self._cache.get(cache_key)
+            if cached_result is not None:
+                logger.info(
+                    "Cache hit for analysis %s", cache_key[:HASH_TRUNCATE_LENGTH]
+                )
+                return cached_result, True
 
         # Perform analysis
         start_time = time.time()
@@ -216,9 +191,8 @@ class PATPerformanceOptimizer:
         logger.info("Inference completed in %.3fs", inference_time)
 
         # Cache the result
-        if use_cache:
-            cache_key = self._generate_cache_key(input_data)
-            self._cache[cache_key] = (result, time.time())
+        if cache_key is not None:
+            self._cache.set(cache_key, result)
             logger.info("Cached analysis result %s", cache_key[:HASH_TRUNCATE_LENGTH])
 
         return result, False
@@ -231,6 +205,15 @@ class PATPerformanceOptimizer:
             msg = "No compiled model available"
             raise RuntimeError(msg)
 
+        # Run on the shared inference pool so the event loop stays responsive
+        return await self.pat_service.executor.run(
+            self._run_compiled_inference, self.compiled_model, input_data
+        )
+
+    def _run_compiled_inference(
+        self, compiled_model: torch.jit.ScriptModule, input_data: ActigraphyInput
+    ) -> ActigraphyAnalysis:
+        """Preprocess, run the compiled model and post-process (blocking)."""
         # Preprocess input data
         input_tensor = self.pat_service._preprocess_actigraphy_data(  # noqa: SLF001
             input_data.data_points
@@ -239,7 +222,7 @@ class PATPerformanceOptimizer:
 
         # Run optimized inference
         with torch.no_grad():
-            outputs = self.compiled_model(input_tensor)
+            outputs = compiled_model(input_tensor)
 
         # Convert outputs to dictionary format expected by postprocessing
         outputs_dict = {
@@ -270,25 +253,14 @@ class PATPerformanceOptimizer:
 
     def get_cache_stats(self) -> dict[str, Any]:
         """Get cache statistics."""
+        stats = self._cache.get_stats()
         return {
-            "cache_size": len(self._cache),
-            "hit_ratio": self._calculate_hit_ratio(),
-            "oldest_entry_age": self._get_oldest_entry_age(),
+            "cache_size": stats["entries"],
+            "hit_ratio": stats["hit_rate"],
+            "oldest_entry_age": self._cache.oldest_entry_age(),
+            **stats,
         }
 
-    @staticmethod
-    def _calculate_hit_ratio() -> float:
-        """Calculate cache hit ratio (placeholder implementation)."""
-        # In a real implementation, you'd track hits/misses
-        return 0.0
-
-    def _get_oldest_entry_age(self) -> float:
-        """Get age of oldest cache entry in seconds."""
-        if not self._cache:
-            return 0.0
-        oldest_timestamp = min(timestamp for _, timestamp in self._cache.values())
-        return time.time() - oldest_timestamp
-
     async def warm_up(
         self, num_iterations: int = DEFAULT_WARMUP_ITERATIONS
     ) -> dict[str, float]:
@@ -19,6 +19,7 @@ import numpy as np
 import torch
 
 from clarity.ml.pat_model_loader import ModelSize, PATModelLoader
+from clarity.ml.result_cache import ResultCache, content_hash
 
 logger = logging.getLogger(__name__)
 
@@ -49,50 +50,47 @@ class PredictionResult:
 
 
 class PredictionCache:
-    """Simple LRU cache for predictions.
+    """LRU cache for predictions keyed by input content.
 
     Follows Single Responsibility: Only caches predictions.
     """
 
     def __init__(self, max_size: int = 1000) -> None:
         """Initialize cache with max size."""
-        self._cache: dict[str, PredictionResult] = {}
-        self._access_order: deque[str] = deque(maxlen=max_size)
+        self._cache: ResultCache[PredictionResult] = ResultCache(
+            max_entries=max_size, name="pat_predictor"
+        )
         self._max_size = max_size
 
-    def _get_key(self, data: NDArray[np.float32], model_size: ModelSize) -> str:
+    @staticmethod
+    def _get_key(
+        data: NDArray[np.float32], model_size: ModelSize, model_version: str = ""
+    ) -> str:
         """Generate cache key from input data."""
-        # Use hash of data for key
-        data_hash = hash(data.tobytes())
-        return f"{model_size.value}:{data_hash}"
+        return content_hash(data, model_size.value, model_version)
 
     def get(
-        self, data: NDArray[np.float32], model_size: ModelSize
+        self,
+        data: NDArray[np.float32],
+        model_size: ModelSize,
+        model_version: str = "",
     ) -> PredictionResult | None:
         """Get cached prediction if available."""
-        key = self._get_key(data, model_size)
-
-        if key in self._cache:
-            # Move to end (most recently used)
-            self._access_order.remove(key)
-            self._access_order.append(key)
-            return self._cache[key]
-
-        return None
+        return self._cache.get(self._get_key(data, model_size, model_version))
 
     def set(
-        self, data: NDArray[np.float32], model_size: ModelSize, result: PredictionResult
+        self,
+        data: NDArray[np.float32],
+        model_size: ModelSize,
+        result: PredictionResult,
+        model_version: str = "",
     ) -> None:
         """Store prediction in cache."""
-        key = self._get_key(data, model_size)
-
-        # Remove oldest if at capacity
-        if len(self._cache) >= self._max_size and key not in self._cache:
-            oldest = self._access_order.popleft()
-            del self._cache[oldest]
+        self._cache.set(self._get_key(data, model_size, model_version), result)
 
-        self._cache[key] = result
-        self._access_order.append(key)
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache statistics."""
+        return self._cache.get_stats()
 
 
 class BatchProcessor:
@@ -212,9 +210,15 @@ class PATPredictor:
         start_time = time.time()
 
         try:
+            # Get current version (cached results are scoped to it)
+            version_info = self.model_loader.get_current_version(request.model_size)
+            model_version = version_info.version if version_info else "unknown"
+
             # Check cache first
-            if self.enable_caching and self._cache:
-                cached = self._cache.get(request.data, request.model_size)
+            if self.enable_caching and self._cache is not None:
+                cached = self._cache.get(
+                    request.data, request.model_size, model_version
+                )
                 if cached:
                     self._cache_hits += 1
                     logger.debug("Prediction cache hit")
@@ -224,10 +228,6 @@ class PATPredictor:
             # Load model
             model = await self.model_loader.load_model(request.model_size)
 
-            # Get current version
-            version_info = self.model_loader.get_current_version(request.model_size)
-            model_version = version_info.version if version_info else "unknown"
-
             # Prepare data
             input_tensor = self._prepare_input(request.data)
 
@@ -258,8 +258,8 @@ class PATPredictor:
                     )
 
             # Cache result
-            if self.enable_caching and self._cache:
-                self._cache.set(request.data, request.model_size, result)
+            if self.enable_caching and self._cache is not None:
+                self._cache.set(request.data, request.model_size, result, model_version)
 
             # Record metrics
             self._prediction_times.append(time.time() - start_time)
@@ -388,6 +388,8 @@ class PATPredictor:
                     "cache_hit_rate": cache_hit_rate,
                 }
             )
+            if self._cache is not None:
+                metrics["cache"] = self._cache.get_stats()
 
         return metrics
 
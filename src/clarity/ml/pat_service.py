@@ -40,8 +40,10 @@ except ImportError:
 
 from clarity.core.exceptions import DataValidationError
 from clarity.core.feature_flags import is_feature_enabled
+from clarity.ml.inference_executor import InferenceExecutor, get_inference_executor
 from clarity.ml.mania_risk_analyzer import ManiaRiskAnalyzer
 from clarity.ml.preprocessing import ActigraphyDataPoint, HealthDataPreprocessor
+from clarity.monitoring.phase_timing import phase
 from clarity.ports.ml_ports import IMLModelService
 from clarity.security.secrets_manager import get_secrets_manager
 from clarity.services.health_data_service import MLPredictionError
@@ -103,6 +105,9 @@ MODERATE_CIRCADIAN_SCORE = 0.6
 HIGH_DEPRESSION_RISK = 0.7
 MODERATE_DEPRESSION_RISK = 0.4
 
+# SECURITY: Upper bound on input size to prevent memory exhaustion (2 weeks)
+MAX_ACTIGRAPHY_DATA_POINTS = 20160
+
 
 class ActigraphyInput(BaseModel):
     """Input model for actigraphy data."""
@@ -165,6 +170,10 @@ class PATMultiHeadAttention(nn.Module):
 
     Unlike standard attention where embed_dim = num_heads * head_dim,
     PAT uses head_dim = embed_dim (each head operates on full embedding).
+
+    The per-head Q, K, V projections are packed into single stacked linear
+    layers (embed_dim → num_heads * head_dim) so all heads are projected and
+    attended in one fused ``scaled_dot_product_attention`` call.
     """
 
     def __init__(
@@ -181,17 +190,11 @@ class PATMultiHeadAttention(nn.Module):
         self.head_dim = head_dim
         self.dropout = dropout
 
-        # Separate Q, K, V projections for each head (non-standard)
-        # Each head: embed_dim → head_dim (typically 96 → 96)
-        self.query_projections = nn.ModuleList(
-            [nn.Linear(embed_dim, head_dim, bias=True) for _ in range(num_heads)]
-        )
-        self.key_projections = nn.ModuleList(
-            [nn.Linear(embed_dim, head_dim, bias=True) for _ in range(num_heads)]
-        )
-        self.value_projections = nn.ModuleList(
-            [nn.Linear(embed_dim, head_dim, bias=True) for _ in range(num_heads)]
-        )
+        # Stacked Q, K, V projections for all heads (non-standard width)
+        # Rows [h * head_dim:(h + 1) * head_dim] hold head h's projection
+        self.query_projection = nn.Linear(embed_dim, num_heads * head_dim, bias=True)
+        self.key_projection = nn.Linear(embed_dim, num_heads * head_dim, bias=True)
+        self.value_projection = nn.Linear(embed_dim, num_heads * head_dim, bias=True)
 
         # Output projection
         self.output_projection = nn.Linear(head_dim * num_heads, embed_dim)
@@ -199,45 +202,104 @@ class PATMultiHeadAttention(nn.Module):
         self.dropout_layer = nn.Dropout(dropout)
         self.scale = 1.0 / math.sqrt(head_dim)
 
+    def _load_from_state_dict(
+        self,
+        state_dict: dict[str, Any],
+        prefix: str,
+        local_metadata: dict[str, Any],
+        strict: bool,  # noqa: FBT001 - signature defined by nn.Module
+        missing_keys: list[str],
+        unexpected_keys: list[str],
+        error_msgs: list[str],
+    ) -> None:
+        """Pack legacy per-head projection weights into the stacked layout.
+
+        Checkpoints written before the projections were fused store
+        ``{query,key,value}_projections.{head}.{weight,bias}``; these are
+        concatenated along the output dimension in head order.
+        """
+        for qkv_name in ("query", "key", "value"):
+            for param in ("weight", "bias"):
+                legacy_keys = [
+                    f"{prefix}{qkv_name}_projections.{head_idx}.{param}"
+                    for head_idx in range(self.num_heads)
+                ]
+                if all(key in state_dict for key in legacy_keys):
+                    state_dict[f"{prefix}{qkv_name}_projection.{param}"] = torch.cat(
+                        [state_dict.pop(key) for key in legacy_keys], dim=0
+                    )
+
+        super()._load_from_state_dict(
+            state_dict,
+            prefix,
+            local_metadata,
+            strict,
+            missing_keys,
+            unexpected_keys,
+            error_msgs,
+        )
+
+    def _split_heads(self, x: torch.Tensor) -> torch.Tensor:
+        """Reshape (batch, seq_len, num_heads * head_dim) to (batch, num_heads, seq_len, head_dim)."""
+        batch_size, seq_len, _ = x.shape
+        return x.view(batch_size, seq_len, self.num_heads, self.head_dim).transpose(
+            1, 2
+        )
+
     def forward(
-        self, query: torch.Tensor, key: torch.Tensor, value: torch.Tensor
-    ) -> tuple[torch.Tensor, torch.Tensor]:
-        """Forward pass through PAT-style multi-head attention."""
-        _batch_size, _seq_len, _embed_dim = query.shape
-
-        # Process each head independently
-        head_outputs = []
-        attention_weights = []
-
-        for head_idx in range(self.num_heads):
-            # Project Q, K, V for this head
-            q = self.query_projections[head_idx](query)  # (batch, seq_len, head_dim)
-            k = self.key_projections[head_idx](key)  # (batch, seq_len, head_dim)
-            v = self.value_projections[head_idx](value)  # (batch, seq_len, head_dim)
-
-            # Compute attention scores
-            scores = (
-                torch.matmul(q, k.transpose(-2, -1)) * self.scale
-            )  # (batch, seq_len, seq_len)
-            attn_weights = functional.softmax(scores, dim=-1)
-            attn_weights = self.dropout_layer(attn_weights)
-
-            # Apply attention to values
-            head_output = torch.matmul(attn_weights, v)  # (batch, seq_len, head_dim)
-            head_outputs.append(head_output)
-            attention_weights.append(attn_weights)
-
-        # Concatenate head outputs
-        concatenated = torch.cat(
-            head_outputs, dim=-1
-        )  # (batch, seq_len, num_heads * head_dim)
+        self,
+        query: torch.Tensor,
+        key: torch.Tensor,
+        value: torch.Tensor,
+        *,
+        need_weights: bool = True,
+    ) -> tuple[torch.Tensor, torch.Tensor | None]:
+        """Forward pass through PAT-style multi-head attention.
+
+        Args:
+            query: Query tensor (batch, seq_len, embed_dim)
+            key: Key tensor (batch, seq_len, embed_dim)
+            value: Value tensor (batch, seq_len, embed_dim)
+            need_weights: Also return attention weights averaged across heads.
+                The fused kernel never materializes the per-head
+                (seq_len x seq_len) maps, so only request them when needed.
+
+        Returns:
+            Output tensor (batch, seq_len, embed_dim) and the averaged attention
+            weights (batch, seq_len, seq_len), or None if not requested
+        """
+        batch_size, seq_len, _embed_dim = query.shape
+
+        # Project Q, K, V for all heads at once: (batch, num_heads, seq_len, head_dim)
+        q = self._split_heads(self.query_projection(query))
+        k = self._split_heads(self.key_projection(key))
+        v = self._split_heads(self.value_projection(value))
+
+        avg_attention: torch.Tensor | None = None
+        if need_weights:
+            scores = torch.matmul(q, k.transpose(-2, -1)) * self.scale
+            attn_weights = self.dropout_layer(functional.softmax(scores, dim=-1))
+            head_outputs = torch.matmul(attn_weights, v)
+
+            # Average attention weights across heads for compatibility
+            avg_attention = attn_weights.mean(dim=1)
+        else:
+            head_outputs = functional.scaled_dot_product_attention(
+                q,
+                k,
+                v,
+                dropout_p=self.dropout if self.training else 0.0,
+                scale=self.scale,
+            )
+
+        # Concatenate head outputs: (batch, seq_len, num_heads * head_dim)
+        concatenated = head_outputs.transpose(1, 2).reshape(
+            batch_size, seq_len, self.num_heads * self.head_dim
+        )
 
         # Final output projection
         output = self.output_projection(concatenated)  # (batch, seq_len, embed_dim)
 
-        # Average attention weights across heads for compatibility
-        avg_attention = torch.stack(attention_weights).mean(dim=0)
-
         return output, avg_attention
 
 
@@ -276,7 +338,7 @@ class PATTransformerBlock(nn.Module):
     def forward(self, x: torch.Tensor) -> torch.Tensor:
         """Forward pass through transformer block."""
         # Self-attention with residual connection
-        attn_out, _ = self.attention(x, x, x)
+        attn_out, _ = self.attention(x, x, x, need_weights=False)
         attn_out = self.dropout(attn_out)
         x = self.norm1(x + attn_out)
 
@@ -407,12 +469,14 @@ class PATModelService(IMLModelService):
         model_size: str = "medium",
         device: str | None = None,
         preprocessor: HealthDataPreprocessor | None = None,
+        executor: InferenceExecutor | None = None,
     ) -> None:
         self.model_size = model_size
         self.device = device or ("cuda" if torch.cuda.is_available() else "cpu")
         self.model: PATForMentalHealthClassification | None = None
         self.is_loaded = False
         self.preprocessor = preprocessor or HealthDataPreprocessor()
+        self._executor = executor
 
         # Get model configuration
         if model_size not in PAT_CONFIGS:
@@ -440,6 +504,22 @@ class PATModelService(IMLModelService):
         else:
             logger.info("PAT weights file found at %s", self.model_path)
 
+    @property
+    def model_version(self) -> str:
+        """Identifier of the configured model weights.
+
+        Used to namespace cached results so they are never served across
+        different model sizes or weight files.
+        """
+        return f"{self.model_size}:{Path(self.model_path).name}"
+
+    @property
+    def executor(self) -> InferenceExecutor:
+        """Executor pool that runs blocking inference work off the event loop."""
+        if self._executor is None:
+            self._executor = get_inference_executor()
+        return self._executor
+
     async def load_model(self) -> None:
         """Load the PAT model weights asynchronously."""
         try:
@@ -783,41 +863,37 @@ class PATModelService(IMLModelService):
         num_heads = int(config["num_heads"])  # 6 or 12
         head_dim = int(config["head_dim"])  # 96
 
-        # Convert Q, K, V weights for each head separately
+        # Convert Q, K, V weights into stacked (all-heads) projections
         for qkv_name in ["query", "key", "value"]:
             if qkv_name in attn_group:
                 qkv_group = attn_group[qkv_name]
+                param_prefix = f"encoder.transformer_layers.{layer_idx}.attention.{qkv_name}_projection"
 
                 if "kernel:0" in qkv_group:
                     # TF shape: [embed_dim, num_heads, head_dim] = (96, 12, 96)
                     tf_weight_data = qkv_group["kernel:0"][:]
                     tf_weight_np = np.array(tf_weight_data)
+                    embed_dim = tf_weight_np.shape[0]
 
-                    # Split into separate heads
-                    for head_idx in range(num_heads):
-                        # Extract weight for this head: [embed_dim, head_dim]
-                        head_weight = tf_weight_np[:, head_idx, :]  # (96, 96)
+                    # PyTorch Linear expects [output_dim, input_dim]
+                    # = [num_heads * head_dim, embed_dim], heads in order
+                    pytorch_weight = np.ascontiguousarray(
+                        tf_weight_np.reshape(embed_dim, num_heads * head_dim).T
+                    )  # (96, 12, 96) → (1152, 96)
 
-                        # PyTorch Linear expects [output_dim, input_dim] = [head_dim, embed_dim]
-                        pytorch_weight = head_weight.T  # (96, 96) → (96, 96)
-
-                        # Store in state dict
-                        param_name = f"encoder.transformer_layers.{layer_idx}.attention.{qkv_name}_projections.{head_idx}.weight"
-                        state_dict[param_name] = torch.from_numpy(pytorch_weight)
+                    state_dict[f"{param_prefix}.weight"] = torch.from_numpy(
+                        pytorch_weight
+                    )
 
                 if "bias:0" in qkv_group:
                     # TF shape: [num_heads, head_dim] = (12, 96)
                     tf_bias_data = qkv_group["bias:0"][:]
                     tf_bias_np = np.array(tf_bias_data)
 
-                    # Split into separate heads
-                    for head_idx in range(num_heads):
-                        # Extract bias for this head: [head_dim]
-                        head_bias = tf_bias_np[head_idx, :]  # (96,)
-
-                        # Store in state dict
-                        param_name = f"encoder.transformer_layers.{layer_idx}.attention.{qkv_name}_projections.{head_idx}.bias"
-                        state_dict[param_name] = torch.from_numpy(head_bias)
+                    # Flatten heads in order: (12, 96) → (1152,)
+                    state_dict[f"{param_prefix}.bias"] = torch.from_numpy(
+                        tf_bias_np.reshape(num_heads * head_dim)
+                    )
 
         # Convert attention output projection
         if "attention_output" in attn_group:
@@ -1100,6 +1176,113 @@ class PATModelService(IMLModelService):
         empty_data_msg = "No actigraphy data provided"
         raise DataValidationError(empty_data_msg)
 
+    @staticmethod
+    def _validate_input_size(input_data: ActigraphyInput) -> None:
+        """Validate input data bounds to prevent memory exhaustion."""
+        data_point_count = len(input_data.data_points)
+
+        if data_point_count == 0:
+            PATModelService._raise_empty_data_error()
+
+        if data_point_count > MAX_ACTIGRAPHY_DATA_POINTS:
+            PATModelService._raise_data_too_large_error(
+                data_point_count, MAX_ACTIGRAPHY_DATA_POINTS
+            )
+
+    def _run_model(self, input_tensor: torch.Tensor) -> dict[str, torch.Tensor]:
+        """Run a single no-grad forward pass over a ``(batch, input_size)`` tensor."""
+        assert self.model is not None, "Model must be loaded at this point"  # noqa: S101
+
+        with torch.no_grad():
+            return cast("dict[str, torch.Tensor]", self.model(input_tensor))
+
+    @staticmethod
+    def _slice_outputs(
+        outputs: dict[str, torch.Tensor], index: int
+    ) -> dict[str, torch.Tensor]:
+        """Select one sample from batched outputs, keeping the batch dimension."""
+        return {name: tensor[index : index + 1] for name, tensor in outputs.items()}
+
+    def _analyze_sync(self, input_data: ActigraphyInput) -> ActigraphyAnalysis:
+        """Preprocess, infer and post-process one input (blocking)."""
+        with phase("pat_preprocess"):
+            input_tensor = self._preprocess_actigraphy_data(input_data.data_points)
+
+        # Add batch dimension
+        with phase("pat_forward"):
+            outputs = self._run_model(input_tensor.unsqueeze(0))
+
+        with phase("pat_postprocess"):
+            return self._postprocess_predictions(outputs, input_data.user_id)
+
+    def _analyze_batch_sync(
+        self, inputs: list[ActigraphyInput]
+    ) -> list[ActigraphyAnalysis]:
+        """Preprocess, infer and post-process a batch of inputs (blocking)."""
+        with phase("pat_preprocess"):
+            batch_tensor = torch.stack(
+                [
+                    self._preprocess_actigraphy_data(input_data.data_points)
+                    for input_data in inputs
+                ]
+            )
+
+        with phase("pat_forward"):
+            outputs = self._run_model(batch_tensor)
+
+        with phase("pat_postprocess"):
+            return [
+                self._postprocess_predictions(
+                    self._slice_outputs(outputs, index), input_data.user_id
+                )
+                for index, input_data in enumerate(inputs)
+            ]
+
+    @resilient_prediction(model_name="PAT")
+    async def analyze_actigraphy_batch(
+        self, inputs: list[ActigraphyInput]
+    ) -> list[ActigraphyAnalysis]:
+        """Analyze several actigraphy inputs with a single batched forward pass.
+
+        All inputs are preprocessed into one ``(batch, input_size)`` tensor so the
+        transformer runs once per batch instead of once per user. Results are
+        returned in the same order as ``inputs``.
+
+        Args:
+            inputs: Actigraphy inputs to analyze together
+
+        Returns:
+            Analysis results, one per input
+
+        Raises:
+            DataValidationError: If any input is empty or too large
+            MLPredictionError: If model is not loaded or inference fails
+        """
+        if not inputs:
+            return []
+
+        logger.info("Analyzing actigraphy batch of %d inputs", len(inputs))
+
+        try:
+            for input_data in inputs:
+                self._validate_input_size(input_data)
+
+            if not self.is_loaded or not self.model:
+                self._raise_model_not_loaded_error()
+
+            analyses = await self.executor.run(self._analyze_batch_sync, inputs)
+
+        except DataValidationError:
+            raise
+        except MLPredictionError:
+            raise
+        except Exception as e:
+            logger.exception("PAT batch analysis failed for %d inputs", len(inputs))
+            error_msg = f"PAT model batch analysis failed: {e!s}"
+            raise MLPredictionError(error_msg, model_name="PAT") from e
+        else:
+            return analyses
+
     @resilient_prediction(model_name="PAT")
     async def analyze_actigraphy(
         self, input_data: ActigraphyInput
@@ -1124,37 +1307,15 @@ class PATModelService(IMLModelService):
 
         try:
             # SECURITY: Validate input data bounds FIRST to prevent memory exhaustion
-            max_data_points = 20160  # 2 weeks max for safety
-            data_point_count = len(input_data.data_points)
-
-            if data_point_count == 0:
-                self._raise_empty_data_error()
-
-            if data_point_count > max_data_points:
-                self._raise_data_too_large_error(data_point_count, max_data_points)
+            self._validate_input_size(input_data)
 
             # Check model loading status AFTER data validation
             if not self.is_loaded or not self.model:
                 self._raise_model_not_loaded_error()
 
-            assert (  # noqa: S101
-                self.model is not None
-            ), "Model must be loaded at this point"
-
-            # Preprocess input data
-            input_tensor = self._preprocess_actigraphy_data(input_data.data_points)
-
-            # Add batch dimension
-            input_tensor = input_tensor.unsqueeze(0)
-
-            model = self.model
-
-            # Run inference - resilience is handled by the decorator
-            with torch.no_grad():
-                outputs = cast("dict[str, torch.Tensor]", model(input_tensor))
-
-            # Post-process outputs
-            analysis = self._postprocess_predictions(outputs, input_data.user_id)
+            # Preprocess, infer and post-process on the inference pool so the
+            # event loop stays responsive - resilience is handled by the decorator
+            analysis = await self.executor.run(self._analyze_sync, input_data)
 
             logger.info(
                 "Actigraphy analysis complete for user %s",
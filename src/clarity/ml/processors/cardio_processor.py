@@ -6,14 +6,23 @@ Implements domain-specific preprocessing and feature extraction for cardiac heal
 
 # removed - breaks FastAPI
 
-from datetime import datetime
+from collections.abc import Sequence
+from datetime import datetime, timedelta
+from itertools import starmap
 import logging
 from typing import TYPE_CHECKING
 
 import numpy as np
-import pandas as pd  # type: ignore[import-untyped]
 from pydantic import BaseModel, Field
 
+from clarity.ml.processors.resampling_kernel import (
+    HOURS_PER_DAY,
+    BinnedSeries,
+    SeriesSpec,
+    prepare_series,
+    prepare_series_batch,
+)
+
 if TYPE_CHECKING:
     pass  # Only for type stubs now
 
@@ -32,12 +41,26 @@ PERCENTILE_25 = 25  # 25th percentile for recovery analysis
 PERCENTILE_75 = 75  # 75th percentile for elevated HR
 
 # Processing parameters
-HR_RESAMPLE_INTERVAL = "1T"  # 1-minute intervals
-HRV_RESAMPLE_INTERVAL = "5T"  # 5-minute intervals
+HR_RESAMPLE_INTERVAL = timedelta(minutes=1)  # 1-minute intervals
+HRV_RESAMPLE_INTERVAL = timedelta(minutes=5)  # 5-minute intervals
 HR_INTERPOLATION_LIMIT = 5  # max gap to interpolate
 HRV_INTERPOLATION_LIMIT = 2  # max gap to interpolate
 SMOOTHING_WINDOW = 3  # rolling window size
 
+HR_SERIES_SPEC = SeriesSpec(
+    step=HR_RESAMPLE_INTERVAL,
+    lower=MIN_HEART_RATE,
+    upper=MAX_HEART_RATE,
+    interpolation_limit=HR_INTERPOLATION_LIMIT,
+    smoothing_window=SMOOTHING_WINDOW,
+)
+HRV_SERIES_SPEC = SeriesSpec(
+    step=HRV_RESAMPLE_INTERVAL,
+    lower=MIN_HRV,
+    upper=MAX_HRV,
+    interpolation_limit=HRV_INTERPOLATION_LIMIT,
+)
+
 # Night and day hours for circadian analysis
 NIGHT_HOURS = [22, 23, 0, 1, 2, 3, 4, 5]
 DAY_HOURS = [8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19]
@@ -115,95 +138,126 @@ class CardioProcessor:
                 features.avg_hr,
                 features.resting_hr,
             )
+            return self._feature_vector(features)
 
-            # Return as list for fusion layer
-            return [
-                features.avg_hr,
-                features.max_hr,
-                features.resting_hr,
-                features.hr_variability,
-                features.avg_hrv,
-                features.hrv_variability,
-                features.hr_recovery_score,
-                features.circadian_rhythm_score,
+    def process_batch(
+        self,
+        users: Sequence[
+            tuple[
+                list[datetime],
+                list[float],
+                list[datetime] | None,
+                list[float] | None,
             ]
+        ],
+    ) -> list[list[float]]:
+        """Extract cardiovascular features for many users at once.
 
-    @staticmethod
-    def _preprocess_heart_rate(
-        timestamps: list[datetime], values: list[float]
-    ) -> pd.Series:
-        """Clean and normalize heart rate time series."""
-        if not timestamps or not values:
-            return pd.Series(dtype=float)
-
-        # Create pandas Series for resampling
-        ts = pd.Series(values, index=pd.to_datetime(timestamps))
+        All users' series are resampled together by the shared kernel.
 
-        # Resample to 1-minute frequency
-        hr_per_min = ts.resample(HR_RESAMPLE_INTERVAL).mean()
-
-        # Remove outliers (HR outside physiological range)
-        hr_per_min = hr_per_min.mask(
-            (hr_per_min <= MIN_HEART_RATE) | (hr_per_min > MAX_HEART_RATE), np.nan
-        )
-
-        # Fill short gaps by interpolation
-        hr_interpolated = hr_per_min.interpolate(
-            limit=HR_INTERPOLATION_LIMIT, limit_direction="forward"
-        )
-
-        # Apply smoothing
-        hr_smoothed = hr_interpolated.rolling(
-            window=SMOOTHING_WINDOW, min_periods=1, center=True
-        ).mean()
+        Args:
+            users: ``(hr_timestamps, hr_values, hrv_timestamps, hrv_values)``
+                per user, as accepted by :meth:`process`
 
-        # Fill remaining NaNs with forward fill
-        return hr_smoothed.ffill().bfill()
+        Returns:
+            One list of 8 cardiovascular features per user, in input order
+        """
+        try:
+            hr_series = prepare_series_batch(
+                [
+                    (hr_ts, hr_vals) if hr_ts and hr_vals else ([], [])
+                    for hr_ts, hr_vals, _, _ in users
+                ],
+                HR_SERIES_SPEC,
+            )
+            hrv_series = prepare_series_batch(
+                [
+                    (hrv_ts, hrv_vals) if hrv_ts and hrv_vals else ([], [])
+                    for _, _, hrv_ts, hrv_vals in users
+                ],
+                HRV_SERIES_SPEC,
+            )
+        except Exception:  # noqa: BLE001 - isolate the failing user below
+            self.logger.warning("Batch resampling failed, processing users one by one")
+            return list(starmap(self.process, users))
+
+        vectors = []
+        for (_, _, hrv_ts, hrv_vals), hr_clean, hrv_clean in zip(
+            users, hr_series, hrv_series, strict=True
+        ):
+            try:
+                features = self._extract_features(
+                    hr_clean, hrv_clean if hrv_ts and hrv_vals else None
+                )
+            except Exception:
+                self.logger.exception("Error processing cardiovascular data")
+                vectors.append([0.0] * 8)
+            else:
+                vectors.append(self._feature_vector(features))
+        return vectors
 
     @staticmethod
-    def _preprocess_hrv(timestamps: list[datetime], values: list[float]) -> pd.Series:
-        """Clean and normalize HRV time series."""
-        if not timestamps or not values:
-            return pd.Series(dtype=float)
+    def _feature_vector(features: CardioFeatures) -> list[float]:
+        """Features as a list for the fusion layer."""
+        return [
+            features.avg_hr,
+            features.max_hr,
+            features.resting_hr,
+            features.hr_variability,
+            features.avg_hrv,
+            features.hrv_variability,
+            features.hr_recovery_score,
+            features.circadian_rhythm_score,
+        ]
 
-        # Create pandas Series
-        ts = pd.Series(values, index=pd.to_datetime(timestamps))
-
-        # Resample to 5-minute frequency (HRV is typically less frequent)
-        hrv_resampled = ts.resample(HRV_RESAMPLE_INTERVAL).mean()
+    @staticmethod
+    def _preprocess_heart_rate(
+        timestamps: list[datetime], values: list[float]
+    ) -> BinnedSeries:
+        """Clean and normalize heart rate time series.
 
-        # Remove outliers (HRV outside physiological range)
-        hrv_resampled = hrv_resampled.mask(
-            (hrv_resampled <= MIN_HRV) | (hrv_resampled > MAX_HRV), np.nan
-        )
+        1-minute means with outliers removed, short gaps interpolated and a
+        3-minute centered smoothing window.
+        """
+        if not timestamps or not values:
+            return BinnedSeries.empty(HR_RESAMPLE_INTERVAL)
+        return prepare_series(timestamps, values, HR_SERIES_SPEC)
 
-        # Interpolate short gaps
-        hrv_interpolated = hrv_resampled.interpolate(limit=HRV_INTERPOLATION_LIMIT)
+    @staticmethod
+    def _preprocess_hrv(
+        timestamps: list[datetime], values: list[float]
+    ) -> BinnedSeries:
+        """Clean and normalize HRV time series.
 
-        # Fill remaining NaNs
-        return hrv_interpolated.ffill().bfill()
+        5-minute means (HRV is typically less frequent) with outliers removed
+        and short gaps interpolated.
+        """
+        if not timestamps or not values:
+            return BinnedSeries.empty(HRV_RESAMPLE_INTERVAL)
+        return prepare_series(timestamps, values, HRV_SERIES_SPEC)
 
     def _extract_features(
         self,
-        hr_series: pd.Series,
-        hrv_series: pd.Series | None,
+        hr_series: BinnedSeries,
+        hrv_series: BinnedSeries | None,
     ) -> CardioFeatures:
         """Extract cardiovascular features from cleaned time series."""
         # Basic HR statistics
         if len(hr_series) > 0:
-            avg_hr = float(np.nanmean(hr_series))
-            max_hr = float(np.nanmax(hr_series))
+            hr_values = hr_series.values
+            avg_hr = float(np.nanmean(hr_values))
+            max_hr = float(np.nanmax(hr_values))
             resting_hr = float(
-                np.nanpercentile(hr_series, PERCENTILE_10)
+                np.nanpercentile(hr_values, PERCENTILE_10)
             )  # 10th percentile as resting
-            hr_variability = float(np.nanstd(hr_series))
+            hr_variability = float(np.nanstd(hr_values))
         else:
             avg_hr = max_hr = resting_hr = hr_variability = 0.0
 
         # HRV statistics
         if hrv_series is not None and len(hrv_series) > 0:
-            avg_hrv = float(np.nanmean(hrv_series))
-            hrv_variability = float(np.nanstd(hrv_series))
+            avg_hrv = float(np.nanmean(hrv_series.values))
+            hrv_variability = float(np.nanstd(hrv_series.values))
         else:
             avg_hrv = hrv_variability = 0.0
 
@@ -223,18 +277,19 @@ class CardioProcessor:
         )
 
     @staticmethod
-    def _calculate_recovery_score(hr_series: pd.Series) -> float:
+    def _calculate_recovery_score(hr_series: BinnedSeries) -> float:
         """Calculate heart rate recovery score (0-1, higher is better)."""
         if len(hr_series) < MIN_DATA_HOURS:  # Need at least 24 hours of data
             return 0.5  # Neutral score
 
         try:
             # Calculate ratio of resting periods to elevated periods
-            resting_threshold = np.nanpercentile(hr_series, PERCENTILE_25)
-            elevated_threshold = np.nanpercentile(hr_series, PERCENTILE_75)
+            hr_values = hr_series.values
+            resting_threshold = np.nanpercentile(hr_values, PERCENTILE_25)
+            elevated_threshold = np.nanpercentile(hr_values, PERCENTILE_75)
 
-            resting_periods = (hr_series <= resting_threshold).sum()
-            elevated_periods = (hr_series >= elevated_threshold).sum()
+            resting_periods = int(np.count_nonzero(hr_values <= resting_threshold))
+            elevated_periods = int(np.count_nonzero(hr_values >= elevated_threshold))
 
             if elevated_periods == 0:
                 return 1.0
@@ -246,32 +301,41 @@ class CardioProcessor:
             return 0.5
 
     @staticmethod
-    def _calculate_circadian_score(hr_series: pd.Series) -> float:
+    def _calculate_circadian_score(hr_series: BinnedSeries) -> float:
         """Calculate circadian rhythm regularity score (0-1, higher is better)."""
         if len(hr_series) < MIN_DATA_HOURS:  # Need at least 24 hours
             return 0.5
 
         try:
-            if not isinstance(hr_series.index, pd.DatetimeIndex):
-                logger.warning(
-                    "hr_series.index is not DatetimeIndex in _calculate_circadian_score. "
-                    "Cannot calculate hourly means."
-                )
-                return 0.5  # Return default score if index type is not as expected
-
             # Group by hour of day and calculate consistency
-            hourly_means = hr_series.groupby(hr_series.index.hour).mean()
+            hours = hr_series.hours
+            valid = ~np.isnan(hr_series.values)
+            covered = np.bincount(hours, minlength=HOURS_PER_DAY) > 0
 
-            if len(hourly_means) < MIN_HOURLY_COVERAGE:  # Need reasonable coverage
+            if np.count_nonzero(covered) < MIN_HOURLY_COVERAGE:  # Need coverage
                 return 0.5
 
+            sums = np.bincount(
+                hours[valid],
+                weights=hr_series.values[valid],
+                minlength=HOURS_PER_DAY,
+            )
+            counts = np.bincount(hours[valid], minlength=HOURS_PER_DAY)
+            has_mean = counts > 0
+            hourly_means = np.divide(
+                sums, counts, out=np.full(HOURS_PER_DAY, np.nan), where=has_mean
+            )
+
             # Calculate day/night difference (expect lower HR at night)
-            night_hr = hourly_means[hourly_means.index.isin(NIGHT_HOURS)].mean()
-            day_hr = hourly_means[hourly_means.index.isin(DAY_HOURS)].mean()
+            night = [hour for hour in NIGHT_HOURS if has_mean[hour]]
+            day = [hour for hour in DAY_HOURS if has_mean[hour]]
 
-            if pd.isna(night_hr) or pd.isna(day_hr):
+            if not night or not day:
                 return 0.5
 
+            night_hr = hourly_means[night].mean()
+            day_hr = hourly_means[day].mean()
+
             # Healthy circadian pattern: day HR > night HR
             day_night_diff = day_hr - night_hr
 
@@ -0,0 +1,317 @@
+"""NumPy resampling kernel shared by the cardio and respiration processors.
+
+The processors used to build a ``pd.Series`` per signal and chain
+``resample().mean()``, ``mask``, ``interpolate(limit=...)``,
+``rolling(center=True).mean()`` and ``ffill().bfill()``. This kernel produces
+the same series with plain array operations:
+
+- samples are binned with ``np.bincount`` into fixed-width bins anchored at
+  local midnight of the first day (pandas' default ``origin="start_day"``)
+- out-of-range bin means are masked to NaN
+- NaN runs are filled by linear interpolation, at most ``limit`` bins forward
+  from the last valid bin (trailing runs repeat the last value)
+- an odd centered rolling mean ignores NaN (``min_periods=1``)
+- remaining NaNs are forward- then backward-filled
+
+Every step works on a ragged batch: several users' series are concatenated
+into one flat array with segment boundaries, so ``prepare_series_batch``
+processes many users with a single set of vectorized operations.
+"""
+
+# removed - breaks FastAPI
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta, tzinfo
+
+import numpy as np
+import numpy.typing as npt
+
+__all__ = ["BinnedSeries", "SeriesSpec", "prepare_series", "prepare_series_batch"]
+
+FloatArray = npt.NDArray[np.float64]
+IntArray = npt.NDArray[np.int64]
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+_MICROSECOND = timedelta(microseconds=1)
+_DAY_US = 86_400_000_000
+_HOUR_US = 3_600_000_000
+HOURS_PER_DAY = 24
+
+
+@dataclass(frozen=True)
+class SeriesSpec:
+    """Preprocessing parameters for one signal.
+
+    Bin means ``<= lower`` or ``> upper`` are treated as outliers.
+    """
+
+    step: timedelta
+    lower: float
+    upper: float
+    interpolation_limit: int
+    smoothing_window: int | None = None
+
+    def __post_init__(self) -> None:
+        """Validate the parameters."""
+        if self.step <= timedelta(0) or _DAY_US % (self.step // _MICROSECOND):
+            msg = f"step must divide a day evenly, got {self.step}"
+            raise ValueError(msg)
+        if self.smoothing_window is not None and self.smoothing_window % 2 == 0:
+            msg = "smoothing_window must be odd for a centered window"
+            raise ValueError(msg)
+
+
+@dataclass(frozen=True)
+class BinnedSeries:
+    """A regularly binned series starting at ``start``.
+
+    ``hours`` gives the local hour of day of every bin; it assumes a constant
+    UTC offset over the series.
+    """
+
+    values: FloatArray
+    start: datetime | None
+    step: timedelta
+    hours: npt.NDArray[np.intp]
+
+    def __len__(self) -> int:
+        """Number of bins."""
+        return len(self.values)
+
+    @classmethod
+    def empty(cls, step: timedelta) -> "BinnedSeries":
+        """Series without any bins."""
+        return cls(
+            values=np.empty(0, dtype=np.float64),
+            start=None,
+            step=step,
+            hours=np.empty(0, dtype=np.intp),
+        )
+
+
+@dataclass
+class _Segments:
+    """Boundaries of the users' series within the flat batch array."""
+
+    starts: IntArray  # first flat index of every series
+    ends: IntArray  # one past the last flat index of every series
+    start_of: IntArray  # per flat index: first flat index of its series
+    end_of: IntArray  # per flat index: one past the last flat index of its series
+
+    @classmethod
+    def from_lengths(cls, lengths: IntArray) -> "_Segments":
+        ends = np.cumsum(lengths)
+        starts = ends - lengths
+        return cls(
+            starts=starts,
+            ends=ends,
+            start_of=np.repeat(starts, lengths),
+            end_of=np.repeat(ends, lengths),
+        )
+
+
+def _epoch_micros(timestamps: Sequence[datetime]) -> tuple[IntArray, int]:
+    """Absolute epoch microseconds and the UTC offset (in microseconds)."""
+    offset = timestamps[0].utcoffset()
+    if offset is None:
+        naive = np.array(timestamps, dtype="datetime64[us]").astype(np.int64)
+        return naive, 0
+    micros = np.fromiter(
+        ((timestamp - _EPOCH) // _MICROSECOND for timestamp in timestamps),
+        dtype=np.int64,
+        count=len(timestamps),
+    )
+    return micros, offset // _MICROSECOND
+
+
+def _previous_valid(valid: npt.NDArray[np.bool_], segments: _Segments) -> IntArray:
+    """Index of the last valid entry at or before each position (-1: none)."""
+    positions = np.arange(len(valid))
+    previous = np.where(valid, positions, -1)
+    np.maximum.accumulate(previous, out=previous)
+    previous[previous < segments.start_of] = -1
+    return previous
+
+
+def _next_valid(valid: npt.NDArray[np.bool_], segments: _Segments) -> IntArray:
+    """Index of the first valid entry at or after each position (-1: none)."""
+    positions = np.arange(len(valid))
+    following = np.where(valid, positions, len(valid))
+    following = np.minimum.accumulate(following[::-1])[::-1]
+    following[following >= segments.end_of] = -1
+    return following
+
+
+def _interpolate_forward(
+    values: FloatArray, segments: _Segments, limit: int
+) -> FloatArray:
+    """Linearly fill up to ``limit`` NaNs after each valid value.
+
+    Matches ``Series.interpolate(limit=limit, limit_direction="forward")``.
+    """
+    valid = ~np.isnan(values)
+    previous = _previous_valid(valid, segments)
+    following = _next_valid(valid, segments)
+    positions = np.arange(len(values))
+
+    fill = ~valid & (previous >= 0) & (positions - previous <= limit)
+    result = values.copy()
+    if not fill.any():
+        return result
+
+    left = previous[fill]
+    right = following[fill]
+    left_values = values[left]
+    # Trailing NaN runs have no right neighbour and repeat the last value
+    has_right = right >= 0
+    right_safe = np.where(has_right, right, left)
+    right_values = values[right_safe]
+    span = np.where(has_right, right_safe - left, 1)
+    slope = (right_values - left_values) / span
+    result[fill] = np.where(
+        has_right, slope * (positions[fill] - left) + left_values, left_values
+    )
+    return result
+
+
+def _rolling_mean(values: FloatArray, segments: _Segments, window: int) -> FloatArray:
+    """Centered rolling mean of the valid values in each window.
+
+    Matches ``Series.rolling(window, min_periods=1, center=True).mean()`` for
+    odd windows.
+    """
+    valid = ~np.isnan(values)
+    filled = np.where(valid, values, 0.0)
+    positions = np.arange(len(values))
+    sums = np.zeros_like(values)
+    counts = np.zeros(len(values), dtype=np.int64)
+
+    half = window // 2
+    for shift in range(-half, half + 1):
+        source = positions + shift
+        inside = (source >= segments.start_of) & (source < segments.end_of)
+        source = np.where(inside, source, positions)
+        sums += np.where(inside, filled[source], 0.0)
+        counts += inside & valid[source]
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(counts > 0, sums / counts, np.nan)
+
+
+def _fill_remaining(values: FloatArray, segments: _Segments) -> FloatArray:
+    """Forward-fill, then backward-fill, NaNs within each series."""
+    valid = ~np.isnan(values)
+    previous = _previous_valid(valid, segments)
+    result = np.where(previous >= 0, values[np.maximum(previous, 0)], np.nan)
+
+    valid = ~np.isnan(result)
+    following = _next_valid(valid, segments)
+    return np.where(following >= 0, result[np.maximum(following, 0)], np.nan)
+
+
+def prepare_series_batch(
+    series: Sequence[tuple[Sequence[datetime], Sequence[float]]], spec: SeriesSpec
+) -> list[BinnedSeries]:
+    """Bin, clean, interpolate and smooth several users' series at once.
+
+    Args:
+        series: ``(timestamps, values)`` per user
+        spec: Preprocessing parameters
+
+    Returns:
+        One binned series per input, in input order (empty for empty input)
+
+    Raises:
+        ValueError: If timestamps and values differ in length
+    """
+    step_us = spec.step // _MICROSECOND
+    bins: list[IntArray] = []
+    samples: list[FloatArray] = []
+    firsts: list[int] = []
+    lengths: list[int] = []
+    metadata: list[tuple[int, int, tzinfo | None] | None] = []
+
+    for timestamps, values in series:
+        if len(timestamps) != len(values):
+            msg = "timestamps and values must have the same length"
+            raise ValueError(msg)
+        if not len(timestamps):
+            bins.append(np.empty(0, dtype=np.int64))
+            samples.append(np.empty(0, dtype=np.float64))
+            firsts.append(0)
+            lengths.append(0)
+            metadata.append(None)
+            continue
+
+        micros, offset = _epoch_micros(timestamps)
+        local = micros + offset
+        # Bins are anchored at local midnight of the first day
+        origin = int(local.min()) // _DAY_US * _DAY_US
+        bin_index = (local - origin) // step_us
+        first, last = int(bin_index.min()), int(bin_index.max())
+
+        bins.append(bin_index - first)
+        samples.append(np.asarray(values, dtype=np.float64))
+        firsts.append(first)
+        lengths.append(last - first + 1)
+        metadata.append((origin, offset, timestamps[0].tzinfo))
+
+    segments = _Segments.from_lengths(np.asarray(lengths, dtype=np.int64))
+    flat_bins = np.concatenate([
+        bin_index + start
+        for bin_index, start in zip(bins, segments.starts, strict=True)
+    ]).astype(np.intp)
+    flat_values = np.concatenate(samples)
+    total = int(segments.ends[-1]) if len(segments.ends) else 0
+
+    # Binned mean (NaN samples are ignored, empty bins are NaN)
+    sample_valid = ~np.isnan(flat_values)
+    sums = np.bincount(
+        flat_bins[sample_valid], weights=flat_values[sample_valid], minlength=total
+    )
+    counts = np.bincount(flat_bins[sample_valid], minlength=total)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        means = np.where(counts > 0, sums / counts, np.nan)
+
+    means[(means <= spec.lower) | (means > spec.upper)] = np.nan
+    result = _interpolate_forward(means, segments, spec.interpolation_limit)
+    if spec.smoothing_window is not None:
+        result = _rolling_mean(result, segments, spec.smoothing_window)
+    result = _fill_remaining(result, segments)
+
+    output: list[BinnedSeries] = []
+    for index, meta in enumerate(metadata):
+        if meta is None:
+            output.append(BinnedSeries.empty(spec.step))
+            continue
+        origin, offset, zone = meta
+        first_us = firsts[index] * step_us
+        start = _EPOCH + timedelta(microseconds=origin + first_us - offset)
+        start = start.astimezone(zone) if zone else start.replace(tzinfo=None)
+        start_local_us = first_us + step_us * np.arange(lengths[index])
+        output.append(
+            BinnedSeries(
+                values=result[segments.starts[index] : segments.ends[index]],
+                start=start,
+                step=spec.step,
+                hours=(start_local_us // _HOUR_US % HOURS_PER_DAY).astype(np.intp),
+            )
+        )
+    return output
+
+
+def prepare_series(
+    timestamps: Sequence[datetime], values: Sequence[float], spec: SeriesSpec
+) -> BinnedSeries:
+    """Bin, clean, interpolate and smooth one series.
+
+    Args:
+        timestamps: Sample timestamps (any order)
+        values: Sample values
+        spec: Preprocessing parameters
+
+    Returns:
+        The binned series (empty for empty input)
+    """
+    return prepare_series_batch([(timestamps, values)], spec)[0]
@@ -6,14 +6,22 @@ Implements domain-specific preprocessing and feature extraction for respiratory
 
 # removed - breaks FastAPI
 
-from datetime import datetime
+from collections.abc import Sequence
+from datetime import datetime, timedelta
+from itertools import starmap
 import logging
 from typing import TYPE_CHECKING
 
 import numpy as np
-import pandas as pd  # type: ignore[import-untyped]
 from pydantic import BaseModel, Field
 
+from clarity.ml.processors.resampling_kernel import (
+    BinnedSeries,
+    SeriesSpec,
+    prepare_series,
+    prepare_series_batch,
+)
+
 if TYPE_CHECKING:
     pass  # Only for type stubs now
 
@@ -34,15 +42,39 @@ DEFAULT_MIN_SPO2 = 95.0  # % - normal minimum SpO2
 DEFAULT_SPO2_VARIABILITY = 1.0  # % - normal SpO2 variability
 DEFAULT_STABILITY_SCORE = 0.5  # neutral stability score
 DEFAULT_EFFICIENCY_SCORE = 0.8  # good oxygenation score
+DEFAULT_FEATURES = (
+    DEFAULT_RR,
+    DEFAULT_RESTING_RR,
+    DEFAULT_RR_VARIABILITY,
+    DEFAULT_SPO2,
+    DEFAULT_MIN_SPO2,
+    DEFAULT_SPO2_VARIABILITY,
+    DEFAULT_STABILITY_SCORE,
+    DEFAULT_EFFICIENCY_SCORE,
+)
 
 # Processing parameters
-RR_RESAMPLE_INTERVAL = "5T"  # 5-minute intervals for RR resampling
-SPO2_RESAMPLE_INTERVAL = "10T"  # 10-minute intervals for SpO2 resampling
+RR_RESAMPLE_INTERVAL = timedelta(minutes=5)  # 5-minute intervals for RR resampling
+SPO2_RESAMPLE_INTERVAL = timedelta(minutes=10)  # 10-minute intervals for SpO2
 RR_INTERPOLATION_LIMIT = 3  # periods - max gap to interpolate for RR
 SPO2_INTERPOLATION_LIMIT = 2  # periods - max gap to interpolate for SpO2
 SMOOTHING_WINDOW = 3  # periods - rolling window for smoothing
 PERCENTILE_25 = 25  # 25th percentile for resting rate calculation
 
+RR_SERIES_SPEC = SeriesSpec(
+    step=RR_RESAMPLE_INTERVAL,
+    lower=MIN_RESPIRATORY_RATE,
+    upper=MAX_RESPIRATORY_RATE,
+    interpolation_limit=RR_INTERPOLATION_LIMIT,
+    smoothing_window=SMOOTHING_WINDOW,
+)
+SPO2_SERIES_SPEC = SeriesSpec(
+    step=SPO2_RESAMPLE_INTERVAL,
+    lower=MIN_SPO2,
+    upper=MAX_SPO2,
+    interpolation_limit=SPO2_INTERPOLATION_LIMIT,
+)
+
 # Stability analysis parameters
 MIN_STABILITY_DATA_HOURS = 1  # minimum hours of data for stability analysis
 STABILITY_DATA_POINTS = 12  # data points needed (1 hour at 5-min intervals)
@@ -126,97 +158,120 @@ class RespirationProcessor:
         except Exception:
             self.logger.exception("Error processing respiratory data")
             # Return default values on error
-            return [
-                DEFAULT_RR,
-                DEFAULT_RESTING_RR,
-                DEFAULT_RR_VARIABILITY,
-                DEFAULT_SPO2,
-                DEFAULT_MIN_SPO2,
-                DEFAULT_SPO2_VARIABILITY,
-                DEFAULT_STABILITY_SCORE,
-                DEFAULT_EFFICIENCY_SCORE,
-            ]
+            return list(DEFAULT_FEATURES)
         else:
-            # Return as list for fusion layer
-            return [
-                features.avg_respiratory_rate,
-                features.resting_respiratory_rate,
-                features.respiratory_variability,
-                features.avg_spo2,
-                features.min_spo2,
-                features.spo2_variability,
-                features.respiratory_stability_score,
-                features.oxygenation_efficiency_score,
-            ]
-
-    @staticmethod
-    def _preprocess_respiratory_rate(
-        timestamps: list[datetime], values: list[float]
-    ) -> pd.Series:
-        """Clean and normalize respiratory rate time series."""
-        if not timestamps or not values:
-            return pd.Series(dtype=float)
-
-        # Create pandas Series for resampling
-        ts = pd.Series(values, index=pd.to_datetime(timestamps))
+            return self._feature_vector(features)
 
-        # Resample to 5-minute frequency (RR is typically less frequent than HR)
-        rr_resampled = ts.resample(RR_RESAMPLE_INTERVAL).mean()
-
-        # Remove outliers (RR outside physiological range)
-        rr_resampled = rr_resampled.mask(
-            (rr_resampled <= MIN_RESPIRATORY_RATE)
-            | (rr_resampled > MAX_RESPIRATORY_RATE),
-            np.nan,
-        )
+    def process_batch(
+        self,
+        users: Sequence[
+            tuple[
+                list[datetime] | None,
+                list[float] | None,
+                list[datetime] | None,
+                list[float] | None,
+            ]
+        ],
+    ) -> list[list[float]]:
+        """Extract respiratory features for many users at once.
 
-        # Fill short gaps by interpolation (up to 3 periods = 15 minutes)
-        rr_interpolated = rr_resampled.interpolate(
-            limit=RR_INTERPOLATION_LIMIT, limit_direction="forward"
-        )
+        All users' series are resampled together by the shared kernel.
 
-        # Apply light smoothing (3-period moving average)
-        rr_smoothed = rr_interpolated.rolling(
-            window=SMOOTHING_WINDOW, min_periods=1, center=True
-        ).mean()
+        Args:
+            users: ``(rr_timestamps, rr_values, spo2_timestamps, spo2_values)``
+                per user, as accepted by :meth:`process`
 
-        # Fill remaining NaNs
-        return rr_smoothed.ffill().bfill()
+        Returns:
+            One list of 8 respiratory features per user, in input order
+        """
+        try:
+            rr_series = prepare_series_batch(
+                [
+                    (rr_ts, rr_vals) if rr_ts and rr_vals else ([], [])
+                    for rr_ts, rr_vals, _, _ in users
+                ],
+                RR_SERIES_SPEC,
+            )
+            spo2_series = prepare_series_batch(
+                [
+                    (spo2_ts, spo2_vals) if spo2_ts and spo2_vals else ([], [])
+                    for _, _, spo2_ts, spo2_vals in users
+                ],
+                SPO2_SERIES_SPEC,
+            )
+        except Exception:  # noqa: BLE001 - isolate the failing user below
+            self.logger.warning("Batch resampling failed, processing users one by one")
+            return list(starmap(self.process, users))
+
+        vectors = []
+        for (rr_ts, rr_vals, spo2_ts, spo2_vals), rr_clean, spo2_clean in zip(
+            users, rr_series, spo2_series, strict=True
+        ):
+            try:
+                features = self._extract_features(
+                    rr_clean if rr_ts and rr_vals else None,
+                    spo2_clean if spo2_ts and spo2_vals else None,
+                )
+            except Exception:
+                self.logger.exception("Error processing respiratory data")
+                vectors.append(list(DEFAULT_FEATURES))
+            else:
+                vectors.append(self._feature_vector(features))
+        return vectors
 
     @staticmethod
-    def _preprocess_spo2(timestamps: list[datetime], values: list[float]) -> pd.Series:
-        """Clean and normalize SpO2 time series."""
-        if not timestamps or not values:
-            return pd.Series(dtype=float)
-
-        # Create pandas Series
-        ts = pd.Series(values, index=pd.to_datetime(timestamps))
+    def _feature_vector(features: RespirationFeatures) -> list[float]:
+        """Features as a list for the fusion layer."""
+        return [
+            features.avg_respiratory_rate,
+            features.resting_respiratory_rate,
+            features.respiratory_variability,
+            features.avg_spo2,
+            features.min_spo2,
+            features.spo2_variability,
+            features.respiratory_stability_score,
+            features.oxygenation_efficiency_score,
+        ]
 
-        # Resample to 10-minute frequency (SpO2 is often periodic)
-        spo2_resampled = ts.resample(SPO2_RESAMPLE_INTERVAL).mean()
+    @staticmethod
+    def _preprocess_respiratory_rate(
+        timestamps: list[datetime], values: list[float]
+    ) -> BinnedSeries:
+        """Clean and normalize respiratory rate time series.
 
-        # Remove outliers (SpO2 outside physiological range)
-        spo2_resampled = spo2_resampled.mask(
-            (spo2_resampled <= MIN_SPO2) | (spo2_resampled > MAX_SPO2), np.nan
-        )
+        5-minute means (RR is typically less frequent than HR) with outliers
+        removed, gaps of up to 15 minutes interpolated and a 3-period centered
+        smoothing window.
+        """
+        if not timestamps or not values:
+            return BinnedSeries.empty(RR_RESAMPLE_INTERVAL)
+        return prepare_series(timestamps, values, RR_SERIES_SPEC)
 
-        # Interpolate short gaps
-        spo2_interpolated = spo2_resampled.interpolate(limit=SPO2_INTERPOLATION_LIMIT)
+    @staticmethod
+    def _preprocess_spo2(
+        timestamps: list[datetime], values: list[float]
+    ) -> BinnedSeries:
+        """Clean and normalize SpO2 time series.
 
-        # Fill remaining NaNs
-        return spo2_interpolated.ffill().bfill()
+        10-minute means (SpO2 is often periodic) with outliers removed and
+        short gaps interpolated.
+        """
+        if not timestamps or not values:
+            return BinnedSeries.empty(SPO2_RESAMPLE_INTERVAL)
+        return prepare_series(timestamps, values, SPO2_SERIES_SPEC)
 
     def _extract_features(
         self,
-        rr_series: pd.Series | None,
-        spo2_series: pd.Series | None,
+        rr_series: BinnedSeries | None,
+        spo2_series: BinnedSeries | None,
     ) -> RespirationFeatures:
         """Extract respiratory features from cleaned time series."""
         # Respiratory rate statistics
         if rr_series is not None and len(rr_series) > 0:
-            avg_respiratory_rate = float(np.nanmean(rr_series))
-            resting_respiratory_rate = float(np.nanpercentile(rr_series, PERCENTILE_25))
-            respiratory_variability = float(np.nanstd(rr_series))
+            rr_values = rr_series.values
+            avg_respiratory_rate = float(np.nanmean(rr_values))
+            resting_respiratory_rate = float(np.nanpercentile(rr_values, PERCENTILE_25))
+            respiratory_variability = float(np.nanstd(rr_values))
         else:
             avg_respiratory_rate = DEFAULT_RR
             resting_respiratory_rate = DEFAULT_RESTING_RR
@@ -224,9 +279,10 @@ class RespirationProcessor:
 
         # SpO2 statistics
         if spo2_series is not None and len(spo2_series) > 0:
-            avg_spo2 = float(np.nanmean(spo2_series))
-            min_spo2 = float(np.nanmin(spo2_series))
-            spo2_variability = float(np.nanstd(spo2_series))
+            spo2_values = spo2_series.values
+            avg_spo2 = float(np.nanmean(spo2_values))
+            min_spo2 = float(np.nanmin(spo2_values))
+            spo2_variability = float(np.nanstd(spo2_values))
         else:
             avg_spo2 = DEFAULT_SPO2
             min_spo2 = DEFAULT_MIN_SPO2
@@ -248,15 +304,15 @@ class RespirationProcessor:
         )
 
     @staticmethod
-    def _calculate_stability_score(rr_series: pd.Series | None) -> float:
+    def _calculate_stability_score(rr_series: BinnedSeries | None) -> float:
         """Calculate respiratory stability score (0-1, higher is better)."""
         if rr_series is None or len(rr_series) < STABILITY_DATA_POINTS:
             return 0.5  # Neutral score
 
         try:
             # Calculate coefficient of variation (CV = std/mean)
-            mean_rr = np.nanmean(rr_series)
-            std_rr = np.nanstd(rr_series)
+            mean_rr = np.nanmean(rr_series.values)
+            std_rr = np.nanstd(rr_series.values)
 
             if mean_rr == 0:
                 return 0.5
@@ -273,14 +329,14 @@ class RespirationProcessor:
             return 0.5
 
     @staticmethod
-    def _calculate_oxygenation_score(spo2_series: pd.Series | None) -> float:
+    def _calculate_oxygenation_score(spo2_series: BinnedSeries | None) -> float:
         """Calculate oxygenation efficiency score (0-1, higher is better)."""
         if spo2_series is None or len(spo2_series) < OXYGENATION_DATA_POINTS:
             return 0.8  # Default good score
 
         try:
-            mean_spo2 = np.nanmean(spo2_series)
-            min_spo2 = np.nanmin(spo2_series)
+            mean_spo2 = np.nanmean(spo2_series.values)
+            min_spo2 = np.nanmin(spo2_series.values)
 
             # Score based on average SpO2 and minimum SpO2
             # Excellent: avg >98%, min >95%
@@ -11,7 +11,7 @@ The transformation process:
 Key Features:
 - NHANES-based population normalization
 - Quality scoring for data validation
-- Caching for performance optimization
+- Bounded, content-keyed result caching (optionally as compact float32 buffers)
 - Comprehensive transformation statistics
 - Circadian-aware padding for realistic actigraphy patterns
 
@@ -21,6 +21,7 @@ comprehensive error handling, and extensive validation.
 
 # removed - breaks FastAPI
 
+from dataclasses import dataclass
 from datetime import datetime
 import logging
 from typing import Any
@@ -40,6 +41,8 @@ from clarity.core.constants import (
     MINUTES_PER_DAY,
     MINUTES_PER_HOUR,
     MINUTES_PER_WEEK,
+    PROXY_TRANSFORM_CACHE_MAX_BYTES,
+    PROXY_TRANSFORM_CACHE_MAX_ENTRIES,
     PROXY_VALUE_CLIP_MAX,
     PROXY_VALUE_CLIP_MIN,
     QUALITY_WEIGHT_COMPLETENESS,
@@ -59,10 +62,18 @@ from clarity.core.exceptions import (
 )
 from clarity.core.types import FloatArray, LoggerProtocol, NHANESStats, StepCount
 from clarity.ml.nhanes_stats import lookup_norm_stats
+from clarity.ml.result_cache import ResultCache, content_hash
+from clarity.monitoring.pat_metrics import (
+    record_result_cache_lookup,
+    update_result_cache_metrics,
+)
 from clarity.utils.time_window import prepare_for_pat_inference
 
 logger: LoggerProtocol = logging.getLogger(__name__)
 
+# Global transformer instance shared by API handlers
+_proxy_actigraphy_transformer: "ProxyActigraphyTransformer | None" = None
+
 # Updated NHANES statistics based on sqrt-transformed step counts
 # These values are more appropriate for proxy actigraphy transformation
 DEFAULT_NHANES_STATS: dict[str, NHANESStats] = {
@@ -108,6 +119,24 @@ class ProxyActigraphyResult(BaseModel):
     )
 
 
+@dataclass(slots=True)
+class _CompactProxyResult:
+    """Cached transformation with the proxy vector held as a float32 buffer."""
+
+    result: ProxyActigraphyResult  # stored with an empty vector
+    vector: NDArray[np.float32]
+
+    @classmethod
+    def from_result(cls, result: ProxyActigraphyResult) -> "_CompactProxyResult":
+        return cls(
+            result=result.model_copy(update={"vector": []}),
+            vector=np.asarray(result.vector, dtype=np.float32),
+        )
+
+    def to_result(self) -> ProxyActigraphyResult:
+        return self.result.model_copy(update={"vector": self.vector.tolist()})
+
+
 def _get_nhanes_stats_for_year(year: int) -> tuple[float, float]:
     """Get NHANES normalization statistics for a given year.
 
@@ -193,6 +222,36 @@ def _generate_circadian_padding(
     return padding_values
 
 
+def smooth_proxy_values_batch(
+    proxy_batch: FloatArray, window_size: int = SMOOTHING_WINDOW_SIZE
+) -> FloatArray:
+    """Apply temporal median smoothing to many proxy series at once.
+
+    Each row is smoothed independently with a centered rolling median over
+    ``2 * (window_size // 2) + 1`` samples; the first and last
+    ``window_size // 2`` samples of each row are left unchanged.
+
+    Args:
+        proxy_batch: Proxy actigraphy values shaped (n_series, n_minutes)
+        window_size: Size of smoothing window
+
+    Returns:
+        Smoothed copy of ``proxy_batch``
+    """
+    smoothed = np.array(proxy_batch, copy=True)
+    half_window = window_size // 2
+    span = 2 * half_window + 1
+    if smoothed.shape[-1] < max(window_size, span):
+        return smoothed
+
+    # Strided (n_series, n_windows, span) view, no copy until the median
+    windows = np.lib.stride_tricks.sliding_window_view(proxy_batch, span, axis=-1)
+    smoothed[..., half_window : smoothed.shape[-1] - half_window] = np.median(
+        windows, axis=-1
+    )
+    return smoothed
+
+
 def _smooth_proxy_values(
     proxy_values: FloatArray, window_size: int = SMOOTHING_WINDOW_SIZE
 ) -> FloatArray:
@@ -208,16 +267,8 @@ def _smooth_proxy_values(
     if len(proxy_values) < window_size:
         return proxy_values
 
-    # Apply light smoothing using a moving average
-    smoothed = np.copy(proxy_values)
-    half_window = window_size // 2
-
-    for i in range(half_window, len(proxy_values) - half_window):
-        window_vals = proxy_values[i - half_window : i + half_window + 1]
-        # Use median to preserve important signal characteristics
-        smoothed[i] = np.median(window_vals)
-
-    return smoothed
+    # Use a rolling median to preserve important signal characteristics
+    return smooth_proxy_values_batch(proxy_values[np.newaxis, :], window_size)[0]
 
 
 class ProxyActigraphyTransformer:
@@ -228,17 +279,34 @@ class ProxyActigraphyTransformer:
     """
 
     def __init__(
-        self, reference_year: int = 2025, *, cache_enabled: bool = True
+        self,
+        reference_year: int = 2025,
+        *,
+        cache_enabled: bool = True,
+        cache_max_entries: int = PROXY_TRANSFORM_CACHE_MAX_ENTRIES,
+        cache_max_bytes: int = PROXY_TRANSFORM_CACHE_MAX_BYTES,
+        compact_cache: bool = False,
     ) -> None:
         """Initialize the proxy actigraphy transformer.
 
         Args:
             reference_year: NHANES reference year for normalization
             cache_enabled: Whether to enable result caching
+            cache_max_entries: Maximum number of cached transformations
+            cache_max_bytes: Byte budget for cached transformations
+            compact_cache: Store cached proxy vectors as float32 buffers
+                instead of Python float lists (values are rounded to float32)
         """
         self.reference_year = reference_year
         self.cache_enabled = cache_enabled
-        self._cache: dict[str, ProxyActigraphyResult] = {}
+        self.compact_cache = compact_cache
+        self._cache: ResultCache[ProxyActigraphyResult | _CompactProxyResult] = (
+            ResultCache(
+                max_entries=cache_max_entries,
+                max_bytes=cache_max_bytes,
+                name="proxy_actigraphy",
+            )
+        )
 
         # Load NHANES normalization parameters
         self.nhanes_mean, self.nhanes_std = lookup_norm_stats(reference_year)
@@ -265,6 +333,37 @@ class ProxyActigraphyTransformer:
         Returns:
             Normalized proxy actigraphy values
         """
+        normalized = self._normalize_steps(steps_per_min, padding_mask)
+
+        # Apply temporal smoothing to reduce unrealistic step changes
+        smoothed = _smooth_proxy_values(normalized)
+
+        # Clip extreme values to reasonable range
+        return np.clip(smoothed, PROXY_VALUE_CLIP_MIN, PROXY_VALUE_CLIP_MAX)
+
+    def steps_to_movement_proxy_batch(
+        self, steps_batch: FloatArray, padding_masks: NDArray[np.bool_] | None = None
+    ) -> FloatArray:
+        """Convert many step count series to movement proxy values at once.
+
+        Same transformation as ``steps_to_movement_proxy`` applied to each row,
+        with the smoothing vectorized across the whole batch.
+
+        Args:
+            steps_batch: Step counts per minute shaped (n_series, n_minutes)
+            padding_masks: Boolean array of the same shape (True = padded)
+
+        Returns:
+            Normalized proxy actigraphy values shaped (n_series, n_minutes)
+        """
+        normalized = self._normalize_steps(steps_batch, padding_masks)
+        smoothed = smooth_proxy_values_batch(normalized)
+        return np.clip(smoothed, PROXY_VALUE_CLIP_MIN, PROXY_VALUE_CLIP_MAX)
+
+    def _normalize_steps(
+        self, steps_per_min: FloatArray, padding_mask: NDArray[np.bool_] | None
+    ) -> FloatArray:
+        """Square-root transform and NHANES z-score step counts."""
         # Apply square root transformation for variance stabilization
         sqrt_steps = np.sqrt(np.maximum(steps_per_min, 0))
 
@@ -286,11 +385,7 @@ class ProxyActigraphyTransformer:
                 0, CIRCADIAN_PADDING_VARIATION_STD, int(np.sum(padding_mask))
             )
 
-        # Apply temporal smoothing to reduce unrealistic step changes
-        smoothed = _smooth_proxy_values(normalized)
-
-        # Clip extreme values to reasonable range
-        return np.clip(smoothed, PROXY_VALUE_CLIP_MIN, PROXY_VALUE_CLIP_MAX)
+        return normalized
 
     def transform_step_data(self, step_data: StepCountData) -> ProxyActigraphyResult:
         """Transform step count data to proxy actigraphy.
@@ -304,15 +399,15 @@ class ProxyActigraphyTransformer:
         Raises:
             DataValidationError: If input data is invalid
         """
-        # Generate cache key
-        cache_key = (
-            f"{step_data.user_id}_{step_data.upload_id}_{len(step_data.step_counts)}"
-        )
-
         # Check cache if enabled
-        if self.cache_enabled and cache_key in self._cache:
-            logger.info("Returning cached transformation for %s", cache_key)
-            return self._cache[cache_key]
+        cache_key = self._cache_key(step_data)
+        if self.cache_enabled:
+            cached = self._get_cached(cache_key, step_data)
+            if cached is not None:
+                logger.info(
+                    "Returning cached transformation for %s", step_data.upload_id
+                )
+                return cached
 
         try:
             # Prepare and validate step data
@@ -365,8 +460,8 @@ class ProxyActigraphyTransformer:
 
             # Cache result if enabled
             if self.cache_enabled:
-                self._cache[cache_key] = result
-                logger.debug("Cached transformation for %s", cache_key)
+                self._store_cached(cache_key, result)
+                logger.debug("Cached transformation for %s", step_data.upload_id)
 
             logger.info("Successfully transformed step data for %s", step_data.user_id)
             logger.info("  • Quality score: %.3f", quality_score)
@@ -384,6 +479,58 @@ class ProxyActigraphyTransformer:
         else:
             return result
 
+    def _cache_key(self, step_data: StepCountData) -> str:
+        """Build a cache key from the step values and NHANES reference.
+
+        Identifiers are deliberately excluded: a re-sent upload with corrected
+        counts gets a new key, and identical data is transformed only once.
+        """
+        return content_hash(
+            np.asarray(step_data.step_counts, dtype=float),
+            len(step_data.timestamps),
+            self.reference_year,
+        )
+
+    def _get_cached(
+        self, cache_key: str, step_data: StepCountData
+    ) -> ProxyActigraphyResult | None:
+        """Look up a cached transformation re-labelled for this upload."""
+        cached = self._cache.get(cache_key)
+        record_result_cache_lookup(self._cache.name, hit=cached is not None)
+        if cached is None:
+            return None
+
+        result = (
+            cached.to_result() if isinstance(cached, _CompactProxyResult) else cached
+        )
+        return result.model_copy(
+            update={"user_id": step_data.user_id, "upload_id": step_data.upload_id}
+        )
+
+    def _store_cached(self, cache_key: str, result: ProxyActigraphyResult) -> None:
+        """Store a transformation, compacting its vector if configured."""
+        entry = (
+            _CompactProxyResult.from_result(result) if self.compact_cache else result
+        )
+        self._cache.set(cache_key, entry)
+        update_result_cache_metrics(self._cache.get_stats())
+
+    def get_cache_stats(self) -> dict[str, Any]:
+        """Get transformation cache statistics.
+
+        Returns:
+            Dictionary with occupancy and hit/miss/eviction counters
+        """
+        stats = self._cache.get_stats()
+        stats["enabled"] = self.cache_enabled
+        stats["compact"] = self.compact_cache
+        return stats
+
+    def clear_cache(self) -> None:
+        """Remove all cached transformations."""
+        self._cache.clear()
+        update_result_cache_metrics(self._cache.get_stats())
+
     @staticmethod
     def _prepare_step_data(
         step_counts: list[StepCount], timestamps: list[datetime]
@@ -547,17 +694,42 @@ class ProxyActigraphyTransformer:
 
 
 def create_proxy_actigraphy_transformer(
-    reference_year: int = 2025, *, cache_enabled: bool = True
+    reference_year: int = 2025,
+    *,
+    cache_enabled: bool = True,
+    cache_max_bytes: int = PROXY_TRANSFORM_CACHE_MAX_BYTES,
+    compact_cache: bool = False,
 ) -> ProxyActigraphyTransformer:
     """Factory function to create a ProxyActigraphyTransformer instance.
 
     Args:
         reference_year: NHANES reference year for normalization
         cache_enabled: Whether to enable result caching
+        cache_max_bytes: Byte budget for cached transformations
+        compact_cache: Store cached proxy vectors as float32 buffers
 
     Returns:
         Configured ProxyActigraphyTransformer instance
     """
     return ProxyActigraphyTransformer(
-        reference_year=reference_year, cache_enabled=cache_enabled
+        reference_year=reference_year,
+        cache_enabled=cache_enabled,
+        cache_max_bytes=cache_max_bytes,
+        compact_cache=compact_cache,
     )
+
+
+def get_proxy_actigraphy_transformer() -> ProxyActigraphyTransformer:
+    """Get or create the shared transformer so its cache persists across requests.
+
+    Returns:
+        Global ProxyActigraphyTransformer instance (compact cache enabled)
+    """
+    global _proxy_actigraphy_transformer  # noqa: PLW0603 - Singleton pattern for shared transform cache
+
+    if _proxy_actigraphy_transformer is None:
+        _proxy_actigraphy_transformer = create_proxy_actigraphy_transformer(
+            compact_cache=True
+        )
+
+    return _proxy_actigraphy_transformer
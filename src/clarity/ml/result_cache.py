@@ -0,0 +1,342 @@
+"""Bounded, content-addressed cache for model inference results.
+
+Inference results are keyed by a hash of the raw numeric input (plus the
+model version, the preprocessing applied and any caller-specific namespace),
+so two requests only share an entry when they carry identical data. Keys are
+built without preprocessing, which runs once, on the inference executor.
+
+``ResultCache`` is an LRU with optional per-entry TTL and a byte budget:
+- ``get`` / ``set`` are O(1); expired entries are dropped lazily on access or
+  when they reach the cold end of the LRU, never by a full scan
+- entry sizes are accounted in bytes and the least recently used entries are
+  evicted once either the entry or the byte limit is exceeded
+- hits, misses, evictions and expirations are counted for monitoring
+
+It backs ``AsyncInferenceEngine``, ``PATPerformanceOptimizer`` and
+``pat_predictor.PredictionCache``.
+"""
+
+# removed - breaks FastAPI
+
+from collections import OrderedDict
+from collections.abc import Mapping
+from dataclasses import dataclass, fields, is_dataclass
+import hashlib
+import sys
+import threading
+import time
+from typing import Any, Generic, TypeVar
+
+import numpy as np
+from numpy.typing import NDArray
+from pydantic import BaseModel
+import torch
+
+from clarity.ml.preprocessing import HealthDataPreprocessor
+
+V = TypeVar("V")
+
+# PAT input length (1 week at 1-minute resolution)
+PAT_INPUT_LENGTH = 10080
+
+# Digest size in bytes (hex keys are twice as long)
+CACHE_KEY_DIGEST_SIZE = 32
+
+DEFAULT_MAX_ENTRIES = 1024
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024  # 64 MiB
+
+
+@dataclass(slots=True)
+class _CacheEntry(Generic[V]):
+    """Cached value with its expiry deadline and accounted size."""
+
+    value: V
+    expires_at: float | None
+    size_bytes: int
+
+
+def content_hash(
+    buffer: NDArray[Any] | torch.Tensor,
+    *parts: object,
+    dtype: type[np.floating[Any]] = np.float32,
+) -> str:
+    """Hash a numeric buffer together with extra key parts.
+
+    The buffer is hashed as contiguous ``dtype`` bytes so equal inputs map to
+    the same key regardless of their original dtype or memory layout.
+
+    Args:
+        buffer: Array or tensor to hash
+        *parts: Additional key components (model version, namespace, ...)
+        dtype: Precision the buffer is hashed at
+
+    Returns:
+        Hex digest string
+    """
+    if isinstance(buffer, torch.Tensor):
+        buffer = buffer.detach().cpu().numpy()
+    array = np.ascontiguousarray(buffer, dtype=dtype)
+
+    digest = hashlib.blake2b(digest_size=CACHE_KEY_DIGEST_SIZE)
+    digest.update(str(array.shape).encode())
+    digest.update(array.data)
+    for part in parts:
+        digest.update(b"\x1f")
+        digest.update(str(part).encode())
+    return digest.hexdigest()
+
+
+def actigraphy_cache_key(
+    input_data: Any,
+    model_version: object = "",
+    preprocessor: HealthDataPreprocessor | None = None,
+    target_length: int = PAT_INPUT_LENGTH,
+) -> str:
+    """Build a content-addressed cache key for a PAT actigraphy input.
+
+    Args:
+        input_data: ``ActigraphyInput`` to key
+        model_version: Version of the model producing the result
+        preprocessor: Preprocessor used by the model service
+        target_length: Model input length
+
+    Returns:
+        Hex digest over the raw data points, user, preprocessing and model
+        version
+    """
+    strategy = (preprocessor or HealthDataPreprocessor()).strategy
+    points = input_data.data_points
+    # Raw (timestamp, value) pairs at full precision - hashing them is far
+    # cheaper than running the preprocessing the model service does anyway
+    buffer = np.fromiter(
+        (
+            field
+            for point in points
+            for field in (point.timestamp.timestamp(), point.value)
+        ),
+        dtype=np.float64,
+        count=2 * len(points),
+    )
+    # Analyses embed the user id, so results are never shared across users
+    return content_hash(
+        buffer,
+        input_data.user_id,
+        model_version,
+        type(strategy).__qualname__,
+        target_length,
+        dtype=np.float64,
+    )
+
+
+def service_cache_key(pat_service: object, input_data: Any) -> str:
+    """Build the cache key for an input analyzed by a PAT model service.
+
+    The key is scoped to the service's model version and uses its
+    preprocessor, falling back to the standard preprocessing strategy.
+
+    Args:
+        pat_service: ``PATModelService`` producing the result
+        input_data: ``ActigraphyInput`` to key
+
+    Returns:
+        Hex digest cache key
+    """
+    preprocessor = getattr(pat_service, "preprocessor", None)
+    return actigraphy_cache_key(
+        input_data,
+        getattr(pat_service, "model_version", ""),
+        preprocessor if isinstance(preprocessor, HealthDataPreprocessor) else None,
+    )
+
+
+def estimate_size(value: object) -> int:
+    """Estimate the memory footprint of a cached value in bytes.
+
+    Arrays and tensors report their buffer size; containers, dataclasses and
+    pydantic models are walked recursively.
+    """
+    if isinstance(value, np.ndarray):
+        return int(value.nbytes)
+    if isinstance(value, torch.Tensor):
+        return value.element_size() * value.nelement()
+    if isinstance(value, BaseModel):
+        return sys.getsizeof(value) + estimate_size(value.__dict__)
+    if is_dataclass(value) and not isinstance(value, type):
+        return sys.getsizeof(value) + sum(
+            estimate_size(getattr(value, field.name)) for field in fields(value)
+        )
+    if isinstance(value, Mapping):
+        return sys.getsizeof(value) + sum(
+            estimate_size(k) + estimate_size(v) for k, v in value.items()
+        )
+    if isinstance(value, list | tuple | set | frozenset):
+        return sys.getsizeof(value) + sum(estimate_size(item) for item in value)
+    return sys.getsizeof(value)
+
+
+class ResultCache(Generic[V]):
+    """Thread-safe LRU cache with TTL, byte accounting and statistics."""
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int | None = DEFAULT_MAX_BYTES,
+        ttl_seconds: float | None = None,
+        name: str = "results",
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of entries kept
+            max_bytes: Maximum accounted size in bytes (None disables the limit)
+            ttl_seconds: Entry lifetime in seconds (None keeps entries until evicted)
+            name: Cache name reported in statistics
+        """
+        if max_entries < 1:
+            msg = f"max_entries must be at least 1, got {max_entries}"
+            raise ValueError(msg)
+
+        self.name = name
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl_seconds
+        self._entries: OrderedDict[str, _CacheEntry[V]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._size_bytes = 0
+
+        # Statistics
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def __len__(self) -> int:
+        """Number of entries currently held (including not yet expired ones)."""
+        return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        """Check whether a live entry exists without touching LRU order."""
+        if not isinstance(key, str):
+            return False
+        entry = self._entries.get(key)
+        return entry is not None and not self._is_expired(entry, time.monotonic())
+
+    @property
+    def size_bytes(self) -> int:
+        """Accounted size of all entries in bytes."""
+        return self._size_bytes
+
+    @staticmethod
+    def _is_expired(entry: _CacheEntry[V], now: float) -> bool:
+        return entry.expires_at is not None and now >= entry.expires_at
+
+    def _remove(self, key: str) -> _CacheEntry[V]:
+        entry = self._entries.pop(key)
+        self._size_bytes -= entry.size_bytes
+        return entry
+
+    def get(self, key: str) -> V | None:
+        """Get a value, refreshing its LRU position.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value, or None if missing or expired
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            if self._is_expired(entry, time.monotonic()):
+                self._remove(key)
+                self.expirations += 1
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry.value
+
+    def set(self, key: str, value: V, size_bytes: int | None = None) -> None:
+        """Store a value as the most recently used entry.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+            size_bytes: Size of the value (estimated when omitted)
+        """
+        if size_bytes is None:
+            size_bytes = estimate_size(value)
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else None
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = _CacheEntry(value, expires_at, size_bytes)
+            self._size_bytes += size_bytes
+            self._evict()
+
+    def _evict(self) -> None:
+        """Evict least recently used entries until within limits."""
+        now = time.monotonic()
+        while self._entries and (
+            len(self._entries) > self.max_entries
+            or (self.max_bytes is not None and self._size_bytes > self.max_bytes)
+        ):
+            _, entry = self._entries.popitem(last=False)
+            self._size_bytes -= entry.size_bytes
+            if self._is_expired(entry, now):
+                self.expirations += 1
+            else:
+                self.evictions += 1
+
+    def pop(self, key: str) -> V | None:
+        """Remove an entry and return its value if present."""
+        with self._lock:
+            if key not in self._entries:
+                return None
+            return self._remove(key).value
+
+    def clear(self) -> None:
+        """Remove all entries (statistics are kept)."""
+        with self._lock:
+            self._entries.clear()
+            self._size_bytes = 0
+
+    def oldest_entry_age(self) -> float:
+        """Seconds since the least recently used live entry was stored."""
+        if self.ttl is None:
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            ages = [
+                now - (entry.expires_at - self.ttl)
+                for entry in self._entries.values()
+                if entry.expires_at is not None
+            ]
+        return max(ages, default=0.0)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache statistics.
+
+        Returns:
+            Dictionary with occupancy and hit/miss/eviction counters
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "name": self.name,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "size_bytes": self._size_bytes,
+                "max_bytes": self.max_bytes,
+                "ttl_seconds": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
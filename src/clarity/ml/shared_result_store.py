@@ -0,0 +1,268 @@
+"""Host-local inference result store shared by all worker processes.
+
+Gunicorn runs several Uvicorn workers per host and each keeps its own
+in-process ``ResultCache``, so the same actigraphy week is re-inferred once
+per worker. ``SharedResultStore`` is an optional second cache tier behind the
+in-process LRU, backed by a SQLite file in WAL mode that every worker on the
+host opens concurrently.
+
+- Entries expire after a TTL and are evicted oldest-first once the entry or
+  byte limit is exceeded; entry count and total size are kept in a one-row
+  ``totals`` table maintained by triggers, so writes never scan the table
+- Values are stored as JSON; ``decode_model`` rebuilds pydantic models with
+  ``model_construct`` so hits skip validation (and no pickled data is ever
+  loaded from a shared file)
+- All operations are synchronous and short; async callers run them through
+  ``asyncio.to_thread``
+"""
+
+# removed - breaks FastAPI
+
+import json
+import logging
+from pathlib import Path
+import sqlite3
+import threading
+import time
+from typing import Any, TypeVar
+
+from pydantic import BaseModel
+
+logger = logging.getLogger(__name__)
+
+M = TypeVar("M", bound=BaseModel)
+
+DEFAULT_SHARED_MAX_ENTRIES = 100_000
+DEFAULT_SHARED_MAX_BYTES = 256 * 1024 * 1024  # 256 MiB
+SQLITE_BUSY_TIMEOUT_SECONDS = 5.0
+
+_SCHEMA = """
+BEGIN IMMEDIATE;
+CREATE TABLE IF NOT EXISTS results (
+    key TEXT PRIMARY KEY,
+    value BLOB NOT NULL,
+    size_bytes INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    expires_at REAL
+);
+CREATE INDEX IF NOT EXISTS idx_results_created_at ON results (created_at);
+CREATE INDEX IF NOT EXISTS idx_results_expires_at ON results (expires_at);
+CREATE TABLE IF NOT EXISTS totals (
+    id INTEGER PRIMARY KEY CHECK (id = 0),
+    entries INTEGER NOT NULL,
+    size_bytes INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO totals (id, entries, size_bytes)
+    SELECT 0, COUNT(*), COALESCE(SUM(size_bytes), 0) FROM results;
+CREATE TRIGGER IF NOT EXISTS results_insert AFTER INSERT ON results BEGIN
+    UPDATE totals
+    SET entries = entries + 1, size_bytes = size_bytes + NEW.size_bytes
+    WHERE id = 0;
+END;
+CREATE TRIGGER IF NOT EXISTS results_delete AFTER DELETE ON results BEGIN
+    UPDATE totals
+    SET entries = entries - 1, size_bytes = size_bytes - OLD.size_bytes
+    WHERE id = 0;
+END;
+CREATE TRIGGER IF NOT EXISTS results_update AFTER UPDATE OF size_bytes ON results
+BEGIN
+    UPDATE totals
+    SET size_bytes = size_bytes - OLD.size_bytes + NEW.size_bytes
+    WHERE id = 0;
+END;
+COMMIT;
+"""
+
+_UPSERT = (
+    "INSERT INTO results (key, value, size_bytes, created_at, expires_at) "
+    "VALUES (?, ?, ?, ?, ?) "
+    "ON CONFLICT (key) DO UPDATE SET value = excluded.value, "
+    "size_bytes = excluded.size_bytes, created_at = excluded.created_at, "
+    "expires_at = excluded.expires_at"
+)
+
+_DELETE_OLDEST = (
+    "DELETE FROM results WHERE key IN "
+    "(SELECT key FROM results ORDER BY created_at LIMIT ?)"
+)
+
+
+def encode_model(model: BaseModel) -> bytes:
+    """Serialize a pydantic model for the shared store."""
+    return model.model_dump_json().encode()
+
+
+def decode_model(model_cls: type[M], payload: bytes) -> M:
+    """Rebuild a pydantic model from the shared store without re-validation.
+
+    Only use for data this service wrote itself with ``encode_model``.
+    """
+    return model_cls.model_construct(**json.loads(payload))
+
+
+class SharedResultStore:
+    """SQLite-backed key/value store with TTL and size limits."""
+
+    def __init__(
+        self,
+        path: str | Path,
+        max_entries: int = DEFAULT_SHARED_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_SHARED_MAX_BYTES,
+        ttl_seconds: float | None = None,
+    ) -> None:
+        """Initialize the store, creating the database file if needed.
+
+        Args:
+            path: SQLite database file shared by the host's workers
+            max_entries: Maximum number of stored entries
+            max_bytes: Maximum total size of stored values in bytes
+            ttl_seconds: Entry lifetime in seconds (None keeps entries until evicted)
+        """
+        self.path = Path(path)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl_seconds
+        self._local = threading.local()
+
+        # Statistics (per process)
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connection() as conn:
+            conn.executescript(_SCHEMA)
+
+    def _connection(self) -> sqlite3.Connection:
+        """Get this thread's connection, opening it on first use."""
+        conn: sqlite3.Connection | None = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(
+                self.path, timeout=SQLITE_BUSY_TIMEOUT_SECONDS, isolation_level=None
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def get(self, key: str) -> bytes | None:
+        """Get a stored value.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Stored bytes, or None if missing, expired or the store is unavailable
+        """
+        try:
+            row = (
+                self._connection()
+                .execute(
+                    "SELECT value FROM results WHERE key = ? "
+                    "AND (expires_at IS NULL OR expires_at > ?)",
+                    (key, time.time()),
+                )
+                .fetchone()
+            )
+        except sqlite3.Error:
+            self.errors += 1
+            logger.warning("Shared result store read failed", exc_info=True)
+            return None
+
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return bytes(row[0])
+
+    def set(self, key: str, value: bytes) -> None:
+        """Store a value and enforce TTL and size limits.
+
+        Args:
+            key: Cache key
+            value: Serialized value
+        """
+        now = time.time()
+        expires_at = now + self.ttl if self.ttl is not None else None
+        try:
+            conn = self._connection()
+            conn.execute(_UPSERT, (key, value, len(value), now, expires_at))
+            self._evict(conn, now)
+        except sqlite3.Error:
+            self.errors += 1
+            logger.warning("Shared result store write failed", exc_info=True)
+
+    @staticmethod
+    def _totals(conn: sqlite3.Connection) -> tuple[int, int]:
+        """Entry count and total value size, from the trigger-maintained row."""
+        entries, size_bytes = conn.execute(
+            "SELECT entries, size_bytes FROM totals WHERE id = 0"
+        ).fetchone()
+        return entries, size_bytes
+
+    def _evict(self, conn: sqlite3.Connection, now: float) -> None:
+        """Drop expired entries, then the oldest ones until within limits."""
+        conn.execute("DELETE FROM results WHERE expires_at <= ?", (now,))
+
+        entries, size_bytes = self._totals(conn)
+        if entries > self.max_entries:
+            conn.execute(_DELETE_OLDEST, (entries - self.max_entries,))
+            entries, size_bytes = self._totals(conn)
+
+        # Usually one entry makes room for the new one; each step is an
+        # indexed delete of the oldest row
+        while entries > 0 and size_bytes > self.max_bytes:
+            conn.execute(_DELETE_OLDEST, (1,))
+            entries, size_bytes = self._totals(conn)
+
+    def delete(self, key: str) -> None:
+        """Remove an entry."""
+        try:
+            self._connection().execute("DELETE FROM results WHERE key = ?", (key,))
+        except sqlite3.Error:
+            self.errors += 1
+            logger.warning("Shared result store delete failed", exc_info=True)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        try:
+            self._connection().execute("DELETE FROM results")
+        except sqlite3.Error:
+            self.errors += 1
+            logger.warning("Shared result store clear failed", exc_info=True)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get store statistics.
+
+        Returns:
+            Dictionary with occupancy (None if the store is unavailable) and
+            this process's hit/miss counters
+        """
+        entries: int | None = None
+        size_bytes: int | None = None
+        try:
+            entries, size_bytes = self._totals(self._connection())
+        except sqlite3.Error:
+            self.errors += 1
+            logger.warning("Shared result store stats failed", exc_info=True)
+
+        lookups = self.hits + self.misses
+        return {
+            "path": str(self.path),
+            "entries": entries,
+            "max_entries": self.max_entries,
+            "size_bytes": size_bytes,
+            "max_bytes": self.max_bytes,
+            "ttl_seconds": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "errors": self.errors,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+    def close(self) -> None:
+        """Close this thread's connection."""
+        conn: sqlite3.Connection | None = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
@@ -5,6 +5,7 @@ from clarity.monitoring.pat_metrics import (
     record_cache_miss,
     record_fallback_attempt,
     record_hot_swap,
+    record_result_cache_lookup,
     record_s3_download,
     record_security_violation,
     record_validation_attempt,
@@ -14,20 +15,35 @@ from clarity.monitoring.pat_metrics import (
     update_current_version,
     update_health_score,
     update_loading_progress,
+    update_result_cache_metrics,
+)
+from clarity.monitoring.phase_timing import (
+    PhaseTimings,
+    collect_phases,
+    is_phase_timing_enabled,
+    phase,
+    set_phase_timing_enabled,
 )
 
 __all__ = [
+    "PhaseTimings",
+    "collect_phases",
+    "is_phase_timing_enabled",
+    "phase",
     "record_cache_hit",
     "record_cache_miss",
     "record_fallback_attempt",
     "record_hot_swap",
+    "record_result_cache_lookup",
     "record_s3_download",
     "record_security_violation",
     "record_validation_attempt",
+    "set_phase_timing_enabled",
     "track_checksum_verification",
     "track_model_load",
     "update_cache_metrics",
     "update_current_version",
     "update_health_score",
     "update_loading_progress",
+    "update_result_cache_metrics",
 ]
@@ -171,6 +171,32 @@ pat_model_health_score = Gauge(
 )
 
 
+# Result Cache Metrics (inference and transform caches)
+result_cache_lookups = Counter(
+    "clarity_result_cache_lookups_total",
+    "Total number of result cache lookups",
+    ["cache", "result"],  # result: hit, miss
+)
+
+result_cache_entries = Gauge(
+    "clarity_result_cache_entries",
+    "Current number of entries in a result cache",
+    ["cache"],
+)
+
+result_cache_size_bytes = Gauge(
+    "clarity_result_cache_size_bytes",
+    "Accounted size of a result cache in bytes",
+    ["cache"],
+)
+
+result_cache_evictions = Gauge(
+    "clarity_result_cache_evictions",
+    "Entries evicted from a result cache since process start",
+    ["cache"],
+)
+
+
 # Helper Functions
 @asynccontextmanager
 async def track_model_load(
@@ -298,6 +324,28 @@ def update_cache_metrics(cache_size: int, memory_bytes: int) -> None:
     pat_model_cache_memory_bytes.set(memory_bytes)
 
 
+def record_result_cache_lookup(cache: str, *, hit: bool) -> None:
+    """Record a result cache lookup.
+
+    Args:
+        cache: Cache name
+        hit: Whether the lookup was a hit
+    """
+    result_cache_lookups.labels(cache=cache, result="hit" if hit else "miss").inc()
+
+
+def update_result_cache_metrics(stats: dict[str, Any]) -> None:
+    """Update result cache occupancy metrics.
+
+    Args:
+        stats: Statistics from ``ResultCache.get_stats()``
+    """
+    cache = str(stats["name"])
+    result_cache_entries.labels(cache=cache).set(stats["entries"])
+    result_cache_size_bytes.labels(cache=cache).set(stats["size_bytes"])
+    result_cache_evictions.labels(cache=cache).set(stats["evictions"])
+
+
 def record_s3_download(
     model_size: str,
     version: str,
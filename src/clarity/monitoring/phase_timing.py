@@ -0,0 +1,125 @@
+"""Per-request phase timing for health data processing.
+
+``phase("fusion")`` times a block of pipeline work. Every duration is
+exported to the ``clarity_health_data_processing_duration_seconds``
+histogram (``stage`` label) and, while a request is inside
+``collect_phases()``, added to that request's breakdown.
+
+The active breakdown lives in a context variable, so concurrent requests stay
+separate while the tasks and threads one request spawns (``asyncio.gather``,
+``asyncio.to_thread``, the inference executor) all report into it. Set
+``PHASE_TIMING_ENABLED=false`` to turn ``phase`` into a shared no-op context.
+"""
+
+# removed - breaks FastAPI
+
+from collections.abc import Iterator
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from contextvars import ContextVar
+import os
+import threading
+import time
+import types
+
+from clarity.api.v1.metrics import record_health_data_processing
+
+_enabled = os.getenv("PHASE_TIMING_ENABLED", "true").lower() == "true"
+_NOOP: AbstractContextManager[None] = nullcontext()
+
+
+class PhaseTimings:
+    """Accumulated phase durations of one request.
+
+    A phase entered more than once (e.g. one span per batch element) adds up.
+    """
+
+    def __init__(self) -> None:
+        self._seconds: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def add(self, name: str, seconds: float) -> None:
+        """Add a duration to a phase."""
+        with self._lock:
+            self._seconds[name] = self._seconds.get(name, 0.0) + seconds
+
+    def as_milliseconds(self) -> dict[str, float]:
+        """Phase durations in milliseconds, in first-completed order."""
+        with self._lock:
+            return {
+                name: round(seconds * 1000, 3)
+                for name, seconds in self._seconds.items()
+            }
+
+
+_current_timings: ContextVar[PhaseTimings | None] = ContextVar(
+    "clarity_phase_timings", default=None
+)
+
+
+class _Phase:
+    """Timer for one phase; reusable only sequentially."""
+
+    __slots__ = ("_started", "name")
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self._started = 0.0
+
+    def __enter__(self) -> None:
+        self._started = time.perf_counter()
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: types.TracebackType | None,
+    ) -> None:
+        elapsed = time.perf_counter() - self._started
+        record_health_data_processing(self.name, elapsed)
+        timings = _current_timings.get()
+        if timings is not None:
+            timings.add(self.name, elapsed)
+
+
+def phase(name: str) -> AbstractContextManager[None]:
+    """Time a block as processing phase ``name``.
+
+    Args:
+        name: Phase name, used as the histogram ``stage`` label; keep the set
+            of names small and fixed
+
+    Returns:
+        A context manager (a no-op when phase timing is disabled)
+    """
+    if not _enabled:
+        return _NOOP
+    return _Phase(name)
+
+
+@contextmanager
+def collect_phases() -> Iterator[PhaseTimings | None]:
+    """Collect the phases timed inside this block into a per-request breakdown.
+
+    Yields:
+        The breakdown being filled, or ``None`` when phase timing is disabled
+    """
+    if not _enabled:
+        yield None
+        return
+    timings = PhaseTimings()
+    token = _current_timings.set(timings)
+    try:
+        yield timings
+    finally:
+        _current_timings.reset(token)
+
+
+def is_phase_timing_enabled() -> bool:
+    """Whether phases are currently timed."""
+    return _enabled
+
+
+def set_phase_timing_enabled(*, enabled: bool) -> None:
+    """Turn phase timing on or off for the whole process."""
+    global _enabled  # noqa: PLW0603 - process-wide switch
+    _enabled = enabled
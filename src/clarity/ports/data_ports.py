@@ -50,6 +50,7 @@ class IHealthDataRepository(ABC):
         metric_type: str | None = None,
         start_date: datetime | None = None,
         end_date: datetime | None = None,
+        cursor: str | None = None,
     ) -> dict[str, str]:
         """Retrieve user health data with filtering and pagination.
 
@@ -60,6 +61,8 @@ class IHealthDataRepository(ABC):
             metric_type: Filter by metric type
             start_date: Filter from date
             end_date: Filter to date
+            cursor: Opaque cursor from the previous page (takes precedence
+                over ``offset``)
 
         Returns:
             Health data with pagination metadata
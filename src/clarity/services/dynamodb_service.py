@@ -24,6 +24,7 @@ if TYPE_CHECKING:
 from clarity.ports.data_ports import IHealthDataRepository
 from clarity.services.dynamodb_connection import ConnectionConfig, DynamoDBConnection
 from clarity.services.dynamodb_repository import RepositoryFactory
+from clarity.services.user_data_erasure import ErasureProgress, ProgressCallback
 
 # Configure logger
 logger = logging.getLogger(__name__)
@@ -408,6 +409,8 @@ class DynamoDBService:
         limit: int | None = None,
         *,
         scan_index_forward: bool = True,
+        exclusive_start_key: dict[str, Any] | None = None,
+        projection_expression: str | None = None,
     ) -> dict[str, Any]:
         """Query items from a table.
 
@@ -417,6 +420,8 @@ class DynamoDBService:
             expression_attribute_values: Values for the expression
             limit: Maximum number of items to return
             scan_index_forward: Sort order (True for ascending)
+            exclusive_start_key: ``LastEvaluatedKey`` of the previous page
+            projection_expression: Attributes to return (default: all)
 
         Returns:
             Dict with Items and pagination info
@@ -432,6 +437,10 @@ class DynamoDBService:
 
             if limit:
                 query_params["Limit"] = limit
+            if exclusive_start_key:
+                query_params["ExclusiveStartKey"] = exclusive_start_key
+            if projection_expression:
+                query_params["ProjectionExpression"] = projection_expression
 
             response = await asyncio.get_event_loop().run_in_executor(
                 None, lambda: table.query(**query_params)
@@ -493,6 +502,60 @@ class DynamoDBService:
             msg = f"Batch write operation failed: {e}"
             raise DynamoDBError(msg) from e
 
+    async def batch_delete_items(
+        self,
+        table_name: str,
+        keys: list[dict[str, Any]],
+        user_id: str | None = None,
+    ) -> int:
+        """Delete multiple items in batch.
+
+        ``batch_writer`` groups deletes into 25-item ``BatchWriteItem``
+        requests and resubmits unprocessed items.
+
+        Args:
+            table_name: Table name
+            keys: Primary keys of the items to delete
+            user_id: User ID for audit logging
+
+        Returns:
+            Number of keys deleted
+
+        Raises:
+            DynamoDBError: If batch delete fails
+        """
+        if not keys:
+            return 0
+
+        try:
+            table = self.dynamodb.Table(table_name)
+
+            def delete_all() -> None:
+                with table.batch_writer() as batch:
+                    for key in keys:
+                        batch.delete_item(Key=key)
+
+            await asyncio.get_event_loop().run_in_executor(None, delete_all)
+
+            for key in keys:
+                item_id = key.get("id") or key.get("user_id") or str(key)
+                self._cache.pop(self._cache_key(table_name, item_id), None)
+
+            await self._audit_log(
+                operation="batch_delete_items",
+                table=table_name,
+                item_id="batch_delete",
+                user_id=user_id,
+                metadata={"item_count": len(keys)},
+            )
+
+        except Exception as e:
+            logger.exception("Failed to batch delete items in %s", table_name)
+            msg = f"Batch delete operation failed: {e}"
+            raise DynamoDBError(msg) from e
+        else:
+            return len(keys)
+
     async def health_check(self) -> dict[str, Any]:
         """Perform a health check on the DynamoDB connection.
 
@@ -795,58 +858,23 @@ class DynamoDBHealthDataRepository(IHealthDataRepository):
         try:
             if processing_id:
                 # Delete specific processing job and related metrics
-                response = await self._dynamodb_service.query(
-                    table_name=self._dynamodb_service.tables["health_data"],
-                    key_condition_expression="user_id = :user_id AND begins_with(id, :processing_id)",
-                    expression_attribute_values={
-                        ":user_id": user_id,
-                        ":processing_id": processing_id,
-                    },
+                await self._delete_user_items(
+                    user_id,
+                    "user_id = :user_id AND begins_with(id, :processing_id)",
+                    {":user_id": user_id, ":processing_id": processing_id},
+                    ErasureProgress(store="dynamodb", user_id=user_id),
                 )
 
-                # Delete each metric
-                for item in response.get("Items", []):
-                    await self._dynamodb_service.delete_item(
-                        table_name=self._dynamodb_service.tables["health_data"],
-                        key={"id": item["id"], "user_id": user_id},
-                        user_id=user_id,
-                    )
-
                 # Delete processing record
                 await self._dynamodb_service.delete_item(
                     table_name=self._dynamodb_service.tables["processing_jobs"],
                     key={"processing_id": processing_id},
                     user_id=user_id,
                 )
+                await self._record_deletion(user_id, processing_id)
             else:
-                # Delete all user data
-                response = await self._dynamodb_service.query(
-                    table_name=self._dynamodb_service.tables["health_data"],
-                    key_condition_expression="user_id = :user_id",
-                    expression_attribute_values={":user_id": user_id},
-                )
-
-                # Delete each item
-                for item in response.get("Items", []):
-                    await self._dynamodb_service.delete_item(
-                        table_name=self._dynamodb_service.tables["health_data"],
-                        key={"id": item["id"], "user_id": user_id},
-                        user_id=user_id,
-                    )
-
-            # Create audit log
-            audit_record = {
-                "user_id": user_id,
-                "action": "data_deletion",
-                "processing_id": processing_id,
-                "timestamp": datetime.now(UTC).isoformat(),
-                "reason": "user_request",
-            }
-
-            await self._dynamodb_service.put_item(
-                table_name=self._dynamodb_service.tables["audit_logs"],
-                item=audit_record,
-            )
+                # Delete all user data (writes its own audit record)
+                await self.erase_user_items(user_id)
 
             logger.info(
                 "Deleted health data for user %s, processing %s", user_id, processing_id
@@ -998,39 +1026,97 @@ class DynamoDBHealthDataRepository(IHealthDataRepository):
             msg = f"Health summary retrieval failed: {e}"
             raise DynamoDBError(msg) from e
 
-    async def delete_user_data(self, user_id: str) -> int:
-        """Delete all health data for a user (GDPR compliance).
+    async def _delete_user_items(
+        self,
+        user_id: str,
+        key_condition_expression: str,
+        expression_attribute_values: dict[str, Any],
+        progress: ErasureProgress,
+        on_progress: ProgressCallback | None = None,
+    ) -> ErasureProgress:
+        """Page through matching health records and batch-delete each page."""
+        table_name = self._dynamodb_service.tables["health_data"]
+        start_key: dict[str, Any] | None = None
+        while True:
+            response = await self._dynamodb_service.query(
+                table_name=table_name,
+                key_condition_expression=key_condition_expression,
+                expression_attribute_values=expression_attribute_values,
+                exclusive_start_key=start_key,
+                projection_expression="id, user_id",
+            )
+            keys = [
+                {"id": item["id"], "user_id": user_id}
+                for item in response.get("Items", [])
+            ]
+            progress.listed += len(keys)
+            if keys:
+                progress.deleted += await self._dynamodb_service.batch_delete_items(
+                    table_name, keys, user_id=user_id
+                )
+                progress.batches += 1
+                if on_progress is not None:
+                    on_progress(progress)
+
+            start_key = response.get("LastEvaluatedKey")
+            if not start_key:
+                break
+
+        progress.completed = True
+        return progress
+
+    async def erase_user_items(
+        self, user_id: str, on_progress: ProgressCallback | None = None
+    ) -> ErasureProgress:
+        """Bulk-delete every health record of a user.
 
         Args:
             user_id: User identifier
+            on_progress: Called after every deleted page of records
 
         Returns:
-            Number of records deleted
+            Progress record with the number of deleted records
         """
         try:
-            # Query all user's records
-            response = await self._dynamodb_service.query(
-                table_name=self._dynamodb_service.tables["health_data"],
-                key_condition_expression="user_id = :user_id",
-                expression_attribute_values={":user_id": user_id},
+            progress = await self._delete_user_items(
+                user_id,
+                "user_id = :user_id",
+                {":user_id": user_id},
+                ErasureProgress(store="dynamodb", user_id=user_id),
+                on_progress,
             )
-
-            items = response.get("Items", [])
-            deleted_count = 0
-
-            # Delete each item
-            for item in items:
-                await self._dynamodb_service.delete_item(
-                    table_name=self._dynamodb_service.tables["health_data"],
-                    key={"id": item["id"], "user_id": user_id},
-                    user_id=user_id,
-                )
-                deleted_count += 1
-
-            logger.info("Deleted %s health records for user %s", deleted_count, user_id)
-            return deleted_count
-
+            await self._record_deletion(user_id, None)
         except Exception as e:
             logger.exception("Failed to delete health data for user %s", user_id)
             msg = f"Health data deletion failed: {e}"
             raise DynamoDBError(msg) from e
+
+        logger.info("Deleted %s health records for user %s", progress.deleted, user_id)
+        return progress
+
+    async def _record_deletion(self, user_id: str, processing_id: str | None) -> None:
+        """Write the audit record of a user-requested deletion."""
+        audit_record = {
+            "user_id": user_id,
+            "action": "data_deletion",
+            "processing_id": processing_id,
+            "timestamp": datetime.now(UTC).isoformat(),
+            "reason": "user_request",
+        }
+
+        await self._dynamodb_service.put_item(
+            table_name=self._dynamodb_service.tables["audit_logs"],
+            item=audit_record,
+        )
+
+    async def delete_user_data(self, user_id: str) -> int:
+        """Delete all health data for a user (GDPR compliance).
+
+        Args:
+            user_id: User identifier
+
+        Returns:
+            Number of records deleted
+        """
+        progress = await self.erase_user_items(user_id)
+        return progress.deleted
@@ -17,11 +17,14 @@ import uuid
 
 try:
     from clarity.services.s3_storage_service import S3StorageService
+    from clarity.services.user_data_erasure import UserDataEraser, UserItemsEraser
 
     _HAS_S3 = True
 except ImportError:
     _HAS_S3 = False
     S3StorageService = None  # type: ignore[misc, assignment]
+    UserDataEraser = None  # type: ignore[misc, assignment]
+    UserItemsEraser = None  # type: ignore[misc, assignment]
 
 from clarity.core.secure_logging import log_health_data_received
 from clarity.models.health_data import (
@@ -115,6 +118,7 @@ class HealthDataService:
                     "HEALTHKIT_RAW_BUCKET", "clarity-healthkit-raw-data"
                 ),
                 region=os.getenv("AWS_REGION", "us-east-1"),
+                raw_data_format=os.getenv("HEALTHKIT_RAW_DATA_FORMAT", "json"),
             )
         else:
             self.cloud_storage = None
@@ -311,6 +315,7 @@ class HealthDataService:
         metric_type: str | None = None,
         start_date: datetime | None = None,
         end_date: datetime | None = None,
+        cursor: str | None = None,
     ) -> dict[str, Any]:
         """Retrieve user's health data with filtering and pagination.
 
@@ -321,6 +326,7 @@ class HealthDataService:
             metric_type: Filter by specific metric type
             start_date: Filter by start date
             end_date: Filter by end date
+            cursor: Cursor returned with the previous page
 
         Returns:
             User health data with metadata
@@ -331,6 +337,10 @@ class HealthDataService:
         try:
             self.logger.debug("Retrieving health data for user: %s", user_id)
 
+            # Cursor is only forwarded when paging, so repositories without
+            # cursor support keep working for offset queries
+            page_kwargs: dict[str, Any] = {"cursor": cursor} if cursor else {}
+
             # Get user health data from repository
             health_data = await self.repository.get_user_health_data(
                 user_id=user_id,
@@ -339,11 +349,12 @@ class HealthDataService:
                 metric_type=metric_type,
                 start_date=start_date,
                 end_date=end_date,
+                **page_kwargs,
             )
 
             self.logger.info(
                 "Retrieved %s health records for user: %s",
-                len(health_data.get("metrics", [])),
+                len(health_data.get("data", health_data.get("metrics", []))),
                 user_id,
             )
 
@@ -354,11 +365,65 @@ class HealthDataService:
         else:
             return health_data
 
+    def _user_data_eraser(self) -> "UserDataEraser | None":
+        """Bulk eraser when the data lives in S3 and a bulk-erasing repository."""
+        if (
+            _HAS_S3
+            and isinstance(self.cloud_storage, S3StorageService)
+            and isinstance(self.repository, UserItemsEraser)
+        ):
+            return UserDataEraser(self.cloud_storage, self.repository)
+        return None
+
+    async def erase_user_data(self, user_id: str) -> bool:
+        """Erase all of a user's health data (GDPR/CCPA erasure).
+
+        Raw uploads and analysis results in S3 and the user's records are
+        deleted as one bulk job when the backends support it; otherwise the
+        repository deletes the user's records.
+
+        Args:
+            user_id: User whose data is erased
+
+        Returns:
+            True if every object and record was deleted
+
+        Raises:
+            HealthDataServiceError: If the erasure fails
+        """
+        try:
+            self.logger.info("Erasing all health data for user: %s", user_id)
+
+            eraser = self._user_data_eraser()
+            if eraser is None:
+                success = await self.repository.delete_health_data(
+                    user_id=user_id, processing_id=None
+                )
+            else:
+                report = await eraser.erase(user_id)
+                audit_logger.info(
+                    "Erased data for user %s (%d deleted, %d failed)",
+                    user_id,
+                    report.deleted,
+                    report.failed,
+                )
+                success = report.complete
+
+        except Exception as e:
+            self.logger.exception("Error during user data erasure")
+            msg = f"Failed to delete health data: {e!s}"
+            raise HealthDataServiceError(msg) from e
+        else:
+            return success
+
     async def delete_health_data(
         self, user_id: str, processing_id: str | None = None
     ) -> bool:
         """Delete user's health data with audit trail.
 
+        Without ``processing_id`` this is a full erasure, see
+        ``erase_user_data``.
+
         Args:
             user_id: User ID to delete data for
             processing_id: Optional specific processing job to delete
@@ -369,6 +434,9 @@ class HealthDataService:
         Raises:
             HealthDataServiceError: If deletion operation fails
         """
+        if processing_id is None:
+            return await self.erase_user_data(user_id)
+
         try:
             self.logger.info(
                 "Deleting health data: %s for user: %s", processing_id, user_id
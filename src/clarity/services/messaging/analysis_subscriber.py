@@ -5,6 +5,7 @@ Handles Pub/Sub messages for health data analysis processing.
 
 # removed - breaks FastAPI
 
+import asyncio
 import base64
 import json
 import logging
@@ -16,6 +17,7 @@ from google.cloud import storage
 
 from clarity.ml.analysis_pipeline import run_analysis_pipeline
 from clarity.services.messaging.publisher import HealthDataPublisher, get_publisher
+from clarity.storage.raw_data_archive import is_archive_key, read_raw_data
 
 logger = logging.getLogger(__name__)
 
@@ -177,15 +179,22 @@ class AnalysisSubscriber:
             if not blob.exists():
                 self._raise_health_data_not_found_error(gcs_path)
 
-            # Download and parse JSON
-            raw_json = blob.download_as_text()
-            health_data = json.loads(raw_json)
-
-            self.logger.info(
-                "Downloaded health data from GCS: %s (%d bytes)",
-                gcs_path,
-                len(raw_json),
-            )
+            if is_archive_key(blob_path):
+                # Stream-decode columnar archives without buffering the object
+                health_data = await asyncio.to_thread(self._read_archive_blob, blob)
+                self.logger.info(
+                    "Downloaded health data archive from GCS: %s", gcs_path
+                )
+            else:
+                # Download and parse JSON
+                raw_json = blob.download_as_text()
+                health_data = json.loads(raw_json)
+
+                self.logger.info(
+                    "Downloaded health data from GCS: %s (%d bytes)",
+                    gcs_path,
+                    len(raw_json),
+                )
 
         except Exception:
             self.logger.exception("Failed to download health data from %s", gcs_path)
@@ -193,6 +202,12 @@ class AnalysisSubscriber:
         else:
             return health_data  # type: ignore[no-any-return]
 
+    @staticmethod
+    def _read_archive_blob(blob: Any) -> dict[str, Any]:
+        """Decode a columnar raw data archive from a blob stream."""
+        with blob.open("rb") as stream:
+            return read_raw_data(stream)
+
     @staticmethod
     def _raise_invalid_token_error() -> None:
         """Raise HTTPException for invalid token format."""
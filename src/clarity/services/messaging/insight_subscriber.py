@@ -15,6 +15,7 @@ from fastapi import FastAPI, HTTPException, Request
 from google.cloud import storage
 
 from clarity.ml.gemini_service import GeminiService, HealthInsightRequest
+from clarity.storage.dynamodb_client import DynamoDBHealthDataRepository
 
 if TYPE_CHECKING:
     pass
@@ -54,6 +55,9 @@ class InsightSubscriber:
             project_id=project_id or "clarity-loop-backend"
         )
 
+        # Insight storage (created on first use)
+        self.insight_repository: DynamoDBHealthDataRepository | None = None
+
         # Environment settings
         self.environment = os.getenv("ENVIRONMENT", "development")
         self.pubsub_push_audience = os.getenv("PUBSUB_PUSH_AUDIENCE")
@@ -173,23 +177,30 @@ class InsightSubscriber:
     async def _store_insights(
         self, user_id: str, upload_id: str, insights: dict[str, Any]
     ) -> None:
-        """Store generated insights.
+        """Store generated insights and update the user's insight counters.
+
+        The insight id is derived from the upload id, so a redelivered
+        message does not store (or count) the same insight twice.
 
         Args:
             user_id: User identifier
             upload_id: Upload identifier
             insights: Generated insights
-
-        Note:
-            This is a placeholder. Implement actual storage logic based on your needs.
         """
-        # TODO: Implement actual storage logic
-        # Options:
-        # - Store in GCS/S3
-        # - Store in database
-        # - Send to another service
         self.logger.info("Storing insights for user %s, upload %s", user_id, upload_id)
 
+        if self.insight_repository is None:
+            self.insight_repository = DynamoDBHealthDataRepository(
+                table_name=os.getenv("DYNAMODB_TABLE_NAME", "clarity-health-data"),
+                region=os.getenv("AWS_REGION", "us-east-1"),
+            )
+
+        await self.insight_repository.save_insight(
+            user_id,
+            {**insights, "upload_id": upload_id},
+            insight_id=f"insight_{upload_id}",
+        )
+
     @staticmethod
     def _raise_invalid_token_error() -> None:
         """Raise HTTPException for invalid token format."""
@@ -8,7 +8,6 @@ Replaces Google Cloud Storage with AWS-native solution.
 
 import asyncio
 from datetime import UTC, datetime
-from functools import partial
 import json
 import logging
 from typing import TYPE_CHECKING, Any
@@ -19,6 +18,22 @@ from mypy_boto3_s3 import S3Client
 
 from clarity.models.health_data import HealthDataUpload
 from clarity.ports.storage import CloudStoragePort
+from clarity.services.user_data_erasure import (
+    ErasureProgress,
+    ProgressCallback,
+    S3BulkDeleter,
+)
+from clarity.storage.raw_data_archive import (
+    ARCHIVE_CONTENT_TYPE,
+    ARCHIVE_FORMAT,
+    ARCHIVE_SUFFIX,
+    RAW_DATA_FORMAT_COLUMNAR,
+    RAW_DATA_FORMAT_JSON,
+    RAW_DATA_FORMATS,
+    encode_raw_data,
+    is_archive_key,
+    read_raw_data,
+)
 
 if TYPE_CHECKING:
     pass  # Only for type stubs now
@@ -27,6 +42,11 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 audit_logger = logging.getLogger("audit")
 
+# Key prefixes holding per-user objects (keys are <prefix><date>/<user_id>/...)
+USER_DATA_PREFIXES = ("raw_data/", "analysis_results/")
+# Keys are laid out as ``{prefix}{YYYY}/{MM}/{DD}/{user_id}/...``
+DATE_PARTITION_DEPTH = 3
+
 __all__ = [
     "S3DownloadError",
     "S3PermissionError",
@@ -72,6 +92,7 @@ class S3StorageService(CloudStoragePort):
         *,
         enable_encryption: bool = True,
         storage_class: str = "STANDARD",
+        raw_data_format: str = RAW_DATA_FORMAT_JSON,
     ) -> None:
         """Initialize the S3 storage service.
 
@@ -81,12 +102,19 @@ class S3StorageService(CloudStoragePort):
             endpoint_url: Optional endpoint URL (for local S3 testing)
             enable_encryption: Enable server-side encryption
             storage_class: S3 storage class (STANDARD, IA, GLACIER, etc.)
+            raw_data_format: Format for raw uploads ("json" or the compressed
+                "columnar" archive); downloads read either format
         """
+        if raw_data_format not in RAW_DATA_FORMATS:
+            msg = f"Unsupported raw data format: {raw_data_format}"
+            raise ValueError(msg)
+
         self.bucket_name = bucket_name
         self.region = region
         self.endpoint_url = endpoint_url
         self.enable_encryption = enable_encryption
         self.storage_class = storage_class
+        self.raw_data_format = raw_data_format
 
         # Initialize S3 client
         self.s3_client: S3Client = boto3.client(
@@ -164,9 +192,12 @@ class S3StorageService(CloudStoragePort):
             S3UploadError: If upload fails
         """
         try:
+            columnar = self.raw_data_format == RAW_DATA_FORMAT_COLUMNAR
+
             # Create S3 key path (partitioned by date for performance)
             upload_date = datetime.now(UTC).strftime("%Y/%m/%d")
-            s3_key = f"raw_data/{upload_date}/{user_id}/{processing_id}.json"
+            suffix = ARCHIVE_SUFFIX if columnar else ".json"
+            s3_key = f"raw_data/{upload_date}/{user_id}/{processing_id}{suffix}"
             s3_uri = f"s3://{self.bucket_name}/{s3_key}"
 
             # Prepare health data for storage - DO NOT SANITIZE raw data!
@@ -211,14 +242,20 @@ class S3StorageService(CloudStoragePort):
                 ],
             }
 
+            # Serialize once; the size is reported from the same bytes
+            if columnar:
+                body = encode_raw_data(raw_data)
+            else:
+                body = json.dumps(
+                    raw_data, indent=2, default=str
+                ).encode()  # Convert UUIDs to strings
+
             # Prepare upload parameters
             upload_params: dict[str, Any] = {
                 "Bucket": self.bucket_name,
                 "Key": s3_key,
-                "Body": json.dumps(
-                    raw_data, indent=2, default=str
-                ),  # Convert UUIDs to strings
-                "ContentType": "application/json",
+                "Body": body,
+                "ContentType": ARCHIVE_CONTENT_TYPE if columnar else "application/json",
                 "StorageClass": self.storage_class,
                 "Metadata": {
                     "user-id": user_id,
@@ -230,6 +267,8 @@ class S3StorageService(CloudStoragePort):
                     "compliance": "hipaa",
                 },
             }
+            if columnar:
+                upload_params["Metadata"]["archive-format"] = ARCHIVE_FORMAT
 
             # Add server-side encryption
             if self.enable_encryption:
@@ -248,7 +287,8 @@ class S3StorageService(CloudStoragePort):
                 metadata={
                     "metrics_count": len(health_data.metrics),
                     "upload_source": health_data.upload_source,
-                    "data_size_bytes": len(json.dumps(raw_data, default=str)),
+                    "data_size_bytes": len(body),
+                    "data_format": self.raw_data_format,
                 },
             )
 
@@ -353,14 +393,19 @@ class S3StorageService(CloudStoragePort):
             S3DownloadError: If download fails
         """
         try:
-            # Download from S3
-            response = await asyncio.get_event_loop().run_in_executor(
-                None,
-                lambda: self.s3_client.get_object(Bucket=self.bucket_name, Key=s3_key),
-            )
-
-            # Parse JSON data
-            data: dict[str, Any] = json.loads(response["Body"].read().decode("utf-8"))
+            # Download and decode from S3; archives are decoded from the stream
+            def download() -> dict[str, Any]:
+                response = self.s3_client.get_object(
+                    Bucket=self.bucket_name, Key=s3_key
+                )
+                if is_archive_key(s3_key):
+                    return read_raw_data(response["Body"])
+                data: dict[str, Any] = json.loads(
+                    response["Body"].read().decode("utf-8")
+                )
+                return data
+
+            data = await asyncio.get_event_loop().run_in_executor(None, download)
 
             await self._audit_log(
                 operation="download_raw_data",
@@ -430,57 +475,71 @@ class S3StorageService(CloudStoragePort):
         else:
             return files
 
-    async def delete_user_data(self, user_id: str) -> int:
-        """Delete all data for a user (GDPR compliance).
+    async def erase_user_objects(
+        self, user_id: str, on_progress: ProgressCallback | None = None
+    ) -> ErasureProgress:
+        """Bulk-delete every raw upload and analysis result of a user.
 
         Args:
             user_id: User identifier
+            on_progress: Called after every ``DeleteObjects`` batch
 
         Returns:
-            Number of files deleted
+            Progress record with deleted and failed object counts
         """
-        try:
-            # List all user files
-            files = await self.list_user_files(user_id)
-
-            deleted_count = 0
-            # Delete files in batches
-            for file_info in files:
-                try:
-                    file_key = file_info["key"]
-                    # Use functools.partial to avoid lambda type inference issues
-                    delete_func = partial(
-                        self.s3_client.delete_object,
-                        Bucket=self.bucket_name,
-                        Key=file_key,
-                    )
-                    await asyncio.get_event_loop().run_in_executor(None, delete_func)
-                    deleted_count += 1
-                except ClientError as e:
-                    logger.warning("Failed to delete file %s: %s", file_info["key"], e)
-                    logger.debug("S3 delete error details: %s", e, exc_info=True)
-                except (OSError, TimeoutError) as e:
-                    # Network or I/O errors that shouldn't crash the deletion process
-                    logger.warning(
-                        "Network/IO error deleting file %s: %s", file_info["key"], e
-                    )
-                    logger.debug("Network error details: %s", e, exc_info=True)
+        progress = ErasureProgress(store="s3", user_id=user_id)
+        deleter = S3BulkDeleter(self.s3_client, self.bucket_name)
 
-            await self._audit_log(
-                operation="delete_user_data",
-                s3_key=f"user_data/{user_id}/*",
-                user_id=user_id,
-                metadata={"deleted_files": deleted_count},
+        try:
+            # Only the date partitions are listed across users; objects are
+            # listed under each partition's user prefix. Both steps run
+            # concurrently within the deleter's request limit.
+            partitions = await deleter.list_partitions(
+                USER_DATA_PREFIXES, DATE_PARTITION_DEPTH
+            )
+            await deleter.delete_matching(
+                [f"{partition}{user_id}/" for partition in partitions],
+                progress,
+                on_progress,
             )
+        except* Exception as eg:
+            logger.exception("Failed to delete user data")
+            msg = f"User data deletion failed: {eg.exceptions[0]}"
+            raise S3StorageError(msg) from eg
+
+        await self._audit_log(
+            operation="delete_user_data",
+            s3_key=f"user_data/{user_id}/*",
+            user_id=user_id,
+            metadata={
+                "deleted_files": progress.deleted,
+                "failed_files": progress.failed,
+                "batches": progress.batches,
+            },
+        )
 
-            logger.info("Deleted %d files for user %s", deleted_count, user_id)
+        logger.info(
+            "Deleted %d files for user %s (%d failed)",
+            progress.deleted,
+            user_id,
+            progress.failed,
+        )
+        return progress
 
-        except Exception as e:
-            logger.exception("Failed to delete user data")
-            msg = f"User data deletion failed: {e}"
-            raise S3StorageError(msg) from e
-        else:
-            return deleted_count
+    async def delete_user_data(
+        self, user_id: str, on_progress: ProgressCallback | None = None
+    ) -> int:
+        """Delete all data for a user (GDPR compliance).
+
+        Args:
+            user_id: User identifier
+            on_progress: Called after every ``DeleteObjects`` batch
+
+        Returns:
+            Number of files deleted
+        """
+        progress = await self.erase_user_objects(user_id, on_progress=on_progress)
+        return progress.deleted
 
     async def setup_bucket_lifecycle(self) -> None:
         """Set up S3 bucket lifecycle policies for automatic data management."""
@@ -718,6 +777,7 @@ def get_s3_service(
     bucket_name: str | None = None,
     region: str = "us-east-1",
     endpoint_url: str | None = None,
+    raw_data_format: str = RAW_DATA_FORMAT_JSON,
 ) -> S3StorageService:
     """Get or create global S3 service instance."""
     global _s3_service  # noqa: PLW0603 - Singleton pattern for S3 storage service
@@ -730,6 +790,7 @@ def get_s3_service(
             bucket_name=bucket_name,
             region=region,
             endpoint_url=endpoint_url,
+            raw_data_format=raw_data_format,
         )
 
     return _s3_service
@@ -0,0 +1,396 @@
+"""CLARITY Digital Twin Platform - Bulk User Data Erasure.
+
+GDPR erasure of a long-tenured user touches thousands of S3 objects and
+DynamoDB items. Deleting them one request at a time takes minutes and holds
+the default thread pool for the whole run, so erasure is done in bulk:
+
+- ``S3BulkDeleter`` finds the user's date partitions with delimiter listings,
+  pages through ``list_objects_v2`` under them and deletes the keys in
+  ``DeleteObjects`` batches of up to 1000 keys, with a bounded number of
+  batches in flight and retries for keys the batch reported as failed
+- repositories implementing ``UserItemsEraser`` page through the user's
+  items and remove them with ``batch_writer`` (25-item ``BatchWriteItem``
+  requests with unprocessed-item retries)
+- ``UserDataEraser`` runs both stores as one job and reports progress through
+  an optional callback; ``HealthDataService.erase_user_data`` uses it when
+  all of a user's data is deleted
+"""
+
+# removed - breaks FastAPI
+
+import asyncio
+from collections.abc import AsyncIterator, Callable, Iterable
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+import logging
+from typing import TYPE_CHECKING, Any, Protocol, runtime_checkable
+
+from botocore.exceptions import BotoCoreError, ClientError
+
+if TYPE_CHECKING:
+    from mypy_boto3_s3 import S3Client
+
+    from clarity.services.s3_storage_service import S3StorageService
+
+logger = logging.getLogger(__name__)
+
+__all__ = [
+    "ErasureProgress",
+    "ErasureReport",
+    "ProgressCallback",
+    "S3BulkDeleter",
+    "UserDataEraser",
+    "UserItemsEraser",
+]
+
+S3_DELETE_BATCH_SIZE = 1000  # DeleteObjects limit
+DEFAULT_MAX_CONCURRENT_BATCHES = 4
+DEFAULT_MAX_ATTEMPTS = 3
+DEFAULT_RETRY_BASE_DELAY = 0.2
+MAX_REPORTED_FAILED_KEYS = 100
+
+
+@dataclass
+class ErasureProgress:
+    """Running totals of an erasure in one store."""
+
+    store: str
+    user_id: str
+    listed: int = 0
+    deleted: int = 0
+    failed: int = 0
+    batches: int = 0
+    failed_keys: list[str] = field(default_factory=list)
+    completed: bool = False
+
+    def record_failures(self, keys: Iterable[str]) -> None:
+        """Count keys that could not be deleted, keeping a bounded sample."""
+        for key in keys:
+            self.failed += 1
+            if len(self.failed_keys) < MAX_REPORTED_FAILED_KEYS:
+                self.failed_keys.append(key)
+
+
+ProgressCallback = Callable[[ErasureProgress], None]
+
+
+@runtime_checkable
+class UserItemsEraser(Protocol):
+    """Repository able to bulk-delete every record of a user."""
+
+    async def erase_user_items(
+        self, user_id: str, on_progress: ProgressCallback | None = None
+    ) -> ErasureProgress:
+        """Delete all of a user's records, reporting progress per batch."""
+        ...
+
+
+@dataclass
+class ErasureReport:
+    """Outcome of a user data erasure across all stores."""
+
+    user_id: str
+    s3: ErasureProgress
+    dynamodb: ErasureProgress
+    started_at: datetime
+    finished_at: datetime
+
+    @property
+    def deleted(self) -> int:
+        """Total number of objects and items deleted."""
+        return self.s3.deleted + self.dynamodb.deleted
+
+    @property
+    def failed(self) -> int:
+        """Total number of objects and items that could not be deleted."""
+        return self.s3.failed + self.dynamodb.failed
+
+    @property
+    def complete(self) -> bool:
+        """Whether every store finished without failures."""
+        return self.s3.completed and self.dynamodb.completed and self.failed == 0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Summary suitable for audit logs and API responses."""
+        return {
+            "user_id": self.user_id,
+            "complete": self.complete,
+            "deleted": self.deleted,
+            "failed": self.failed,
+            "s3": {
+                "deleted": self.s3.deleted,
+                "failed": self.s3.failed,
+                "batches": self.s3.batches,
+            },
+            "dynamodb": {
+                "deleted": self.dynamodb.deleted,
+                "failed": self.dynamodb.failed,
+                "batches": self.dynamodb.batches,
+            },
+            "started_at": self.started_at.isoformat(),
+            "finished_at": self.finished_at.isoformat(),
+        }
+
+
+class S3BulkDeleter:
+    """Delete many S3 objects with paged listing and batched deletes."""
+
+    def __init__(
+        self,
+        s3_client: "S3Client",
+        bucket_name: str,
+        *,
+        batch_size: int = S3_DELETE_BATCH_SIZE,
+        max_concurrent_batches: int = DEFAULT_MAX_CONCURRENT_BATCHES,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+        retry_base_delay: float = DEFAULT_RETRY_BASE_DELAY,
+    ) -> None:
+        """Initialize the deleter.
+
+        Args:
+            s3_client: boto3 S3 client
+            bucket_name: Bucket to delete from
+            batch_size: Keys per ``DeleteObjects`` request (at most 1000)
+            max_concurrent_batches: Maximum S3 requests (delete batches and
+                listings) in flight
+            max_attempts: Attempts per key before it is reported as failed
+            retry_base_delay: Initial retry backoff in seconds (doubles per attempt)
+        """
+        if not 1 <= batch_size <= S3_DELETE_BATCH_SIZE:
+            msg = f"batch_size must be between 1 and {S3_DELETE_BATCH_SIZE}"
+            raise ValueError(msg)
+        if max_concurrent_batches < 1 or max_attempts < 1:
+            msg = "max_concurrent_batches and max_attempts must be at least 1"
+            raise ValueError(msg)
+
+        self.s3_client = s3_client
+        self.bucket_name = bucket_name
+        self.batch_size = batch_size
+        self.max_attempts = max_attempts
+        self.retry_base_delay = retry_base_delay
+        self._semaphore = asyncio.Semaphore(max_concurrent_batches)
+
+    async def delete_matching(
+        self,
+        prefixes: Iterable[str],
+        progress: ErasureProgress,
+        on_progress: ProgressCallback | None = None,
+        *,
+        key_filter: Callable[[str], bool] | None = None,
+    ) -> ErasureProgress:
+        """Delete every object under ``prefixes`` accepted by ``key_filter``.
+
+        Prefixes are listed concurrently and listing continues while earlier
+        batches are being deleted.
+
+        Args:
+            prefixes: Key prefixes to list
+            progress: Progress record to update
+            on_progress: Called after every completed batch
+            key_filter: Predicate selecting the keys to delete (default: all)
+
+        Returns:
+            The updated progress record
+        """
+        async with asyncio.TaskGroup() as tasks:
+            pending: list[str] = []
+
+            async def collect(prefix: str) -> None:
+                async for page in self._list_pages(prefix):
+                    matched = (
+                        page
+                        if key_filter is None
+                        else [k for k in page if key_filter(k)]
+                    )
+                    progress.listed += len(matched)
+                    pending.extend(matched)
+                    while len(pending) >= self.batch_size:
+                        batch = pending[: self.batch_size]
+                        del pending[: self.batch_size]
+                        await self._start_batch(tasks, batch, progress, on_progress)
+
+            async with asyncio.TaskGroup() as listings:
+                for prefix in prefixes:
+                    listings.create_task(collect(prefix))
+            if pending:
+                await self._start_batch(tasks, pending, progress, on_progress)
+
+        progress.completed = True
+        return progress
+
+    async def list_partitions(self, prefixes: Iterable[str], depth: int) -> list[str]:
+        """Prefixes ``depth`` ``/``-separated levels below each of ``prefixes``.
+
+        Uses delimiter listings, so only the partition names are read, not
+        the objects stored under them. The prefixes of each level are listed
+        concurrently.
+
+        Args:
+            prefixes: Prefixes to start from (ending with ``/``)
+            depth: Number of levels to descend
+
+        Returns:
+            Partition prefixes, each ending with ``/``
+        """
+        level = list(prefixes)
+        for _ in range(depth):
+            children = await asyncio.gather(*map(self._child_prefixes, level))
+            level = [child for group in children for child in group]
+        return level
+
+    async def _child_prefixes(self, prefix: str) -> list[str]:
+        """Prefixes one ``/``-separated level below ``prefix``."""
+        return [
+            common["Prefix"]
+            async for response in self._list_responses(prefix, Delimiter="/")
+            for common in response.get("CommonPrefixes", [])
+        ]
+
+    async def _list_pages(self, prefix: str) -> AsyncIterator[list[str]]:
+        """Yield the keys of each ``list_objects_v2`` page under a prefix."""
+        async for response in self._list_responses(prefix):
+            yield [obj["Key"] for obj in response.get("Contents", [])]
+
+    async def _list_responses(
+        self, prefix: str, **options: Any
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Yield every ``list_objects_v2`` response page under a prefix."""
+        params: dict[str, Any] = {
+            "Bucket": self.bucket_name,
+            "Prefix": prefix,
+            **options,
+        }
+        while True:
+            async with self._semaphore:
+                response = await asyncio.to_thread(
+                    self.s3_client.list_objects_v2, **params
+                )
+            yield response
+            if not response.get("IsTruncated"):
+                return
+            params["ContinuationToken"] = response["NextContinuationToken"]
+
+    async def _start_batch(
+        self,
+        tasks: asyncio.TaskGroup,
+        keys: list[str],
+        progress: ErasureProgress,
+        on_progress: ProgressCallback | None,
+    ) -> None:
+        """Start a delete batch once a concurrency slot is free."""
+        await self._semaphore.acquire()
+        tasks.create_task(self._run_batch(keys, progress, on_progress))
+
+    async def _run_batch(
+        self,
+        keys: list[str],
+        progress: ErasureProgress,
+        on_progress: ProgressCallback | None,
+    ) -> None:
+        try:
+            deleted, failed = await self.delete_keys(keys)
+        finally:
+            self._semaphore.release()
+
+        progress.batches += 1
+        progress.deleted += deleted
+        progress.record_failures(failed)
+        if on_progress is not None:
+            on_progress(progress)
+
+    async def delete_keys(self, keys: list[str]) -> tuple[int, list[str]]:
+        """Delete one batch of keys, retrying keys that failed.
+
+        Args:
+            keys: Keys to delete (at most ``batch_size``)
+
+        Returns:
+            Number of deleted keys and the keys that still failed
+        """
+        remaining = keys
+        for attempt in range(self.max_attempts):
+            if attempt:
+                await asyncio.sleep(self.retry_base_delay * 2 ** (attempt - 1))
+            try:
+                response = await asyncio.to_thread(
+                    self.s3_client.delete_objects,
+                    Bucket=self.bucket_name,
+                    Delete={
+                        "Objects": [{"Key": key} for key in remaining],
+                        "Quiet": True,
+                    },
+                )
+            except (ClientError, BotoCoreError) as e:
+                logger.warning(
+                    "DeleteObjects request failed (attempt %d/%d): %s",
+                    attempt + 1,
+                    self.max_attempts,
+                    e,
+                )
+                continue
+
+            errors = response.get("Errors", [])
+            remaining = [error["Key"] for error in errors]
+            if not remaining:
+                break
+            logger.warning(
+                "DeleteObjects failed for %d of %d keys (attempt %d/%d): %s",
+                len(remaining),
+                len(keys),
+                attempt + 1,
+                self.max_attempts,
+                errors[0].get("Code", "Unknown"),
+            )
+
+        return len(keys) - len(remaining), remaining
+
+
+class UserDataEraser:
+    """Erase a user's health data from S3 and DynamoDB as one job."""
+
+    def __init__(
+        self,
+        s3_service: "S3StorageService",
+        repository: UserItemsEraser,
+    ) -> None:
+        """Initialize the eraser.
+
+        Args:
+            s3_service: Storage service holding raw uploads and analysis results
+            repository: Repository holding the user's health records
+        """
+        self.s3_service = s3_service
+        self.repository = repository
+
+    async def erase(
+        self, user_id: str, on_progress: ProgressCallback | None = None
+    ) -> ErasureReport:
+        """Delete all of a user's data from both stores concurrently.
+
+        Args:
+            user_id: User identifier
+            on_progress: Called with the store's progress after every batch
+
+        Returns:
+            Report with per-store totals
+        """
+        started_at = datetime.now(UTC)
+        s3_progress, dynamodb_progress = await asyncio.gather(
+            self.s3_service.erase_user_objects(user_id, on_progress=on_progress),
+            self.repository.erase_user_items(user_id, on_progress=on_progress),
+        )
+        report = ErasureReport(
+            user_id=user_id,
+            s3=s3_progress,
+            dynamodb=dynamodb_progress,
+            started_at=started_at,
+            finished_at=datetime.now(UTC),
+        )
+
+        logger.info(
+            "Erased data for user %s: %d deleted, %d failed",
+            user_id,
+            report.deleted,
+            report.failed,
+        )
+        return report
@@ -0,0 +1,226 @@
+"""Non-blocking access layer for DynamoDB tables.
+
+boto3 is synchronous: calling ``table.put_item`` or ``table.query`` inside an
+``async def`` blocks the event loop for a full network round trip and stalls
+every other request served by the worker. This module runs table operations
+on a bounded thread pool shared by the whole process:
+- ``DynamoDBExecutor`` owns the pool; its size also sizes botocore's HTTP
+  connection pool (``dynamodb_client_config``) so concurrent operations reuse
+  keep-alive connections instead of waiting for one
+- ``AsyncDynamoDBTable`` wraps a boto3 ``Table`` with awaitable operations and
+  records per-operation latency through ``record_dynamodb_operation``
+
+Used by ``DynamoDBHealthDataRepository``, ``HealthAnalysisPipeline`` and the
+API handlers that read from the health data table.
+"""
+
+# removed - breaks FastAPI
+
+import asyncio
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+import functools
+import logging
+import time
+from typing import Any, ParamSpec, TypeVar
+
+from botocore.config import Config
+from mypy_boto3_dynamodb.service_resource import Table
+
+from clarity.api.v1.metrics import record_dynamodb_operation
+from clarity.core.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+P = ParamSpec("P")
+T = TypeVar("T")
+
+# Global DynamoDB executor instance
+_dynamodb_executor: "DynamoDBExecutor | None" = None
+
+
+def dynamodb_client_config() -> Config:
+    """Build the botocore config for DynamoDB clients and resources.
+
+    The HTTP connection pool matches the executor size so every worker thread
+    can hold a keep-alive connection.
+
+    Returns:
+        botocore ``Config`` with pool size and retry policy
+    """
+    return Config(
+        max_pool_connections=get_settings().dynamodb_executor_workers,
+        retries={"mode": "standard"},
+    )
+
+
+class DynamoDBExecutor:
+    """Bounded thread pool for blocking boto3 DynamoDB calls."""
+
+    def __init__(
+        self, max_workers: int = 16, thread_name_prefix: str = "dynamodb"
+    ) -> None:
+        """Initialize the executor.
+
+        Args:
+            max_workers: Maximum number of concurrent DynamoDB calls
+            thread_name_prefix: Prefix for worker thread names
+        """
+        if max_workers < 1:
+            msg = f"max_workers must be at least 1, got {max_workers}"
+            raise ValueError(msg)
+
+        self.max_workers = max_workers
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix=thread_name_prefix
+        )
+        logger.info("Initialized DynamoDBExecutor: workers=%d", max_workers)
+
+    async def run(self, func: Callable[P, T], *args: P.args, **kwargs: P.kwargs) -> T:
+        """Run a blocking callable on the DynamoDB pool.
+
+        Args:
+            func: Callable to execute
+            *args: Positional arguments for ``func``
+            **kwargs: Keyword arguments for ``func``
+
+        Returns:
+            The callable's return value
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, functools.partial(func, *args, **kwargs)
+        )
+
+    def shutdown(self, *, wait: bool = True) -> None:
+        """Shut down the worker threads.
+
+        Args:
+            wait: Block until running calls complete
+        """
+        self._executor.shutdown(wait=wait, cancel_futures=not wait)
+        logger.info("DynamoDBExecutor shut down")
+
+
+def get_dynamodb_executor() -> DynamoDBExecutor:
+    """Get or create the global DynamoDB executor.
+
+    Pool size comes from the ``DYNAMODB_EXECUTOR_WORKERS`` setting.
+
+    Returns:
+        Global DynamoDB executor instance
+    """
+    global _dynamodb_executor  # noqa: PLW0603 - Singleton pattern for shared DynamoDB pool
+
+    if _dynamodb_executor is None:
+        _dynamodb_executor = DynamoDBExecutor(
+            max_workers=get_settings().dynamodb_executor_workers
+        )
+
+    return _dynamodb_executor
+
+
+def shutdown_dynamodb_executor(*, wait: bool = True) -> None:
+    """Shut down the global DynamoDB executor.
+
+    Args:
+        wait: Block until running calls complete
+    """
+    global _dynamodb_executor  # noqa: PLW0603 - Singleton pattern for shared DynamoDB pool
+
+    if _dynamodb_executor is not None:
+        _dynamodb_executor.shutdown(wait=wait)
+        _dynamodb_executor = None
+
+
+class AsyncDynamoDBTable:
+    """Awaitable wrapper around a boto3 DynamoDB ``Table``.
+
+    Every operation runs on the DynamoDB executor and is recorded with
+    ``record_dynamodb_operation(operation, table, status, duration)``.
+    """
+
+    def __init__(
+        self,
+        table: Table,
+        table_name: str | None = None,
+        executor: DynamoDBExecutor | None = None,
+    ) -> None:
+        """Initialize the wrapper.
+
+        Args:
+            table: boto3 DynamoDB table resource
+            table_name: Table name used in metrics (defaults to ``table.name``)
+            executor: Executor to run calls on (defaults to the global executor)
+        """
+        self.table = table
+        self.table_name = (
+            table_name if table_name is not None else str(getattr(table, "name", ""))
+        )
+        self._executor = executor
+
+    async def _execute(
+        self, operation: str, func: Callable[..., T], **kwargs: Any
+    ) -> T:
+        """Run a table call on the executor and record its latency."""
+        executor = self._executor or get_dynamodb_executor()
+        started_at = time.perf_counter()
+        status = "failed"
+        try:
+            result = await executor.run(func, **kwargs)
+            status = "success"
+            return result
+        finally:
+            record_dynamodb_operation(
+                operation, self.table_name, status, time.perf_counter() - started_at
+            )
+
+    async def put_item(self, **kwargs: Any) -> dict[str, Any]:
+        """Awaitable ``Table.put_item``."""
+        return await self._execute("put_item", self.table.put_item, **kwargs)
+
+    async def get_item(self, **kwargs: Any) -> dict[str, Any]:
+        """Awaitable ``Table.get_item``."""
+        return await self._execute("get_item", self.table.get_item, **kwargs)
+
+    async def query(self, **kwargs: Any) -> dict[str, Any]:
+        """Awaitable ``Table.query``."""
+        return await self._execute("query", self.table.query, **kwargs)
+
+    async def update_item(self, **kwargs: Any) -> dict[str, Any]:
+        """Awaitable ``Table.update_item``."""
+        return await self._execute("update_item", self.table.update_item, **kwargs)
+
+    async def delete_item(self, **kwargs: Any) -> dict[str, Any]:
+        """Awaitable ``Table.delete_item``."""
+        return await self._execute("delete_item", self.table.delete_item, **kwargs)
+
+    async def transact_write_items(self, **kwargs: Any) -> dict[str, Any]:
+        """Awaitable ``TransactWriteItems`` on the table's resource client.
+
+        The resource client accepts plain Python values (no type descriptors),
+        so items are written exactly as with ``put_item``.
+        """
+        return await self._execute(
+            "transact_write_items",
+            self.table.meta.client.transact_write_items,
+            **kwargs,
+        )
+
+    async def batch_delete(self, keys: list[dict[str, Any]]) -> int:
+        """Delete items in batches of up to 25 using ``Table.batch_writer``.
+
+        Args:
+            keys: Primary keys of the items to delete
+
+        Returns:
+            Number of keys submitted for deletion
+        """
+
+        def delete_all() -> int:
+            with self.table.batch_writer() as batch:
+                for key in keys:
+                    batch.delete_item(Key=key)
+            return len(keys)
+
+        return await self._execute("batch_delete", delete_all)
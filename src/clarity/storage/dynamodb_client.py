@@ -6,16 +6,20 @@ from datetime import UTC, datetime
 from decimal import Decimal
 import logging
 from typing import TYPE_CHECKING, Any, TypeAlias
+import uuid
 
 import boto3
-from boto3.dynamodb.conditions import ConditionBase, Key
+from boto3.dynamodb.conditions import Attr, ConditionBase, Key
 from botocore.exceptions import ClientError
 from mypy_boto3_dynamodb import DynamoDBServiceResource
 from mypy_boto3_dynamodb.service_resource import Table
 
 from clarity.core.exceptions import ServiceError
+from clarity.core.pagination import CursorInfo, create_cursor, decode_cursor
 from clarity.models.health_data import HealthMetric, ProcessingStatus
 from clarity.ports.data_ports import IHealthDataRepository
+from clarity.services.user_data_erasure import ErasureProgress, ProgressCallback
+from clarity.storage.async_dynamodb import AsyncDynamoDBTable, dynamodb_client_config
 
 if TYPE_CHECKING:
     pass  # Only for type stubs now
@@ -26,9 +30,40 @@ SerializedItem: TypeAlias = dict[str, Any]
 
 logger = logging.getLogger(__name__)
 
+# Minimum items read per Query request when paging
+QUERY_PAGE_SIZE = 100
+
+# Insight items live in the user's partition next to health data:
+# - USER#<id> / INSIGHT#<created_at>  history listing, newest first
+# - INSIGHT#<insight_id> / INSIGHT#<insight_id>  direct lookup by id
+# - USER#<id> / SUMMARY#INSIGHTS  per-user counters, updated with every save
+INSIGHT_SORT_KEY_PREFIX = "INSIGHT#"
+INSIGHT_SUMMARY_SORT_KEY = "SUMMARY#INSIGHTS"
+# Positions of the conditional writes in the ``save_insight`` transaction
+_INSIGHT_LOOKUP_INDEX = 1
+_SUMMARY_UPDATE_INDEX = 2
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a page cursor is malformed or belongs to another listing."""
+
+
+def _failed_conditions(error: ClientError) -> set[int]:
+    """Indexes of the transaction items whose condition check failed."""
+    reasons = error.response.get("CancellationReasons", [])
+    return {
+        index
+        for index, reason in enumerate(reasons)
+        if reason.get("Code") == "ConditionalCheckFailed"
+    }
+
 
 class DynamoDBHealthDataRepository(IHealthDataRepository):
-    """DynamoDB implementation of health data repository."""
+    """DynamoDB implementation of health data repository.
+
+    All table operations go through ``async_table`` so they run on the shared
+    DynamoDB executor instead of blocking the event loop.
+    """
 
     def __init__(
         self,
@@ -42,12 +77,18 @@ class DynamoDBHealthDataRepository(IHealthDataRepository):
         # Create DynamoDB resource with proper typing
         if endpoint_url:  # For local testing with DynamoDB Local
             self.dynamodb: DynamoDBServiceResource = boto3.resource(
-                "dynamodb", region_name=region, endpoint_url=endpoint_url
+                "dynamodb",
+                region_name=region,
+                endpoint_url=endpoint_url,
+                config=dynamodb_client_config(),
             )
         else:
-            self.dynamodb = boto3.resource("dynamodb", region_name=region)
+            self.dynamodb = boto3.resource(
+                "dynamodb", region_name=region, config=dynamodb_client_config()
+            )
 
         self.table: Table = self.dynamodb.Table(table_name)
+        self.async_table = AsyncDynamoDBTable(self.table, table_name)
 
     @staticmethod
     def _serialize_item(data: DynamoDBItem) -> SerializedItem:
@@ -157,7 +198,7 @@ class DynamoDBHealthDataRepository(IHealthDataRepository):
             serialized_item = self._serialize_item(item)
 
             # Save to DynamoDB
-            self.table.put_item(Item=serialized_item)
+            await self.async_table.put_item(Item=serialized_item)
 
         except ClientError as e:
             logger.exception("DynamoDB error saving health data")
@@ -178,16 +219,22 @@ class DynamoDBHealthDataRepository(IHealthDataRepository):
         metric_type: str | None = None,
         start_date: datetime | None = None,
         end_date: datetime | None = None,
+        cursor: str | None = None,
     ) -> dict[str, Any]:
         """Retrieve user health data with filtering and pagination.
 
+        Pages are read with DynamoDB ``ExclusiveStartKey`` cursors and the
+        metric type filter is evaluated by DynamoDB, so every page is full
+        and deep pages never read earlier items.
+
         Args:
             user_id: User identifier
             limit: Maximum records to return
-            offset: Records to skip
+            offset: Records to skip (ignored when ``cursor`` is given)
             metric_type: Filter by metric type
             start_date: Filter from date
             end_date: Filter to date
+            cursor: ``next_cursor`` returned with the previous page
 
         Returns:
             Health data with pagination metadata
@@ -207,45 +254,31 @@ class DynamoDBHealthDataRepository(IHealthDataRepository):
             else:
                 key_condition &= Key("sk").begins_with("HEALTH#")
 
-            # Query DynamoDB
-            response = self.table.query(
-                KeyConditionExpression=key_condition,
-                Limit=limit + offset,  # Fetch extra for offset
-                ScanIndexForward=False,  # Most recent first
-            )
-
-            items = response.get("Items", [])
-
-            # Apply offset
-            if offset > 0:
-                items = items[offset:]
-
-            # Limit results
-            items = items[:limit]
-
-            # Convert to response objects
-            results = []
-            for item in items:
-                deserialized = self._deserialize_item(item)
-
-                # Filter by metric type if specified
-                if metric_type:
-                    metrics = deserialized.get("metrics", {})
-                    if metric_type not in metrics:
-                        continue
-
-                results.append(deserialized)
-
-            return {
-                "data": results,
-                "pagination": {
-                    "limit": limit,
-                    "offset": offset,
-                    "total": len(results),
-                    "has_more": len(response.get("Items", [])) > limit + offset,
-                },
+            query_kwargs: dict[str, Any] = {
+                "KeyConditionExpression": key_condition,
+                "ScanIndexForward": False,  # Most recent first
             }
+            if metric_type:
+                # Metrics are stored as a map keyed by metric type
+                query_kwargs["FilterExpression"] = Attr(f"metrics.{metric_type}").exists()
+
+            start_key: SerializedItem | None = None
+            if cursor:
+                start_key = self._decode_health_cursor(user_id, cursor)
+            elif offset > 0:
+                # Walk past skipped items reading keys only
+                skipped, start_key = await self._query_pages(
+                    {**query_kwargs, "ProjectionExpression": "pk, sk"}, offset, None
+                )
+                if start_key is None:
+                    return self._health_data_page([], limit, offset, None)
+                logger.debug("Skipped %d items for offset pagination", len(skipped))
+
+            items, next_key = await self._query_pages(query_kwargs, limit, start_key)
+            results = [self._deserialize_item(item) for item in items]
 
+        except ValueError:
+            raise
         except ClientError as e:
             logger.exception("DynamoDB error retrieving health data")
             msg = f"Failed to retrieve health data: {e!s}"
@@ -254,6 +287,95 @@ class DynamoDBHealthDataRepository(IHealthDataRepository):
             logger.exception("Unexpected error retrieving health data")
             msg = f"Failed to retrieve health data: {e!s}"
             raise ServiceError(msg) from e
+        else:
+            return self._health_data_page(results, limit, offset, next_key)
+
+    async def _query_pages(
+        self,
+        query_kwargs: dict[str, Any],
+        limit: int,
+        start_key: SerializedItem | None,
+    ) -> tuple[list[SerializedItem], SerializedItem | None]:
+        """Query until ``limit`` matching items are read or the partition ends.
+
+        DynamoDB applies ``Limit`` before a ``FilterExpression``, so every
+        request reads at least a full page; filtered queries then need few
+        round trips even for sparse matches. Extra items are trimmed and the
+        returned key always points just after the last returned item.
+
+        Returns:
+            Tuple of (items, key to resume from or None when exhausted)
+        """
+        items: list[SerializedItem] = []
+        last_key = start_key
+        while len(items) < limit:
+            request = {
+                **query_kwargs,
+                "Limit": max(limit - len(items), QUERY_PAGE_SIZE),
+            }
+            if last_key is not None:
+                request["ExclusiveStartKey"] = last_key
+            response = await self.async_table.query(**request)
+            items.extend(response.get("Items", []))
+            last_key = response.get("LastEvaluatedKey")
+            if last_key is None:
+                break
+
+        if len(items) > limit:
+            # Resume right after the last kept item
+            items = items[:limit]
+            last_key = {"pk": items[-1]["pk"], "sk": items[-1]["sk"]}
+        return items, last_key
+
+    @staticmethod
+    def _decode_user_cursor(
+        user_id: str, cursor: str, prefix: str, kind: str
+    ) -> SerializedItem:
+        """Turn a page cursor into an ``ExclusiveStartKey`` for this user.
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed or of another kind
+        """
+        try:
+            sort_key = decode_cursor(cursor).sort_key
+        except ValueError as e:
+            raise InvalidCursorError(str(e)) from e
+        if not sort_key or not sort_key.startswith(prefix):
+            msg = f"Invalid cursor: not {kind} cursor"
+            raise InvalidCursorError(msg)
+        # The partition key comes from the caller, never from the cursor
+        return {"pk": f"USER#{user_id}", "sk": sort_key}
+
+    @classmethod
+    def _decode_health_cursor(cls, user_id: str, cursor: str) -> SerializedItem:
+        """Turn a health data page cursor into an ``ExclusiveStartKey``."""
+        return cls._decode_user_cursor(user_id, cursor, "HEALTH#", "a health data")
+
+    @staticmethod
+    def _next_cursor(next_key: SerializedItem | None) -> str | None:
+        """Encode the key to resume from as a page cursor."""
+        if next_key is None:
+            return None
+        return create_cursor(CursorInfo(sort_key=str(next_key["sk"])))
+
+    @staticmethod
+    def _health_data_page(
+        results: list[DynamoDBItem],
+        limit: int,
+        offset: int,
+        next_key: SerializedItem | None,
+    ) -> dict[str, Any]:
+        """Build the paginated response for ``get_user_health_data``."""
+        return {
+            "data": results,
+            "pagination": {
+                "limit": limit,
+                "offset": offset,
+                "total": len(results),
+                "has_more": next_key is not None,
+                "next_cursor": DynamoDBHealthDataRepository._next_cursor(next_key),
+            },
+        }
 
     async def get_processing_status(
         self, processing_id: str, user_id: str
@@ -269,7 +391,7 @@ class DynamoDBHealthDataRepository(IHealthDataRepository):
         """
         try:
             # Query by processing_id
-            response = self.table.query(
+            response = await self.async_table.query(
                 IndexName="processing-id-index",  # Assumes GSI exists
                 KeyConditionExpression=Key("processing_id").eq(processing_id),
             )
@@ -310,26 +432,18 @@ class DynamoDBHealthDataRepository(IHealthDataRepository):
             if processing_id:
                 # Delete specific processing job
                 # First, find the item by processing_id
-                response = self.table.query(
+                response = await self.async_table.query(
                     IndexName="processing-id-index",
                     KeyConditionExpression=Key("processing_id").eq(processing_id),
                 )
                 items = response.get("Items", [])
                 if items and items[0].get("user_id") == user_id:
-                    self.table.delete_item(
+                    await self.async_table.delete_item(
                         Key={"pk": items[0]["pk"], "sk": items[0]["sk"]}
                     )
             else:
                 # Delete all user data
-                response = self.table.query(
-                    KeyConditionExpression=Key("pk").eq(f"USER#{user_id}")
-                    & Key("sk").begins_with("HEALTH#")
-                )
-
-                # Delete each item
-                with self.table.batch_writer() as batch:
-                    for item in response.get("Items", []):
-                        batch.delete_item(Key={"pk": item["pk"], "sk": item["sk"]})
+                await self.erase_user_items(user_id)
 
         except ClientError as e:
             logger.exception("DynamoDB error deleting health data")
@@ -338,6 +452,58 @@ class DynamoDBHealthDataRepository(IHealthDataRepository):
         else:
             return True
 
+    async def erase_user_items(
+        self, user_id: str, on_progress: ProgressCallback | None = None
+    ) -> ErasureProgress:
+        """Bulk-delete every item in a user's partition.
+
+        Pages through ``USER#<id>`` reading keys only and deletes each page
+        with ``batch_delete``. The lookup-by-id item of each insight is
+        deleted together with its history item.
+
+        Args:
+            user_id: User identifier
+            on_progress: Called after every deleted page of items
+
+        Returns:
+            Progress record with the number of deleted items
+        """
+        progress = ErasureProgress(store="dynamodb", user_id=user_id)
+        request: dict[str, Any] = {
+            "KeyConditionExpression": Key("pk").eq(f"USER#{user_id}"),
+            "ProjectionExpression": "pk, sk, #id",
+            "ExpressionAttributeNames": {"#id": "id"},
+        }
+        try:
+            while True:
+                response = await self.async_table.query(**request)
+                keys: list[SerializedItem] = []
+                for item in response.get("Items", []):
+                    keys.append({"pk": item["pk"], "sk": item["sk"]})
+                    insight_id = item.get("id")
+                    if insight_id and item["sk"].startswith(INSIGHT_SORT_KEY_PREFIX):
+                        lookup_key = f"{INSIGHT_SORT_KEY_PREFIX}{insight_id}"
+                        keys.append({"pk": lookup_key, "sk": lookup_key})
+
+                if keys:
+                    progress.listed += len(keys)
+                    progress.deleted += await self.async_table.batch_delete(keys)
+                    progress.batches += 1
+                    if on_progress is not None:
+                        on_progress(progress)
+
+                if "LastEvaluatedKey" not in response:
+                    break
+                request["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+        except ClientError as e:
+            logger.exception("DynamoDB error erasing user data")
+            msg = f"Failed to delete health data: {e!s}"
+            raise ServiceError(msg) from e
+
+        progress.completed = True
+        logger.info("Deleted %d items for user %s", progress.deleted, user_id)
+        return progress
+
     async def save_data(self, user_id: str, data: dict[str, str]) -> str:
         """Save health data for a user (legacy method).
 
@@ -361,7 +527,7 @@ class DynamoDBHealthDataRepository(IHealthDataRepository):
                 "created_at": timestamp.isoformat(),
             }
 
-            self.table.put_item(Item=self._serialize_item(item))
+            await self.async_table.put_item(Item=self._serialize_item(item))
 
         except ClientError as e:
             logger.exception("DynamoDB error saving data")
@@ -383,7 +549,7 @@ class DynamoDBHealthDataRepository(IHealthDataRepository):
             Health data dictionary
         """
         try:
-            response = self.table.query(
+            response = await self.async_table.query(
                 KeyConditionExpression=Key("pk").eq(f"USER#{user_id}")
                 & Key("sk").begins_with("DATA#"),
                 Limit=1,
@@ -405,6 +571,226 @@ class DynamoDBHealthDataRepository(IHealthDataRepository):
         else:
             return {}
 
+    async def save_insight(
+        self,
+        user_id: str,
+        insight: DynamoDBItem,
+        insight_id: str | None = None,
+    ) -> str:
+        """Store a generated insight and update the user's insight counters.
+
+        The history item, the lookup-by-id item and the counter update are
+        written in one transaction, so ``total_count`` always matches the
+        stored insights. The counter update requires the summary item to
+        exist; for users whose insights predate it, the summary is backfilled
+        from the stored insights and the transaction retried. Saving an
+        ``insight_id`` that already exists is a no-op, which makes redelivered
+        insight messages idempotent.
+
+        Args:
+            user_id: User identifier
+            insight: Insight fields (narrative, key_insights, ...)
+            insight_id: Insight identifier (generated when not given)
+
+        Returns:
+            Identifier of the stored insight
+        """
+        insight_id = insight_id or f"insight_{uuid.uuid4().hex[:8]}"
+        timestamp = datetime.now(UTC)
+        key_insights = insight.get("key_insights") or []
+        recommendations = insight.get("recommendations") or []
+
+        item = self._serialize_item({
+            **insight,
+            "pk": f"USER#{user_id}",
+            "sk": f"{INSIGHT_SORT_KEY_PREFIX}{timestamp.isoformat()}",
+            "id": insight_id,
+            "data_id": insight_id,  # Required by the health data table
+            "user_id": user_id,
+            "created_at": timestamp.isoformat(),
+        })
+        lookup_key = f"{INSIGHT_SORT_KEY_PREFIX}{insight_id}"
+        summary_key = {"pk": f"USER#{user_id}", "sk": INSIGHT_SUMMARY_SORT_KEY}
+        transact_items: list[dict[str, Any]] = [
+            {"Put": {"TableName": self.table_name, "Item": item}},
+            {
+                "Put": {
+                    "TableName": self.table_name,
+                    "Item": {**item, "pk": lookup_key, "sk": lookup_key},
+                    "ConditionExpression": "attribute_not_exists(pk)",
+                }
+            },
+            {
+                "Update": {
+                    "TableName": self.table_name,
+                    "Key": summary_key,
+                    "ConditionExpression": "attribute_exists(pk)",
+                    "UpdateExpression": (
+                        "ADD total_count :one, "
+                        "key_insights_total :key_insights, "
+                        "recommendations_total :recommendations "
+                        "SET last_insight_id = :insight_id, "
+                        "last_generated_at = :generated_at, "
+                        "updated_at = :updated_at"
+                    ),
+                    "ExpressionAttributeValues": {
+                        ":one": 1,
+                        ":key_insights": len(key_insights),
+                        ":recommendations": len(recommendations),
+                        ":insight_id": insight_id,
+                        ":generated_at": str(
+                            insight.get("generated_at") or timestamp.isoformat()
+                        ),
+                        ":updated_at": timestamp.isoformat(),
+                    },
+                }
+            },
+        ]
+
+        try:
+            try:
+                await self.async_table.transact_write_items(
+                    TransactItems=transact_items
+                )
+            except ClientError as e:
+                if _failed_conditions(e) != {_SUMMARY_UPDATE_INDEX}:
+                    raise
+                # The user's insights predate the summary item: count them first
+                await self._backfill_insight_summary(user_id, summary_key)
+                await self.async_table.transact_write_items(
+                    TransactItems=transact_items
+                )
+        except ClientError as e:
+            if _INSIGHT_LOOKUP_INDEX in _failed_conditions(e):
+                logger.info("Insight %s already stored", insight_id)
+                return insight_id
+            logger.exception("DynamoDB error saving insight")
+            msg = f"Failed to save insight: {e!s}"
+            raise ServiceError(msg) from e
+
+        return insight_id
+
+    async def get_insight_summary(self, user_id: str) -> dict[str, Any]:
+        """Get the user's insight counters from the summary item.
+
+        Users whose insights predate the summary item are counted once and
+        the summary is created from that count.
+
+        Args:
+            user_id: User identifier
+
+        Returns:
+            Counters (``total_count``, ``key_insights_total``,
+            ``recommendations_total``) and the latest insight id
+        """
+        key = {"pk": f"USER#{user_id}", "sk": INSIGHT_SUMMARY_SORT_KEY}
+        try:
+            response = await self.async_table.get_item(Key=key)
+            item = response.get("Item")
+            if item is None:
+                item = await self._backfill_insight_summary(user_id, key)
+        except ClientError as e:
+            logger.exception("DynamoDB error getting insight summary")
+            msg = f"Failed to get insight summary: {e!s}"
+            raise ServiceError(msg) from e
+
+        return {
+            "total_count": int(item.get("total_count", 0)),
+            "key_insights_total": int(item.get("key_insights_total", 0)),
+            "recommendations_total": int(item.get("recommendations_total", 0)),
+            "last_insight_id": item.get("last_insight_id"),
+            "last_generated_at": item.get("last_generated_at"),
+        }
+
+    async def _backfill_insight_summary(
+        self, user_id: str, key: SerializedItem
+    ) -> SerializedItem:
+        """Count a user's existing insights once and create the summary item."""
+        total = 0
+        request: dict[str, Any] = {
+            "KeyConditionExpression": Key("pk").eq(f"USER#{user_id}")
+            & Key("sk").begins_with(INSIGHT_SORT_KEY_PREFIX),
+            "Select": "COUNT",
+            "ConsistentRead": True,
+        }
+        while True:
+            response = await self.async_table.query(**request)
+            total += response.get("Count", 0)
+            if "LastEvaluatedKey" not in response:
+                break
+            request["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+        item = {
+            **key,
+            "total_count": total,
+            "updated_at": datetime.now(UTC).isoformat(),
+        }
+        try:
+            await self.async_table.put_item(
+                Item=item, ConditionExpression="attribute_not_exists(pk)"
+            )
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") != (
+                "ConditionalCheckFailedException"
+            ):
+                raise
+            # A concurrent save created the summary first
+            response = await self.async_table.get_item(Key=key)
+            return response.get("Item", item)
+        return item
+
+    async def list_insights(
+        self,
+        user_id: str,
+        limit: int = 10,
+        offset: int = 0,
+        cursor: str | None = None,
+    ) -> dict[str, Any]:
+        """List a user's insights, newest first.
+
+        Args:
+            user_id: User identifier
+            limit: Maximum insights to return
+            offset: Insights to skip (ignored when ``cursor`` is given)
+            cursor: ``next_cursor`` returned with the previous page
+
+        Returns:
+            Dictionary with ``items`` and ``next_cursor`` (None on the last page)
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed or not an insight cursor
+        """
+        query_kwargs: dict[str, Any] = {
+            "KeyConditionExpression": Key("pk").eq(f"USER#{user_id}")
+            & Key("sk").begins_with(INSIGHT_SORT_KEY_PREFIX),
+            "ScanIndexForward": False,  # Most recent first
+        }
+        try:
+            start_key: SerializedItem | None = None
+            if cursor:
+                start_key = self._decode_user_cursor(
+                    user_id, cursor, INSIGHT_SORT_KEY_PREFIX, "an insight"
+                )
+            elif offset > 0:
+                # Walk past skipped insights reading keys only
+                _, start_key = await self._query_pages(
+                    {**query_kwargs, "ProjectionExpression": "pk, sk"}, offset, None
+                )
+                if start_key is None:
+                    return {"items": [], "next_cursor": None}
+
+            items, next_key = await self._query_pages(query_kwargs, limit, start_key)
+
+        except ClientError as e:
+            logger.exception("DynamoDB error listing insights")
+            msg = f"Failed to list insights: {e!s}"
+            raise ServiceError(msg) from e
+
+        return {
+            "items": [self._deserialize_item(item) for item in items],
+            "next_cursor": self._next_cursor(next_key),
+        }
+
     @staticmethod
     async def initialize() -> None:
         """Initialize the repository.
@@ -14,6 +14,7 @@ from operator import itemgetter
 from typing import Any
 import uuid
 
+from clarity.core.pagination import CursorInfo, create_cursor, decode_cursor
 from clarity.models.health_data import HealthMetric
 from clarity.ports.data_ports import IHealthDataRepository
 
@@ -114,8 +115,13 @@ class MockHealthDataRepository(IHealthDataRepository):
         metric_type: str | None = None,
         start_date: datetime | None = None,
         end_date: datetime | None = None,
+        cursor: str | None = None,
     ) -> dict[str, Any]:
         """Retrieve user health data with filtering and pagination."""
+        if cursor:
+            # Mock cursors carry the position of the next item
+            offset = int(decode_cursor(cursor).id or 0)
+
         if user_id not in self._health_data:
             return {
                 "data": [],
@@ -160,6 +166,7 @@ class MockHealthDataRepository(IHealthDataRepository):
         # Apply pagination
         total_count = len(all_metrics)
         paginated_metrics = all_metrics[offset : offset + limit]
+        has_more = offset + len(paginated_metrics) < total_count
 
         return {
             "data": paginated_metrics,
@@ -167,7 +174,12 @@ class MockHealthDataRepository(IHealthDataRepository):
             "page_info": {
                 "limit": limit,
                 "offset": offset,
-                "has_more": offset + len(paginated_metrics) < total_count,
+                "has_more": has_more,
+                "next_cursor": (
+                    create_cursor(CursorInfo(id=str(offset + len(paginated_metrics))))
+                    if has_more
+                    else None
+                ),
             },
         }
 
@@ -0,0 +1,217 @@
+"""Columnar, compressed archive format for raw health data uploads.
+
+Raw uploads used to be stored as pretty-printed JSON with one object per
+metric, repeating every field name for every minute of HealthKit data. The
+archive format stores the same payload as gzip-compressed JSON lines:
+
+- line 1 is a header with the upload fields, ``archive_format`` and
+  ``archive_version``
+- every following line is one metric type with its rows stored as
+  per-field arrays (``columns``); nested data objects (``biometric_data``,
+  ``activity_data``, ...) become a presence array plus per-field arrays
+- a ``_row`` array keeps each metric's position in the original upload
+
+``read_raw_data`` decodes archives line by line from a file-like stream and
+rebuilds exactly the dictionary shape of the legacy JSON documents, so
+consumers do not care which format an object was written in. Legacy JSON
+objects are detected by their first bytes and parsed as before.
+"""
+
+# removed - breaks FastAPI
+
+from collections import defaultdict
+from collections.abc import Iterator
+import gzip
+import io
+from itertools import starmap
+import json
+from typing import IO, Any
+
+ARCHIVE_FORMAT = "clarity-columnar"
+ARCHIVE_VERSION = 1
+ARCHIVE_SUFFIX = ".columnar.json.gz"
+ARCHIVE_CONTENT_TYPE = "application/gzip"
+ARCHIVE_COMPRESSION_LEVEL = 6
+
+RAW_DATA_FORMAT_JSON = "json"
+RAW_DATA_FORMAT_COLUMNAR = "columnar"
+RAW_DATA_FORMATS = frozenset({RAW_DATA_FORMAT_JSON, RAW_DATA_FORMAT_COLUMNAR})
+
+_GZIP_MAGIC = b"\x1f\x8b"
+_ROW_COLUMN = "_row"
+
+
+class RawDataArchiveError(ValueError):
+    """Raised when an archive cannot be decoded."""
+
+
+def _encode_group(
+    metric_type: str, rows: list[tuple[int, dict[str, Any]]]
+) -> dict[str, Any]:
+    """Turn the rows of one metric type into per-field arrays."""
+    columns: dict[str, list[Any]] = {_ROW_COLUMN: [index for index, _ in rows]}
+    nested: dict[str, dict[str, Any]] = {}
+
+    for position, (_, row) in enumerate(rows):
+        for field, value in row.items():
+            if field == "metric_type":
+                continue
+            if isinstance(value, dict) or field in nested:
+                group = nested.setdefault(
+                    field, {"present": [False] * len(rows), "columns": {}}
+                )
+                if isinstance(value, dict):
+                    group["present"][position] = True
+                    for key, item in value.items():
+                        column = group["columns"].setdefault(key, [None] * len(rows))
+                        column[position] = item
+                continue
+            columns.setdefault(field, [None] * len(rows))[position] = value
+
+    # Rows where a nested field was None are covered by its presence array
+    for field in nested:
+        columns.pop(field, None)
+
+    return {
+        "metric_type": metric_type,
+        "count": len(rows),
+        "columns": columns,
+        "nested": nested,
+    }
+
+
+def encode_raw_data(raw_data: dict[str, Any]) -> bytes:
+    """Encode a raw upload document as a compressed columnar archive.
+
+    Args:
+        raw_data: Document in the legacy JSON shape (upload fields plus a
+            ``metrics`` list of row dictionaries)
+
+    Returns:
+        Gzip-compressed archive bytes
+    """
+    metrics: list[dict[str, Any]] = raw_data.get("metrics", [])
+    groups: dict[str, list[tuple[int, dict[str, Any]]]] = defaultdict(list)
+    for index, metric in enumerate(metrics):
+        groups[str(metric.get("metric_type"))].append((index, metric))
+
+    header = {key: value for key, value in raw_data.items() if key != "metrics"}
+    header.update({
+        "archive_format": ARCHIVE_FORMAT,
+        "archive_version": ARCHIVE_VERSION,
+        "metric_types": list(groups),
+    })
+
+    buffer = io.BytesIO()
+    with gzip.GzipFile(
+        fileobj=buffer, mode="wb", compresslevel=ARCHIVE_COMPRESSION_LEVEL, mtime=0
+    ) as archive:
+        for line in (header, *starmap(_encode_group, groups.items())):
+            archive.write(json.dumps(line, separators=(",", ":"), default=str).encode())
+            archive.write(b"\n")
+    return buffer.getvalue()
+
+
+def _decode_group(group: dict[str, Any]) -> Iterator[tuple[int, dict[str, Any]]]:
+    """Rebuild ``(position, row)`` pairs from one metric-type line."""
+    count: int = group["count"]
+    columns: dict[str, list[Any]] = group["columns"]
+    nested: dict[str, dict[str, Any]] = group.get("nested", {})
+    positions = columns[_ROW_COLUMN]
+    fields = [name for name in columns if name != _ROW_COLUMN]
+
+    for position in range(count):
+        row: dict[str, Any] = {"metric_type": group["metric_type"]}
+        for name in fields:
+            row[name] = columns[name][position]
+        for name, data in nested.items():
+            row[name] = (
+                {key: values[position] for key, values in data["columns"].items()}
+                if data["present"][position]
+                else None
+            )
+        yield positions[position], row
+
+
+def _read_archive(stream: IO[bytes]) -> dict[str, Any]:
+    """Decode a columnar archive one line at a time."""
+    with gzip.GzipFile(fileobj=stream, mode="rb") as archive:
+        lines = iter(archive)
+        try:
+            header = json.loads(next(lines))
+        except StopIteration as e:
+            msg = "Empty raw data archive"
+            raise RawDataArchiveError(msg) from e
+
+        if header.pop("archive_format", None) != ARCHIVE_FORMAT:
+            msg = "Not a raw data archive"
+            raise RawDataArchiveError(msg)
+        version = header.pop("archive_version", None)
+        if version != ARCHIVE_VERSION:
+            msg = f"Unsupported raw data archive version: {version}"
+            raise RawDataArchiveError(msg)
+        header.pop("metric_types", None)
+
+        metrics: list[dict[str, Any] | None] = [None] * int(
+            header.get("metrics_count", 0)
+        )
+        for line in lines:
+            for position, row in _decode_group(json.loads(line)):
+                if position >= len(metrics):
+                    metrics.extend([None] * (position + 1 - len(metrics)))
+                metrics[position] = row
+
+    header["metrics"] = [metric for metric in metrics if metric is not None]
+    return header
+
+
+def read_raw_data(stream: IO[bytes]) -> dict[str, Any]:
+    """Read a raw upload document from a stream in either storage format.
+
+    Args:
+        stream: Readable binary stream (e.g. an S3 ``StreamingBody``)
+
+    Returns:
+        Document in the legacy JSON shape
+
+    Raises:
+        RawDataArchiveError: If an archive is malformed or of an unknown version
+        json.JSONDecodeError: If a legacy JSON document is malformed
+    """
+    head = stream.read(len(_GZIP_MAGIC))
+    if head != _GZIP_MAGIC:
+        document: dict[str, Any] = json.loads((head + stream.read()).decode("utf-8"))
+        return document
+
+    try:
+        return _read_archive(_PrefixedStream(head, stream))
+    except (OSError, EOFError, KeyError, IndexError, TypeError) as e:
+        msg = f"Malformed raw data archive: {e}"
+        raise RawDataArchiveError(msg) from e
+
+
+def is_archive_key(key: str) -> bool:
+    """Whether an object key names a columnar archive."""
+    return key.endswith(ARCHIVE_SUFFIX)
+
+
+class _PrefixedStream(io.RawIOBase):
+    """Re-attach bytes already consumed from a stream for format detection."""
+
+    def __init__(self, prefix: bytes, stream: IO[bytes]) -> None:
+        self._prefix = prefix
+        self._stream = stream
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        view = memoryview(buffer).cast("B")
+        if self._prefix:
+            size = min(len(view), len(self._prefix))
+            view[:size] = self._prefix[:size]
+            self._prefix = self._prefix[size:]
+            return size
+        data = self._stream.read(len(view))
+        view[: len(data)] = data
+        return len(data)
@@ -7,19 +7,25 @@ patterns with proper dependency injection and real behavior validation.
 
 from __future__ import annotations
 
+import asyncio
+from collections.abc import AsyncIterator
 from datetime import UTC, datetime, timedelta
 import json
+from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
 from fastapi import WebSocket
+from prometheus_client import REGISTRY
 from pydantic import ValidationError
 import pytest
+from starlette.websockets import WebSocketState
 
 from clarity.api.v1.websocket.chat_handler import (
     WebSocketChatHandler,
     _authenticate_websocket_user,
     _extract_username,
     _handle_health_analysis_message,
+    create_chat_handler,
     get_gemini_service,
     get_pat_model_service,
 )
@@ -423,6 +429,147 @@ class TestWebSocketChatHandler:
         assert call_args.duration_hours == 2
 
 
+class _StreamingGeminiService:
+    """Gemini stand-in that streams fixed chunks and can fail midway."""
+
+    def __init__(self, chunks: list[str], *, fail_after: int | None = None) -> None:
+        self.chunks = chunks
+        self.fail_after = fail_after
+        self.requests: list[HealthInsightRequest] = []
+
+    async def stream_health_insights(
+        self, request: HealthInsightRequest
+    ) -> AsyncIterator[str]:
+        self.requests.append(request)
+        for index, chunk in enumerate(self.chunks):
+            if index == self.fail_after:
+                msg = "stream interrupted"
+                raise RuntimeError(msg)
+            await asyncio.sleep(0)
+            yield chunk
+
+
+def _connected_manager(user_id: str) -> tuple[ConnectionManager, AsyncMock]:
+    manager = ConnectionManager()
+    websocket = AsyncMock(spec=WebSocket)
+    websocket.client_state = WebSocketState.CONNECTED
+    manager.user_connections[user_id] = [websocket]
+    return manager, websocket
+
+
+def _sent_frames(websocket: AsyncMock) -> list[dict[str, Any]]:
+    return [json.loads(call.args[0]) for call in websocket.send_text.call_args_list]
+
+
+class TestStreamingChatResponses:
+    """Test streamed chat responses over the websocket."""
+
+    @pytest.mark.asyncio
+    @staticmethod
+    async def test_streams_chunks_then_done_frame(
+        mock_pat_service: AsyncMock, valid_chat_message: ChatMessage
+    ) -> None:
+        gemini = _StreamingGeminiService(["Your sleep", " looks", " steady."])
+        handler = WebSocketChatHandler(gemini, mock_pat_service)
+        manager, websocket = _connected_manager(valid_chat_message.user_id)
+        valid_chat_message.metadata = {"stream": True}
+        ttft_before = (
+            REGISTRY.get_sample_value("clarity_chat_time_to_first_token_seconds_count")
+            or 0.0
+        )
+
+        await handler.process_chat_message(valid_chat_message, manager)
+
+        frames = _sent_frames(websocket)
+        chunks, done = frames[:-1], frames[-1]
+        assert [f["type"] for f in chunks] == [MessageType.MESSAGE_CHUNK.value] * 3
+        assert [f["sequence"] for f in chunks] == [0, 1, 2]
+        assert "".join(f["delta"] for f in chunks) == "Your sleep looks steady."
+        assert done["type"] == MessageType.MESSAGE_DONE.value
+        assert done["content"] == "Your sleep looks steady."
+        assert done["chunk_count"] == 3
+        assert done["status"] == "completed"
+        assert done["time_to_first_token_ms"] is not None
+        assert {f["stream_id"] for f in frames} == {done["stream_id"]}
+        assert gemini.requests[0].context == valid_chat_message.content
+        assert (
+            REGISTRY.get_sample_value("clarity_chat_time_to_first_token_seconds_count")
+            == ttft_before + 1
+        )
+
+    @pytest.mark.asyncio
+    @staticmethod
+    async def test_failed_stream_still_sends_done_frame(
+        mock_pat_service: AsyncMock, valid_chat_message: ChatMessage
+    ) -> None:
+        gemini = _StreamingGeminiService(["Partial", " answer"], fail_after=1)
+        handler = WebSocketChatHandler(gemini, mock_pat_service, stream_responses=True)
+        manager, websocket = _connected_manager(valid_chat_message.user_id)
+
+        await handler.process_chat_message(valid_chat_message, manager)
+
+        frames = _sent_frames(websocket)
+        assert [f["type"] for f in frames] == [
+            MessageType.MESSAGE_CHUNK.value,
+            MessageType.MESSAGE_DONE.value,
+        ]
+        assert frames[-1]["status"] == "failed"
+        assert frames[-1]["content"] == "Partial"
+
+    @pytest.mark.asyncio
+    @staticmethod
+    async def test_stream_can_be_disabled_per_message(
+        chat_handler: WebSocketChatHandler,
+        valid_chat_message: ChatMessage,
+        mock_connection_manager: AsyncMock,
+    ) -> None:
+        chat_handler.stream_responses = True
+        valid_chat_message.metadata = {"stream": False}
+
+        await chat_handler.process_chat_message(
+            valid_chat_message, mock_connection_manager
+        )
+
+        mock_connection_manager.stream_to_user.assert_not_called()
+        mock_connection_manager.send_to_user.assert_called_once()
+
+    @pytest.mark.asyncio
+    @staticmethod
+    async def test_endpoint_handler_sends_single_message_by_default(
+        mock_pat_service: AsyncMock,
+        valid_chat_message: ChatMessage,
+        mock_connection_manager: AsyncMock,
+    ) -> None:
+        gemini = MagicMock()
+        gemini.generate_health_insights = AsyncMock(
+            return_value=MagicMock(narrative="All good")
+        )
+        handler = create_chat_handler(gemini, mock_pat_service)
+
+        await handler.process_chat_message(valid_chat_message, mock_connection_manager)
+
+        assert handler.stream_responses is False
+        mock_connection_manager.stream_to_user.assert_not_called()
+        sent = mock_connection_manager.send_to_user.call_args[0][1]
+        assert sent.type == MessageType.MESSAGE
+        assert sent.content == "All good"
+
+    @pytest.mark.asyncio
+    @staticmethod
+    async def test_endpoint_handler_streams_when_requested(
+        mock_pat_service: AsyncMock,
+        valid_chat_message: ChatMessage,
+        mock_connection_manager: AsyncMock,
+    ) -> None:
+        handler = create_chat_handler(MagicMock(), mock_pat_service)
+        valid_chat_message.metadata = {"stream": True}
+
+        await handler.process_chat_message(valid_chat_message, mock_connection_manager)
+
+        mock_connection_manager.stream_to_user.assert_called_once()
+        mock_connection_manager.send_to_user.assert_not_called()
+
+
 # ===== TESTS FOR SERVICE DEPENDENCY FUNCTIONS =====
 
 
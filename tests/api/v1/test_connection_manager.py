@@ -274,3 +274,64 @@ async def test_multiple_connections_per_user():
     assert manager.get_connection_count() == 0
     assert manager.get_user_count() == 0
     assert user_id not in manager.user_connections
+
+
+@pytest.mark.asyncio
+async def test_stream_to_user_sends_frames_in_order_to_each_connection():
+    manager = ConnectionManager()
+    ws1 = AsyncMock(spec=WebSocket)
+    ws1.client_state = WebSocketState.CONNECTED
+    ws2 = AsyncMock(spec=WebSocket)
+    ws2.client_state = WebSocketState.CONNECTED
+    await manager.connect(ws1, "stream_user", "Streamer")
+    await manager.connect(ws2, "stream_user", "Streamer")
+    ws1.send_text.reset_mock()
+    ws2.send_text.reset_mock()
+
+    async def frames():
+        for index in range(5):
+            yield ChatMessage(user_id="AI", content=f"frame {index}")
+
+    await manager.stream_to_user("stream_user", frames())
+
+    for ws in (ws1, ws2):
+        sent = [call.args[0] for call in ws.send_text.call_args_list]
+        assert [f"frame {index}" in text for index, text in enumerate(sent)] == [
+            True
+        ] * 5
+
+
+@pytest.mark.asyncio
+async def test_stream_to_user_applies_backpressure_per_connection():
+    manager = ConnectionManager(stream_buffer_size=1)
+    release = asyncio.Event()
+    sent: list[str] = []
+
+    async def slow_send(text: str) -> None:
+        await release.wait()
+        sent.append(text)
+
+    ws = AsyncMock(spec=WebSocket)
+    ws.client_state = WebSocketState.CONNECTED
+    ws.send_text.side_effect = slow_send
+    manager.user_connections["slow_user"] = [ws]
+
+    produced = 0
+
+    async def frames():
+        nonlocal produced
+        for index in range(10):
+            produced += 1
+            yield ChatMessage(user_id="AI", content=f"frame {index}")
+
+    stream = asyncio.create_task(manager.stream_to_user("slow_user", frames()))
+    await asyncio.sleep(0.05)
+
+    # One frame being sent, one buffered and one waiting to be buffered
+    assert produced <= 3
+    assert not stream.done()
+
+    release.set()
+    await asyncio.wait_for(stream, timeout=1)
+    assert produced == 10
+    assert len(sent) == 10
@@ -36,6 +36,8 @@ from clarity.auth.dependencies import AuthenticatedUser
 from clarity.ml.gemini_service import GeminiService, HealthInsightResponse
 from clarity.ports.auth_ports import IAuthProvider
 from clarity.ports.config_ports import IConfigProvider
+from clarity.storage.async_dynamodb import AsyncDynamoDBTable
+from clarity.storage.dynamodb_client import InvalidCursorError
 
 
 class TestGeminiInsightsModels:
@@ -525,6 +527,7 @@ class TestGetInsightEndpoint:
     async def test_get_insight_success(self, mock_get_client, mock_current_user):
         """Test successful insight retrieval."""
         mock_client = MagicMock()
+        mock_client.async_table = AsyncDynamoDBTable(mock_client.table)
         mock_get_client.return_value = mock_client
 
         # Mock cached insight data
@@ -557,6 +560,7 @@ class TestGetInsightEndpoint:
     async def test_get_insight_not_found(self, mock_get_client, mock_current_user):
         """Test insight retrieval when insight not found."""
         mock_client = MagicMock()
+        mock_client.async_table = AsyncDynamoDBTable(mock_client.table)
         mock_get_client.return_value = mock_client
         mock_client.table.get_item.return_value = {"Item": None}
 
@@ -575,6 +579,7 @@ class TestGetInsightEndpoint:
     async def test_get_insight_access_denied(self, mock_get_client, mock_current_user):
         """Test insight retrieval when user doesn't own the insight."""
         mock_client = MagicMock()
+        mock_client.async_table = AsyncDynamoDBTable(mock_client.table)
         mock_get_client.return_value = mock_client
 
         # Mock insight owned by different user
@@ -661,9 +666,11 @@ class TestGetInsightHistoryEndpoint:
             "offset": 0,
         }
 
-        # Mock the table.query response
-        mock_client.table.query.return_value = {
-            "Items": [
+        # Mock the insight page and the maintained counters
+        mock_client.get_insight_summary = AsyncMock(return_value={"total_count": 2})
+        mock_client.list_insights = AsyncMock()
+        mock_client.list_insights.return_value = {
+            "items": [
                 {
                     "id": "insight_123",
                     "user_id": "user_456",
@@ -683,7 +690,7 @@ class TestGetInsightHistoryEndpoint:
                     "key_insights": ["Activity level increased"],
                 },
             ],
-            "Count": 2,
+            "next_cursor": None,
         }
 
         response = await get_insight_history(
@@ -699,6 +706,85 @@ class TestGetInsightHistoryEndpoint:
         assert response.data["has_more"] is False
         assert response.data["total_count"] == 2
         assert response.data["pagination"]["offset"] == 0
+        mock_client.list_insights.assert_awaited_once_with(
+            "user_456", limit=10, offset=0, cursor=None
+        )
+
+    @pytest.mark.asyncio
+    @patch("clarity.api.v1.gemini_insights._get_dynamodb_client")
+    async def test_get_insight_history_cursor_page(
+        self, mock_get_client, mock_current_user
+    ):
+        """Test that cursor pages report the maintained total and next cursor."""
+        mock_client = MagicMock()
+        mock_get_client.return_value = mock_client
+        mock_client.get_insight_summary = AsyncMock(return_value={"total_count": 25})
+        mock_client.list_insights = AsyncMock(
+            return_value={
+                "items": [{"id": "insight_789", "narrative": "x" * 300}],
+                "next_cursor": "next-page",
+            }
+        )
+
+        response = await get_insight_history(
+            user_id="user_456",
+            current_user=mock_current_user,
+            limit=1,
+            offset=4,
+            cursor="this-page",
+        )
+
+        assert response.data["total_count"] == 25
+        assert response.data["has_more"] is True
+        assert response.data["pagination"]["next_cursor"] == "next-page"
+        assert response.data["insights"][0]["narrative"].endswith("...")
+        mock_client.list_insights.assert_awaited_once_with(
+            "user_456", limit=1, offset=0, cursor="this-page"
+        )
+
+    @pytest.mark.asyncio
+    @patch("clarity.api.v1.gemini_insights._get_dynamodb_client")
+    async def test_get_insight_history_invalid_cursor(
+        self, mock_get_client, mock_current_user
+    ):
+        """Test that malformed cursors are rejected with 400."""
+        mock_client = MagicMock()
+        mock_get_client.return_value = mock_client
+        mock_client.get_insight_summary = AsyncMock(return_value={"total_count": 0})
+        mock_client.list_insights = AsyncMock(
+            side_effect=InvalidCursorError("Invalid cursor: not an insight cursor")
+        )
+
+        with pytest.raises(HTTPException) as exc_info:
+            await get_insight_history(
+                user_id="user_456",
+                current_user=mock_current_user,
+                cursor="bogus",
+            )
+
+        assert exc_info.value.status_code == status.HTTP_400_BAD_REQUEST
+        assert "INVALID_CURSOR" in str(exc_info.value.detail)
+
+    @pytest.mark.asyncio
+    @patch("clarity.api.v1.gemini_insights._get_dynamodb_client")
+    async def test_get_insight_history_other_value_error_is_not_a_cursor_error(
+        self, mock_get_client, mock_current_user
+    ):
+        """Test that unrelated ValueErrors are reported as retrieval failures."""
+        mock_client = MagicMock()
+        mock_get_client.return_value = mock_client
+        mock_client.get_insight_summary = AsyncMock(return_value={"total_count": 0})
+        mock_client.list_insights = AsyncMock(side_effect=ValueError("bad item"))
+
+        with pytest.raises(HTTPException) as exc_info:
+            await get_insight_history(
+                user_id="user_456",
+                current_user=mock_current_user,
+                cursor="page",
+            )
+
+        assert exc_info.value.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
+        assert "HISTORY_RETRIEVAL_FAILED" in str(exc_info.value.detail)
 
     @pytest.mark.asyncio
     async def test_get_insight_history_access_denied(self, mock_current_user):
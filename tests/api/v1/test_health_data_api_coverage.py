@@ -336,6 +336,51 @@ class TestDeleteEndpointErrors:
         )
 
 
+class TestEraseEndpoint:
+    """Test the whole-user erasure endpoint."""
+
+    @pytest.mark.asyncio
+    async def test_erase_all_health_data(
+        self,
+        app_with_dependencies: FastAPI,
+        test_user: UserContext,
+    ):
+        """Test erasure of all of the authenticated user's data."""
+        mock_service = AsyncMock(spec=HealthDataService)
+        mock_service.erase_user_data = AsyncMock(return_value=True)
+
+        app_with_dependencies.dependency_overrides[get_health_data_service] = (
+            lambda: mock_service
+        )
+        client = TestClient(app_with_dependencies)
+
+        response = client.delete("/api/v1/health-data/")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["user_id"] == test_user.user_id
+        mock_service.erase_user_data.assert_awaited_once_with(test_user.user_id)
+
+    @pytest.mark.asyncio
+    async def test_incomplete_erasure_asks_for_retry(
+        self,
+        app_with_dependencies: FastAPI,
+        test_user: UserContext,
+    ):
+        """Test that leftover objects are reported as retryable."""
+        mock_service = AsyncMock(spec=HealthDataService)
+        mock_service.erase_user_data = AsyncMock(return_value=False)
+
+        app_with_dependencies.dependency_overrides[get_health_data_service] = (
+            lambda: mock_service
+        )
+        client = TestClient(app_with_dependencies)
+
+        response = client.delete("/api/v1/health-data/")
+
+        assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+        assert response.headers["Retry-After"] == "60"
+
+
 # ===== TESTS FOR COMPLEX HEALTH CHECK LOGIC =====
 
 
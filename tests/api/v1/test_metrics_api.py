@@ -532,17 +532,27 @@ class TestMetricsModuleExports:
 
         expected_exports = [
             "MetricsContext",
+            "record_chat_time_to_first_token",
             "record_dynamodb_operation",
             "record_failed_job",
             "record_health_data_processing",
             "record_health_data_upload",
             "record_health_metric_processed",
             "record_http_request",
+            "record_inference_queue_depth",
+            "record_inference_queue_wait",
+            "record_insight_coalesced",
             "record_insight_generation",
+            "record_insight_queue",
+            "record_insight_queue_wait",
+            "record_login_activity_flush",
             "record_pat_inference",
             "record_pat_model_loading",
             "record_processing_job_status",
             "record_pubsub_message",
+            "record_token_cache_event",
+            "record_token_cache_size",
+            "record_user_context_cache_lookup",
             "router",
         ]
 
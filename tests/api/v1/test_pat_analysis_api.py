@@ -31,6 +31,7 @@ from clarity.auth.dependencies import get_authenticated_user, get_current_user
 from clarity.ml.inference_engine import AsyncInferenceEngine
 from clarity.ml.pat_service import ActigraphyAnalysis, PATModelService
 from clarity.models.auth import UserContext
+from clarity.storage.async_dynamodb import AsyncDynamoDBTable
 from clarity.storage.dynamodb_client import DynamoDBHealthDataRepository
 
 # ===== FIXTURES FOLLOWING ESTABLISHED PATTERNS =====
@@ -68,7 +69,7 @@ def mock_inference_engine() -> AsyncMock:
     )
 
     # Mock stats
-    engine.get_stats.return_value = {
+    engine.get_stats_async.return_value = {
         "requests_processed": 42,
         "average_processing_time": 1200,
         "cache_hit_rate": 0.65,
@@ -104,6 +105,7 @@ def mock_dynamodb_repository() -> MagicMock:
     mock_table.query.return_value = {"Items": []}
     mock_table.get_item.return_value = {"Item": None}
     repo.table = mock_table
+    repo.async_table = AsyncDynamoDBTable(mock_table)
 
     return repo
 
@@ -418,7 +420,9 @@ class TestHealthCheckEndpoint:
     ) -> None:
         """Test health check when service is unhealthy."""
         # Make inference engine stats fail
-        mock_inference_engine.get_stats.side_effect = Exception("Service unavailable")
+        mock_inference_engine.get_stats_async.side_effect = Exception(
+            "Service unavailable"
+        )
 
         response = client.get("/api/v1/pat/health")
 
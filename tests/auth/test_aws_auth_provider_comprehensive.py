@@ -9,11 +9,14 @@ from __future__ import annotations
 import asyncio
 import json
 import time
+from typing import Any
 from unittest.mock import AsyncMock, MagicMock, Mock, patch
 from urllib.error import URLError
 
 from botocore.exceptions import ClientError
-from jose import JWTError
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from jose import JWTError, jwk, jwt
 import pytest
 
 from clarity.auth.aws_auth_provider import CognitoAuthProvider
@@ -211,6 +214,110 @@ class TestJWKSHandling:
         jwks = await provider._get_jwks()
         assert jwks["keys"][0]["kid"] == "cached_key"
 
+    @pytest.mark.asyncio
+    async def test_get_jwks_concurrent_callers_share_one_fetch(self) -> None:
+        """Concurrent cache misses wait for a single in-flight fetch."""
+        provider = CognitoAuthProvider(
+            user_pool_id="us-east-1_ABC123", client_id="client123"
+        )
+
+        def slow_fetch() -> dict[str, Any]:
+            time.sleep(0.05)
+            return {"keys": [{"kid": "key1"}]}
+
+        with patch.object(provider, "_fetch_jwks", side_effect=slow_fetch) as fetch:
+            results = await asyncio.gather(*(provider._get_jwks() for _ in range(5)))
+
+        fetch.assert_called_once()
+        assert all(result is results[0] for result in results)
+
+    @pytest.mark.asyncio
+    async def test_get_jwks_refreshes_in_background_before_expiry(self) -> None:
+        """A set close to expiry is served while a refresh runs."""
+        provider = CognitoAuthProvider(
+            user_pool_id="us-east-1_ABC123", client_id="client123"
+        )
+        provider._jwks_cache = {"keys": [{"kid": "old_key"}]}
+        provider._jwks_cache_time = time.time() - provider._jwks_cache_ttl + 60
+
+        with patch.object(
+            provider, "_fetch_jwks", return_value={"keys": [{"kid": "new_key"}]}
+        ):
+            jwks = await provider._get_jwks()
+            assert jwks["keys"][0]["kid"] == "old_key"
+            assert provider._jwks_refresh_task is not None
+            await provider._jwks_refresh_task
+
+        assert (await provider._get_jwks())["keys"][0]["kid"] == "new_key"
+
+    @pytest.mark.asyncio
+    async def test_unknown_kid_refetches_at_most_once_per_interval(self) -> None:
+        """Rotated keys are picked up; unknown kids cannot force refetch storms."""
+        provider = CognitoAuthProvider(
+            user_pool_id="us-east-1_ABC123", client_id="client123"
+        )
+        provider._jwks_cache = {"keys": [{"kid": "old_key"}]}
+        provider._jwks_cache_time = time.time()
+
+        with patch.object(
+            provider, "_fetch_jwks", return_value={"keys": [{"kid": "rotated_key"}]}
+        ) as fetch:
+            jwks = await provider._get_jwks()
+            assert await provider._get_signing_key(jwks, "rotated_key") is not None
+            jwks = await provider._get_jwks()
+            assert await provider._get_signing_key(jwks, "bogus_key") is None
+            assert await provider._get_signing_key(jwks, "other_bogus_key") is None
+
+        fetch.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_verify_token_with_prebuilt_rsa_key(self) -> None:
+        """Keys are built once and verify real RS256 signatures."""
+        private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        private_pem = private_key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        )
+        public_jwk = jwk.construct(
+            private_key.public_key().public_bytes(
+                serialization.Encoding.PEM,
+                serialization.PublicFormat.SubjectPublicKeyInfo,
+            ),
+            algorithm="RS256",
+        ).to_dict()
+        public_jwk["kid"] = "key1"
+
+        provider = CognitoAuthProvider(
+            user_pool_id="us-east-1_ABC123", client_id="client123"
+        )
+        provider._initialized = True
+        provider._jwks_cache = {"keys": [public_jwk]}
+        provider._jwks_cache_time = time.time()
+        token = jwt.encode(
+            {
+                "sub": "user123",
+                "email": "user@example.com",
+                "aud": "client123",
+                "iss": "https://cognito-idp.us-east-1.amazonaws.com/us-east-1_ABC123",
+                "exp": int(time.time()) + 300,
+            },
+            private_pem.decode(),
+            algorithm="RS256",
+            headers={"kid": "key1"},
+        )
+
+        construct_key = jwk.construct
+        with patch(
+            "clarity.auth.aws_auth_provider.jwk.construct", side_effect=construct_key
+        ) as construct:
+            user_info = await provider.verify_token(token)
+            provider._token_cache.clear()
+            await provider.verify_token(token)
+
+        assert user_info["user_id"] == "user123"
+        construct.assert_called_once()
+
 
 class TestTokenVerification:
     """Test token verification logic."""
@@ -293,10 +400,7 @@ class TestTokenVerification:
 
         # Pre-populate cache
         cached_user_data = {"user_id": "cached_user", "email": "cached@example.com"}
-        provider._token_cache["cached_token"] = {
-            "user_data": cached_user_data,
-            "timestamp": time.time(),
-        }
+        provider._token_cache.set("cached_token", cached_user_data)
 
         result = await provider.verify_token("cached_token")
 
@@ -382,45 +486,43 @@ class TestTokenVerification:
 class TestTokenCacheManagement:
     """Test token cache management functionality."""
 
-    def test_remove_expired_tokens_with_cache_disabled(self):
-        """Test cache cleanup when caching is disabled."""
+    def test_token_cache_uses_configured_limits(self):
+        """The verified token cache is bounded by the provider config."""
         provider = CognitoAuthProvider(
             user_pool_id="us-east-1_ABC123",
             client_id="client123",
-            middleware_config={"auth_provider_config": {"cache_enabled": False}},
+            middleware_config={
+                "auth_provider_config": {"cache_max_size": 2, "cache_ttl_seconds": 60}
+            },
         )
 
-        # Add some tokens to cache anyway
-        provider._token_cache["token1"] = {"timestamp": time.time() - 1000}
-
-        provider._remove_expired_tokens()
+        for index in range(3):
+            provider._token_cache.set(f"token{index}", {"user_id": str(index)})
 
-        # Should not remove anything when cache is disabled
-        assert "token1" in provider._token_cache
+        assert len(provider._token_cache) == 2
+        assert "token0" not in provider._token_cache
+        assert provider._token_cache.ttl == 60
 
-    def test_remove_expired_tokens_removes_old_tokens(self):
-        """Test that expired tokens are removed from cache."""
+    def test_expired_tokens_are_not_served(self):
+        """Tokens expire at their exp claim, even within the cache TTL."""
         provider = CognitoAuthProvider(
             user_pool_id="us-east-1_ABC123", client_id="client123"
         )
-        provider._token_cache_ttl_seconds = 300  # 5 minutes
 
         current_time = time.time()
-        # Add expired token
-        provider._token_cache["expired_token"] = {
-            "user_data": {"user_id": "expired"},
-            "timestamp": current_time - 600,  # 10 minutes ago
-        }
-        # Add valid token
-        provider._token_cache["valid_token"] = {
-            "user_data": {"user_id": "valid"},
-            "timestamp": current_time - 100,  # 1.6 minutes ago
-        }
-
-        provider._remove_expired_tokens()
+        with patch("clarity.auth.token_cache.time.time", return_value=current_time):
+            provider._token_cache.set(
+                "expiring_token", {"user_id": "expiring"}, current_time + 30
+            )
+            provider._token_cache.set("valid_token", {"user_id": "valid"})
+
+        with patch(
+            "clarity.auth.token_cache.time.time", return_value=current_time + 60
+        ):
+            assert provider._token_cache.get("expiring_token") is None
+            assert provider._token_cache.get("valid_token") == {"user_id": "valid"}
 
-        assert "expired_token" not in provider._token_cache
-        assert "valid_token" in provider._token_cache
+        assert len(provider._token_cache) == 1
 
 
 class TestUserInfoRetrieval:
@@ -662,8 +764,79 @@ class TestUserContextCreation:
         context = await provider.get_or_create_user_context(cognito_user_info)
 
         assert context.user_id == "user123"
+        # Last login is written behind, on the next flush
+        mock_dynamodb.update_item.assert_not_called()
+        assert await provider.flush_login_activity() == 1
         mock_dynamodb.update_item.assert_called_once()  # Should update last login
 
+    @pytest.mark.asyncio
+    async def test_get_or_create_user_context_is_cached_per_user(self):
+        """Repeated requests reuse the context and coalesce login updates."""
+        mock_dynamodb = AsyncMock()
+        mock_dynamodb.get_item.return_value = {
+            "user_id": "user123",
+            "email": "test@example.com",
+            "role": "clinician",
+            "status": "active",
+        }
+
+        provider = CognitoAuthProvider(
+            user_pool_id="us-east-1_ABC123",
+            client_id="client123",
+            dynamodb_service=mock_dynamodb,
+        )
+
+        cognito_user_info = {
+            "user_id": "user123",
+            "email": "test@example.com",
+            "verified": True,
+            "custom_claims": {},
+        }
+
+        contexts = [
+            await provider.get_or_create_user_context(cognito_user_info)
+            for _ in range(3)
+        ]
+
+        assert all(context is contexts[0] for context in contexts)
+        assert contexts[0].role == UserRole.CLINICIAN
+        mock_dynamodb.get_item.assert_called_once()
+        assert provider.user_context_cache.get_stats()["hits"] == 2
+
+        await provider.cleanup()
+
+        # One update carrying all three logins, written on cleanup
+        mock_dynamodb.update_item.assert_called_once()
+        values = mock_dynamodb.update_item.call_args.kwargs[
+            "expression_attribute_values"
+        ]
+        assert values[":inc"] == 3
+
+    @pytest.mark.asyncio
+    async def test_get_or_create_user_context_cache_disabled(self):
+        """Disabling the provider cache reads the user record every time."""
+        mock_dynamodb = AsyncMock()
+        mock_dynamodb.get_item.return_value = {
+            "user_id": "user123",
+            "email": "test@example.com",
+            "role": "patient",
+            "status": "active",
+        }
+
+        provider = CognitoAuthProvider(
+            user_pool_id="us-east-1_ABC123",
+            client_id="client123",
+            dynamodb_service=mock_dynamodb,
+            middleware_config={"auth_provider_config": {"cache_enabled": False}},
+        )
+
+        cognito_user_info = {"user_id": "user123", "email": "test@example.com"}
+        await provider.get_or_create_user_context(cognito_user_info)
+        await provider.get_or_create_user_context(cognito_user_info)
+
+        assert mock_dynamodb.get_item.call_count == 2
+        await provider.cleanup()
+
     async def test_get_or_create_user_context_creates_new_user(self):
         """Test user context creation when creating new DynamoDB user."""
         mock_dynamodb = AsyncMock()
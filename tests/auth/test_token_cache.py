@@ -0,0 +1,101 @@
+"""Tests for the bounded verified-token cache."""
+
+from __future__ import annotations
+
+from contextlib import AbstractContextManager
+import time
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from clarity.auth.token_cache import VerifiedTokenCache, token_digest
+
+NOW = 1_700_000_000.0
+
+
+def _at(seconds: float) -> AbstractContextManager[Any]:
+    return patch("clarity.auth.token_cache.time.time", return_value=seconds)
+
+
+class TestVerifiedTokenCache:
+    """LRU keyed by token digest, expired by deadline heap."""
+
+    @staticmethod
+    def test_tokens_are_keyed_by_digest() -> None:
+        cache = VerifiedTokenCache()
+
+        cache.set("header.payload.signature", {"user_id": "user-1"})
+
+        assert "header.payload.signature" in cache
+        assert all(
+            isinstance(key, bytes) and len(key) == len(token_digest("x"))
+            for key in cache._entries
+        )
+        assert "header.payload.signature" not in {
+            key.decode(errors="ignore") for key in cache._entries
+        }
+
+    @staticmethod
+    def test_entries_expire_at_the_exp_claim() -> None:
+        cache = VerifiedTokenCache(ttl_seconds=300)
+        with _at(NOW):
+            cache.set("short", {"user_id": "short"}, expires_at=NOW + 10)
+            cache.set("long", {"user_id": "long"}, expires_at=NOW + 3600)
+
+        with _at(NOW + 11):
+            assert cache.get("short") is None
+            assert cache.get("long") == {"user_id": "long"}
+
+        # The cache TTL caps tokens with a distant exp
+        with _at(NOW + 301):
+            assert cache.get("long") is None
+        assert len(cache) == 0
+        assert cache.get_stats()["expirations"] == 2
+
+    @staticmethod
+    def test_already_expired_tokens_are_not_cached() -> None:
+        cache = VerifiedTokenCache()
+
+        cache.set("expired", {"user_id": "expired"}, expires_at=time.time() - 1)
+
+        assert len(cache) == 0
+
+    @staticmethod
+    def test_least_recently_used_token_is_evicted() -> None:
+        cache = VerifiedTokenCache(max_entries=2)
+        cache.set("token-1", {"user_id": "1"})
+        cache.set("token-2", {"user_id": "2"})
+        cache.get("token-1")
+
+        cache.set("token-3", {"user_id": "3"})
+
+        assert "token-2" not in cache
+        assert cache.get("token-1") is not None
+        assert cache.get_stats()["evictions"] == 1
+
+    @staticmethod
+    def test_recached_token_keeps_its_new_deadline() -> None:
+        cache = VerifiedTokenCache(ttl_seconds=300)
+        with _at(NOW):
+            cache.set("token", {"user_id": "old"}, expires_at=NOW + 10)
+        with _at(NOW + 5):
+            cache.set("token", {"user_id": "new"}, expires_at=NOW + 100)
+
+        with _at(NOW + 20):
+            assert cache.get("token") == {"user_id": "new"}
+
+    @staticmethod
+    def test_heap_stays_bounded_under_churn() -> None:
+        cache = VerifiedTokenCache(max_entries=10)
+
+        for index in range(1000):
+            cache.set(f"token-{index}", {"user_id": str(index)})
+
+        assert len(cache) == 10
+        assert len(cache._deadlines) <= 2 * len(cache) + 1
+
+    @staticmethod
+    def test_rejects_empty_cache() -> None:
+        with pytest.raises(ValueError, match="max_entries"):
+            VerifiedTokenCache(max_entries=0)
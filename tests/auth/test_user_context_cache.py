@@ -0,0 +1,143 @@
+"""Tests for the user context cache and write-behind login activity buffer."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from clarity.auth.user_context_cache import LoginActivityBuffer, UserContextCache
+from clarity.models.auth import UserContext, UserRole
+
+
+def _context(user_id: str) -> UserContext:
+    return UserContext(
+        user_id=user_id,
+        email=f"{user_id}@example.com",
+        role=UserRole.PATIENT,
+    )
+
+
+class TestUserContextCache:
+    """Bounded TTL cache keyed by the token subject."""
+
+    @staticmethod
+    def test_hit_and_miss_are_counted() -> None:
+        cache = UserContextCache()
+        context = _context("user-1")
+
+        assert cache.get("user-1") is None
+        cache.set("user-1", context)
+
+        assert cache.get("user-1") is context
+        stats = cache.get_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+
+    @staticmethod
+    def test_entries_expire_after_ttl() -> None:
+        cache = UserContextCache(ttl_seconds=10)
+        with patch("clarity.ml.result_cache.time.monotonic", return_value=0):
+            cache.set("user-1", _context("user-1"))
+
+        with patch("clarity.ml.result_cache.time.monotonic", return_value=11):
+            assert cache.get("user-1") is None
+        assert len(cache) == 0
+
+    @staticmethod
+    def test_least_recently_used_user_is_evicted() -> None:
+        cache = UserContextCache(max_entries=2)
+        cache.set("user-1", _context("user-1"))
+        cache.set("user-2", _context("user-2"))
+        cache.get("user-1")
+
+        cache.set("user-3", _context("user-3"))
+
+        assert cache.get("user-2") is None
+        assert cache.get("user-1") is not None
+        assert cache.get("user-3") is not None
+
+    @staticmethod
+    def test_invalidate_drops_the_user() -> None:
+        cache = UserContextCache()
+        cache.set("user-1", _context("user-1"))
+
+        cache.invalidate("user-1")
+
+        assert cache.get("user-1") is None
+
+
+class TestLoginActivityBuffer:
+    """Login activity is coalesced per user and written on flush."""
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_activity_is_coalesced_per_user() -> None:
+        dynamodb = AsyncMock()
+        buffer = LoginActivityBuffer(dynamodb, "clarity_users", flush_interval=3600)
+        first = datetime(2024, 3, 1, 8, tzinfo=UTC)
+
+        buffer.record("user-1", first + timedelta(minutes=5))
+        buffer.record("user-1", first)
+        buffer.record("user-2", first)
+
+        assert await buffer.flush() == 2
+        calls = {
+            call.kwargs["key"]["user_id"]: call.kwargs
+            for call in dynamodb.update_item.call_args_list
+        }
+        values = calls["user-1"]["expression_attribute_values"]
+        assert values[":inc"] == 2
+        assert values[":login_time"] == (first + timedelta(minutes=5)).isoformat()
+        assert buffer.pending_users == 0
+        await buffer.close()
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_failed_updates_are_retried() -> None:
+        dynamodb = AsyncMock()
+        dynamodb.update_item.side_effect = [Exception("throttled"), True]
+        buffer = LoginActivityBuffer(dynamodb, "clarity_users", flush_interval=3600)
+        now = datetime.now(UTC)
+
+        buffer.record("user-1", now)
+        assert await buffer.flush() == 0
+        buffer.record("user-1", now)
+
+        assert await buffer.flush() == 1
+        values = dynamodb.update_item.call_args.kwargs["expression_attribute_values"]
+        assert values[":inc"] == 2
+        await buffer.close()
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_background_flush_and_close() -> None:
+        dynamodb = AsyncMock()
+        buffer = LoginActivityBuffer(dynamodb, "clarity_users", flush_interval=0.01)
+
+        buffer.record("user-1", datetime.now(UTC))
+        await asyncio.sleep(0.05)
+        dynamodb.update_item.assert_called_once()
+
+        buffer.record("user-2", datetime.now(UTC))
+        await buffer.close()
+
+        assert dynamodb.update_item.call_count == 2
+        assert buffer.pending_users == 0
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_many_pending_users_flush_early() -> None:
+        dynamodb = AsyncMock()
+        buffer = LoginActivityBuffer(
+            dynamodb, "clarity_users", flush_interval=3600, max_pending_users=3
+        )
+
+        for index in range(3):
+            buffer.record(f"user-{index}", datetime.now(UTC))
+        await asyncio.sleep(0)
+        await buffer.close()
+
+        assert dynamodb.update_item.call_count == 3
@@ -0,0 +1,59 @@
+"""Tests for queue-based logging setup."""
+
+from __future__ import annotations
+
+import logging
+import logging.handlers
+
+from clarity.core.logging_config import enable_queue_logging, stop_queue_logging
+
+
+class ListHandler(logging.Handler):
+    """Handler keeping the records it receives."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.records: list[logging.LogRecord] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.records.append(record)
+
+
+class TestQueueLogging:
+    """Records go through a queue to the logger's original handlers."""
+
+    @staticmethod
+    def test_records_reach_original_handlers_via_queue() -> None:
+        target = logging.getLogger("clarity.tests.queue_logging")
+        target.setLevel(logging.INFO)
+        handler = ListHandler()
+        target.addHandler(handler)
+
+        try:
+            enable_queue_logging(target.name)
+            assert isinstance(target.handlers[0], logging.handlers.QueueHandler)
+            assert target.propagate is False
+
+            target.info("hello %s", "queue")
+        finally:
+            stop_queue_logging()
+
+        # Stopping the listener drains the queue
+        assert [r.getMessage() for r in handler.records] == ["hello queue"]
+        assert target.handlers == [handler]
+        assert target.propagate is True
+        target.removeHandler(handler)
+
+    @staticmethod
+    def test_enable_is_idempotent() -> None:
+        target = logging.getLogger("clarity.tests.queue_logging_idempotent")
+        handler = ListHandler()
+        target.addHandler(handler)
+
+        try:
+            enable_queue_logging(target.name)
+            enable_queue_logging(target.name)
+            assert len(target.handlers) == 1
+        finally:
+            stop_queue_logging()
+            target.removeHandler(handler)
@@ -3,16 +3,20 @@
 from __future__ import annotations
 
 from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
 from unittest.mock import MagicMock
 
 import numpy as np
 import pytest
 
+from clarity.core.exceptions import ProcessingError
 from clarity.integrations.apple_watch import (
+    SERIES_FIELDS,
     AppleWatchDataProcessor,
     ProcessedHealthData,
 )
-from clarity.integrations.healthkit import HealthDataPoint
+from clarity.integrations.healthkit import HealthDataBatch, HealthDataPoint
+from clarity.integrations.resampling import SeriesModality
 
 
 @pytest.mark.asyncio
@@ -217,3 +221,62 @@ def test_calculate_completeness():
     completeness = processor._calculate_completeness(result)
     # Expected: (0.75 + 1.0 + 0.5 + 0.0) / 4 = 0.5625 * 100 = 56.25
     assert completeness == pytest.approx(56.25)
+
+
+def _week_batch(user_id: str = "user-1") -> HealthDataBatch:
+    end_time = datetime(2024, 3, 8, tzinfo=UTC)
+    start_time = end_time - timedelta(days=7)
+    minutes = range(0, 7 * 24 * 60, 3)
+
+    def series(base: float, spread: int) -> list[HealthDataPoint]:
+        return [
+            HealthDataPoint(
+                timestamp=start_time + timedelta(minutes=m),
+                value=base + m % spread,
+                unit="",
+            )
+            for m in minutes
+        ]
+
+    return HealthDataBatch(
+        user_id=user_id,
+        end_date=end_time,
+        heart_rate_samples=series(60, 40),
+        hrv_samples=series(40, 20),
+        respiratory_rate_samples=series(12, 6),
+        step_count_samples=series(0, 90),
+    )
+
+
+@pytest.mark.asyncio
+async def test_process_health_batch_aligns_series_in_one_matrix():
+    processor = AppleWatchDataProcessor()
+
+    result = await processor.process_health_batch(_week_batch())
+
+    assert result.minute_matrix is not None
+    assert result.minute_matrix.shape == (len(SeriesModality), 10080)
+    assert result.minute_matrix.dtype == np.float32
+    for modality, field in SERIES_FIELDS.items():
+        series = getattr(result, field)
+        assert np.shares_memory(series, result.minute_matrix)
+        np.testing.assert_array_equal(series, result.minute_matrix[modality.row])
+    assert result.avg_hr is not None
+    assert result.hrv_median is not None
+    assert result.avg_respiratory_rate is not None
+
+
+@pytest.mark.asyncio
+async def test_process_health_batches_runs_users_on_worker_pool():
+    processor = AppleWatchDataProcessor()
+    broken = _week_batch("user-2")
+    broken.workout_samples = [SimpleNamespace(duration_minutes="thirty")]
+    batches = [_week_batch("user-1"), broken, _week_batch("user-3")]
+
+    results = await processor.process_health_batches(batches, max_workers=2)
+    single = await processor.process_health_batch(batches[0])
+
+    assert isinstance(results[1], ProcessingError)
+    assert isinstance(results[0], ProcessedHealthData)
+    assert isinstance(results[2], ProcessedHealthData)
+    np.testing.assert_array_equal(results[0].minute_matrix, single.minute_matrix)
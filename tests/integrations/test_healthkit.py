@@ -0,0 +1,347 @@
+"""Tests for the paginated, chunked HealthKit data fetch."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator, Callable
+from datetime import UTC, datetime, timedelta
+import json
+from typing import Any
+
+import httpx
+import numpy as np
+import pytest
+
+from clarity.core.exceptions import (
+    AuthorizationError,
+    DataValidationError,
+    IntegrationError,
+)
+from clarity.integrations.healthkit import (
+    HealthDataPoint,
+    HealthDataType,
+    HealthKitClient,
+    HealthKitTokens,
+    _PageDecoder,
+)
+
+START = datetime(2024, 3, 1, tzinfo=UTC)
+
+
+def _tokens(*, expired: bool = False) -> HealthKitTokens:
+    offset = timedelta(hours=-1 if expired else 1)
+    return HealthKitTokens(
+        access_token="access",
+        refresh_token="refresh",
+        expires_at=datetime.now(UTC) + offset,
+        scope=["heart_rate"],
+    )
+
+
+def _minute_samples(start: datetime, end: datetime) -> list[dict[str, Any]]:
+    """One sample per minute; values depend only on the timestamp."""
+    first = int((start - START) / timedelta(minutes=1))
+    last = int((end - START) / timedelta(minutes=1))
+    return [
+        {
+            "timestamp": (START + timedelta(minutes=minute)).isoformat(),
+            "value": 60 + minute % 40,
+            "unit": "count/min",
+            "source": "apple_watch",
+        }
+        for minute in range(first, last)
+    ]
+
+
+def _paged_handler(
+    samples_for: Callable[[datetime, datetime], list[dict[str, Any]]],
+    requests: list[httpx.Request],
+) -> Callable[[httpx.Request], httpx.Response]:
+    """Serve ``samples_for(start, end)`` in pages of ``limit`` samples."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        params = request.url.params
+        samples = samples_for(
+            datetime.fromisoformat(params["start_date"]),
+            datetime.fromisoformat(params["end_date"]),
+        )
+        limit = int(params["limit"])
+        offset = int(params.get("page_token", "0"))
+        body: dict[str, Any] = {
+            "user_id": "user-1",
+            "data": samples[offset : offset + limit],
+        }
+        if offset + limit < len(samples):
+            body["next_page_token"] = str(offset + limit)
+        return httpx.Response(200, json=body)
+
+    return handler
+
+
+@pytest.fixture
+def make_client() -> Callable[..., HealthKitClient]:
+    def make(handler: Callable[[httpx.Request], Any], **kwargs: Any) -> HealthKitClient:
+        client = HealthKitClient(
+            client_id="client", base_url="https://healthkit.test", **kwargs
+        )
+        client._http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        return client
+
+    return make
+
+
+class TestPageDecoder:
+    """Incremental decoding of a single data page."""
+
+    @staticmethod
+    def test_decodes_samples_fed_one_character_at_a_time() -> None:
+        body = json.dumps({
+            "user_id": "user-1",
+            "data": [
+                {"timestamp": "2024-03-01T00:00:00+00:00", "value": 61.25},
+                {"timestamp": "2024-03-01T00:01:00+00:00", "value": 1234567},
+            ],
+            "total": 98765,
+            "next_page_token": None,
+        })
+        samples: list[dict[str, Any]] = []
+        decoder = _PageDecoder(samples.append)
+
+        for char in body:
+            decoder.feed(char)
+        envelope = decoder.close()
+
+        assert [sample["value"] for sample in samples] == [61.25, 1234567]
+        assert envelope == {
+            "user_id": "user-1",
+            "total": 98765,
+            "next_page_token": None,
+        }
+
+    @staticmethod
+    def test_emits_samples_before_the_body_is_complete() -> None:
+        samples: list[dict[str, Any]] = []
+        decoder = _PageDecoder(samples.append)
+
+        decoder.feed('{"data": [{"timestamp": "2024-03-01T00:00:00", "value": 1},')
+
+        assert len(samples) == 1
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "body",
+        ['{"data": [{"value": 1}', '["data"]', '{"data": []} trailing', ""],
+    )
+    def test_rejects_truncated_or_malformed_bodies(body: str) -> None:
+        def decode() -> dict[str, Any]:
+            decoder = _PageDecoder(lambda _: None)
+            decoder.feed(body)
+            return decoder.close()
+
+        with pytest.raises(ValueError, match="HealthKit response body"):
+            decode()
+
+
+class TestFetchHealthArrays:
+    """Chunked, paginated fetch into NumPy arrays."""
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_fetches_every_page_of_every_chunk(
+        make_client: Callable[..., HealthKitClient],
+    ) -> None:
+        requests: list[httpx.Request] = []
+        client = make_client(_paged_handler(_minute_samples, requests))
+        end = START + timedelta(days=3)
+
+        result = await client.fetch_health_arrays(
+            _tokens(), HealthDataType.HEART_RATE, START, end, page_size=1000
+        )
+
+        # 3 one-day chunks of 1440 samples, two pages each
+        assert len(requests) == 6
+        assert len(result) == 3 * 1440
+        assert result.timestamps.dtype == np.dtype("datetime64[ms]")
+        assert result.values.dtype == np.float64
+        assert result.timestamps[0] == np.datetime64("2024-03-01T00:00:00", "ms")
+        assert result.timestamps[-1] == np.datetime64("2024-03-03T23:59:00", "ms")
+        assert bool(np.all(np.diff(result.timestamps.astype(np.int64)) == 60_000))
+        assert result.values[:3].tolist() == [60.0, 61.0, 62.0]
+        assert result.unit == "count/min"
+        assert result.user_id == "user-1"
+        assert all(
+            request.headers["Authorization"] == "Bearer access" for request in requests
+        )
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_drops_samples_repeated_on_chunk_boundaries(
+        make_client: Callable[..., HealthKitClient],
+    ) -> None:
+        def inclusive_samples(start: datetime, end: datetime) -> list[dict[str, Any]]:
+            return _minute_samples(start, end + timedelta(minutes=1))
+
+        client = make_client(_paged_handler(inclusive_samples, []))
+        end = START + timedelta(hours=4)
+
+        result = await client.fetch_health_arrays(
+            _tokens(),
+            HealthDataType.HEART_RATE,
+            START,
+            end,
+            chunk_duration=timedelta(hours=1),
+        )
+
+        assert len(result) == 4 * 60 + 1
+        assert len(np.unique(result.timestamps)) == len(result)
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_caps_concurrent_requests_per_host(
+        make_client: Callable[..., HealthKitClient],
+    ) -> None:
+        in_flight = 0
+        peak = 0
+
+        async def handler(_request: httpx.Request) -> httpx.Response:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return httpx.Response(200, json={"data": []})
+
+        client = make_client(handler, max_requests_per_host=2)
+
+        result = await client.fetch_health_arrays(
+            _tokens(),
+            HealthDataType.STEPS,
+            START,
+            START + timedelta(days=7),
+        )
+
+        assert len(result) == 0
+        assert peak == 2
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_decodes_bodies_split_across_stream_chunks(
+        make_client: Callable[..., HealthKitClient],
+    ) -> None:
+        body = json.dumps(
+            {"data": _minute_samples(START, START + timedelta(minutes=50))},
+            ensure_ascii=False,
+        ).replace("apple_watch", "Apple Watch Série 9")
+
+        async def pieces() -> AsyncIterator[bytes]:
+            encoded = body.encode()
+            for offset in range(0, len(encoded), 7):
+                await asyncio.sleep(0)
+                yield encoded[offset : offset + 7]
+
+        client = make_client(lambda _: httpx.Response(200, content=pieces()))
+
+        result = await client.fetch_health_arrays(
+            _tokens(),
+            HealthDataType.HEART_RATE,
+            START,
+            START + timedelta(minutes=50),
+        )
+
+        assert len(result) == 50
+        assert result.user_id == "unknown"
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_api_error_raises_integration_error(
+        make_client: Callable[..., HealthKitClient],
+    ) -> None:
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.params["start_date"].startswith("2024-03-02"):
+                return httpx.Response(503, text="unavailable")
+            return httpx.Response(200, json={"data": []})
+
+        client = make_client(handler)
+
+        with pytest.raises(IntegrationError, match="503 unavailable"):
+            await client.fetch_health_arrays(
+                _tokens(),
+                HealthDataType.HEART_RATE,
+                START,
+                START + timedelta(days=3),
+            )
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_truncated_body_raises_integration_error(
+        make_client: Callable[..., HealthKitClient],
+    ) -> None:
+        client = make_client(lambda _: httpx.Response(200, text='{"data": [{"va'))
+
+        with pytest.raises(IntegrationError, match="Health data fetch failed"):
+            await client.fetch_health_arrays(
+                _tokens(),
+                HealthDataType.HEART_RATE,
+                START,
+                START + timedelta(hours=1),
+            )
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_repeated_page_token_raises_integration_error(
+        make_client: Callable[..., HealthKitClient],
+    ) -> None:
+        client = make_client(
+            lambda _: httpx.Response(200, json={"data": [], "next_page_token": "p2"})
+        )
+
+        with pytest.raises(IntegrationError, match="did not advance"):
+            await client.fetch_health_arrays(
+                _tokens(),
+                HealthDataType.HEART_RATE,
+                START,
+                START + timedelta(hours=1),
+            )
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_rejects_expired_tokens_and_unsupported_types(
+        make_client: Callable[..., HealthKitClient],
+    ) -> None:
+        client = make_client(lambda _: httpx.Response(200, json={"data": []}))
+        end = START + timedelta(days=1)
+
+        with pytest.raises(AuthorizationError):
+            await client.fetch_health_arrays(
+                _tokens(expired=True), HealthDataType.HEART_RATE, START, end
+            )
+        with pytest.raises(DataValidationError):
+            await client.fetch_health_arrays(
+                _tokens(), HealthDataType.BLOOD_PRESSURE, START, end
+            )
+
+
+class TestFetchHealthData:
+    """The ``HealthDataBatch`` fetch shares the paginated path."""
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_returns_data_points_from_every_page(
+        make_client: Callable[..., HealthKitClient],
+    ) -> None:
+        requests: list[httpx.Request] = []
+        client = make_client(_paged_handler(_minute_samples, requests))
+        end = START + timedelta(days=2)
+
+        batch = await client.fetch_health_data(
+            _tokens(), HealthDataType.HEART_RATE, START, end, limit=500
+        )
+
+        assert len(requests) == 6
+        assert batch.total_count == 2 * 1440
+        assert batch.user_id == "user-1"
+        assert isinstance(batch.data_points[0], HealthDataPoint)
+        assert batch.data_points[0].timestamp == START
+        assert batch.data_points[-1].timestamp == end - timedelta(minutes=1)
+        assert batch.data_points[0].unit == "count/min"
@@ -0,0 +1,109 @@
+"""Tests for the shared minute-grid resampling engine."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from clarity.integrations.healthkit import (
+    HealthDataPoint,
+    HealthDataType,
+    HealthSampleArrays,
+)
+from clarity.integrations.resampling import (
+    MinuteGrid,
+    ResamplingEngine,
+    SeriesModality,
+    _forward_fill,
+    butter_coefficients,
+    minute_grid,
+)
+
+END = datetime(2024, 3, 8, tzinfo=UTC)
+START = END - timedelta(days=1)
+
+
+def _points(offsets_minutes: list[float], values: list[float]) -> list[HealthDataPoint]:
+    return [
+        HealthDataPoint(
+            timestamp=START + timedelta(minutes=offset), value=value, unit=""
+        )
+        for offset, value in zip(offsets_minutes, values, strict=True)
+    ]
+
+
+@pytest.mark.parametrize("limit", [1, 5, 10])
+def test_forward_fill_matches_pandas(limit: int) -> None:
+    rng = np.random.default_rng(7)
+    values = rng.normal(size=500)
+    values[rng.random(500) < 0.6] = np.nan
+    values[:4] = np.nan
+
+    expected = pd.Series(values).ffill(limit=limit).to_numpy()
+
+    np.testing.assert_array_equal(_forward_fill(values.copy(), limit), expected)
+
+
+def test_filter_coefficients_are_designed_once() -> None:
+    first = butter_coefficients(4, 1 / 60)
+    second = butter_coefficients(4, 1 / 60)
+
+    assert first is second
+    assert not first[0].flags.writeable
+
+
+def test_minute_grid_is_shared_per_time_range() -> None:
+    grid = minute_grid(START, END)
+
+    assert grid is minute_grid(START, END)
+    assert grid.n_minutes == 1440
+    assert len(grid.respiratory_timestamps) == 288
+    assert not grid.timestamps.flags.writeable
+
+
+def test_resample_writes_each_modality_into_its_row() -> None:
+    engine = ResamplingEngine()
+    offsets = [float(m) for m in range(0, 1440, 2)]
+    sources = {
+        SeriesModality.HEART_RATE: _points(offsets, [70.0] * len(offsets)),
+        SeriesModality.STEPS: _points([0.5, 0.75, 10.0], [16.0, 9.0, 4.0]),
+    }
+
+    result = engine.resample(sources, MinuteGrid(START, END))
+
+    assert result.matrix.shape == (len(SeriesModality), 1440)
+    assert result.modalities == {SeriesModality.HEART_RATE, SeriesModality.STEPS}
+    assert result.series(SeriesModality.HRV) is None
+    assert np.isnan(result.matrix[SeriesModality.HRV.row]).all()
+    assert result.stats["avg_hr"] == pytest.approx(70.0)
+    assert result.stats["total_steps"] == 29.0
+    steps = result.series(SeriesModality.STEPS)
+    assert steps is not None
+    assert steps[0] == pytest.approx((5.0 - 7.49) / 7.71)
+    assert steps[10] == pytest.approx((2.0 - 7.49) / 7.71)
+
+
+def test_resample_accepts_sample_arrays() -> None:
+    engine = ResamplingEngine()
+    offsets = [float(m) for m in range(0, 1440, 7)]
+    values = [60.0 + (m % 30) for m in range(len(offsets))]
+    points = _points(offsets, values)
+    arrays = HealthSampleArrays(
+        user_id="user-1",
+        data_type=HealthDataType.HEART_RATE,
+        start_date=START,
+        end_date=END,
+        timestamps=np.array(
+            [p.timestamp.replace(tzinfo=None) for p in points], dtype="datetime64[ms]"
+        ),
+        values=np.array(values),
+    )
+    grid = MinuteGrid(START, END)
+
+    from_points = engine.resample({SeriesModality.HEART_RATE: points}, grid)
+    from_arrays = engine.resample({SeriesModality.HEART_RATE: arrays}, grid)
+
+    np.testing.assert_array_equal(from_points.matrix, from_arrays.matrix)
@@ -6,26 +6,68 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 from starlette.requests import Request
 from starlette.responses import Response
+from starlette.types import Message, Receive, Scope, Send
 
 from clarity.middleware.auth_middleware import CognitoAuthMiddleware
 from clarity.models.auth import Permission, UserContext, UserRole
 
 
-@pytest.fixture
-def mock_app():
-    """Create a mock ASGI application."""
-    return MagicMock()
+class RecordingApp:
+    """ASGI app answering "OK" and recording the requests it receives."""
+
+    def __init__(self) -> None:
+        self.requests: list[Request] = []
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        self.requests.append(Request(scope, receive))
+        await Response("OK")(scope, receive, send)
+
+
+async def call_middleware(
+    middleware: CognitoAuthMiddleware, scope: Scope
+) -> list[Message]:
+    """Run one request through the middleware and return what it sent."""
+    sent: list[Message] = []
+
+    async def receive() -> Message:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: Message) -> None:
+        sent.append(message)
+
+    await middleware(scope, receive, send)
+    return sent
+
+
+def response_body(sent: list[Message]) -> bytes:
+    """Concatenated response body of the sent messages."""
+    return b"".join(
+        message.get("body", b"")
+        for message in sent
+        if message["type"] == "http.response.body"
+    )
+
+
+def request_scope(
+    path: str = "/api/v1/health-data", headers: dict[str, str] | None = None
+) -> Scope:
+    """ASGI scope of a GET request."""
+    return {
+        "type": "http",
+        "method": "GET",
+        "path": path,
+        "query_string": b"",
+        "headers": [
+            (name.lower().encode(), value.encode())
+            for name, value in (headers or {}).items()
+        ],
+    }
 
 
 @pytest.fixture
-def mock_request():
-    """Create a mock request."""
-    request = MagicMock(spec=Request)
-    request.state = MagicMock()
-    request.headers = {}
-    request.url = MagicMock()
-    request.url.path = "/api/v1/health-data"
-    return request
+def mock_app() -> RecordingApp:
+    """Create a recording ASGI application."""
+    return RecordingApp()
 
 
 @pytest.fixture
@@ -42,98 +84,93 @@ def mock_user_context():
     )
 
 
+def cognito_env() -> Any:
+    """Environment with Cognito authentication configured."""
+    return patch.dict(
+        "os.environ",
+        {
+            "ENABLE_AUTH": "true",
+            "COGNITO_USER_POOL_ID": "test-pool",
+            "COGNITO_CLIENT_ID": "test-client",
+        },
+    )
+
+
 class TestCognitoAuthMiddleware:
     """Test cases for Cognito authentication middleware."""
 
     @pytest.mark.asyncio
-    async def test_public_path_bypass(self, mock_app: Any, mock_request: Any) -> None:
+    async def test_public_path_bypass(self, mock_app: RecordingApp) -> None:
         """Test that public paths bypass authentication."""
         # Arrange
-        mock_request.url.path = "/health"
-        call_next = AsyncMock(return_value=Response("OK"))
-
         middleware = CognitoAuthMiddleware(mock_app)
 
         # Act
-        response = await middleware.dispatch(mock_request, call_next)
+        sent = await call_middleware(middleware, request_scope("/health"))
 
         # Assert
-        assert response.body == b"OK"
-        assert mock_request.state.user is None
-        call_next.assert_called_once_with(mock_request)
+        assert response_body(sent) == b"OK"
+        assert len(mock_app.requests) == 1
+        assert mock_app.requests[0].state.user is None
 
     @pytest.mark.asyncio
-    async def test_no_auth_header(self, mock_app: Any, mock_request: Any) -> None:
+    async def test_no_auth_header(self, mock_app: RecordingApp) -> None:
         """Test request without Authorization header."""
         # Arrange
-        call_next = AsyncMock(return_value=Response("OK"))
-
         with patch.dict("os.environ", {"ENABLE_AUTH": "true"}):
             middleware = CognitoAuthMiddleware(mock_app)
 
         # Act
-        response = await middleware.dispatch(mock_request, call_next)
+        sent = await call_middleware(middleware, request_scope())
 
         # Assert
-        assert response.body == b"OK"
-        assert mock_request.state.user is None
-        call_next.assert_called_once_with(mock_request)
+        assert response_body(sent) == b"OK"
+        assert len(mock_app.requests) == 1
+        assert mock_app.requests[0].state.user is None
 
     @pytest.mark.asyncio
-    async def test_invalid_auth_header_format(
-        self, mock_app: Any, mock_request: Any
-    ) -> None:
+    async def test_invalid_auth_header_format(self, mock_app: RecordingApp) -> None:
         """Test request with invalid Authorization header format."""
         # Arrange
-        mock_request.headers = {"Authorization": "Invalid token"}
-        call_next = AsyncMock(return_value=Response("OK"))
+        scope = request_scope(headers={"Authorization": "Invalid token"})
 
         with patch.dict("os.environ", {"ENABLE_AUTH": "true"}):
             middleware = CognitoAuthMiddleware(mock_app)
 
         # Act
-        response = await middleware.dispatch(mock_request, call_next)
+        sent = await call_middleware(middleware, scope)
 
         # Assert
-        assert response.body == b"OK"
-        assert mock_request.state.user is None
-        call_next.assert_called_once_with(mock_request)
+        assert response_body(sent) == b"OK"
+        assert len(mock_app.requests) == 1
+        assert mock_app.requests[0].state.user is None
 
     @pytest.mark.asyncio
-    async def test_auth_disabled(self, mock_app: Any, mock_request: Any) -> None:
+    async def test_auth_disabled(self, mock_app: RecordingApp) -> None:
         """Test when authentication is disabled."""
         # Arrange
-        mock_request.headers = {"Authorization": "Bearer test-token"}
-        call_next = AsyncMock(return_value=Response("OK"))
+        scope = request_scope(headers={"Authorization": "Bearer test-token"})
 
         with patch.dict("os.environ", {"ENABLE_AUTH": "false"}):
             middleware = CognitoAuthMiddleware(mock_app)
 
         # Act
-        response = await middleware.dispatch(mock_request, call_next)
+        sent = await call_middleware(middleware, scope)
 
         # Assert
-        assert response.body == b"OK"
-        assert mock_request.state.user is None
-        call_next.assert_called_once_with(mock_request)
+        assert response_body(sent) == b"OK"
+        assert len(mock_app.requests) == 1
+        assert mock_app.requests[0].state.user is None
 
     @pytest.mark.asyncio
     async def test_valid_token_authentication(
-        self, mock_app: Any, mock_request: Any, mock_user_context: UserContext
+        self, mock_app: RecordingApp, mock_user_context: UserContext
     ) -> None:
         """Test successful authentication with valid token."""
         # Arrange
-        mock_request.headers = {"Authorization": "Bearer valid-token"}
-        call_next = AsyncMock(return_value=Response("OK"))
-
-        with patch.dict(
-            "os.environ",
-            {
-                "ENABLE_AUTH": "true",
-                "COGNITO_USER_POOL_ID": "test-pool",
-                "COGNITO_CLIENT_ID": "test-client",
-            },
-        ):
+        scope = request_scope(headers={"Authorization": "Bearer valid-token"})
+
+        with cognito_env():
             middleware = CognitoAuthMiddleware(mock_app)
 
             # Mock the auth provider
@@ -156,32 +193,22 @@ class TestCognitoAuthMiddleware:
         with patch(
             "clarity.middleware.auth_middleware.set_user_context"
         ) as mock_set_context:
-            response = await middleware.dispatch(mock_request, call_next)
+            sent = await call_middleware(middleware, scope)
 
         # Assert
-        assert response.body == b"OK"
-        assert mock_request.state.user == mock_user_context
+        assert response_body(sent) == b"OK"
+        assert len(mock_app.requests) == 1
+        assert mock_app.requests[0].state.user == mock_user_context
         mock_auth_provider.verify_token.assert_called_once_with("valid-token")
         mock_set_context.assert_called_once_with(mock_user_context)
-        call_next.assert_called_once_with(mock_request)
 
     @pytest.mark.asyncio
-    async def test_invalid_token_authentication(
-        self, mock_app: Any, mock_request: Any
-    ) -> None:
+    async def test_invalid_token_authentication(self, mock_app: RecordingApp) -> None:
         """Test authentication with invalid token."""
         # Arrange
-        mock_request.headers = {"Authorization": "Bearer invalid-token"}
-        call_next = AsyncMock(return_value=Response("OK"))
-
-        with patch.dict(
-            "os.environ",
-            {
-                "ENABLE_AUTH": "true",
-                "COGNITO_USER_POOL_ID": "test-pool",
-                "COGNITO_CLIENT_ID": "test-client",
-            },
-        ):
+        scope = request_scope(headers={"Authorization": "Bearer invalid-token"})
+
+        with cognito_env():
             middleware = CognitoAuthMiddleware(mock_app)
 
             # Mock the auth provider
@@ -194,10 +221,27 @@ class TestCognitoAuthMiddleware:
             middleware.auth_provider = mock_auth_provider
 
         # Act
-        response = await middleware.dispatch(mock_request, call_next)
+        sent = await call_middleware(middleware, scope)
 
         # Assert
-        assert response.body == b"OK"
-        assert mock_request.state.user is None
+        assert response_body(sent) == b"OK"
+        assert len(mock_app.requests) == 1
+        assert mock_app.requests[0].state.user is None
         mock_auth_provider.verify_token.assert_called_once_with("invalid-token")
-        call_next.assert_called_once_with(mock_request)
+
+    @pytest.mark.asyncio
+    async def test_websocket_scope_passes_through(
+        self, mock_user_context: UserContext
+    ) -> None:
+        """Non-HTTP connections are handed on untouched."""
+        inner = AsyncMock()
+        with cognito_env():
+            middleware = CognitoAuthMiddleware(inner)
+        middleware.auth_provider = MagicMock()
+        scope: Scope = {"type": "websocket", "path": "/api/v1/ws", "headers": []}
+
+        await middleware(scope, AsyncMock(), AsyncMock())
+
+        inner.assert_awaited_once()
+        assert "state" not in scope
+        middleware.auth_provider.verify_token.assert_not_called()
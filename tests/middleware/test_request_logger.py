@@ -0,0 +1,160 @@
+"""Tests for the sampled access logging middleware."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+import json
+import logging
+
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+import pytest
+
+from clarity.core.logging_config import stop_queue_logging
+from clarity.middleware.request_logger import (
+    ACCESS_LOGGER_NAME,
+    RequestLoggingMiddleware,
+    summarize_body,
+)
+
+
+@pytest.fixture(autouse=True)
+def direct_logging() -> Iterator[None]:
+    """Keep access records off queue handlers left behind by other tests."""
+    stop_queue_logging()
+    yield
+    stop_queue_logging()
+
+
+def create_test_app(**options: object) -> FastAPI:
+    """Create a FastAPI app echoing the request body."""
+    app = FastAPI()
+    app.add_middleware(RequestLoggingMiddleware, **options)
+
+    @app.post("/echo")
+    async def echo(request: Request) -> dict[str, str]:
+        return {"body": (await request.body()).decode()}
+
+    @app.get("/fail")
+    async def fail() -> None:
+        msg = "boom"
+        raise RuntimeError(msg)
+
+    return app
+
+
+def access_records(caplog: pytest.LogCaptureFixture) -> list[logging.LogRecord]:
+    return [r for r in caplog.records if r.name == ACCESS_LOGGER_NAME]
+
+
+class TestRequestLoggingMiddleware:
+    """One structured record per sampled request, without raw bodies."""
+
+    @staticmethod
+    def test_request_is_logged_and_body_still_readable(
+        caplog: pytest.LogCaptureFixture,
+    ) -> None:
+        client = TestClient(create_test_app())
+
+        with caplog.at_level(logging.INFO, ACCESS_LOGGER_NAME):
+            response = client.post(
+                "/echo", content=(chunk for chunk in [b'{"a": ', b"1}"])
+            )
+
+        assert response.json() == {"body": '{"a": 1}'}
+        (record,) = access_records(caplog)
+        assert record.access["method"] == "POST"
+        assert record.access["path"] == "/echo"
+        assert record.access["status"] == 200
+        assert record.access["request_bytes"] == 8
+        assert record.access["response_bytes"] == len(response.content)
+        assert "body" not in record.access
+
+    @staticmethod
+    def test_body_summary_hides_values(caplog: pytest.LogCaptureFixture) -> None:
+        client = TestClient(create_test_app(log_bodies=True))
+        payload = {"email": "jane@example.com", "heart_rate": 72, "samples": [1, 2]}
+
+        with caplog.at_level(logging.INFO, ACCESS_LOGGER_NAME):
+            client.post("/echo", json=payload)
+
+        (record,) = access_records(caplog)
+        summary = record.access["body"]
+        assert "jane@example.com" not in summary
+        assert "72" not in summary
+        assert "heart_rate" in summary
+        assert "[list:2]" in summary
+
+    @staticmethod
+    def test_large_bodies_are_only_counted(caplog: pytest.LogCaptureFixture) -> None:
+        client = TestClient(create_test_app(log_bodies=True, max_body_bytes=16))
+        payload = {"values": list(range(100))}
+
+        with caplog.at_level(logging.INFO, ACCESS_LOGGER_NAME):
+            client.post("/echo", json=payload)
+
+        (record,) = access_records(caplog)
+        assert record.access["request_bytes"] > 16
+        assert record.access["body"] == f"[{record.access['request_bytes']} bytes]"
+
+    @staticmethod
+    def test_unsampled_requests_are_not_logged(
+        caplog: pytest.LogCaptureFixture,
+    ) -> None:
+        client = TestClient(create_test_app(sample_rate=0.0))
+
+        with caplog.at_level(logging.INFO, ACCESS_LOGGER_NAME):
+            client.post("/echo", json={"a": 1})
+
+        assert access_records(caplog) == []
+
+    @staticmethod
+    def test_server_errors_are_logged_regardless_of_sampling(
+        caplog: pytest.LogCaptureFixture,
+    ) -> None:
+        client = TestClient(
+            create_test_app(sample_rate=0.0), raise_server_exceptions=False
+        )
+
+        with caplog.at_level(logging.INFO, ACCESS_LOGGER_NAME):
+            assert client.get("/fail").status_code == 500
+
+        (record,) = access_records(caplog)
+        assert record.access["status"] == 500
+
+    @staticmethod
+    def test_building_an_app_leaves_access_logger_alone() -> None:
+        access_logger = logging.getLogger(ACCESS_LOGGER_NAME)
+        handlers = access_logger.handlers[:]
+
+        TestClient(create_test_app()).post("/echo", json={"a": 1})
+
+        assert access_logger.handlers == handlers
+        assert access_logger.propagate is True
+
+    @staticmethod
+    def test_invalid_sample_rate_is_rejected() -> None:
+        with pytest.raises(ValueError, match="sample_rate"):
+            RequestLoggingMiddleware(FastAPI(), sample_rate=1.5)
+
+
+class TestSummarizeBody:
+    """Summaries never contain body values."""
+
+    @staticmethod
+    def test_non_json_body_reports_size() -> None:
+        assert summarize_body(b"secret", 6, "text/plain") == "[6 bytes]"
+
+    @staticmethod
+    def test_invalid_json_reports_size() -> None:
+        assert summarize_body(b"{", 1, "application/json") == (
+            "[1 bytes, invalid JSON]"
+        )
+
+    @staticmethod
+    def test_nested_objects_keep_structure() -> None:
+        body = json.dumps({"user": {"ssn": "123-45-6789", "age": 40}}).encode()
+
+        summary = summarize_body(body, len(body), "application/json")
+
+        assert summary == "{'user': {'ssn': 'str', 'age': 'int'}}"
@@ -0,0 +1,140 @@
+"""Tests for the request size limiting middleware."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+import pytest
+from starlette.responses import PlainTextResponse
+from starlette.types import Message, Receive, Scope, Send
+
+from clarity.middleware.request_size_limiter import RequestSizeLimiterMiddleware
+
+JSON_LIMIT = 1024
+DEFAULT_LIMIT = 4096
+
+
+def create_test_app() -> FastAPI:
+    """Create a FastAPI app echoing the size of the request body."""
+    app = FastAPI()
+    app.add_middleware(
+        RequestSizeLimiterMiddleware,
+        max_request_size=DEFAULT_LIMIT,
+        max_json_size=JSON_LIMIT,
+    )
+
+    @app.post("/echo")
+    async def echo(request: Request) -> dict[str, int]:
+        return {"received": len(await request.body())}
+
+    @app.get("/ping")
+    async def ping() -> dict[str, str]:
+        return {"status": "ok"}
+
+    return app
+
+
+@pytest.fixture
+def client() -> TestClient:
+    return TestClient(create_test_app())
+
+
+def _chunks(total: int, chunk_size: int = 256) -> Iterator[bytes]:
+    for start in range(0, total, chunk_size):
+        yield b"x" * min(chunk_size, total - start)
+
+
+class TestRequestSizeLimiter:
+    """Limits are enforced from Content-Length and while streaming."""
+
+    @staticmethod
+    def test_small_requests_pass(client: TestClient) -> None:
+        response = client.post("/echo", json={"value": 1})
+
+        assert response.status_code == 200
+        assert response.json()["received"] > 0
+
+    @staticmethod
+    def test_declared_oversize_is_rejected_up_front(client: TestClient) -> None:
+        response = client.post(
+            "/echo",
+            content=b"x" * (JSON_LIMIT + 1),
+            headers={"content-type": "application/json"},
+        )
+
+        assert response.status_code == 413
+        assert response.json()["error"] == "Request payload too large"
+        assert response.headers["Retry-After"] == "3600"
+        assert response.headers["X-Content-Type-Options"] == "nosniff"
+
+    @staticmethod
+    def test_limit_depends_on_content_type(client: TestClient) -> None:
+        body = b"x" * (JSON_LIMIT + 1)
+
+        response = client.post(
+            "/echo", content=body, headers={"content-type": "text/plain"}
+        )
+
+        assert response.status_code == 200
+        assert response.json() == {"received": len(body)}
+
+    @staticmethod
+    def test_chunked_body_is_cut_off_while_streaming(client: TestClient) -> None:
+        response = client.post(
+            "/echo",
+            content=_chunks(DEFAULT_LIMIT * 4),
+            headers={"content-type": "text/plain"},
+        )
+
+        assert response.status_code == 413
+
+    @staticmethod
+    def test_chunked_body_under_limit_passes(client: TestClient) -> None:
+        response = client.post(
+            "/echo",
+            content=_chunks(DEFAULT_LIMIT),
+            headers={"content-type": "text/plain"},
+        )
+
+        assert response.status_code == 200
+        assert response.json() == {"received": DEFAULT_LIMIT}
+
+    @staticmethod
+    def test_requests_without_body_are_not_checked(client: TestClient) -> None:
+        assert client.get("/ping").status_code == 200
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_plain_asgi_app_gets_413_response() -> None:
+        """Apps without HTTPException handling still answer 413."""
+
+        async def app(scope: Scope, receive: Receive, send: Send) -> None:
+            while (await receive()).get("more_body"):
+                pass
+            await PlainTextResponse("read")(scope, receive, send)
+
+        middleware = RequestSizeLimiterMiddleware(app, max_request_size=10)
+        messages = [
+            {"type": "http.request", "body": b"x" * 8, "more_body": True},
+            {"type": "http.request", "body": b"x" * 8, "more_body": False},
+        ]
+        sent: list[Message] = []
+
+        async def receive() -> Message:
+            return messages.pop(0)
+
+        async def send(message: Message) -> None:
+            sent.append(message)
+
+        scope = {
+            "type": "http",
+            "method": "POST",
+            "path": "/upload",
+            "headers": [],
+            "query_string": b"",
+        }
+        await middleware(scope, receive, send)
+
+        assert sent[0]["status"] == 413
@@ -15,6 +15,7 @@ This test suite covers all aspects of the analysis pipeline including:
 from __future__ import annotations
 
 from datetime import UTC, datetime, timedelta
+import threading
 from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import pytest
@@ -34,6 +35,8 @@ from clarity.models.health_data import (
     HealthMetric,
     HealthMetricType,
 )
+from clarity.monitoring.phase_timing import set_phase_timing_enabled
+from clarity.storage.async_dynamodb import AsyncDynamoDBTable
 
 
 class TestAnalysisResults:
@@ -700,6 +703,85 @@ class TestHealthAnalysisPipelineMainWorkflow:
         assert "cardio" in result.processing_metadata["modalities_processed"]
         assert len(result.processing_metadata["modalities_processed"]) == 1
 
+    @pytest.mark.asyncio
+    @staticmethod
+    async def test_process_health_data_runs_modalities_concurrently() -> None:
+        """Modality processors run in parallel and each stage is timed."""
+        pipeline = HealthAnalysisPipeline()
+
+        # Each processor blocks until the other one has started
+        barrier = threading.Barrier(2, timeout=5)
+
+        def wait_for_peer(features: list[float]) -> list[float]:
+            barrier.wait()
+            return features
+
+        mock_cardio = Mock()
+        mock_cardio.process = MagicMock(
+            side_effect=lambda *_: wait_for_peer([1.0, 2.0, 3.0])
+        )
+        pipeline.cardio_processor = mock_cardio
+
+        mock_respiratory = Mock()
+        mock_respiratory.process = MagicMock(
+            side_effect=lambda *_: wait_for_peer([4.0, 5.0, 6.0])
+        )
+        pipeline.respiratory_processor = mock_respiratory
+
+        mock_fusion = Mock()
+        mock_fusion.fuse_modalities = MagicMock(return_value=[7.0, 8.0])
+        mock_fusion.initialize_model = MagicMock()
+        pipeline.fusion_service = mock_fusion
+
+        metrics = [
+            HealthMetric(
+                metric_type=HealthMetricType.HEART_RATE,
+                biometric_data=BiometricData(heart_rate=75.0),
+            ),
+            HealthMetric(
+                metric_type=HealthMetricType.RESPIRATORY_RATE,
+                biometric_data=BiometricData(respiratory_rate=16.0),
+            ),
+        ]
+
+        result = await pipeline.process_health_data("user1", metrics)
+
+        assert result.cardio_features == [1.0, 2.0, 3.0]
+        assert result.respiratory_features == [4.0, 5.0, 6.0]
+        assert result.fused_vector == [7.0, 8.0]
+        mock_fusion.fuse_modalities.assert_called_once_with(
+            {"cardio": [1.0, 2.0, 3.0], "respiratory": [4.0, 5.0, 6.0]}
+        )
+
+        timings = result.processing_metadata["stage_timings_ms"]
+        for stage in ("organize", "cardio", "respiratory", "modalities", "fusion"):
+            assert timings[stage] >= 0.0
+        assert timings["total"] >= timings["modalities"]
+
+    @pytest.mark.asyncio
+    @staticmethod
+    async def test_process_health_data_without_phase_timing() -> None:
+        """Disabled phase timing leaves the breakdown out of the metadata."""
+        pipeline = HealthAnalysisPipeline()
+        mock_processor = Mock()
+        mock_processor.process = MagicMock(return_value=[1.0, 2.0, 3.0])
+        pipeline.cardio_processor = mock_processor
+        metrics = [
+            HealthMetric(
+                metric_type=HealthMetricType.HEART_RATE,
+                biometric_data=BiometricData(heart_rate=75.0),
+            )
+        ]
+
+        set_phase_timing_enabled(enabled=False)
+        try:
+            result = await pipeline.process_health_data("user1", metrics)
+        finally:
+            set_phase_timing_enabled(enabled=True)
+
+        assert result.cardio_features == [1.0, 2.0, 3.0]
+        assert "stage_timings_ms" not in result.processing_metadata
+
     @pytest.mark.asyncio
     @staticmethod
     async def test_process_health_data_with_dynamodb_save() -> None:
@@ -717,6 +799,7 @@ class TestHealthAnalysisPipelineMainWorkflow:
         mock_table = MagicMock()
         mock_table.put_item = MagicMock()
         mock_dynamodb.table = mock_table
+        mock_dynamodb.async_table = AsyncDynamoDBTable(mock_table)
         pipeline.dynamodb_client = mock_dynamodb
 
         cardio_metric = HealthMetric(
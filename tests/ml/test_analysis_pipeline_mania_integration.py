@@ -14,6 +14,7 @@ from clarity.models.health_data import (
     HealthMetricType,
     SleepData,
 )
+from clarity.storage.async_dynamodb import AsyncDynamoDBTable
 from tests.helpers.pat_test_utils import mock_pat_service_for_testing
 
 
@@ -36,6 +37,7 @@ class TestManiaRiskIntegration:
         """Mock DynamoDB client for baseline retrieval."""
         mock_client = MagicMock()
         mock_client.table = MagicMock()
+        mock_client.async_table = AsyncDynamoDBTable(mock_client.table)
         return mock_client
 
     def create_sleep_metric(
@@ -355,6 +357,7 @@ class TestManiaRiskIntegration:
                 with patch.object(pipeline, "_get_dynamodb_client") as mock_get_db:
                     mock_db = MagicMock()
                     mock_db.table.query.return_value = {"Items": []}
+                    mock_db.async_table = AsyncDynamoDBTable(mock_db.table)
                     mock_get_db.return_value = mock_db
 
                     results = await pipeline.process_health_data(
@@ -22,6 +22,7 @@ from clarity.models.health_data import (
     SleepData,
     SleepStage,
 )
+from clarity.storage.async_dynamodb import AsyncDynamoDBTable
 from clarity.storage.dynamodb_client import DynamoDBHealthDataRepository
 
 
@@ -247,6 +248,7 @@ class TestAnalysisPipelineSleepIntegration:
         self, mock_dynamodb: MagicMock
     ) -> None:
         """Test successful saving of analysis results to DynamoDB."""
+        mock_dynamodb.async_table = AsyncDynamoDBTable(mock_dynamodb.table)
         self.pipeline.dynamodb_client = mock_dynamodb
         processing_id = "test_processing_id_save_success"
 
@@ -283,6 +285,7 @@ class TestAnalysisPipelineSleepIntegration:
         self, mock_dynamodb: MagicMock
     ) -> None:
         """Test failure when saving analysis results to DynamoDB."""
+        mock_dynamodb.async_table = AsyncDynamoDBTable(mock_dynamodb.table)
         self.pipeline.dynamodb_client = mock_dynamodb
         mock_dynamodb.table.put_item.side_effect = Exception("DynamoDB Save Error")
 
@@ -349,6 +352,7 @@ class TestAnalysisPipelineSleepIntegration:
             # Set up the mock instance
             mock_instance = MagicMock()
             mock_instance.table = mock_table
+            mock_instance.async_table = AsyncDynamoDBTable(mock_table)
             mock_repo.return_value = mock_instance
 
             await self.pipeline.process_health_data(
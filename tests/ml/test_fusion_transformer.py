@@ -0,0 +1,135 @@
+"""Tests for batched multimodal fusion."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+import torch
+
+from clarity.ml.fusion_transformer import HealthFusionService
+
+MODALITY_DIMS = {"cardio": 8, "respiratory": 8, "activity": 16, "sleep": 9}
+
+
+@pytest.fixture
+def service() -> HealthFusionService:
+    torch.manual_seed(0)
+    fusion = HealthFusionService()
+    fusion.initialize_model(MODALITY_DIMS)
+    return fusion
+
+
+def _users(count: int, seed: int = 0) -> list[dict[str, list[float]]]:
+    rng = np.random.default_rng(seed)
+    return [
+        {name: rng.normal(size=dim).tolist() for name, dim in MODALITY_DIMS.items()}
+        for _ in range(count)
+    ]
+
+
+class TestFuseBatch:
+    """Many users fuse in one forward pass."""
+
+    @staticmethod
+    def test_batch_matches_single_user_fusion(service: HealthFusionService) -> None:
+        users = _users(6)
+
+        fused = service.fuse_users(users)
+
+        assert fused.shape == (6, 64)
+        assert fused.dtype == np.float32
+        single = np.array([service.fuse_modalities(user) for user in users])
+        np.testing.assert_allclose(fused, single, atol=1e-5)
+
+    @staticmethod
+    def test_missing_modalities_are_masked(service: HealthFusionService) -> None:
+        full, partial = _users(2)
+        del partial["activity"]
+        del partial["sleep"]
+
+        fused = service.fuse_users([full, partial, {}])
+
+        np.testing.assert_allclose(
+            fused[1], service.fuse_modalities(partial), atol=1e-5
+        )
+        np.testing.assert_allclose(fused[0], service.fuse_modalities(full), atol=1e-5)
+        # A user without any modality has nothing to fuse
+        assert not fused[2].any()
+
+    @staticmethod
+    def test_absent_rows_ignore_placeholder_values(
+        service: HealthFusionService,
+    ) -> None:
+        users = _users(3)
+        features = {
+            name: np.array([user[name] for user in users], dtype=np.float32)
+            for name in MODALITY_DIMS
+        }
+        present = {"sleep": np.array([True, False, True])}
+        features["sleep"][1] = np.nan
+
+        fused = service.fuse_batch(features, present)
+
+        assert np.isfinite(fused).all()
+        without_sleep = {k: v for k, v in users[1].items() if k != "sleep"}
+        np.testing.assert_allclose(
+            fused[1], service.fuse_modalities(without_sleep), atol=1e-5
+        )
+
+    @staticmethod
+    def test_forward_leaves_parameters_untouched(
+        service: HealthFusionService,
+    ) -> None:
+        assert service.model is not None
+        before = {
+            name: tensor.clone() for name, tensor in service.model.state_dict().items()
+        }
+
+        first = service.fuse_users(_users(2))
+        second = service.fuse_users(_users(2))
+
+        np.testing.assert_array_equal(first, second)
+        for name, tensor in service.model.state_dict().items():
+            assert torch.equal(tensor, before[name]), name
+        # Position ids are a precomputed, non-persistent buffer
+        assert "position_ids" not in before
+
+    @staticmethod
+    def test_mismatched_batch_sizes_raise(service: HealthFusionService) -> None:
+        with pytest.raises(ValueError, match="batch sizes differ"):
+            service.fuse_batch({
+                "cardio": np.ones((3, 8)),
+                "respiratory": np.ones((2, 8)),
+            })
+
+    @staticmethod
+    def test_misshaped_matrix_raises(service: HealthFusionService) -> None:
+        with pytest.raises(ValueError, match=r"cardio features must have shape"):
+            service.fuse_batch({"cardio": np.ones((2, 5))})
+
+    @staticmethod
+    def test_model_failure_fuses_to_zeros(
+        service: HealthFusionService, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        def fail(*_args: object) -> None:
+            msg = "device lost"
+            raise RuntimeError(msg)
+
+        monkeypatch.setattr(service, "model", fail)
+
+        fused = service.fuse_batch({"cardio": np.ones((2, 8))})
+
+        assert fused.shape == (2, 64)
+        assert not fused.any()
+
+    @staticmethod
+    def test_wrong_feature_length_raises(service: HealthFusionService) -> None:
+        with pytest.raises(ValueError, match="cardio features must have 8 values"):
+            service.fuse_users([{"cardio": [1.0, 2.0]}])
+
+        assert service.fuse_modalities({"cardio": [1.0, 2.0]}) == [0.0] * 64
+
+    @staticmethod
+    def test_requires_initialized_model() -> None:
+        with pytest.raises(RuntimeError, match="not initialized"):
+            HealthFusionService().fuse_batch({"cardio": np.ones((1, 8))})
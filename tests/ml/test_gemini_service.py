@@ -10,7 +10,12 @@ This test suite covers all aspects of the Gemini service including:
 
 from __future__ import annotations
 
+import asyncio
+from collections.abc import AsyncIterator, Iterator
 import json
+import threading
+from types import SimpleNamespace
+from typing import Any
 from unittest.mock import MagicMock, patch
 from uuid import uuid4
 
@@ -119,20 +124,18 @@ class TestGeminiServiceHealthInsights:
 
         # Mock successful response
         mock_response = MagicMock()
-        mock_response.text = json.dumps(
-            {
-                "narrative": "Your sleep patterns show excellent efficiency at 85%",
-                "key_insights": [
-                    "Sleep efficiency of 85% indicates healthy sleep",
-                    "Low depression risk factors observed",
-                ],
-                "recommendations": [
-                    "Maintain current sleep schedule",
-                    "Continue regular exercise routine",
-                ],
-                "confidence_score": 0.85,
-            }
-        )
+        mock_response.text = json.dumps({
+            "narrative": "Your sleep patterns show excellent efficiency at 85%",
+            "key_insights": [
+                "Sleep efficiency of 85% indicates healthy sleep",
+                "Low depression risk factors observed",
+            ],
+            "recommendations": [
+                "Maintain current sleep schedule",
+                "Continue regular exercise routine",
+            ],
+            "confidence_score": 0.85,
+        })
 
         mock_model = MagicMock()
         mock_model.generate_content.return_value = mock_response
@@ -164,14 +167,12 @@ class TestGeminiServiceHealthInsights:
         service = GeminiService(project_id="test-project")
 
         mock_response = MagicMock()
-        mock_response.text = json.dumps(
-            {
-                "narrative": "Analysis completed",
-                "key_insights": ["Test insight"],
-                "recommendations": ["Test recommendation"],
-                "confidence_score": 0.8,
-            }
-        )
+        mock_response.text = json.dumps({
+            "narrative": "Analysis completed",
+            "key_insights": ["Test insight"],
+            "recommendations": ["Test recommendation"],
+            "confidence_score": 0.8,
+        })
 
         mock_model = MagicMock()
         mock_model.generate_content.return_value = mock_response
@@ -331,14 +332,12 @@ class TestGeminiServiceResponseParsing:
     def test_parse_gemini_response_valid_json() -> None:
         """Test parsing valid JSON response."""
         mock_response = MagicMock()
-        mock_response.text = json.dumps(
-            {
-                "narrative": "Test narrative",
-                "key_insights": ["Insight 1", "Insight 2"],
-                "recommendations": ["Rec 1", "Rec 2"],
-                "confidence_score": 0.9,
-            }
-        )
+        mock_response.text = json.dumps({
+            "narrative": "Test narrative",
+            "key_insights": ["Insight 1", "Insight 2"],
+            "recommendations": ["Rec 1", "Rec 2"],
+            "confidence_score": 0.9,
+        })
 
         result = GeminiService._parse_gemini_response(mock_response, "test-user")
 
@@ -352,12 +351,10 @@ class TestGeminiServiceResponseParsing:
     def test_parse_gemini_response_partial_json() -> None:
         """Test parsing JSON response with missing fields."""
         mock_response = MagicMock()
-        mock_response.text = json.dumps(
-            {
-                "narrative": "Partial narrative"
-                # Missing other fields
-            }
-        )
+        mock_response.text = json.dumps({
+            "narrative": "Partial narrative"
+            # Missing other fields
+        })
 
         result = GeminiService._parse_gemini_response(mock_response, "test-user")
 
@@ -511,5 +508,292 @@ class TestGeminiServiceEdgeCases:
         assert len(recommendations) >= 0
 
 
+class _FakeGeminiModel:
+    """Local stand-in for the Vertex AI model with an async client."""
+
+    def __init__(self, delay: float = 0.05) -> None:
+        self.delay = delay
+        self.calls = 0
+        self.active = 0
+        self.peak_active = 0
+        self.generate_content = MagicMock(side_effect=AssertionError("sync call"))
+
+    async def generate_content_async(self, prompt: str, **_: Any) -> SimpleNamespace:
+        self.calls += 1
+        self.active += 1
+        self.peak_active = max(self.peak_active, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.active -= 1
+        return SimpleNamespace(
+            text=json.dumps({
+                "narrative": f"Narrative for prompt of {len(prompt)} chars",
+                "key_insights": ["Insight"],
+                "recommendations": ["Recommendation"],
+                "confidence_score": 0.9,
+            })
+        )
+
+
+def _service_with_model(model: object, **kwargs: Any) -> GeminiService:
+    service = GeminiService(project_id="test-project", testing=False, **kwargs)
+    service.is_initialized = True
+    service.model = model
+    return service
+
+
+def _insight_request(
+    user_id: str = "user-1", context: str = ""
+) -> HealthInsightRequest:
+    return HealthInsightRequest(
+        user_id=user_id,
+        analysis_results={"sleep_efficiency": 82.0, "circadian_rhythm_score": 0.7},
+        context=context,
+    )
+
+
+class TestGeminiServiceAsyncClient:
+    """Test non-blocking generation, caching, coalescing and limiting."""
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_uses_async_client_without_blocking_loop() -> None:
+        model = _FakeGeminiModel(delay=0.1)
+        service = _service_with_model(model)
+        ticks = 0
+
+        async def ticker() -> None:
+            nonlocal ticks
+            for _ in range(5):
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        result, _ = await asyncio.gather(
+            service.generate_health_insights(_insight_request()), ticker()
+        )
+
+        assert ticks == 5
+        assert model.calls == 1
+        model.generate_content.assert_not_called()
+        assert result.narrative.startswith("Narrative for prompt")
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_sync_model_runs_off_event_loop_thread() -> None:
+        threads: list[str] = []
+        response = SimpleNamespace(text=json.dumps({"narrative": "Sync"}))
+
+        def generate_content(*_: object, **__: object) -> SimpleNamespace:
+            threads.append(threading.current_thread().name)
+            return response
+
+        model = MagicMock(spec=["generate_content"])
+        model.generate_content.side_effect = generate_content
+        service = _service_with_model(model)
+
+        result = await service.generate_health_insights(_insight_request())
+
+        assert result.narrative == "Sync"
+        assert threads
+        assert threads[0] != threading.current_thread().name
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_cached_response_is_relabeled_per_user() -> None:
+        model = _FakeGeminiModel(delay=0)
+        service = _service_with_model(model)
+
+        first = await service.generate_health_insights(_insight_request("user-1"))
+        second = await service.generate_health_insights(_insight_request("user-2"))
+
+        assert model.calls == 1
+        assert first.user_id == "user-1"
+        assert second.user_id == "user-2"
+        assert second.narrative == first.narrative
+        stats = service.get_cache_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+
+        service.clear_cache()
+        await service.generate_health_insights(_insight_request("user-1"))
+        assert model.calls == 2
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_identical_in_flight_requests_are_coalesced() -> None:
+        model = _FakeGeminiModel(delay=0.05)
+        service = _service_with_model(model, cache_ttl_seconds=0)
+
+        results = await asyncio.gather(
+            *(
+                service.generate_health_insights(_insight_request(f"user-{i}"))
+                for i in range(5)
+            )
+        )
+
+        assert model.calls == 1
+        assert [r.user_id for r in results] == [f"user-{i}" for i in range(5)]
+        assert service.get_cache_stats()["enabled"] is False
+        assert service.get_cache_stats()["in_flight"] == 0
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_concurrency_limiter_bounds_model_calls() -> None:
+        model = _FakeGeminiModel(delay=0.02)
+        service = _service_with_model(model, max_concurrency=2)
+
+        await asyncio.gather(
+            *(
+                service.generate_health_insights(
+                    _insight_request(context=f"context {i}")
+                )
+                for i in range(6)
+            )
+        )
+
+        assert model.calls == 6
+        assert model.peak_active == 2
+        stats = service.get_cache_stats()
+        assert stats["queued"] == 0
+        assert stats["active"] == 0
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_failed_call_is_not_cached() -> None:
+        model = _FakeGeminiModel(delay=0)
+        service = _service_with_model(model)
+
+        async def fail(*_: object, **__: object) -> SimpleNamespace:
+            await asyncio.sleep(0)
+            msg = "boom"
+            raise RuntimeError(msg)
+
+        with (
+            patch.object(model, "generate_content_async", fail),
+            pytest.raises(ServiceUnavailableProblem),
+        ):
+            await service.generate_health_insights(_insight_request())
+
+        await service.generate_health_insights(_insight_request())
+        assert model.calls == 1
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_unparseable_response_is_not_cached() -> None:
+        model = _FakeGeminiModel(delay=0)
+        service = _service_with_model(model)
+
+        async def not_json(*_: object, **__: object) -> SimpleNamespace:
+            await asyncio.sleep(0)
+            return SimpleNamespace(text="Not JSON")
+
+        with patch.object(model, "generate_content_async", not_json):
+            degraded = await service.generate_health_insights(_insight_request())
+
+        assert degraded.narrative == "Not JSON"
+        assert service.get_cache_stats()["entries"] == 0
+
+        result = await service.generate_health_insights(_insight_request())
+        assert model.calls == 1
+        assert result.narrative.startswith("Narrative for prompt")
+
+
+class _FakeStreamingModel:
+    """Local stand-in for a streaming Vertex AI model."""
+
+    def __init__(self, chunks: list[str]) -> None:
+        self.chunks = chunks
+        self.kwargs: dict[str, Any] = {}
+
+    async def generate_content_async(
+        self, prompt: str, **kwargs: Any
+    ) -> AsyncIterator[SimpleNamespace]:
+        self.kwargs = {"prompt": prompt, **kwargs}
+
+        async def responses() -> AsyncIterator[SimpleNamespace]:
+            for chunk in self.chunks:
+                await asyncio.sleep(0)
+                yield SimpleNamespace(text=chunk)
+
+        return responses()
+
+
+class TestGeminiServiceStreaming:
+    """Test streamed plain-text insight generation."""
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_stream_yields_sanitized_chunks() -> None:
+        model = _FakeStreamingModel([
+            "Sleep ",
+            "<b>well</b>",
+            "",
+            " tonight <scr",
+            "ipt>",
+        ])
+        service = _service_with_model(model)
+
+        chunks = [
+            chunk
+            async for chunk in service.stream_health_insights(
+                _insight_request(context="How did I sleep?")
+            )
+        ]
+
+        assert chunks == ["Sleep ", "well", " tonight scr", "ipt"]
+        assert model.kwargs["stream"] is True
+        assert "How did I sleep?" in model.kwargs["prompt"]
+        assert "JSON" in model.kwargs["prompt"]  # Told not to answer in JSON
+        assert service.get_cache_stats()["active"] == 0
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_stream_from_sync_model_runs_off_event_loop_thread() -> None:
+        threads: list[str] = []
+
+        def responses() -> Iterator[SimpleNamespace]:
+            for chunk in ("One ", "two"):
+                threads.append(threading.current_thread().name)
+                yield SimpleNamespace(text=chunk)
+
+        model = MagicMock(spec=["generate_content"])
+        model.generate_content.return_value = responses()
+        service = _service_with_model(model)
+
+        chunks = [
+            chunk async for chunk in service.stream_health_insights(_insight_request())
+        ]
+
+        assert chunks == ["One ", "two"]
+        assert threading.current_thread().name not in threads
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_stream_is_truncated_at_limit() -> None:
+        model = _FakeStreamingModel(["x" * 3000, "y" * 3000, "z" * 10])
+        service = _service_with_model(model)
+
+        chunks = [
+            chunk async for chunk in service.stream_health_insights(_insight_request())
+        ]
+
+        assert sum(len(chunk) for chunk in chunks) == 5000
+        assert len(chunks) == 2
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_fallback_stream_reassembles_narrative() -> None:
+        service = GeminiService(testing=True)
+        request = _insight_request()
+
+        chunks = [chunk async for chunk in service.stream_health_insights(request)]
+
+        assert len(chunks) > 1
+        assert "".join(chunks) == (
+            GeminiService._create_fallback_insights_response(request).narrative
+        )
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -11,9 +11,9 @@ This test suite covers all aspects of the inference engine including:
 from __future__ import annotations
 
 import asyncio
-from datetime import UTC, datetime
-from typing import Never
-from unittest.mock import AsyncMock, MagicMock
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING, Never
+from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 
 import pytest
@@ -21,12 +21,16 @@ import pytest
 from clarity.core.exceptions import ServiceUnavailableProblem
 from clarity.ml.inference_engine import (  # type: ignore[attr-defined]
     AsyncInferenceEngine,
-    InferenceCache,
     InferenceRequest,
     InferenceResponse,
 )
 from clarity.ml.pat_service import ActigraphyAnalysis, ActigraphyInput, PATModelService
-from clarity.ml.preprocessing import ActigraphyDataPoint
+from clarity.ml.preprocessing import ActigraphyDataPoint, HealthDataPreprocessor
+from clarity.ml.result_cache import actigraphy_cache_key
+from clarity.ml.shared_result_store import SharedResultStore
+
+if TYPE_CHECKING:
+    from pathlib import Path
 
 
 class TestAsyncInferenceEngineInitialization:
@@ -229,82 +233,211 @@ class TestAsyncInferenceEngineInference:
             assert engine.cache_hits > 0
 
 
-class TestInferenceCache:
-    """Test inference cache functionality."""
+class TestAsyncInferenceEngineBatching:
+    """Test that batched requests share a single model call."""
+
+    @staticmethod
+    def _make_input(user_id: str, offset: int) -> ActigraphyInput:
+        data_points = [
+            ActigraphyDataPoint(
+                timestamp=datetime.now(UTC), value=float((i + offset) % 100)
+            )
+            for i in range(1440)
+        ]
+        return ActigraphyInput(user_id=user_id, data_points=data_points)
+
+    @staticmethod
+    def _make_analysis(user_id: str) -> ActigraphyAnalysis:
+        return ActigraphyAnalysis(
+            user_id=user_id,
+            analysis_timestamp=datetime.now(UTC).isoformat(),
+            sleep_efficiency=85.0,
+            sleep_onset_latency=15.0,
+            wake_after_sleep_onset=30.0,
+            total_sleep_time=7.5,
+            circadian_rhythm_score=0.75,
+            activity_fragmentation=0.25,
+            depression_risk_score=0.2,
+            sleep_stages=["wake"],
+            confidence_score=0.85,
+            clinical_insights=["Good sleep efficiency"],
+            embedding=[0.0] * 96,
+        )
 
     @staticmethod
-    def test_cache_initialization() -> None:
-        """Test cache initialization with TTL."""
-        cache = InferenceCache(ttl_seconds=3600)
-        assert cache.ttl == 3600
-        assert len(cache.cache) == 0
+    def _make_requests(count: int) -> list[InferenceRequest]:
+        return [
+            InferenceRequest(
+                request_id=f"request-{i}",
+                input_data=TestAsyncInferenceEngineBatching._make_input(
+                    f"user-{i}", i
+                ),
+            )
+            for i in range(count)
+        ]
 
     @staticmethod
     @pytest.mark.asyncio
-    async def test_cache_set_and_get() -> None:
-        """Test basic cache set and get operations."""
-        cache = InferenceCache(ttl_seconds=3600)
+    async def test_misses_share_one_batched_call() -> None:
+        """Test that distinct cache misses go through one batched model call."""
+        mock_pat_service = MagicMock(spec=PATModelService)
+        mock_pat_service.analyze_actigraphy = AsyncMock()
+        mock_pat_service.analyze_actigraphy_batch = AsyncMock(
+            side_effect=lambda inputs: [
+                TestAsyncInferenceEngineBatching._make_analysis(item.user_id)
+                for item in inputs
+            ]
+        )
+        engine = AsyncInferenceEngine(pat_service=mock_pat_service, batch_size=3)
+        requests = TestAsyncInferenceEngineBatching._make_requests(3)
+        loop = asyncio.get_running_loop()
+        futures: list[asyncio.Future[InferenceResponse]] = [
+            loop.create_future() for _ in requests
+        ]
 
-        test_key = "test_key"
-        test_value = {"data": "test_value"}
+        await engine._process_batch(list(zip(requests, futures, strict=True)))
 
-        # Set value
-        await cache.set(test_key, test_value)
+        mock_pat_service.analyze_actigraphy_batch.assert_awaited_once()
+        mock_pat_service.analyze_actigraphy.assert_not_awaited()
+        for request, future in zip(requests, futures, strict=True):
+            response = future.result()
+            assert response.request_id == request.request_id
+            assert response.analysis.user_id == request.input_data.user_id
+            assert response.cached is False
 
-        # Get value
-        retrieved_value = await cache.get(test_key)
-        assert retrieved_value == test_value
+        stats = engine.get_stats()
+        assert stats["model_calls"] == 1
+        assert stats["batches_processed"] == 1
+        assert stats["batch_size_histogram"] == {3: 1}
+        assert stats["batch_latency_ms"]["max"] > 0
 
     @staticmethod
     @pytest.mark.asyncio
-    async def test_cache_expiration() -> None:
-        """Test cache expiration functionality."""
-        # Short TTL for testing
-        cache = InferenceCache(ttl_seconds=1)
+    async def test_identical_inputs_are_coalesced() -> None:
+        """Test that identical inputs in one batch trigger a single inference."""
+        input_data = TestAsyncInferenceEngineBatching._make_input("user-1", 0)
+        mock_pat_service = MagicMock(spec=PATModelService)
+        mock_pat_service.analyze_actigraphy = AsyncMock(
+            return_value=TestAsyncInferenceEngineBatching._make_analysis("user-1")
+        )
+        engine = AsyncInferenceEngine(pat_service=mock_pat_service)
+        loop = asyncio.get_running_loop()
+        batch = [
+            (
+                InferenceRequest(request_id=f"request-{i}", input_data=input_data),
+                loop.create_future(),
+            )
+            for i in range(2)
+        ]
+
+        await engine._process_batch(batch)
+
+        mock_pat_service.analyze_actigraphy.assert_awaited_once()
+        assert [future.result().request_id for _, future in batch] == [
+            "request-0",
+            "request-1",
+        ]
+        assert engine.get_stats()["batch_size_histogram"] == {1: 1}
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_batch_failure_falls_back_to_single_inference() -> None:
+        """Test that a failed batched call is retried per request."""
+        mock_pat_service = MagicMock(spec=PATModelService)
+        mock_pat_service.analyze_actigraphy_batch = AsyncMock(
+            side_effect=RuntimeError("batch failed")
+        )
+        mock_pat_service.analyze_actigraphy = AsyncMock(
+            side_effect=lambda item: TestAsyncInferenceEngineBatching._make_analysis(
+                item.user_id
+            )
+        )
+        engine = AsyncInferenceEngine(pat_service=mock_pat_service)
+        requests = TestAsyncInferenceEngineBatching._make_requests(2)
+        loop = asyncio.get_running_loop()
+        futures: list[asyncio.Future[InferenceResponse]] = [
+            loop.create_future() for _ in requests
+        ]
 
-        test_key = "expiring_key"
-        test_value = {"data": "will_expire"}
+        await engine._process_batch(list(zip(requests, futures, strict=True)))
 
-        # Set value
-        await cache.set(test_key, test_value)
+        assert mock_pat_service.analyze_actigraphy.await_count == 2
+        assert [future.result().analysis.user_id for future in futures] == [
+            "user-0",
+            "user-1",
+        ]
 
-        # Should be available immediately
-        assert await cache.get(test_key) == test_value
 
-        # Wait for expiration
-        await asyncio.sleep(1.1)
+class TestAsyncInferenceEngineSharedCache:
+    """Test the shared cross-worker cache tier."""
 
-        # Should be None after expiration
-        assert await cache.get(test_key) is None
+    @staticmethod
+    def _make_engine(store: SharedResultStore) -> AsyncInferenceEngine:
+        mock_pat_service = MagicMock(spec=PATModelService)
+        mock_pat_service.model_version = "medium:test.h5"
+        mock_pat_service.analyze_actigraphy = AsyncMock(
+            side_effect=lambda input_data: TestAsyncInferenceEngineBatching._make_analysis(
+                input_data.user_id
+            )
+        )
+        return AsyncInferenceEngine(pat_service=mock_pat_service, shared_cache=store)
 
     @staticmethod
     @pytest.mark.asyncio
-    async def test_cache_miss() -> None:
-        """Test cache miss for non-existent key."""
-        cache = InferenceCache()
-
-        result = await cache.get("non_existent_key")
-        assert result is None
+    async def test_result_shared_between_workers(tmp_path: Path) -> None:
+        """Test a result computed by one worker is served to another."""
+        path = tmp_path / "inference-cache.db"
+        worker1 = TestAsyncInferenceEngineSharedCache._make_engine(
+            SharedResultStore(path)
+        )
+        worker2 = TestAsyncInferenceEngineSharedCache._make_engine(
+            SharedResultStore(path)
+        )
+        loop = asyncio.get_running_loop()
+        request = TestAsyncInferenceEngineBatching._make_requests(1)[0]
+
+        first = loop.create_future()
+        await worker1._process_batch([(request, first)])
+        second = loop.create_future()
+        await worker2._process_batch([(request, second)])
+
+        assert first.result().cached is False
+        assert second.result().cached is True
+        assert second.result().analysis == first.result().analysis
+        worker2.pat_service.analyze_actigraphy.assert_not_awaited()
+        assert worker2.shared_cache_hits == 1
+
+        # Shared hits are promoted into the in-process cache
+        third = loop.create_future()
+        await worker2._process_batch([(request, third)])
+        assert third.result().cached is True
+        assert worker2.shared_cache_hits == 1
 
     @staticmethod
-    def test_cache_clear() -> None:
-        """Test cache clear functionality."""
-        cache = InferenceCache()
-        cache.cache["key1"] = ("value1", 12345)
-        cache.cache["key2"] = ("value2", 12346)
+    @pytest.mark.asyncio
+    async def test_get_stats_async_reads_store_off_loop(tmp_path: Path) -> None:
+        """Test async stats query the shared store on a worker thread."""
+        store = SharedResultStore(tmp_path / "inference-cache.db")
+        store.set("key", b"value")
+        engine = TestAsyncInferenceEngineSharedCache._make_engine(store)
 
-        assert len(cache.cache) == 2
+        with patch(
+            "clarity.ml.inference_engine.asyncio.to_thread",
+            wraps=asyncio.to_thread,
+        ) as mock_to_thread:
+            stats = await engine.get_stats_async()
 
-        cache.clear()
-        assert len(cache.cache) == 0
+        mock_to_thread.assert_awaited_once_with(store.get_stats)
+        assert stats["shared_cache"]["entries"] == 1
+        assert engine.get_stats(include_shared_cache=False)["shared_cache"] is None
 
 
 class TestInferenceEngineUtilities:
     """Test utility functions of the inference engine."""
 
     @staticmethod
-    def test_generate_cache_key() -> None:
-        """Test cache key generation."""
+    def test_cache_key() -> None:
+        """Test the engine keys inputs by its PAT service's model and preprocessing."""
         data_points = [
             ActigraphyDataPoint(timestamp=datetime.now(UTC), value=50.0),
             ActigraphyDataPoint(timestamp=datetime.now(UTC), value=75.0),
@@ -317,17 +450,22 @@ class TestInferenceEngineUtilities:
             duration_hours=24,
         )
 
-        cache_key = AsyncInferenceEngine._generate_cache_key(input_data)
+        pat_service = MagicMock(spec=PATModelService)
+        pat_service.model_version = "medium:PAT-M.h5"
+        pat_service.preprocessor = HealthDataPreprocessor()
+        engine = AsyncInferenceEngine(pat_service=pat_service)
 
-        assert isinstance(cache_key, str)
-        assert len(cache_key) > 0
+        cache_key = engine._cache_key(input_data)
 
+        assert cache_key == actigraphy_cache_key(
+            input_data, "medium:PAT-M.h5", pat_service.preprocessor
+        )
         # Same input should generate same key
-        cache_key2 = AsyncInferenceEngine._generate_cache_key(input_data)
-        assert cache_key == cache_key2
+        assert engine._cache_key(input_data) == cache_key
+        assert cache_key != actigraphy_cache_key(input_data)
 
     @staticmethod
-    def test_generate_cache_key_different_inputs() -> None:
+    def test_cache_key_different_inputs() -> None:
         """Test that different inputs generate different cache keys."""
         data_points1 = [ActigraphyDataPoint(timestamp=datetime.now(UTC), value=50.0)]
         data_points2 = [ActigraphyDataPoint(timestamp=datetime.now(UTC), value=75.0)]
@@ -346,22 +484,91 @@ class TestInferenceEngineUtilities:
             duration_hours=24,
         )
 
-        key1 = AsyncInferenceEngine._generate_cache_key(input1)
-        key2 = AsyncInferenceEngine._generate_cache_key(input2)
+        key1 = actigraphy_cache_key(input1)
+        key2 = actigraphy_cache_key(input2)
 
         assert key1 != key2
 
     @staticmethod
-    def test_generate_cache_key_empty_data() -> None:
+    def test_cache_key_empty_data() -> None:
         """Test cache key generation with empty data points."""
         input_data = ActigraphyInput(
             user_id="test-user", data_points=[], sampling_rate=1.0, duration_hours=24
         )
 
-        cache_key = AsyncInferenceEngine._generate_cache_key(input_data)
+        cache_key = actigraphy_cache_key(input_data)
         assert isinstance(cache_key, str)
         assert len(cache_key) > 0
 
+    @staticmethod
+    def test_cache_key_matching_endpoints() -> None:
+        """Test inputs sharing first/last points but not content do not collide."""
+        base_time = datetime.now(UTC)
+        values1 = [10.0, 20.0, 30.0, 40.0]
+        values2 = [10.0, 35.0, 15.0, 40.0]
+
+        input1, input2 = (
+            ActigraphyInput(
+                user_id="test-user",
+                data_points=[
+                    ActigraphyDataPoint(timestamp=base_time, value=value)
+                    for value in values
+                ],
+                sampling_rate=1.0,
+                duration_hours=24,
+            )
+            for values in (values1, values2)
+        )
+
+        assert actigraphy_cache_key(input1) != actigraphy_cache_key(input2)
+
+    @staticmethod
+    def test_cache_key_model_version() -> None:
+        """Test cache keys are scoped to the model version."""
+        input_data = ActigraphyInput(
+            user_id="test-user",
+            data_points=[ActigraphyDataPoint(timestamp=datetime.now(UTC), value=5.0)],
+            sampling_rate=1.0,
+            duration_hours=24,
+        )
+
+        assert actigraphy_cache_key(
+            input_data, "medium:PAT-M.h5"
+        ) != actigraphy_cache_key(input_data, "large:PAT-L.h5")
+
+    @staticmethod
+    def test_cache_key_skips_preprocessing() -> None:
+        """Test keys are built from the raw input without preprocessing it."""
+        input_data = ActigraphyInput(
+            user_id="test-user",
+            data_points=[ActigraphyDataPoint(timestamp=datetime.now(UTC), value=5.0)],
+            sampling_rate=1.0,
+            duration_hours=24,
+        )
+
+        with patch.object(
+            HealthDataPreprocessor, "preprocess_for_pat_model"
+        ) as mock_preprocess:
+            actigraphy_cache_key(input_data)
+
+        mock_preprocess.assert_not_called()
+
+    @staticmethod
+    def test_cache_key_timestamps() -> None:
+        """Test equal values recorded at different times do not collide."""
+        base_time = datetime.now(UTC)
+        input1, input2 = (
+            ActigraphyInput(
+                user_id="test-user",
+                data_points=[ActigraphyDataPoint(timestamp=timestamp, value=5.0)],
+                sampling_rate=1.0,
+                duration_hours=24,
+            )
+            for timestamp in (base_time, base_time + timedelta(minutes=1))
+        )
+
+        assert actigraphy_cache_key(input1) != actigraphy_cache_key(input2)
+
 
 class TestInferenceEngineStats:
     """Test inference engine statistics functionality."""
@@ -0,0 +1,117 @@
+"""Tests for the dedicated PAT inference executor pool."""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import threading
+import time
+
+import pytest
+
+from clarity.api.v1.metrics import pat_inference_queue_depth
+from clarity.ml.inference_executor import (
+    InferenceExecutor,
+    get_inference_executor,
+    shutdown_inference_executor,
+)
+
+
+class TestInferenceExecutor:
+    """Test inference executor behaviour and statistics."""
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_run_returns_result_from_worker_thread() -> None:
+        """Test that work runs off the event loop thread."""
+        executor = InferenceExecutor(max_workers=1)
+        loop_thread = threading.get_ident()
+
+        try:
+            worker_thread = await executor.run(threading.get_ident)
+        finally:
+            executor.shutdown()
+
+        assert worker_thread != loop_thread
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_event_loop_stays_responsive() -> None:
+        """Test that blocking inference does not stall other coroutines."""
+        executor = InferenceExecutor(max_workers=1)
+        ticks = 0
+
+        async def heartbeat() -> None:
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        heartbeat_task = asyncio.create_task(heartbeat())
+        try:
+            await executor.run(time.sleep, 0.2)
+        finally:
+            heartbeat_task.cancel()
+            executor.shutdown()
+
+        assert ticks >= 5
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_stats_track_queue_and_failures() -> None:
+        """Test that completed, failed and waiting tasks are counted."""
+        executor = InferenceExecutor(max_workers=1)
+
+        def fail() -> None:
+            msg = "boom"
+            raise RuntimeError(msg)
+
+        try:
+            await asyncio.gather(
+                executor.run(time.sleep, 0.05),
+                executor.run(time.sleep, 0.05),
+            )
+            with pytest.raises(RuntimeError, match="boom"):
+                await executor.run(fail)
+        finally:
+            executor.shutdown()
+
+        stats = executor.get_stats()
+        assert stats["completed"] == 2
+        assert stats["failed"] == 1
+        assert stats["queue_depth"] == 0
+        assert stats["running"] == 0
+        assert stats["avg_wait_ms"] > 0
+        assert pat_inference_queue_depth._value.get() == 0
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_run_propagates_context_variables() -> None:
+        """Test that work sees the submitting coroutine's context."""
+        request_id: contextvars.ContextVar[str] = contextvars.ContextVar("request_id")
+        request_id.set("req-1")
+        executor = InferenceExecutor(max_workers=1)
+
+        try:
+            seen = await executor.run(request_id.get)
+        finally:
+            executor.shutdown()
+
+        assert seen == "req-1"
+
+    @staticmethod
+    def test_invalid_worker_count() -> None:
+        """Test that an empty pool is rejected."""
+        with pytest.raises(ValueError, match="max_workers"):
+            InferenceExecutor(max_workers=0)
+
+    @staticmethod
+    def test_global_executor_singleton() -> None:
+        """Test global executor creation and shutdown."""
+        executor = get_inference_executor()
+
+        assert get_inference_executor() is executor
+
+        shutdown_inference_executor()
+        assert get_inference_executor() is not executor
+        shutdown_inference_executor()
@@ -19,6 +19,7 @@ from uuid import uuid4
 import pytest
 import torch
 
+from clarity.ml.inference_executor import InferenceExecutor
 from clarity.ml.pat_optimization import (
     BatchAnalysisProcessor,
     PATPerformanceOptimizer,
@@ -37,6 +38,7 @@ def mock_pat_service() -> Mock:
     service = Mock(spec=PATModelService)
     service.is_loaded = True
     service.device = torch.device("cpu")
+    service.executor = InferenceExecutor()
     service.model = Mock()
     # Set up AsyncMock properly for analyze_actigraphy
     analyze_mock = AsyncMock()
@@ -114,7 +116,7 @@ class TestPATPerformanceOptimizer:  # noqa: PLR0904
         assert optimizer.pat_service is mock_pat_service
         assert optimizer.compiled_model is None
         assert optimizer.optimization_enabled is False
-        assert optimizer._cache == {}
+        assert len(optimizer._cache) == 0
 
     @staticmethod
     async def test_optimize_model_success(optimizer: PATPerformanceOptimizer) -> None:
@@ -260,23 +262,43 @@ class TestPATPerformanceOptimizer:  # noqa: PLR0904
         # Should not raise, just log error
 
     @staticmethod
-    def test_generate_cache_key(sample_actigraphy_input: ActigraphyInput) -> None:
+    def test_generate_cache_key(
+        optimizer: PATPerformanceOptimizer, sample_actigraphy_input: ActigraphyInput
+    ) -> None:
         """Test cache key generation."""
-        key = PATPerformanceOptimizer._generate_cache_key(sample_actigraphy_input)
+        key = optimizer._generate_cache_key(sample_actigraphy_input)
 
         assert isinstance(key, str)
-        assert len(key) == 64  # SHA256 hex digest length
+        assert len(key) == 64  # 32-byte hex digest length
+
+    @staticmethod
+    def test_generate_cache_key_uses_full_content(
+        optimizer: PATPerformanceOptimizer, sample_actigraphy_input: ActigraphyInput
+    ) -> None:
+        """Test inputs differing only in the middle get different keys."""
+        data_points = list(sample_actigraphy_input.data_points)
+        middle = len(data_points) // 2
+        data_points[middle] = data_points[middle].model_copy(update={"value": 999.0})
+        changed_input = sample_actigraphy_input.model_copy(
+            update={"data_points": data_points}
+        )
+
+        assert optimizer._generate_cache_key(
+            sample_actigraphy_input
+        ) != optimizer._generate_cache_key(changed_input)
 
     @staticmethod
-    def test_is_cache_valid() -> None:
-        """Test cache validity check."""
-        # Valid cache (recent)
-        recent_timestamp = time.time() - 1800  # 30 minutes ago
-        assert PATPerformanceOptimizer._is_cache_valid(recent_timestamp) is True
+    def test_cache_entries_expire() -> None:
+        """Test cached results expire after the configured TTL."""
+        optimizer = PATPerformanceOptimizer(Mock(spec=PATModelService))
+        mock_analysis = Mock(spec=ActigraphyAnalysis)
+        optimizer._cache.set("key", mock_analysis)
 
-        # Invalid cache (old)
-        old_timestamp = time.time() - 7200  # 2 hours ago
-        assert PATPerformanceOptimizer._is_cache_valid(old_timestamp) is False
+        with patch(
+            "clarity.ml.result_cache.time.monotonic",
+            return_value=time.monotonic() + 7200,  # 2 hours later
+        ):
+            assert optimizer._cache.get("key") is None
 
     @staticmethod
     async def test_optimized_analyze_cache_hit(
@@ -287,7 +309,7 @@ class TestPATPerformanceOptimizer:  # noqa: PLR0904
         """Test optimized analysis with cache hit."""
         # Set up cache
         cache_key = optimizer._generate_cache_key(sample_actigraphy_input)
-        optimizer._cache[cache_key] = (sample_analysis_result, time.time())
+        optimizer._cache.set(cache_key, sample_analysis_result)
 
         result, was_cached = await optimizer.optimized_analyze(sample_actigraphy_input)
 
@@ -369,24 +391,27 @@ class TestPATPerformanceOptimizer:  # noqa: PLR0904
     def test_clear_cache(optimizer: PATPerformanceOptimizer) -> None:
         """Test cache clearing."""
         mock_analysis = Mock(spec=ActigraphyAnalysis)
-        optimizer._cache["test"] = (mock_analysis, 123.0)
+        optimizer._cache.set("test", mock_analysis)
 
         optimizer.clear_cache()
 
-        assert optimizer._cache == {}
+        assert len(optimizer._cache) == 0
 
     @staticmethod
     def test_get_cache_stats(optimizer: PATPerformanceOptimizer) -> None:
         """Test cache statistics."""
         mock_analysis = Mock(spec=ActigraphyAnalysis)
-        optimizer._cache["test1"] = (mock_analysis, time.time())
-        optimizer._cache["test2"] = (mock_analysis, time.time() - 100)
+        optimizer._cache.set("test1", mock_analysis)
+        optimizer._cache.set("test2", mock_analysis)
+        optimizer._cache.get("test1")
+        optimizer._cache.get("missing")
 
         stats = optimizer.get_cache_stats()
 
         assert stats["cache_size"] == 2
-        assert "hit_ratio" in stats
+        assert stats["hit_ratio"] == pytest.approx(0.5)
         assert "oldest_entry_age" in stats
+        assert stats["size_bytes"] > 0
 
     @staticmethod
     async def test_warm_up(optimizer: PATPerformanceOptimizer) -> None:
@@ -519,35 +544,26 @@ class TestErrorHandling:
         assert result is False
 
     @staticmethod
-    async def test_cache_corruption_handling(
+    @pytest.mark.asyncio
+    async def test_expired_cache_entry_is_recomputed(
         optimizer: PATPerformanceOptimizer, sample_actigraphy_input: ActigraphyInput
     ) -> None:
-        """Test handling of corrupted cache entries."""
-        # Create a corrupted cache entry with wrong format
+        """Test expired cache entries are replaced by a fresh analysis."""
         cache_key = optimizer._generate_cache_key(sample_actigraphy_input)
-        # Simulate cache corruption by setting invalid data
-        optimizer._cache[cache_key] = "corrupted_data_not_tuple"  # type: ignore[assignment]
+        optimizer._cache.set(cache_key, Mock(spec=ActigraphyAnalysis))
 
-        # Should handle gracefully and not use corrupted cache
         mock_result = Mock(spec=ActigraphyAnalysis)
         async_mock = AsyncMock(return_value=mock_result)
         optimizer.pat_service.analyze_actigraphy = async_mock  # type: ignore[method-assign]
 
-        # Capture logs to verify corruption was detected
-        with patch("clarity.ml.pat_optimization.logger") as mock_logger:
+        with patch(
+            "clarity.ml.result_cache.time.monotonic",
+            return_value=time.monotonic() + 7200,
+        ):
             result, was_cached = await optimizer.optimized_analyze(
                 sample_actigraphy_input
             )
 
-            # Verify corruption was detected and logged
-            assert any(
-                "Cache corruption detected" in str(call)
-                for call in mock_logger.warning.call_args_list
-            )
-
-        assert was_cached is False  # Should not use corrupted cache
+        assert was_cached is False
         assert result is mock_result
-        # After analysis, the cache should contain a new valid entry (not the corrupted one)
-        assert cache_key in optimizer._cache  # New valid entry was cached
-        cached_result, _timestamp = optimizer._cache[cache_key]
-        assert cached_result is mock_result  # Cached the correct result
+        assert optimizer._cache.get(cache_key) is mock_result
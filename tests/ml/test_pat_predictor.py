@@ -10,7 +10,6 @@ Tests all components of the PAT predictor including:
 
 from __future__ import annotations
 
-from collections import deque
 import time
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -100,7 +99,7 @@ class TestPredictionCache:
 
         assert cache._max_size == 100
         assert len(cache._cache) == 0
-        assert isinstance(cache._access_order, deque)
+        assert cache._cache.max_entries == 100
 
     def test_cache_key_generation(self) -> None:
         """Test cache key generation."""
@@ -115,6 +114,8 @@ class TestPredictionCache:
         assert key1 == key2
         # Different size should produce different key
         assert key1 != key3
+        # Different model version should produce different key
+        assert key1 != cache._get_key(data, ModelSize.SMALL, "v2")
 
     def test_cache_set_and_get(self) -> None:
         """Test setting and getting from cache."""
@@ -356,13 +357,17 @@ class TestPATPredictor:
         self, predictor: PATPredictor, mock_model_loader: MagicMock
     ) -> None:
         """Test prediction with cache hit."""
+        mock_model_loader.get_current_version = MagicMock(
+            return_value=MagicMock(version="v1.0")
+        )
+
         # Add to cache
         data = np.array([[1, 2, 3]], dtype=np.float32)
         cached_result = PredictionResult(
             inference_time_ms=5.0,
             model_version="cached",
         )
-        predictor._cache.set(data, ModelSize.MEDIUM, cached_result)
+        predictor._cache.set(data, ModelSize.MEDIUM, cached_result, "v1.0")
 
         # Predict (should hit cache)
         request = PredictionRequest(data=data)
@@ -384,6 +389,9 @@ class TestPATPredictor:
     ) -> None:
         """Test prediction with cache miss."""
         mock_model_loader.load_model = AsyncMock(return_value=mock_model)
+        mock_model_loader.get_current_version = MagicMock(
+            return_value=MagicMock(version="v1.0")
+        )
 
         data = np.random.randn(1, 10080).astype(np.float32)
         request = PredictionRequest(data=data)
@@ -393,9 +401,10 @@ class TestPATPredictor:
         assert predictor._cache_hits == 0
         assert predictor._cache_misses == 1
 
-        # Result should be cached
-        cached = predictor._cache.get(data, ModelSize.MEDIUM)
+        # Result should be cached for the current model version only
+        cached = predictor._cache.get(data, ModelSize.MEDIUM, "v1.0")
         assert cached is result
+        assert predictor._cache.get(data, ModelSize.MEDIUM, "v2.0") is None
 
     @pytest.mark.asyncio
     async def test_predict_error_handling(
@@ -467,6 +467,68 @@ class TestPATModelServiceAnalysis:
         assert isinstance(excinfo.value.__cause__, RuntimeError)
 
 
+class TestPATModelServiceBatchAnalysis:
+    """Test batched actigraphy analysis."""
+
+    @staticmethod
+    def _make_input(offset: int) -> ActigraphyInput:
+        data_points = [
+            ActigraphyDataPoint(
+                timestamp=datetime.now(UTC), value=float((i + offset) % 100)
+            )
+            for i in range(1440)
+        ]
+        return ActigraphyInput(user_id=f"user-{offset}", data_points=data_points)
+
+    @pytest.mark.asyncio
+    @staticmethod
+    async def test_batch_matches_single_inference() -> None:
+        """Test that one batched forward pass matches per-input analysis."""
+        service = PATModelService(model_size="small")
+        await service.load_model()
+        inputs = [
+            TestPATModelServiceBatchAnalysis._make_input(offset)
+            for offset in (0, 7, 42)
+        ]
+
+        with patch.object(
+            service.model, "forward", wraps=service.model.forward
+        ) as forward_spy:
+            batch_results = await service.analyze_actigraphy_batch(inputs)
+
+        assert forward_spy.call_count == 1
+        assert forward_spy.call_args.args[0].shape == (3, 10080)
+
+        for input_data, batch_result in zip(inputs, batch_results, strict=True):
+            single_result = await service.analyze_actigraphy(input_data)
+            assert batch_result.user_id == input_data.user_id
+            assert batch_result.sleep_efficiency == pytest.approx(
+                single_result.sleep_efficiency, abs=1e-4
+            )
+            assert np.allclose(
+                batch_result.embedding, single_result.embedding, atol=1e-5
+            )
+
+    @pytest.mark.asyncio
+    @staticmethod
+    async def test_batch_empty_input_list() -> None:
+        """Test that an empty batch returns no results."""
+        service = PATModelService(model_size="small")
+
+        assert await service.analyze_actigraphy_batch([]) == []
+
+    @pytest.mark.asyncio
+    @staticmethod
+    async def test_batch_model_not_loaded() -> None:
+        """Test batched analysis when model is not loaded."""
+        service = PATModelService(model_size="small")
+
+        with pytest.raises(MLPredictionError, match="not loaded"):
+            await service.analyze_actigraphy_batch(
+                [TestPATModelServiceBatchAnalysis._make_input(0)]
+            )
+
+
 class TestPATModelServicePostprocessing:
     """Test PAT model postprocessing functionality."""
 
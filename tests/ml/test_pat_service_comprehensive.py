@@ -150,8 +150,8 @@ class TestPATModelService:
         attention = first_layer.attention
 
         # Check query projection weights
-        first_query = attention.query_projections[0]  # type: ignore[union-attr,index]
-        weight_std = first_query.weight.std().item()  # type: ignore[union-attr]
+        first_query = attention.query_projection.weight[: attention.head_dim]  # type: ignore[union-attr,index]
+        weight_std = first_query.std().item()  # type: ignore[union-attr]
 
         # Real weights should have reasonable std (not too small/large)
         assert 0.01 < weight_std < 1.0, f"Weight std {weight_std} suggests random init"
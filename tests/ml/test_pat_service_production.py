@@ -20,6 +20,7 @@ import numpy as np
 import pytest
 import torch
 from torch import nn
+from torch.nn import functional
 
 from clarity.core.exceptions import DataValidationError
 from clarity.ml.pat_service import (
@@ -166,9 +167,10 @@ class TestPATMultiHeadAttention:
         assert attention.embed_dim == embed_dim
         assert attention.num_heads == num_heads
         assert attention.head_dim == head_dim
-        assert len(attention.query_projections) == num_heads
-        assert len(attention.key_projections) == num_heads
-        assert len(attention.value_projections) == num_heads
+        stacked_shape = (num_heads * head_dim, embed_dim)
+        assert attention.query_projection.weight.shape == stacked_shape
+        assert attention.key_projection.weight.shape == stacked_shape
+        assert attention.value_projection.weight.shape == stacked_shape
 
     def test_multihead_attention_forward(self):
         """Test multi-head attention forward pass."""
@@ -224,6 +226,86 @@ class TestPATMultiHeadAttention:
         # Outputs should be different due to dropout
         assert not all(torch.equal(outputs[0], out) for out in outputs[1:])
 
+    @staticmethod
+    def _legacy_per_head_attention(
+        attention: PATMultiHeadAttention, x: torch.Tensor
+    ) -> tuple[torch.Tensor, torch.Tensor]:
+        """Reference per-head loop the fused implementation replaced."""
+        head_dim = attention.head_dim
+        head_outputs = []
+        attention_weights = []
+        for head_idx in range(attention.num_heads):
+            rows = slice(head_idx * head_dim, (head_idx + 1) * head_dim)
+            q = functional.linear(
+                x,
+                attention.query_projection.weight[rows],
+                attention.query_projection.bias[rows],
+            )
+            k = functional.linear(
+                x,
+                attention.key_projection.weight[rows],
+                attention.key_projection.bias[rows],
+            )
+            v = functional.linear(
+                x,
+                attention.value_projection.weight[rows],
+                attention.value_projection.bias[rows],
+            )
+            scores = torch.matmul(q, k.transpose(-2, -1)) * attention.scale
+            attn_weights = functional.softmax(scores, dim=-1)
+            head_outputs.append(torch.matmul(attn_weights, v))
+            attention_weights.append(attn_weights)
+
+        output = attention.output_projection(torch.cat(head_outputs, dim=-1))
+        return output, torch.stack(attention_weights).mean(dim=0)
+
+    def test_fused_attention_matches_per_head_loop(self):
+        """Test fused attention is numerically equivalent to the per-head loop."""
+        torch.manual_seed(0)
+        attention = PATMultiHeadAttention(96, 12, 96)
+        attention.eval()
+        input_tensor = torch.randn(2, 560, 96)
+
+        with torch.no_grad():
+            expected_output, expected_weights = self._legacy_per_head_attention(
+                attention, input_tensor
+            )
+            output, attn_weights = attention(
+                input_tensor, input_tensor, input_tensor, need_weights=True
+            )
+            fused_output, no_weights = attention(
+                input_tensor, input_tensor, input_tensor, need_weights=False
+            )
+
+        assert no_weights is None
+        assert torch.allclose(output, expected_output, atol=1e-5)
+        assert torch.allclose(attn_weights, expected_weights, atol=1e-6)
+        assert torch.allclose(fused_output, expected_output, atol=1e-5)
+
+    def test_legacy_per_head_state_dict_is_packed(self):
+        """Test checkpoints with per-head projections load into stacked layers."""
+        num_heads, head_dim = 6, 96
+        attention = PATMultiHeadAttention(96, num_heads, head_dim)
+        legacy_state = {
+            "output_projection.weight": attention.output_projection.weight.clone(),
+            "output_projection.bias": attention.output_projection.bias.clone(),
+        }
+        for qkv_name in ("query", "key", "value"):
+            for head_idx in range(num_heads):
+                legacy_state[f"{qkv_name}_projections.{head_idx}.weight"] = (
+                    torch.full((head_dim, 96), float(head_idx))
+                )
+                legacy_state[f"{qkv_name}_projections.{head_idx}.bias"] = torch.full(
+                    (head_dim,), float(head_idx)
+                )
+
+        attention.load_state_dict(legacy_state)
+
+        for head_idx in range(num_heads):
+            rows = slice(head_idx * head_dim, (head_idx + 1) * head_dim)
+            assert torch.all(attention.key_projection.weight[rows] == head_idx)
+            assert torch.all(attention.value_projection.bias[rows] == head_idx)
+
 
 class TestPATTransformerBlock:
     """Test PAT transformer block implementation."""
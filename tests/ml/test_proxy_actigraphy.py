@@ -23,7 +23,9 @@ from clarity.ml.proxy_actigraphy import (
     ProxyActigraphyResult,
     ProxyActigraphyTransformer,
     StepCountData,
+    _smooth_proxy_values,
     create_proxy_actigraphy_transformer,
+    smooth_proxy_values_batch,
 )
 
 if TYPE_CHECKING:
@@ -252,6 +254,106 @@ class TestProxyActigraphyTransformer:
         result = transformer.transform_step_data(step_data)
         assert isinstance(result, ProxyActigraphyResult)
 
+    @patch("clarity.ml.proxy_actigraphy.lookup_norm_stats")
+    def test_cache_keyed_on_step_content(self, mock_lookup_stats: MagicMock) -> None:
+        """Corrected counts re-sent under the same upload id are re-transformed."""
+        mock_lookup_stats.return_value = (1.2, 0.8)
+
+        transformer = ProxyActigraphyTransformer()
+        timestamps = [datetime.now(UTC) for _ in range(3)]
+        original = StepCountData(
+            user_id="user123",
+            upload_id="upload456",
+            step_counts=[4.0, 9.0, 1.0],
+            timestamps=timestamps,
+        )
+        corrected = original.model_copy(update={"step_counts": [4.0, 9.0, 4.0]})
+
+        first = transformer.transform_step_data(original)
+        second = transformer.transform_step_data(corrected)
+
+        # The final minute is outside the smoothing window and reflects the edit
+        assert second.vector[-1] > first.vector[-1]
+        assert transformer.get_cache_stats()["misses"] == 2
+
+    @patch("clarity.ml.proxy_actigraphy.lookup_norm_stats")
+    def test_cache_hit_relabels_identifiers(self, mock_lookup_stats: MagicMock) -> None:
+        """Identical steps from another upload reuse the result with its own ids."""
+        mock_lookup_stats.return_value = (1.2, 0.8)
+
+        transformer = ProxyActigraphyTransformer()
+        timestamps = [datetime.now(UTC) for _ in range(3)]
+        first = transformer.transform_step_data(
+            StepCountData(
+                user_id="user1",
+                upload_id="upload1",
+                step_counts=[100.0, 150.0, 80.0],
+                timestamps=timestamps,
+            )
+        )
+        second = transformer.transform_step_data(
+            StepCountData(
+                user_id="user2",
+                upload_id="upload2",
+                step_counts=[100.0, 150.0, 80.0],
+                timestamps=timestamps,
+            )
+        )
+
+        assert second.vector == first.vector
+        assert (second.user_id, second.upload_id) == ("user2", "upload2")
+        assert (first.user_id, first.upload_id) == ("user1", "upload1")
+        assert transformer.get_cache_stats()["hits"] == 1
+
+    @patch("clarity.ml.proxy_actigraphy.lookup_norm_stats")
+    def test_compact_cache_stores_float32(self, mock_lookup_stats: MagicMock) -> None:
+        """Compact mode keeps a float32 buffer and returns float32-rounded values."""
+        mock_lookup_stats.return_value = (1.2, 0.8)
+
+        transformer = ProxyActigraphyTransformer(compact_cache=True)
+        step_data = StepCountData(
+            user_id="user123",
+            upload_id="upload456",
+            step_counts=[100.0, 150.0, 80.0],
+            timestamps=[datetime.now(UTC) for _ in range(3)],
+        )
+
+        first = transformer.transform_step_data(step_data)
+        cached = transformer.transform_step_data(step_data)
+
+        assert len(cached.vector) == MINUTES_PER_WEEK
+        np.testing.assert_array_equal(
+            np.asarray(cached.vector), np.asarray(first.vector, dtype=np.float32)
+        )
+        # float32 buffer instead of a list of Python floats
+        assert transformer.get_cache_stats()["size_bytes"] < MINUTES_PER_WEEK * 8
+
+    @patch("clarity.ml.proxy_actigraphy.lookup_norm_stats")
+    def test_cache_respects_byte_budget(self, mock_lookup_stats: MagicMock) -> None:
+        """Least recently used transformations are evicted past the byte budget."""
+        mock_lookup_stats.return_value = (1.2, 0.8)
+
+        transformer = ProxyActigraphyTransformer(
+            compact_cache=True, cache_max_bytes=3 * MINUTES_PER_WEEK * 4
+        )
+        for steps in range(5):
+            transformer.transform_step_data(
+                StepCountData(
+                    user_id="user123",
+                    upload_id=f"upload{steps}",
+                    step_counts=[float(steps)],
+                    timestamps=[datetime.now(UTC)],
+                )
+            )
+
+        stats = transformer.get_cache_stats()
+        assert stats["size_bytes"] <= stats["max_bytes"]
+        assert stats["entries"] < 5
+        assert stats["evictions"] == 5 - stats["entries"]
+
+        transformer.clear_cache()
+        assert transformer.get_cache_stats()["entries"] == 0
+
     @patch("clarity.ml.proxy_actigraphy.lookup_norm_stats")
     def test_transform_large_dataset(self, mock_lookup_stats: MagicMock) -> None:
         """Test transformation with large dataset."""
@@ -448,6 +550,65 @@ class TestHelperFunctions:
         assert transformer.cache_enabled is False
 
 
+def _loop_rolling_median(values: np.ndarray, window_size: int) -> np.ndarray:
+    """Reference per-minute loop the vectorized smoothing replaced."""
+    if len(values) < window_size:
+        return values
+    smoothed = np.copy(values)
+    half_window = window_size // 2
+    for i in range(half_window, len(values) - half_window):
+        smoothed[i] = np.median(values[i - half_window : i + half_window + 1])
+    return smoothed
+
+
+class TestProxySmoothing:
+    """Test vectorized rolling-median smoothing."""
+
+    @pytest.mark.parametrize("window_size", [1, 2, 3, 4, 5, 7])
+    @pytest.mark.parametrize("length", [0, 3, 4, 5, 6, 50, MINUTES_PER_WEEK])
+    def test_matches_loop_implementation(self, window_size: int, length: int) -> None:
+        """Test smoothing is identical to the per-minute loop."""
+        values = np.random.default_rng(length).normal(size=length)
+
+        expected = _loop_rolling_median(values, window_size)
+        result = _smooth_proxy_values(values, window_size)
+
+        np.testing.assert_array_equal(result, expected)
+
+    def test_does_not_modify_input(self) -> None:
+        """Test the input array is left untouched."""
+        values = np.random.default_rng(0).normal(size=100)
+        original = values.copy()
+
+        _smooth_proxy_values(values)
+
+        np.testing.assert_array_equal(values, original)
+
+    def test_batch_matches_per_series(self) -> None:
+        """Test batch smoothing equals smoothing each series separately."""
+        batch = np.random.default_rng(1).normal(size=(4, MINUTES_PER_DAY))
+
+        result = smooth_proxy_values_batch(batch)
+
+        assert result.shape == batch.shape
+        for row, smoothed_row in zip(batch, result, strict=True):
+            np.testing.assert_array_equal(smoothed_row, _loop_rolling_median(row, 5))
+
+    @patch("clarity.ml.proxy_actigraphy.lookup_norm_stats")
+    def test_steps_to_movement_proxy_batch(self, mock_lookup_stats: MagicMock) -> None:
+        """Test batch conversion matches converting each series."""
+        mock_lookup_stats.return_value = (1.2, 0.8)
+        transformer = ProxyActigraphyTransformer()
+        steps = np.random.default_rng(2).integers(0, 150, size=(3, 1440)).astype(float)
+
+        result = transformer.steps_to_movement_proxy_batch(steps)
+
+        for row, proxy_row in zip(steps, result, strict=True):
+            np.testing.assert_array_equal(
+                proxy_row, transformer.steps_to_movement_proxy(row)
+            )
+
+
 class TestConstants:
     """Test module constants."""
 
@@ -0,0 +1,236 @@
+"""Equivalence tests for the NumPy resampling kernel.
+
+The kernel replaced a pandas ``resample``/``interpolate``/``rolling`` chain in
+the cardio and respiration processors; ``_pandas_reference`` is that chain.
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta, timezone
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from clarity.ml.processors.cardio_processor import (
+    HR_SERIES_SPEC,
+    HRV_SERIES_SPEC,
+    CardioProcessor,
+)
+from clarity.ml.processors.resampling_kernel import (
+    SeriesSpec,
+    prepare_series,
+    prepare_series_batch,
+)
+from clarity.ml.processors.respiration_processor import (
+    RR_SERIES_SPEC,
+    SPO2_SERIES_SPEC,
+    RespirationProcessor,
+)
+
+SPECS = {
+    "heart_rate": HR_SERIES_SPEC,
+    "hrv": HRV_SERIES_SPEC,
+    "respiratory_rate": RR_SERIES_SPEC,
+    "spo2": SPO2_SERIES_SPEC,
+}
+ZONES = [
+    None,
+    UTC,
+    timezone(timedelta(hours=5, minutes=45)),
+    timezone(-timedelta(hours=7)),
+]
+
+
+def _pandas_reference(
+    timestamps: list[datetime], values: list[float], spec: SeriesSpec
+) -> pd.Series:
+    """The pandas preprocessing chain the kernel replaced."""
+    series = pd.Series(values, index=pd.to_datetime(timestamps))
+    resampled = series.resample(spec.step).mean()
+    resampled = resampled.mask(
+        (resampled <= spec.lower) | (resampled > spec.upper), np.nan
+    )
+    result = resampled.interpolate(
+        limit=spec.interpolation_limit, limit_direction="forward"
+    )
+    if spec.smoothing_window is not None:
+        result = result.rolling(
+            window=spec.smoothing_window, min_periods=1, center=True
+        ).mean()
+    return result.ffill().bfill()
+
+
+def _random_series(
+    rng: np.random.Generator,
+    spec: SeriesSpec,
+    zone: timezone | None,
+    samples: int,
+) -> tuple[list[datetime], list[float]]:
+    """Unsorted samples with gaps, outliers and several samples per bin."""
+    start = datetime(2024, 3, 1, 7, 13, 27, tzinfo=zone)
+    span = samples * spec.step.total_seconds() * rng.uniform(0.2, 3.0)
+    offsets = rng.uniform(0, span, samples)
+    # Knock out whole stretches to create gaps longer than the limit
+    gap_start = rng.uniform(0, span)
+    offsets = offsets[(offsets < gap_start) | (offsets > gap_start + span / 10)]
+    timestamps = [start + timedelta(seconds=float(offset)) for offset in offsets]
+
+    margin = (spec.upper - spec.lower) * 0.1
+    values = rng.uniform(spec.lower - margin, spec.upper + margin, len(offsets))
+    values[rng.random(len(values)) < 0.02] = np.nan
+    return timestamps, values.tolist()
+
+
+class TestPandasEquivalence:
+    """The kernel reproduces the pandas chain bin for bin."""
+
+    @staticmethod
+    @pytest.mark.parametrize("signal", sorted(SPECS))
+    @pytest.mark.parametrize("zone", ZONES)
+    def test_random_series_match_pandas(signal: str, zone: timezone | None) -> None:
+        spec = SPECS[signal]
+        rng = np.random.default_rng(len(signal))
+
+        for _ in range(20):
+            timestamps, values = _random_series(
+                rng, spec, zone, int(rng.integers(1, 800))
+            )
+            expected = _pandas_reference(timestamps, values, spec)
+
+            result = prepare_series(timestamps, values, spec)
+
+            np.testing.assert_allclose(
+                result.values, expected.to_numpy(), rtol=1e-12, equal_nan=True
+            )
+            assert result.start == expected.index[0].to_pydatetime()
+            np.testing.assert_array_equal(result.hours, expected.index.hour)
+
+    @staticmethod
+    def test_interpolation_fills_only_the_limit_forward() -> None:
+        spec = SeriesSpec(
+            step=timedelta(minutes=1), lower=0, upper=100, interpolation_limit=2
+        )
+        start = datetime(2024, 3, 1, tzinfo=UTC)
+        minutes = [1, 5, 9]
+        timestamps = [start + timedelta(minutes=minute) for minute in minutes]
+        values = [10.0, 50.0, 90.0]
+
+        result = prepare_series(timestamps, values, spec)
+
+        # Only the first two bins of each 3-bin gap are interpolated; the
+        # final ffill/bfill covers the rest
+        np.testing.assert_allclose(result.values, [10, 20, 30, 30, 50, 60, 70, 70, 90])
+        np.testing.assert_allclose(
+            result.values,
+            _pandas_reference(timestamps, values, spec).to_numpy(),
+        )
+
+    @staticmethod
+    def test_all_outliers_stay_nan() -> None:
+        timestamps = [datetime(2024, 3, 1, hour, tzinfo=UTC) for hour in range(3)]
+
+        result = prepare_series(timestamps, [500.0, 0.0, 300.0], HR_SERIES_SPEC)
+
+        assert len(result) == 2 * 60 + 1
+        assert bool(np.isnan(result.values).all())
+
+
+class TestBatch:
+    """Batches of users resample like their users one by one."""
+
+    @staticmethod
+    @pytest.mark.parametrize("signal", sorted(SPECS))
+    def test_batch_matches_single_series(signal: str) -> None:
+        spec = SPECS[signal]
+        rng = np.random.default_rng(7)
+        users = [
+            _random_series(rng, spec, ZONES[index % len(ZONES)], samples)
+            for index, samples in enumerate([300, 1, 0, 50, 700])
+        ]
+
+        batch = prepare_series_batch(users, spec)
+
+        assert len(batch) == len(users)
+        for (timestamps, values), result in zip(users, batch, strict=True):
+            single = prepare_series(timestamps, values, spec)
+            np.testing.assert_array_equal(result.values, single.values)
+            np.testing.assert_array_equal(result.hours, single.hours)
+            assert result.start == single.start
+        assert len(batch[2]) == 0
+        assert batch[2].start is None
+
+    @staticmethod
+    def test_mismatched_lengths_raise() -> None:
+        with pytest.raises(ValueError, match="same length"):
+            prepare_series_batch(
+                [([datetime(2024, 3, 1, tzinfo=UTC)], [1.0, 2.0])], HR_SERIES_SPEC
+            )
+
+    @staticmethod
+    def test_spec_rejects_even_windows_and_uneven_steps() -> None:
+        with pytest.raises(ValueError, match="odd"):
+            SeriesSpec(
+                step=timedelta(minutes=1),
+                lower=0,
+                upper=1,
+                interpolation_limit=1,
+                smoothing_window=4,
+            )
+        with pytest.raises(ValueError, match="divide a day"):
+            SeriesSpec(
+                step=timedelta(minutes=7), lower=0, upper=1, interpolation_limit=1
+            )
+
+
+class TestProcessors:
+    """Both processors run on the kernel, one user or many at a time."""
+
+    @staticmethod
+    def test_cardio_batch_matches_process() -> None:
+        rng = np.random.default_rng(11)
+        users = [
+            (
+                *_random_series(rng, HR_SERIES_SPEC, UTC, 3000),
+                *_random_series(rng, HRV_SERIES_SPEC, UTC, 200),
+            ),
+            (*_random_series(rng, HR_SERIES_SPEC, None, 500), None, None),
+            ([], [], None, None),
+        ]
+        processor = CardioProcessor()
+
+        batch = processor.process_batch(users)
+
+        assert batch == [processor.process(*user) for user in users]
+        # No heart rate: zero statistics and neutral scores
+        assert batch[2] == [0.0] * 6 + [0.5, 0.5]
+        # Enough hourly coverage for a real circadian score
+        assert batch[0][7] != 0.5
+
+    @staticmethod
+    def test_respiration_batch_matches_process() -> None:
+        rng = np.random.default_rng(12)
+        users = [
+            (
+                *_random_series(rng, RR_SERIES_SPEC, UTC, 400),
+                *_random_series(rng, SPO2_SERIES_SPEC, UTC, 100),
+            ),
+            (None, None, *_random_series(rng, SPO2_SERIES_SPEC, None, 50)),
+            (None, None, None, None),
+        ]
+        processor = RespirationProcessor()
+
+        batch = processor.process_batch(users)
+
+        assert batch == [processor.process(*user) for user in users]
+
+    @staticmethod
+    def test_batch_isolates_a_broken_user() -> None:
+        start = datetime(2024, 3, 1, tzinfo=UTC)
+        good = ([start, start + timedelta(minutes=1)], [60.0, 62.0], None, None)
+        broken = ([start], [60.0, 61.0], None, None)
+
+        vectors = CardioProcessor().process_batch([good, broken])
+
+        assert vectors[0] == CardioProcessor().process(*good)
+        assert vectors[1] == [0.0] * 8
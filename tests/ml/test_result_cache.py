@@ -0,0 +1,144 @@
+"""Tests for the bounded, content-addressed inference result cache."""
+
+from __future__ import annotations
+
+import time
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+import torch
+
+from clarity.ml.result_cache import ResultCache, content_hash, estimate_size
+
+
+class TestContentHash:
+    """Test content hashing of model input buffers."""
+
+    @staticmethod
+    def test_same_content_same_key() -> None:
+        """Test equal buffers hash equally regardless of dtype and container."""
+        values = [1.0, 2.0, 3.0]
+
+        assert content_hash(np.array(values, dtype=np.float64)) == content_hash(
+            torch.tensor(values, dtype=torch.float32)
+        )
+
+    @staticmethod
+    def test_parts_change_key() -> None:
+        """Test extra key parts are part of the digest."""
+        buffer = np.zeros(10, dtype=np.float32)
+
+        assert content_hash(buffer, "v1") != content_hash(buffer, "v2")
+        assert content_hash(buffer, "ab", "c") != content_hash(buffer, "a", "bc")
+
+    @staticmethod
+    def test_shape_changes_key() -> None:
+        """Test buffers with equal bytes but different shapes differ."""
+        buffer = np.arange(6, dtype=np.float32)
+
+        assert content_hash(buffer) != content_hash(buffer.reshape(2, 3))
+
+
+class TestResultCache:
+    """Test LRU, TTL and size accounting of the result cache."""
+
+    @staticmethod
+    def test_set_and_get() -> None:
+        """Test basic cache set and get operations."""
+        cache: ResultCache[dict[str, str]] = ResultCache(ttl_seconds=3600)
+        cache.set("test_key", {"data": "test_value"})
+
+        assert cache.get("test_key") == {"data": "test_value"}
+        assert cache.get("missing") is None
+        assert cache.hits == 1
+        assert cache.misses == 1
+
+    @staticmethod
+    def test_expiration() -> None:
+        """Test entries expire after their TTL."""
+        cache: ResultCache[str] = ResultCache(ttl_seconds=1)
+        cache.set("expiring_key", "value")
+
+        assert cache.get("expiring_key") == "value"
+        with patch(
+            "clarity.ml.result_cache.time.monotonic",
+            return_value=time.monotonic() + 1.1,
+        ):
+            assert cache.get("expiring_key") is None
+
+        assert cache.expirations == 1
+        assert len(cache) == 0
+
+    @staticmethod
+    def test_lru_eviction() -> None:
+        """Test the least recently used entry is evicted at capacity."""
+        cache: ResultCache[int] = ResultCache(max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+        assert cache.evictions == 1
+
+    @staticmethod
+    def test_byte_budget_eviction() -> None:
+        """Test entries are evicted once the byte budget is exceeded."""
+        cache: ResultCache[np.ndarray] = ResultCache(max_bytes=1000)
+        for key in ("a", "b", "c"):
+            cache.set(key, np.zeros(100, dtype=np.float32))  # 400 bytes each
+
+        assert len(cache) == 2
+        assert cache.size_bytes == 800
+        assert "a" not in cache
+
+    @staticmethod
+    def test_overwrite_updates_size() -> None:
+        """Test replacing an entry does not double count its size."""
+        cache: ResultCache[str] = ResultCache()
+        cache.set("key", "old", size_bytes=10)
+        cache.set("key", "new", size_bytes=25)
+
+        assert len(cache) == 1
+        assert cache.size_bytes == 25
+        assert cache.get("key") == "new"
+
+    @staticmethod
+    def test_clear_and_pop() -> None:
+        """Test removing entries."""
+        cache: ResultCache[str] = ResultCache()
+        cache.set("key1", "value1")
+        cache.set("key2", "value2")
+
+        assert cache.pop("key1") == "value1"
+        assert cache.pop("key1") is None
+
+        cache.clear()
+        assert len(cache) == 0
+        assert cache.size_bytes == 0
+
+    @staticmethod
+    def test_stats() -> None:
+        """Test statistics reporting."""
+        cache: ResultCache[str] = ResultCache(max_entries=10, name="test")
+        cache.set("key", "value")
+        cache.get("key")
+        cache.get("other")
+
+        stats = cache.get_stats()
+
+        assert stats["name"] == "test"
+        assert stats["entries"] == 1
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == pytest.approx(0.5)
+        assert stats["size_bytes"] == estimate_size("value")
+
+    @staticmethod
+    def test_invalid_max_entries() -> None:
+        """Test a cache must hold at least one entry."""
+        with pytest.raises(ValueError, match="max_entries"):
+            ResultCache(max_entries=0)
@@ -0,0 +1,177 @@
+"""Tests for the host-local shared inference result store."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+import sqlite3
+import time
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+from clarity.ml.pat_service import ActigraphyAnalysis
+from clarity.ml.shared_result_store import (
+    SharedResultStore,
+    decode_model,
+    encode_model,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _make_analysis(user_id: str = "user-1") -> ActigraphyAnalysis:
+    return ActigraphyAnalysis(
+        user_id=user_id,
+        analysis_timestamp=datetime.now(UTC).isoformat(),
+        sleep_efficiency=85.0,
+        sleep_onset_latency=15.0,
+        wake_after_sleep_onset=30.0,
+        total_sleep_time=7.5,
+        circadian_rhythm_score=0.75,
+        activity_fragmentation=0.25,
+        depression_risk_score=0.2,
+        sleep_stages=["wake", "light"],
+        confidence_score=0.85,
+        clinical_insights=["Good sleep efficiency"],
+        embedding=[0.5] * 96,
+    )
+
+
+class TestModelSerialization:
+    """Test serialization of cached analyses."""
+
+    @staticmethod
+    def test_round_trip() -> None:
+        """Test an analysis survives encoding and decoding unchanged."""
+        analysis = _make_analysis()
+
+        decoded = decode_model(ActigraphyAnalysis, encode_model(analysis))
+
+        assert decoded == analysis
+
+    @staticmethod
+    def test_decode_skips_validation() -> None:
+        """Test decoding does not run pydantic validation on hits."""
+        payload = encode_model(_make_analysis())
+
+        with patch.object(
+            ActigraphyAnalysis, "model_validate", side_effect=AssertionError
+        ):
+            decoded = decode_model(ActigraphyAnalysis, payload)
+
+        assert decoded.user_id == "user-1"
+
+
+class TestSharedResultStore:
+    """Test the SQLite-backed shared result store."""
+
+    @staticmethod
+    def test_set_and_get(tmp_path: Path) -> None:
+        """Test basic set and get operations."""
+        store = SharedResultStore(tmp_path / "cache.db")
+        store.set("key", b"value")
+
+        assert store.get("key") == b"value"
+        assert store.get("missing") is None
+        assert store.hits == 1
+        assert store.misses == 1
+
+    @staticmethod
+    def test_shared_between_instances(tmp_path: Path) -> None:
+        """Test entries written by one worker are visible to another."""
+        path = tmp_path / "cache.db"
+        writer = SharedResultStore(path)
+        reader = SharedResultStore(path)
+
+        writer.set("key", b"from-worker-1")
+
+        assert reader.get("key") == b"from-worker-1"
+
+    @staticmethod
+    def test_expiration(tmp_path: Path) -> None:
+        """Test entries expire after the TTL."""
+        store = SharedResultStore(tmp_path / "cache.db", ttl_seconds=60)
+        store.set("key", b"value")
+
+        with patch(
+            "clarity.ml.shared_result_store.time.time",
+            return_value=time.time() + 61,
+        ):
+            assert store.get("key") is None
+
+    @staticmethod
+    def test_entry_limit_evicts_oldest(tmp_path: Path) -> None:
+        """Test the oldest entries are evicted past the entry limit."""
+        store = SharedResultStore(tmp_path / "cache.db", max_entries=2)
+        for key in ("a", "b", "c"):
+            store.set(key, key.encode())
+
+        assert store.get("a") is None
+        assert store.get("b") == b"b"
+        assert store.get("c") == b"c"
+
+    @staticmethod
+    def test_byte_limit(tmp_path: Path) -> None:
+        """Test stored values are kept within the byte limit."""
+        store = SharedResultStore(tmp_path / "cache.db", max_bytes=250)
+        for key in ("a", "b", "c"):
+            store.set(key, b"x" * 100)
+
+        stats = store.get_stats()
+        assert stats["entries"] == 2
+        assert stats["size_bytes"] == 200
+
+    @staticmethod
+    def test_delete_and_clear(tmp_path: Path) -> None:
+        """Test removing entries."""
+        store = SharedResultStore(tmp_path / "cache.db")
+        store.set("a", b"1")
+        store.set("b", b"2")
+
+        store.delete("a")
+        assert store.get("a") is None
+
+        store.clear()
+        assert store.get_stats()["entries"] == 0
+
+    @staticmethod
+    def test_totals_track_replacements_and_deletes(tmp_path: Path) -> None:
+        """Test the maintained totals match the stored values."""
+        store = SharedResultStore(tmp_path / "cache.db")
+        store.set("a", b"x" * 10)
+        store.set("b", b"x" * 20)
+        store.set("a", b"x" * 5)
+        store.delete("b")
+
+        stats = store.get_stats()
+        assert stats["entries"] == 1
+        assert stats["size_bytes"] == 5
+
+    @staticmethod
+    def test_byte_limit_evicts_only_what_is_needed(tmp_path: Path) -> None:
+        """Test a large value evicts just enough of the oldest entries."""
+        store = SharedResultStore(tmp_path / "cache.db", max_bytes=300)
+        for key in ("a", "b", "c"):
+            store.set(key, b"x" * 100)
+
+        store.set("d", b"x" * 150)
+
+        assert store.get("a") is None
+        assert store.get("b") is None
+        assert store.get("c") is not None
+        assert store.get("d") is not None
+
+    @staticmethod
+    def test_unavailable_store_degrades(tmp_path: Path) -> None:
+        """Test stats and clear report failures instead of raising."""
+        store = SharedResultStore(tmp_path / "cache.db")
+        store.set("a", b"1")
+        store.close()
+        store._local.conn = sqlite3.connect(":memory:")
+
+        store.clear()
+        stats = store.get_stats()
+
+        assert stats["entries"] is None
+        assert stats["size_bytes"] is None
+        assert stats["errors"] == 2
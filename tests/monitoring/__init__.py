@@ -0,0 +1 @@
+"""Tests for monitoring and observability helpers."""
@@ -0,0 +1,111 @@
+"""Tests for per-request phase timing."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterator
+
+import pytest
+
+from clarity.api.v1.metrics import health_data_processing_duration_seconds
+from clarity.monitoring.phase_timing import (
+    collect_phases,
+    is_phase_timing_enabled,
+    phase,
+    set_phase_timing_enabled,
+)
+
+
+def _observations(stage: str) -> float:
+    """Number of histogram observations recorded for a stage."""
+    for metric in health_data_processing_duration_seconds.collect():
+        for sample in metric.samples:
+            if sample.name.endswith("_count") and sample.labels["stage"] == stage:
+                return sample.value
+    return 0.0
+
+
+@pytest.fixture
+def phase_timing_disabled() -> Iterator[None]:
+    enabled = is_phase_timing_enabled()
+    set_phase_timing_enabled(enabled=False)
+    yield
+    set_phase_timing_enabled(enabled=enabled)
+
+
+class TestPhaseTiming:
+    """Phases feed Prometheus and the active request's breakdown."""
+
+    @staticmethod
+    def test_phases_accumulate_into_breakdown() -> None:
+        before = _observations("test_accumulate")
+
+        with collect_phases() as timings:
+            for _ in range(3):
+                with phase("test_accumulate"):
+                    pass
+            with phase("test_other"):
+                pass
+
+        assert timings is not None
+        breakdown = timings.as_milliseconds()
+        assert list(breakdown) == ["test_accumulate", "test_other"]
+        assert all(value >= 0.0 for value in breakdown.values())
+        assert _observations("test_accumulate") == before + 3
+
+    @staticmethod
+    def test_phase_outside_a_request_only_exports_metrics() -> None:
+        before = _observations("test_unscoped")
+
+        with phase("test_unscoped"):
+            pass
+
+        assert _observations("test_unscoped") == before + 1
+
+    @staticmethod
+    def test_phase_is_recorded_when_the_block_raises() -> None:
+        with collect_phases() as timings, pytest.raises(ValueError, match="boom"):
+            with phase("test_failure"):
+                msg = "boom"
+                raise ValueError(msg)
+
+        assert timings is not None
+        assert "test_failure" in timings.as_milliseconds()
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_keep_separate_breakdowns() -> None:
+        async def request(name: str) -> dict[str, float]:
+            with collect_phases() as timings:
+                with phase(f"test_{name}"):
+                    await asyncio.sleep(0.01)
+                # Worker threads and child tasks report into the same request
+                await asyncio.to_thread(_timed_in_thread, name)
+                await asyncio.gather(_timed_in_task(name))
+            assert timings is not None
+            return timings.as_milliseconds()
+
+        first, second = await asyncio.gather(request("a"), request("b"))
+
+        assert set(first) == {"test_a", "test_a_thread", "test_a_task"}
+        assert set(second) == {"test_b", "test_b_thread", "test_b_task"}
+
+    @staticmethod
+    def test_disabled_timing_is_a_no_op(phase_timing_disabled: None) -> None:
+        before = _observations("test_disabled")
+
+        with collect_phases() as timings, phase("test_disabled"):
+            pass
+
+        assert timings is None
+        assert _observations("test_disabled") == before
+
+
+def _timed_in_thread(name: str) -> None:
+    with phase(f"test_{name}_thread"):
+        pass
+
+
+async def _timed_in_task(name: str) -> None:
+    with phase(f"test_{name}_task"):
+        await asyncio.sleep(0)
@@ -0,0 +1,130 @@
+"""Benchmark of the HTTP middleware stack.
+
+Compares the pure ASGI middleware registered by ``configure_middleware_from_env``
+(auth, request size limiter, CORS, security headers) against equivalent
+``BaseHTTPMiddleware`` implementations they replaced, on a trivial endpoint.
+Requests are driven in-process through ``httpx.ASGITransport``; requests/sec
+and latency percentiles are printed with ``pytest -s``.
+"""
+
+from __future__ import annotations
+
+import time
+
+from fastapi import FastAPI, Request, Response
+from fastapi.middleware.cors import CORSMiddleware
+import httpx
+import numpy as np
+import pytest
+from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
+
+from clarity.middleware.auth_middleware import PUBLIC_PATHS, CognitoAuthMiddleware
+from clarity.middleware.request_size_limiter import RequestSizeLimiterMiddleware
+from clarity.middleware.security_headers import SecurityHeadersMiddleware
+
+WARMUP_REQUESTS = 200
+BENCHMARK_REQUESTS = 2000
+MAX_REQUEST_SIZE = 10 * 1024 * 1024
+
+
+class _LegacyAuth(BaseHTTPMiddleware):
+    """Previous auth middleware with authentication disabled."""
+
+    async def dispatch(
+        self, request: Request, call_next: RequestResponseEndpoint
+    ) -> Response:
+        request.state.user = None
+        if request.url.path in PUBLIC_PATHS:
+            return await call_next(request)
+        request.headers.get("Authorization", "")
+        return await call_next(request)
+
+
+class _LegacySizeLimiter(BaseHTTPMiddleware):
+    """Previous size limiter: Content-Length check only."""
+
+    async def dispatch(
+        self, request: Request, call_next: RequestResponseEndpoint
+    ) -> Response:
+        if request.method in {"POST", "PUT", "PATCH"}:
+            int(request.headers.get("content-length", "0"))
+        return await call_next(request)
+
+
+class _LegacySecurityHeaders(BaseHTTPMiddleware):
+    """Previous security headers middleware."""
+
+    async def dispatch(
+        self, request: Request, call_next: RequestResponseEndpoint
+    ) -> Response:
+        response = await call_next(request)
+        SecurityHeadersMiddleware.add_security_headers_to_response(response)
+        return response
+
+
+def _app(*, legacy: bool) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/ping")
+    async def ping() -> dict[str, str]:
+        return {"status": "ok"}
+
+    if legacy:
+        app.add_middleware(_LegacyAuth)
+        app.add_middleware(_LegacySizeLimiter)
+    else:
+        # No Cognito configuration: the middleware only inspects the request
+        app.add_middleware(CognitoAuthMiddleware)
+        app.add_middleware(
+            RequestSizeLimiterMiddleware, max_request_size=MAX_REQUEST_SIZE
+        )
+    app.add_middleware(CORSMiddleware, allow_origins=["http://localhost:3000"])
+    if legacy:
+        app.add_middleware(_LegacySecurityHeaders)
+    else:
+        app.add_middleware(SecurityHeadersMiddleware)
+    return app
+
+
+async def _measure(app: FastAPI) -> tuple[float, np.ndarray]:
+    """Requests/sec and per-request latencies (seconds) for sequential GETs."""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://bench"
+    ) as client:
+        for _ in range(WARMUP_REQUESTS):
+            await client.get("/ping")
+
+        latencies = np.empty(BENCHMARK_REQUESTS)
+        started = time.perf_counter()
+        for index in range(BENCHMARK_REQUESTS):
+            request_started = time.perf_counter()
+            response = await client.get("/ping", headers={"Authorization": "Bearer x"})
+            latencies[index] = time.perf_counter() - request_started
+            assert response.status_code == 200
+        elapsed = time.perf_counter() - started
+    return BENCHMARK_REQUESTS / elapsed, latencies
+
+
+def _summary(name: str, rps: float, latencies: np.ndarray) -> str:
+    p50, p99 = np.percentile(latencies, [50, 99]) * 1000
+    return f"{name}: {rps:,.0f} req/s, p50 {p50:.3f}ms, p99 {p99:.3f}ms"
+
+
+@pytest.mark.slow
+@pytest.mark.asyncio
+async def test_middleware_stack_benchmark(monkeypatch: pytest.MonkeyPatch) -> None:
+    """The pure ASGI stack serves a trivial endpoint faster."""
+    monkeypatch.setenv("ENABLE_AUTH", "false")
+
+    legacy_rps, legacy_latencies = await _measure(_app(legacy=True))
+    asgi_rps, asgi_latencies = await _measure(_app(legacy=False))
+
+    print(  # noqa: T201
+        "\n"
+        + _summary("BaseHTTPMiddleware", legacy_rps, legacy_latencies)
+        + "\n"
+        + _summary("pure ASGI", asgi_rps, asgi_latencies)
+        + f"\nspeedup {asgi_rps / legacy_rps:.2f}x"
+    )
+    assert asgi_rps > legacy_rps
@@ -0,0 +1,71 @@
+"""Micro-benchmark for proxy actigraphy rolling-median smoothing.
+
+Compares the vectorized ``_smooth_proxy_values`` / ``smooth_proxy_values_batch``
+against the per-minute ``np.median`` loop they replaced on a full week of data.
+Timings are printed with ``pytest -s``.
+"""
+
+from __future__ import annotations
+
+import timeit
+
+import numpy as np
+import pytest
+
+from clarity.core.constants import MINUTES_PER_WEEK, SMOOTHING_WINDOW_SIZE
+from clarity.ml.proxy_actigraphy import _smooth_proxy_values, smooth_proxy_values_batch
+
+BENCHMARK_REPEATS = 3
+BATCH_USERS = 8
+
+
+def _loop_rolling_median(
+    values: np.ndarray, window_size: int = SMOOTHING_WINDOW_SIZE
+) -> np.ndarray:
+    """Original per-minute loop implementation."""
+    smoothed = np.copy(values)
+    half_window = window_size // 2
+    for i in range(half_window, len(values) - half_window):
+        smoothed[i] = np.median(values[i - half_window : i + half_window + 1])
+    return smoothed
+
+
+def _best_time(func: object, *args: object) -> float:
+    return min(
+        timeit.repeat(lambda: func(*args), number=1, repeat=BENCHMARK_REPEATS)  # type: ignore[operator]
+    )
+
+
+@pytest.mark.slow
+def test_vectorized_smoothing_benchmark() -> None:
+    """Vectorized smoothing of one week is identical and faster than the loop."""
+    week = np.random.default_rng(0).normal(size=MINUTES_PER_WEEK)
+
+    np.testing.assert_array_equal(
+        _smooth_proxy_values(week), _loop_rolling_median(week)
+    )
+
+    loop_time = _best_time(_loop_rolling_median, week)
+    vectorized_time = _best_time(_smooth_proxy_values, week)
+
+    print(  # noqa: T201
+        f"\nrolling median, 1 week: loop {loop_time * 1000:.2f}ms, "
+        f"vectorized {vectorized_time * 1000:.2f}ms "
+        f"({loop_time / vectorized_time:.1f}x)"
+    )
+    assert vectorized_time < loop_time
+
+
+@pytest.mark.slow
+def test_batch_smoothing_benchmark() -> None:
+    """Batch smoothing of many weeks beats smoothing them one by one."""
+    weeks = np.random.default_rng(1).normal(size=(BATCH_USERS, MINUTES_PER_WEEK))
+
+    loop_time = _best_time(lambda: [_loop_rolling_median(week) for week in weeks])
+    batch_time = _best_time(smooth_proxy_values_batch, weeks)
+
+    print(  # noqa: T201
+        f"\nrolling median, {BATCH_USERS} weeks: loop {loop_time * 1000:.2f}ms, "
+        f"batch {batch_time * 1000:.2f}ms ({loop_time / batch_time:.1f}x)"
+    )
+    assert batch_time < loop_time
@@ -0,0 +1,95 @@
+"""Micro-benchmark for the NumPy resampling kernel.
+
+Compares ``prepare_series`` / ``prepare_series_batch`` against the pandas
+``resample``/``interpolate``/``rolling`` chain they replaced in the cardio and
+respiration processors, on a week of minute-level heart rate. Timings are
+printed with ``pytest -s``.
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+import timeit
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from clarity.ml.processors.cardio_processor import HR_SERIES_SPEC
+from clarity.ml.processors.resampling_kernel import (
+    SeriesSpec,
+    prepare_series,
+    prepare_series_batch,
+)
+
+BENCHMARK_REPEATS = 3
+BATCH_USERS = 8
+MINUTES_PER_WEEK = 7 * 24 * 60
+
+
+def _pandas_chain(
+    timestamps: list[datetime], values: list[float], spec: SeriesSpec
+) -> pd.Series:
+    """Original pandas implementation."""
+    series = pd.Series(values, index=pd.to_datetime(timestamps))
+    resampled = series.resample(spec.step).mean()
+    resampled = resampled.mask(
+        (resampled <= spec.lower) | (resampled > spec.upper), np.nan
+    )
+    result = resampled.interpolate(
+        limit=spec.interpolation_limit, limit_direction="forward"
+    ).rolling(window=spec.smoothing_window, min_periods=1, center=True)
+    return result.mean().ffill().bfill()
+
+
+def _week_of_heart_rate(seed: int) -> tuple[list[datetime], list[float]]:
+    rng = np.random.default_rng(seed)
+    start = datetime(2024, 3, 1, tzinfo=UTC)
+    minutes = np.flatnonzero(rng.random(MINUTES_PER_WEEK) > 0.1)
+    timestamps = [start + timedelta(minutes=int(minute)) for minute in minutes]
+    return timestamps, rng.normal(70, 15, len(minutes)).tolist()
+
+
+def _best_time(func: object, *args: object) -> float:
+    return min(
+        timeit.repeat(lambda: func(*args), number=1, repeat=BENCHMARK_REPEATS)  # type: ignore[operator]
+    )
+
+
+@pytest.mark.slow
+def test_kernel_benchmark() -> None:
+    """The kernel matches pandas on one week and is faster."""
+    timestamps, values = _week_of_heart_rate(0)
+
+    np.testing.assert_allclose(
+        prepare_series(timestamps, values, HR_SERIES_SPEC).values,
+        _pandas_chain(timestamps, values, HR_SERIES_SPEC).to_numpy(),
+        rtol=1e-12,
+    )
+
+    pandas_time = _best_time(_pandas_chain, timestamps, values, HR_SERIES_SPEC)
+    kernel_time = _best_time(prepare_series, timestamps, values, HR_SERIES_SPEC)
+
+    print(  # noqa: T201
+        f"\nHR preprocessing, 1 week: pandas {pandas_time * 1000:.2f}ms, "
+        f"kernel {kernel_time * 1000:.2f}ms ({pandas_time / kernel_time:.1f}x)"
+    )
+    assert kernel_time < pandas_time
+
+
+@pytest.mark.slow
+def test_batch_kernel_benchmark() -> None:
+    """One batched kernel call beats the pandas chain user by user."""
+    users = [_week_of_heart_rate(seed) for seed in range(BATCH_USERS)]
+
+    pandas_time = _best_time(
+        lambda: [_pandas_chain(*user, HR_SERIES_SPEC) for user in users]
+    )
+    batch_time = _best_time(prepare_series_batch, users, HR_SERIES_SPEC)
+
+    print(  # noqa: T201
+        f"\nHR preprocessing, {BATCH_USERS} weeks: pandas "
+        f"{pandas_time * 1000:.2f}ms, batch {batch_time * 1000:.2f}ms "
+        f"({pandas_time / batch_time:.1f}x)"
+    )
+    assert batch_time < pandas_time
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import base64
+import io
 import json
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -11,6 +12,7 @@ from fastapi import HTTPException, Request
 import pytest
 
 from clarity.services.messaging.analysis_subscriber import AnalysisSubscriber
+from clarity.storage.raw_data_archive import encode_raw_data
 
 
 @pytest.fixture
@@ -59,6 +61,26 @@ async def test_download_health_data_success(subscriber: AnalysisSubscriber):
         assert data == expected_data
 
 
+@pytest.mark.asyncio
+async def test_download_health_data_archive(subscriber: AnalysisSubscriber):
+    gcs_path = "gs://bucket/raw_data/user/proc.columnar.json.gz"
+    expected_data: dict[str, Any] = {
+        "metrics_count": 1,
+        "metrics": [{"metric_type": "heart_rate", "biometric_data": None}],
+    }
+    mock_blob = MagicMock()
+    mock_blob.exists.return_value = True
+    mock_blob.open.return_value = io.BytesIO(encode_raw_data(expected_data))
+
+    with patch.object(subscriber.storage_client, "bucket") as mock_bucket:
+        mock_bucket.return_value.blob.return_value = mock_blob
+        data = await subscriber._download_health_data(gcs_path)
+
+    assert data == expected_data
+    mock_blob.open.assert_called_once_with("rb")
+    mock_blob.download_as_text.assert_not_called()
+
+
 @pytest.mark.asyncio
 async def test_download_health_data_not_found(subscriber: AnalysisSubscriber):
     gcs_path = "gs://bucket/path"
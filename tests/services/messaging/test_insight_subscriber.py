@@ -376,14 +376,23 @@ class TestStoreInsights:
 
     @pytest.mark.asyncio
     async def test_store_insights(self, insight_subscriber: InsightSubscriber) -> None:
-        """Test storing insights (placeholder implementation)."""
-        # Currently just logs, so verify it doesn't raise
+        """Test storing insights through the insight repository."""
+        repository = MagicMock()
+        repository.save_insight = AsyncMock(return_value="insight_test-upload")
+        insight_subscriber.insight_repository = repository
+
         await insight_subscriber._store_insights(
             user_id="test-user",
             upload_id="test-upload",
             insights={"test": "data"},
         )
 
+        repository.save_insight.assert_awaited_once_with(
+            "test-user",
+            {"test": "data", "upload_id": "test-upload"},
+            insight_id="insight_test-upload",
+        )
+
 
 class TestHelperMethods:
     """Test helper methods."""
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 from datetime import UTC, datetime
+import io
 import json
 from typing import Any
 from unittest.mock import MagicMock, patch
@@ -27,6 +28,7 @@ from clarity.services.s3_storage_service import (
     S3UploadError,
     get_s3_service,
 )
+from clarity.storage.raw_data_archive import encode_raw_data, read_raw_data
 
 
 @pytest.fixture
@@ -88,6 +90,28 @@ def valid_health_data() -> HealthDataUpload:
     )
 
 
+def fake_list_objects(keys: list[str]) -> Any:
+    """``list_objects_v2`` stand-in over ``keys`` honouring Prefix and Delimiter."""
+
+    def list_objects_v2(**params: Any) -> dict[str, Any]:
+        prefix = params["Prefix"]
+        matched = [key for key in keys if key.startswith(prefix)]
+        delimiter = params.get("Delimiter")
+        if delimiter is None:
+            return {"Contents": [{"Key": key} for key in matched], "IsTruncated": False}
+        children = sorted({
+            prefix + key[len(prefix) :].split(delimiter)[0] + delimiter
+            for key in matched
+            if delimiter in key[len(prefix) :]
+        })
+        return {
+            "CommonPrefixes": [{"Prefix": child} for child in children],
+            "IsTruncated": False,
+        }
+
+    return list_objects_v2
+
+
 class TestS3StorageServiceInit:
     """Test S3 storage service initialization."""
 
@@ -253,6 +277,41 @@ class TestUploadRawHealthData:
         assert body_data["metrics_count"] == 2
         assert len(body_data["metrics"]) == 2
 
+    @pytest.mark.asyncio
+    async def test_upload_raw_health_data_columnar(
+        self, mock_s3_client: MagicMock, valid_health_data: HealthDataUpload
+    ) -> None:
+        """Test upload in the columnar archive format."""
+        service = S3StorageService(
+            bucket_name="test-health-bucket", raw_data_format="columnar"
+        )
+        service.s3_client = mock_s3_client
+        user_id = valid_health_data.user_id
+
+        s3_uri = await service.upload_raw_health_data(
+            user_id, "proc-123", valid_health_data
+        )
+
+        assert s3_uri.endswith(f"/{user_id}/proc-123.columnar.json.gz")
+        call_kwargs = mock_s3_client.put_object.call_args[1]
+        assert call_kwargs["ContentType"] == "application/gzip"
+        assert call_kwargs["Metadata"]["archive-format"] == "clarity-columnar"
+
+        body = read_raw_data(io.BytesIO(call_kwargs["Body"]))
+        assert body["processing_id"] == "proc-123"
+        assert [m["metric_type"] for m in body["metrics"]] == [
+            "heart_rate",
+            "activity_level",
+        ]
+        assert body["metrics"][0]["biometric_data"]["heart_rate"] == 72
+        assert body["metrics"][0]["activity_data"] is None
+
+    @staticmethod
+    def test_unsupported_raw_data_format(mock_s3_client: MagicMock) -> None:
+        """Test that unknown raw data formats are rejected."""
+        with pytest.raises(ValueError, match="Unsupported raw data format"):
+            S3StorageService(bucket_name="test-health-bucket", raw_data_format="xml")
+
     @pytest.mark.asyncio
     async def test_upload_raw_health_data_no_encryption(
         self, mock_s3_client: MagicMock, valid_health_data: HealthDataUpload
@@ -403,6 +462,26 @@ class TestDownloadRawData:
             Key=s3_key,
         )
 
+    @pytest.mark.asyncio
+    async def test_download_raw_data_columnar(
+        self, s3_service: S3StorageService, mock_s3_client: MagicMock
+    ) -> None:
+        """Test download of a columnar archive."""
+        s3_key = "raw_data/2024/01/15/user-123/proc-123.columnar.json.gz"
+        test_data = {
+            "user_id": "user-123",
+            "processing_id": "proc-123",
+            "metrics_count": 1,
+            "metrics": [{"metric_type": "heart_rate", "biometric_data": None}],
+        }
+        mock_s3_client.get_object.return_value = {
+            "Body": io.BytesIO(encode_raw_data(test_data))
+        }
+
+        result = await s3_service.download_raw_data(s3_key, "user-123")
+
+        assert result == test_data
+
     @pytest.mark.asyncio
     async def test_download_raw_data_not_found(
         self, s3_service: S3StorageService, mock_s3_client: MagicMock
@@ -610,41 +689,72 @@ class TestDeleteUserData:
         self, s3_service: S3StorageService, mock_s3_client: MagicMock
     ) -> None:
         """Test successful user data deletion."""
-        # Mock list_user_files response
-        with patch.object(s3_service, "list_user_files") as mock_list:
-            mock_list.return_value = [
-                {"key": "raw_data/2024/01/15/user-123/file1.json"},
-                {"key": "raw_data/2024/01/14/user-123/file2.json"},
-            ]
-
-            deleted_count = await s3_service.delete_user_data("user-123")
-
-            assert deleted_count == 2
-            assert mock_s3_client.delete_object.call_count == 2
+        mock_s3_client.list_objects_v2.side_effect = fake_list_objects([
+            "raw_data/2024/01/15/user-123/file1.json",
+            "raw_data/2024/01/14/user-123/file2.json",
+            "raw_data/2024/01/14/user-1234/other.json",
+            "analysis_results/2024/01/15/user-123/file1_results.json",
+        ])
+        mock_s3_client.delete_objects.return_value = {}
+
+        deleted_count = await s3_service.delete_user_data("user-123")
+
+        assert deleted_count == 3
+        deleted_keys = [
+            obj["Key"]
+            for call in mock_s3_client.delete_objects.call_args_list
+            for obj in call[1]["Delete"]["Objects"]
+        ]
+        assert "raw_data/2024/01/14/user-1234/other.json" not in deleted_keys
+        mock_s3_client.delete_object.assert_not_called()
+
+        # Objects are only listed under the user's own date partitions
+        object_listings = [
+            call[1]["Prefix"]
+            for call in mock_s3_client.list_objects_v2.call_args_list
+            if "Delimiter" not in call[1]
+        ]
+        assert sorted(object_listings) == [
+            "analysis_results/2024/01/15/user-123/",
+            "raw_data/2024/01/14/user-123/",
+            "raw_data/2024/01/15/user-123/",
+        ]
 
     @pytest.mark.asyncio
     async def test_delete_user_data_partial_failure(
         self, s3_service: S3StorageService, mock_s3_client: MagicMock
     ) -> None:
-        """Test user data deletion with partial failures."""
-        with patch.object(s3_service, "list_user_files") as mock_list:
-            mock_list.return_value = [
-                {"key": "raw_data/2024/01/15/user-123/file1.json"},
-                {"key": "raw_data/2024/01/14/user-123/file2.json"},
+        """Test user data deletion with keys that keep failing."""
+        mock_s3_client.list_objects_v2.side_effect = fake_list_objects([
+            "raw_data/2024/01/15/user-123/file1.json",
+            "raw_data/2024/01/14/user-123/file2.json",
+        ])
+        mock_s3_client.delete_objects.return_value = {
+            "Errors": [
+                {
+                    "Key": "raw_data/2024/01/14/user-123/file2.json",
+                    "Code": "AccessDenied",
+                }
             ]
+        }
 
-            # First delete succeeds, second fails
-            mock_s3_client.delete_object.side_effect = [
-                None,
-                ClientError(
-                    {"Error": {"Code": "NoSuchKey", "Message": "Delete error"}},
-                    "DeleteObject",
-                ),
-            ]
+        progress = await s3_service.erase_user_objects("user-123")
 
-            deleted_count = await s3_service.delete_user_data("user-123")
+        assert progress.deleted == 1  # Only one successful deletion
+        assert progress.failed_keys == ["raw_data/2024/01/14/user-123/file2.json"]
+
+    @pytest.mark.asyncio
+    async def test_delete_user_data_list_error(
+        self, s3_service: S3StorageService, mock_s3_client: MagicMock
+    ) -> None:
+        """Test that listing failures surface as storage errors."""
+        mock_s3_client.list_objects_v2.side_effect = ClientError(
+            {"Error": {"Code": "AccessDenied", "Message": "Denied"}},
+            "ListObjectsV2",
+        )
 
-            assert deleted_count == 1  # Only one successful deletion
+        with pytest.raises(S3StorageError, match="User data deletion failed"):
+            await s3_service.delete_user_data("user-123")
 
 
 class TestSetupBucketLifecycle:
@@ -0,0 +1,320 @@
+"""Tests for bulk user data erasure across S3 and DynamoDB."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+import threading
+import time
+from typing import TYPE_CHECKING, Any
+from unittest.mock import AsyncMock, MagicMock
+
+import boto3
+from moto import mock_aws
+import pytest
+
+from clarity.ports.data_ports import IHealthDataRepository
+from clarity.services.dynamodb_service import DynamoDBHealthDataRepository
+from clarity.services.health_data_service import HealthDataService
+from clarity.services.s3_storage_service import S3StorageService
+from clarity.services.user_data_erasure import (
+    ErasureProgress,
+    S3BulkDeleter,
+    UserDataEraser,
+    UserItemsEraser,
+)
+from clarity.storage.dynamodb_client import (
+    DynamoDBHealthDataRepository as StorageHealthDataRepository,
+)
+
+if TYPE_CHECKING:
+    from mypy_boto3_s3 import S3Client
+
+TEST_REGION = "us-east-1"
+TEST_BUCKET = "erasure-test-bucket"
+
+
+@pytest.fixture
+def s3_client(monkeypatch: pytest.MonkeyPatch) -> Iterator[S3Client]:
+    """Create an empty bucket in moto."""
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+    monkeypatch.setenv("AWS_DEFAULT_REGION", TEST_REGION)
+
+    with mock_aws():
+        client = boto3.client("s3", region_name=TEST_REGION)
+        client.create_bucket(Bucket=TEST_BUCKET)
+        yield client
+
+
+def _put_objects(client: S3Client, user_id: str, count: int) -> None:
+    for index in range(count):
+        prefix = "raw_data" if index % 2 else "analysis_results"
+        client.put_object(
+            Bucket=TEST_BUCKET,
+            Key=f"{prefix}/2024/01/{index % 28 + 1:02d}/{user_id}/{index}.json",
+            Body=b"{}",
+        )
+
+
+def _remaining_keys(client: S3Client) -> list[str]:
+    paginator = client.get_paginator("list_objects_v2")
+    return [
+        obj["Key"]
+        for page in paginator.paginate(Bucket=TEST_BUCKET)
+        for obj in page.get("Contents", [])
+    ]
+
+
+class TestS3BulkDeleter:
+    """Paged listing and batched deletes against moto."""
+
+    @pytest.mark.asyncio
+    @staticmethod
+    async def test_deletes_across_pages_and_batches(s3_client: S3Client) -> None:
+        _put_objects(s3_client, "user-1", 2300)
+        _put_objects(s3_client, "user-10", 5)
+        updates: list[int] = []
+
+        progress = await S3BulkDeleter(s3_client, TEST_BUCKET).delete_matching(
+            ("raw_data/", "analysis_results/"),
+            ErasureProgress(store="s3", user_id="user-1"),
+            lambda p: updates.append(p.deleted),
+            key_filter=lambda key: "/user-1/" in key,
+        )
+
+        assert progress.completed
+        assert progress.deleted == progress.listed == 2300
+        assert progress.failed == 0
+        assert progress.batches == 3
+        assert updates[-1] == 2300
+        remaining = _remaining_keys(s3_client)
+        assert len(remaining) == 5
+        assert all("/user-10/" in key for key in remaining)
+
+    @pytest.mark.asyncio
+    @staticmethod
+    async def test_retries_failed_keys() -> None:
+        client = MagicMock()
+        client.delete_objects.side_effect = [
+            {"Errors": [{"Key": "b", "Code": "InternalError"}]},
+            {},
+        ]
+
+        deleter = S3BulkDeleter(client, TEST_BUCKET, retry_base_delay=0)
+        deleted, failed = await deleter.delete_keys(["a", "b"])
+
+        assert (deleted, failed) == (2, [])
+        retried = client.delete_objects.call_args_list[1][1]["Delete"]["Objects"]
+        assert retried == [{"Key": "b"}]
+
+    @pytest.mark.asyncio
+    @staticmethod
+    async def test_limits_concurrent_batches() -> None:
+        client = MagicMock()
+        client.list_objects_v2.return_value = {
+            "Contents": [{"Key": f"raw_data/u/{i}"} for i in range(50)],
+            "IsTruncated": False,
+        }
+        in_flight = 0
+        peak = 0
+
+        def delete_objects(**_: Any) -> dict[str, Any]:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            in_flight -= 1
+            return {}
+
+        client.delete_objects.side_effect = delete_objects
+        deleter = S3BulkDeleter(
+            client, TEST_BUCKET, batch_size=5, max_concurrent_batches=2
+        )
+
+        progress = await deleter.delete_matching(
+            ("raw_data/",), ErasureProgress("s3", "u")
+        )
+
+        assert progress.batches == 10
+        assert progress.deleted == 50
+        assert peak <= 2
+
+    @pytest.mark.asyncio
+    @staticmethod
+    async def test_lists_date_partitions_without_objects(s3_client: S3Client) -> None:
+        _put_objects(s3_client, "user-1", 60)
+        _put_objects(s3_client, "user-2", 3)
+        s3_client.put_object(Bucket=TEST_BUCKET, Key="raw_data/2023/12/31/x", Body=b"")
+
+        partitions = sorted(
+            await S3BulkDeleter(s3_client, TEST_BUCKET).list_partitions(
+                ["raw_data/"], 3
+            )
+        )
+
+        assert len(partitions) == 15  # raw uploads land on 14 days of January
+        assert partitions[0] == "raw_data/2023/12/31/"
+        assert all(p.startswith("raw_data/2024/01/") for p in partitions[1:])
+        assert all(p.count("/") == 4 for p in partitions)
+
+    @pytest.mark.asyncio
+    @staticmethod
+    async def test_lists_prefixes_concurrently_within_limit() -> None:
+        lock = threading.Lock()
+        in_flight = 0
+        peak = 0
+
+        def list_objects_v2(**params: Any) -> dict[str, Any]:
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            time.sleep(0.02)
+            with lock:
+                in_flight -= 1
+            if params.get("Delimiter"):
+                return {
+                    "CommonPrefixes": [
+                        {"Prefix": f"{params['Prefix']}{i}/"} for i in range(4)
+                    ]
+                }
+            return {"Contents": [{"Key": f"{params['Prefix']}x"}]}
+
+        client = MagicMock()
+        client.list_objects_v2.side_effect = list_objects_v2
+        client.delete_objects.return_value = {}
+        deleter = S3BulkDeleter(client, TEST_BUCKET, max_concurrent_batches=3)
+
+        partitions = await deleter.list_partitions(["raw_data/"], 2)
+        progress = await deleter.delete_matching(
+            [f"{p}user-1/" for p in partitions], ErasureProgress("s3", "user-1")
+        )
+
+        assert len(partitions) == 16
+        assert progress.deleted == 16
+        assert 1 < peak <= 3
+
+    @staticmethod
+    def test_rejects_oversized_batches() -> None:
+        with pytest.raises(ValueError, match="batch_size"):
+            S3BulkDeleter(MagicMock(), TEST_BUCKET, batch_size=1001)
+
+
+class TestDynamoDBUserErasure:
+    """Paged batch deletes of a user's health records."""
+
+    @pytest.mark.asyncio
+    @staticmethod
+    async def test_erase_user_items_pages_and_batches() -> None:
+        repository = DynamoDBHealthDataRepository()
+        service = MagicMock()
+        service.tables = {
+            "health_data": "test_health_data",
+            "audit_logs": "test_audit_logs",
+        }
+        service.query = AsyncMock(
+            side_effect=[
+                {
+                    "Items": [{"id": "1"}, {"id": "2"}],
+                    "LastEvaluatedKey": {"id": "2", "user_id": "user-1"},
+                },
+                {"Items": [{"id": "3"}], "LastEvaluatedKey": None},
+                {"Items": []},
+            ]
+        )
+        service.batch_delete_items = AsyncMock(
+            side_effect=lambda _t, keys, **_: len(keys)
+        )
+        service.put_item = AsyncMock()
+        repository._dynamodb_service = service
+
+        progress = await repository.erase_user_items("user-1")
+
+        assert progress.deleted == 3
+        assert progress.batches == 2
+        second_query = service.query.call_args_list[1][1]
+        assert second_query["exclusive_start_key"] == {"id": "2", "user_id": "user-1"}
+        service.batch_delete_items.assert_any_call(
+            "test_health_data",
+            [{"id": "3", "user_id": "user-1"}],
+            user_id="user-1",
+        )
+        assert await repository.delete_user_data("user-1") == 0
+        audit = service.put_item.call_args_list[0][1]
+        assert audit["table_name"] == "test_audit_logs"
+        assert audit["item"]["action"] == "data_deletion"
+        assert service.put_item.await_count == 2
+
+
+class TestUserDataEraser:
+    """One erasure job covering both stores."""
+
+    @pytest.mark.asyncio
+    @staticmethod
+    async def test_erase_reports_both_stores(s3_client: S3Client) -> None:
+        _put_objects(s3_client, "user-1", 12)
+        _put_objects(s3_client, "user-10", 2)
+        s3_service = S3StorageService(bucket_name=TEST_BUCKET, region=TEST_REGION)
+        s3_service.s3_client = s3_client
+        repository = MagicMock()
+        dynamodb_progress = ErasureProgress(
+            store="dynamodb", user_id="user-1", deleted=7, batches=1, completed=True
+        )
+        repository.erase_user_items = AsyncMock(return_value=dynamodb_progress)
+        stores: list[str] = []
+
+        report = await UserDataEraser(s3_service, repository).erase(
+            "user-1", on_progress=lambda p: stores.append(p.store)
+        )
+
+        assert report.complete
+        assert report.deleted == 19
+        assert report.to_dict()["s3"]["deleted"] == 12
+        assert stores == ["s3"]
+        remaining = _remaining_keys(s3_client)
+        assert len(remaining) == 2
+        assert all("/user-10/" in key for key in remaining)
+
+    @pytest.mark.asyncio
+    @staticmethod
+    async def test_health_data_service_erases_both_stores(s3_client: S3Client) -> None:
+        _put_objects(s3_client, "user-1", 4)
+        _put_objects(s3_client, "user-2", 2)
+        table = boto3.resource("dynamodb", region_name=TEST_REGION).create_table(
+            TableName="erasure-health-data",
+            KeySchema=[
+                {"AttributeName": "pk", "KeyType": "HASH"},
+                {"AttributeName": "sk", "KeyType": "RANGE"},
+            ],
+            AttributeDefinitions=[
+                {"AttributeName": "pk", "AttributeType": "S"},
+                {"AttributeName": "sk", "AttributeType": "S"},
+            ],
+            BillingMode="PAY_PER_REQUEST",
+        )
+        for index in range(3):
+            table.put_item(Item={"pk": "USER#user-1", "sk": f"HEALTH#{index}"})
+        table.put_item(Item={"pk": "USER#user-2", "sk": "HEALTH#0"})
+        s3_service = S3StorageService(bucket_name=TEST_BUCKET, region=TEST_REGION)
+        s3_service.s3_client = s3_client
+        # The repository the dependency container wires in production
+        repository = StorageHealthDataRepository(
+            table_name=table.name, region=TEST_REGION
+        )
+        service = HealthDataService(repository, cloud_storage=s3_service)
+        assert isinstance(repository, UserItemsEraser)
+
+        assert await service.erase_user_data("user-1") is True
+
+        remaining = _remaining_keys(s3_client)
+        assert len(remaining) == 2
+        assert all("/user-2/" in key for key in remaining)
+        assert [item["pk"] for item in table.scan()["Items"]] == ["USER#user-2"]
+
+    @staticmethod
+    def test_repositories_without_bulk_erasure_use_delete_health_data() -> None:
+        repository = MagicMock(spec=IHealthDataRepository)
+        service = HealthDataService(
+            repository, cloud_storage=MagicMock(spec=S3StorageService)
+        )
+
+        assert service._user_data_eraser() is None
@@ -0,0 +1,527 @@
+"""Tests for the non-blocking DynamoDB access layer against a moto backend."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from datetime import UTC, datetime
+import threading
+from typing import TYPE_CHECKING
+from unittest.mock import MagicMock
+import uuid
+
+import boto3
+from moto import mock_aws
+from prometheus_client import REGISTRY
+import pytest
+
+from clarity.core.exceptions import ServiceError
+from clarity.models.health_data import BiometricData, HealthMetric, HealthMetricType
+from clarity.storage.async_dynamodb import (
+    AsyncDynamoDBTable,
+    DynamoDBExecutor,
+    get_dynamodb_executor,
+    shutdown_dynamodb_executor,
+)
+from clarity.storage.dynamodb_client import DynamoDBHealthDataRepository
+
+if TYPE_CHECKING:
+    from mypy_boto3_dynamodb.service_resource import Table
+
+TEST_REGION = "us-east-1"
+TEST_TABLE_NAME = "async-health-data"
+
+
+def _operation_count(operation: str, status: str = "success") -> float:
+    return (
+        REGISTRY.get_sample_value(
+            "clarity_dynamodb_operations_total",
+            {"operation": operation, "collection": TEST_TABLE_NAME, "status": status},
+        )
+        or 0.0
+    )
+
+
+@pytest.fixture
+def moto_table(monkeypatch: pytest.MonkeyPatch) -> Iterator[Table]:
+    """Create the health data table (with processing id index) in moto."""
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+    monkeypatch.setenv("AWS_DEFAULT_REGION", TEST_REGION)
+
+    with mock_aws():
+        dynamodb = boto3.resource("dynamodb", region_name=TEST_REGION)
+        table = dynamodb.create_table(
+            TableName=TEST_TABLE_NAME,
+            KeySchema=[
+                {"AttributeName": "pk", "KeyType": "HASH"},
+                {"AttributeName": "sk", "KeyType": "RANGE"},
+            ],
+            AttributeDefinitions=[
+                {"AttributeName": "pk", "AttributeType": "S"},
+                {"AttributeName": "sk", "AttributeType": "S"},
+                {"AttributeName": "processing_id", "AttributeType": "S"},
+            ],
+            GlobalSecondaryIndexes=[
+                {
+                    "IndexName": "processing-id-index",
+                    "KeySchema": [
+                        {"AttributeName": "processing_id", "KeyType": "HASH"}
+                    ],
+                    "Projection": {"ProjectionType": "ALL"},
+                }
+            ],
+            BillingMode="PAY_PER_REQUEST",
+        )
+        yield table
+
+
+@pytest.fixture
+def repository(moto_table: Table) -> DynamoDBHealthDataRepository:
+    """Repository bound to the moto table."""
+    return DynamoDBHealthDataRepository(table_name=moto_table.name, region=TEST_REGION)
+
+
+def _heart_rate_metric() -> HealthMetric:
+    return HealthMetric(
+        metric_id=uuid.uuid4(),
+        metric_type=HealthMetricType.HEART_RATE,
+        created_at=datetime.now(UTC),
+        biometric_data=BiometricData(heart_rate=72.0),
+    )
+
+
+class TestAsyncDynamoDBTable:
+    """Test the awaitable table wrapper."""
+
+    @pytest.mark.asyncio
+    @staticmethod
+    async def test_operations_round_trip(moto_table: Table) -> None:
+        table = AsyncDynamoDBTable(moto_table)
+
+        await table.put_item(Item={"pk": "USER#1", "sk": "DATA#1", "value": 1})
+        item = await table.get_item(Key={"pk": "USER#1", "sk": "DATA#1"})
+        assert item["Item"]["value"] == 1
+
+        await table.update_item(
+            Key={"pk": "USER#1", "sk": "DATA#1"},
+            UpdateExpression="SET #v = :v",
+            ExpressionAttributeNames={"#v": "value"},
+            ExpressionAttributeValues={":v": 2},
+        )
+        response = await table.query(
+            KeyConditionExpression="pk = :pk",
+            ExpressionAttributeValues={":pk": "USER#1"},
+        )
+        assert [i["value"] for i in response["Items"]] == [2]
+
+        await table.delete_item(Key={"pk": "USER#1", "sk": "DATA#1"})
+        assert "Item" not in await table.get_item(Key={"pk": "USER#1", "sk": "DATA#1"})
+
+    @pytest.mark.asyncio
+    @staticmethod
+    async def test_batch_delete(moto_table: Table) -> None:
+        table = AsyncDynamoDBTable(moto_table)
+        keys = [{"pk": "USER#1", "sk": f"HEALTH#{i:03d}"} for i in range(30)]
+        for key in keys:
+            await table.put_item(Item=key)
+
+        assert await table.batch_delete(keys) == len(keys)
+        assert moto_table.scan()["Count"] == 0
+
+    @pytest.mark.asyncio
+    @staticmethod
+    async def test_runs_off_the_event_loop_thread(moto_table: Table) -> None:
+        calls: list[str] = []
+        original = moto_table.put_item
+
+        def put_item(**kwargs: object) -> object:
+            calls.append(threading.current_thread().name)
+            return original(**kwargs)
+
+        wrapped = MagicMock(wraps=moto_table)
+        wrapped.put_item = put_item
+        executor = DynamoDBExecutor(max_workers=2, thread_name_prefix="dynamodb-test")
+        try:
+            await AsyncDynamoDBTable(wrapped, TEST_TABLE_NAME, executor).put_item(
+                Item={"pk": "USER#1", "sk": "DATA#1"}
+            )
+        finally:
+            executor.shutdown()
+
+        assert calls
+        assert calls[0].startswith("dynamodb-test")
+        assert calls[0] != threading.current_thread().name
+
+    @pytest.mark.asyncio
+    @staticmethod
+    async def test_records_operation_metrics(moto_table: Table) -> None:
+        table = AsyncDynamoDBTable(moto_table)
+        before_success = _operation_count("get_item")
+        before_failed = _operation_count("get_item", "failed")
+
+        await table.get_item(Key={"pk": "USER#1", "sk": "DATA#1"})
+        with pytest.raises(moto_table.meta.client.exceptions.ClientError):
+            await table.get_item(Key={"missing": "key"})
+
+        assert _operation_count("get_item") == before_success + 1
+        assert _operation_count("get_item", "failed") == before_failed + 1
+        assert (
+            REGISTRY.get_sample_value(
+                "clarity_dynamodb_operation_duration_seconds_count",
+                {"operation": "get_item", "collection": TEST_TABLE_NAME},
+            )
+            or 0.0
+        ) >= 2
+
+    @staticmethod
+    def test_global_executor_lifecycle() -> None:
+        executor = get_dynamodb_executor()
+        assert get_dynamodb_executor() is executor
+
+        shutdown_dynamodb_executor()
+        assert get_dynamodb_executor() is not executor
+        shutdown_dynamodb_executor()
+
+    @staticmethod
+    def test_executor_requires_workers() -> None:
+        with pytest.raises(ValueError, match="max_workers"):
+            DynamoDBExecutor(max_workers=0)
+
+
+class TestDynamoDBHealthDataRepositoryMoto:
+    """Exercise every repository method against the moto backend."""
+
+    @pytest.mark.asyncio
+    @staticmethod
+    async def test_save_and_query_health_data(
+        repository: DynamoDBHealthDataRepository,
+    ) -> None:
+        await repository.save_health_data(
+            user_id="user-1",
+            processing_id="proc-1",
+            metrics=[_heart_rate_metric()],
+            upload_source="apple_health",
+            client_timestamp=datetime.now(UTC),
+        )
+
+        result = await repository.get_user_health_data("user-1")
+        assert result["pagination"]["total"] == 1
+        record = result["data"][0]
+        assert record["processing_id"] == "proc-1"
+        assert record["metrics"]["heart_rate"]["biometric_data"]["heart_rate"] == 72.0
+
+        status = await repository.get_processing_status("proc-1", "user-1")
+        assert status is not None
+        assert status["status"] == "received"
+        assert await repository.get_processing_status("proc-1", "user-2") is None
+
+    @pytest.mark.asyncio
+    @staticmethod
+    async def test_delete_health_data(
+        repository: DynamoDBHealthDataRepository,
+    ) -> None:
+        for index in range(3):
+            await repository.save_health_data(
+                user_id="user-1",
+                processing_id=f"proc-{index}",
+                metrics=[_heart_rate_metric()],
+                upload_source="apple_health",
+                client_timestamp=datetime.now(UTC),
+            )
+
+        assert await repository.delete_health_data("user-1", "proc-0")
+        remaining = await repository.get_user_health_data("user-1")
+        assert {r["processing_id"] for r in remaining["data"]} == {"proc-1", "proc-2"}
+
+        assert await repository.delete_health_data("user-1")
+        assert (await repository.get_user_health_data("user-1"))["data"] == []
+
+    @pytest.mark.asyncio
+    @staticmethod
+    async def test_legacy_save_and_get_data(
+        repository: DynamoDBHealthDataRepository,
+    ) -> None:
+        record_id = await repository.save_data("user-1", {"source": "watch"})
+
+        assert record_id.startswith("user-1#")
+        assert await repository.get_data("user-1") == {"source": "watch"}
+        assert await repository.get_data("user-2") == {}
+
+    @pytest.mark.asyncio
+    @staticmethod
+    async def test_missing_table_raises_service_error(moto_table: Table) -> None:
+        repository = DynamoDBHealthDataRepository(
+            table_name="does-not-exist", region=TEST_REGION
+        )
+        assert moto_table.name != repository.table_name
+
+        with pytest.raises(ServiceError):
+            await repository.get_user_health_data("user-1")
+
+
+class TestHealthDataCursorPaginationMoto:
+    """Cursor pagination of ``get_user_health_data`` against moto."""
+
+    @staticmethod
+    def _seed(moto_table: Table, count: int) -> None:
+        for index in range(count):
+            metric = "heart_rate" if index % 3 == 0 else "steps"
+            moto_table.put_item(
+                Item={
+                    "pk": "USER#user-1",
+                    "sk": f"HEALTH#2024-01-01T00:{index:02d}:00",
+                    "metrics": {metric: {"value": index}},
+                }
+            )
+
+    @pytest.mark.asyncio
+    @staticmethod
+    async def test_cursor_pages_cover_all_items_once(
+        repository: DynamoDBHealthDataRepository, moto_table: Table
+    ) -> None:
+        TestHealthDataCursorPaginationMoto._seed(moto_table, 23)
+
+        seen: list[str] = []
+        cursor = None
+        while True:
+            page = await repository.get_user_health_data(
+                "user-1", limit=5, cursor=cursor
+            )
+            seen.extend(item["sk"] for item in page["data"])
+            cursor = page["pagination"]["next_cursor"]
+            if cursor is None:
+                break
+            assert len(page["data"]) == 5
+
+        assert len(seen) == 23
+        assert seen == sorted(set(seen), reverse=True)
+
+    @pytest.mark.asyncio
+    @staticmethod
+    async def test_metric_filter_returns_full_pages(
+        repository: DynamoDBHealthDataRepository, moto_table: Table
+    ) -> None:
+        TestHealthDataCursorPaginationMoto._seed(moto_table, 30)
+
+        first = await repository.get_user_health_data(
+            "user-1", limit=4, metric_type="heart_rate"
+        )
+        second = await repository.get_user_health_data(
+            "user-1",
+            limit=4,
+            metric_type="heart_rate",
+            cursor=first["pagination"]["next_cursor"],
+        )
+
+        assert len(first["data"]) == 4
+        assert len(second["data"]) == 4
+        items = first["data"] + second["data"]
+        assert all("heart_rate" in item["metrics"] for item in items)
+        assert len({item["sk"] for item in items}) == 8
+
+    @pytest.mark.asyncio
+    @staticmethod
+    async def test_sparse_metric_filter_reads_full_pages(
+        repository: DynamoDBHealthDataRepository,
+        moto_table: Table,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        TestHealthDataCursorPaginationMoto._seed(moto_table, 60)
+        query = repository.async_table.query
+        requests: list[dict[str, object]] = []
+
+        async def recording_query(**kwargs: object) -> dict[str, object]:
+            requests.append(kwargs)
+            return await query(**kwargs)
+
+        monkeypatch.setattr(repository.async_table, "query", recording_query)
+
+        first = await repository.get_user_health_data(
+            "user-1", limit=4, metric_type="heart_rate"
+        )
+        assert len(requests) == 1
+        by_offset = await repository.get_user_health_data(
+            "user-1", limit=4, offset=4, metric_type="heart_rate"
+        )
+        by_cursor = await repository.get_user_health_data(
+            "user-1",
+            limit=4,
+            metric_type="heart_rate",
+            cursor=first["pagination"]["next_cursor"],
+        )
+
+        # One request per page; the offset page adds one key-only walk
+        assert len(requests) == 4
+        assert by_offset["data"] == by_cursor["data"]
+        assert {item["sk"] for item in first["data"]}.isdisjoint(
+            item["sk"] for item in by_cursor["data"]
+        )
+
+    @pytest.mark.asyncio
+    @staticmethod
+    async def test_offset_matches_cursor_paging(
+        repository: DynamoDBHealthDataRepository, moto_table: Table
+    ) -> None:
+        TestHealthDataCursorPaginationMoto._seed(moto_table, 12)
+
+        first = await repository.get_user_health_data("user-1", limit=5)
+        by_cursor = await repository.get_user_health_data(
+            "user-1", limit=5, cursor=first["pagination"]["next_cursor"]
+        )
+        by_offset = await repository.get_user_health_data("user-1", limit=5, offset=5)
+        past_end = await repository.get_user_health_data("user-1", limit=5, offset=20)
+
+        assert by_offset["data"] == by_cursor["data"]
+        assert past_end["data"] == []
+        assert past_end["pagination"]["has_more"] is False
+
+
+class TestInsightStorageMoto:
+    """Insight counters and cursor listing against moto."""
+
+    @staticmethod
+    def _insight(index: int) -> dict[str, object]:
+        return {
+            "narrative": f"Insight {index}",
+            "key_insights": ["a", "b"],
+            "recommendations": ["c"],
+            "confidence_score": 0.8,
+            "generated_at": f"2024-01-01T00:00:{index:02d}+00:00",
+        }
+
+    @pytest.mark.asyncio
+    @staticmethod
+    async def test_save_insight_updates_summary(
+        repository: DynamoDBHealthDataRepository,
+    ) -> None:
+        for index in range(3):
+            await repository.save_insight(
+                "user-1", TestInsightStorageMoto._insight(index)
+            )
+
+        summary = await repository.get_insight_summary("user-1")
+        assert summary["total_count"] == 3
+        assert summary["key_insights_total"] == 6
+        assert summary["recommendations_total"] == 3
+        assert summary["last_generated_at"] == "2024-01-01T00:00:02+00:00"
+        assert (await repository.get_insight_summary("user-2"))["total_count"] == 0
+
+    @pytest.mark.asyncio
+    @staticmethod
+    async def test_duplicate_insight_id_is_not_counted_twice(
+        repository: DynamoDBHealthDataRepository,
+    ) -> None:
+        insight = TestInsightStorageMoto._insight(0)
+        await repository.save_insight("user-1", insight, insight_id="insight_upload-1")
+        await repository.save_insight("user-1", insight, insight_id="insight_upload-1")
+
+        page = await repository.list_insights("user-1")
+        assert len(page["items"]) == 1
+        assert (await repository.get_insight_summary("user-1"))["total_count"] == 1
+
+    @pytest.mark.asyncio
+    @staticmethod
+    async def test_summary_backfills_existing_insights(
+        repository: DynamoDBHealthDataRepository, moto_table: Table
+    ) -> None:
+        for index in range(4):
+            moto_table.put_item(
+                Item={"pk": "USER#user-1", "sk": f"INSIGHT#2023-01-0{index + 1}"}
+            )
+
+        assert (await repository.get_insight_summary("user-1"))["total_count"] == 4
+        await repository.save_insight("user-1", TestInsightStorageMoto._insight(0))
+        assert (await repository.get_insight_summary("user-1"))["total_count"] == 5
+
+    @pytest.mark.asyncio
+    @staticmethod
+    async def test_legacy_user_first_save_counts_existing_insights(
+        repository: DynamoDBHealthDataRepository, moto_table: Table
+    ) -> None:
+        for index in range(4):
+            moto_table.put_item(
+                Item={"pk": "USER#user-1", "sk": f"INSIGHT#2023-01-0{index + 1}"}
+            )
+
+        # Saving before the summary was ever read must not start it at 1
+        await repository.save_insight("user-1", TestInsightStorageMoto._insight(0))
+
+        summary = await repository.get_insight_summary("user-1")
+        assert summary["total_count"] == 5
+        assert summary["last_generated_at"] == "2024-01-01T00:00:00+00:00"
+
+    @pytest.mark.asyncio
+    @staticmethod
+    async def test_list_insights_pages_by_cursor(
+        repository: DynamoDBHealthDataRepository,
+    ) -> None:
+        for index in range(7):
+            await repository.save_insight(
+                "user-1", TestInsightStorageMoto._insight(index)
+            )
+
+        first = await repository.list_insights("user-1", limit=3)
+        second = await repository.list_insights(
+            "user-1", limit=3, cursor=first["next_cursor"]
+        )
+        by_offset = await repository.list_insights("user-1", limit=3, offset=3)
+        last = await repository.list_insights(
+            "user-1", limit=3, cursor=second["next_cursor"]
+        )
+
+        assert second["items"] == by_offset["items"]
+        assert len(last["items"]) == 1
+        assert last["next_cursor"] is None
+        narratives = [
+            i["narrative"] for i in first["items"] + second["items"] + last["items"]
+        ]
+        assert narratives == [f"Insight {index}" for index in reversed(range(7))]
+
+    @pytest.mark.asyncio
+    @staticmethod
+    async def test_list_insights_rejects_health_cursor(
+        repository: DynamoDBHealthDataRepository, moto_table: Table
+    ) -> None:
+        TestHealthDataCursorPaginationMoto._seed(moto_table, 3)
+        page = await repository.get_user_health_data("user-1", limit=1)
+
+        with pytest.raises(ValueError, match="not an insight cursor"):
+            await repository.list_insights(
+                "user-1", cursor=page["pagination"]["next_cursor"]
+            )
+
+
+class TestUserErasureMoto:
+    """Whole-user erasure through the repository the container wires."""
+
+    @pytest.mark.asyncio
+    @staticmethod
+    async def test_erase_user_items_pages_through_partition(
+        repository: DynamoDBHealthDataRepository,
+        moto_table: Table,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        TestHealthDataCursorPaginationMoto._seed(moto_table, 5)
+        await repository.save_insight("user-1", {"narrative": "n"}, "insight_a")
+        await repository.get_insight_summary("user-1")
+        moto_table.put_item(Item={"pk": "USER#user-2", "sk": "HEALTH#1"})
+        query = repository.async_table.query
+
+        async def small_pages(**kwargs: object) -> dict[str, object]:
+            return await query(**kwargs, Limit=2)
+
+        monkeypatch.setattr(repository.async_table, "query", small_pages)
+        pages: list[int] = []
+
+        progress = await repository.erase_user_items(
+            "user-1", on_progress=lambda p: pages.append(p.deleted)
+        )
+
+        # 5 health records, insight history + lookup item, insight summary
+        assert progress.completed
+        assert progress.deleted == 8
+        assert progress.batches == len(pages) == 4
+        remaining = moto_table.scan()["Items"]
+        assert [(item["pk"], item["sk"]) for item in remaining] == [
+            ("USER#user-2", "HEALTH#1")
+        ]
@@ -5,13 +5,15 @@ from __future__ import annotations
 from datetime import UTC, datetime, timedelta
 from decimal import Decimal
 import math
-from unittest.mock import MagicMock, patch
+from unittest.mock import ANY, MagicMock, patch
 import uuid
 
 from botocore.exceptions import ClientError
 import pytest
 
+from clarity.core.config import get_settings
 from clarity.core.exceptions import ServiceError
+from clarity.core.pagination import CursorInfo, create_cursor
 from clarity.models.health_data import (
     ActivityData,
     BiometricData,
@@ -21,7 +23,10 @@ from clarity.models.health_data import (
     ProcessingStatus,
     SleepData,
 )
-from clarity.storage.dynamodb_client import DynamoDBHealthDataRepository
+from clarity.storage.dynamodb_client import (
+    QUERY_PAGE_SIZE,
+    DynamoDBHealthDataRepository,
+)
 
 
 @pytest.fixture
@@ -142,7 +147,11 @@ class TestDynamoDBHealthDataRepositoryInit:
             assert repo.table_name == "test-table"
             assert repo.region == "us-west-2"
             mock_boto_resource.assert_called_once_with(
-                "dynamodb", region_name="us-west-2"
+                "dynamodb", region_name="us-west-2", config=ANY
+            )
+            config = mock_boto_resource.call_args.kwargs["config"]
+            assert (
+                config.max_pool_connections == get_settings().dynamodb_executor_workers
             )
 
     def test_init_with_endpoint(self) -> None:
@@ -160,6 +169,7 @@ class TestDynamoDBHealthDataRepositoryInit:
                 "dynamodb",
                 region_name="us-east-1",
                 endpoint_url="http://localhost:8000",
+                config=ANY,
             )
 
 
@@ -427,7 +437,7 @@ class TestGetUserHealthData:
     async def test_get_user_health_data_with_metric_filter(
         self, dynamodb_repository: DynamoDBHealthDataRepository, mock_table: MagicMock
     ) -> None:
-        """Test retrieval with metric type filtering."""
+        """Test metric type filtering is pushed into the query."""
         user_id = "user-123"
         mock_table.query.return_value = {
             "Items": [
@@ -436,11 +446,6 @@ class TestGetUserHealthData:
                     "sk": "HEALTH#2024-01-15T12:00:00",
                     "metrics": {"heart_rate": {"value": Decimal(72)}},
                 },
-                {
-                    "pk": f"USER#{user_id}",
-                    "sk": "HEALTH#2024-01-15T11:00:00",
-                    "metrics": {"steps": {"value": Decimal(5000)}},
-                },
             ]
         }
 
@@ -449,7 +454,9 @@ class TestGetUserHealthData:
             metric_type="heart_rate",
         )
 
-        # Should only return items with heart_rate metric
+        expression = mock_table.query.call_args[1]["FilterExpression"].get_expression()
+        assert expression["operator"] == "attribute_exists"
+        assert expression["values"][0].name == "metrics.heart_rate"
         assert len(result["data"]) == 1
         assert "heart_rate" in result["data"][0]["metrics"]
 
@@ -457,7 +464,7 @@ class TestGetUserHealthData:
     async def test_get_user_health_data_with_pagination(
         self, dynamodb_repository: DynamoDBHealthDataRepository, mock_table: MagicMock
     ) -> None:
-        """Test retrieval with pagination."""
+        """Test offset pagination skips items with a key-only query."""
         user_id = "user-123"
         items = [
             {
@@ -467,7 +474,10 @@ class TestGetUserHealthData:
             }
             for i in range(15)
         ]
-        mock_table.query.return_value = {"Items": items}
+        mock_table.query.side_effect = [
+            {"Items": items[:5], "LastEvaluatedKey": items[4]},
+            {"Items": items[5:10], "LastEvaluatedKey": items[9]},
+        ]
 
         result = await dynamodb_repository.get_user_health_data(
             user_id=user_id,
@@ -475,9 +485,51 @@ class TestGetUserHealthData:
             offset=5,
         )
 
-        assert len(result["data"]) == 5
+        skip_call, page_call = mock_table.query.call_args_list
+        assert skip_call[1]["ProjectionExpression"] == "pk, sk"
+        assert skip_call[1]["Limit"] == QUERY_PAGE_SIZE
+        assert page_call[1]["ExclusiveStartKey"] == items[4]
+        assert page_call[1]["Limit"] == QUERY_PAGE_SIZE
+        assert [item["sk"] for item in result["data"]] == [
+            item["sk"] for item in items[5:10]
+        ]
         assert result["pagination"]["offset"] == 5
         assert result["pagination"]["has_more"] is True
+        assert result["pagination"]["next_cursor"] is not None
+
+    @pytest.mark.asyncio
+    async def test_get_user_health_data_with_cursor(
+        self, dynamodb_repository: DynamoDBHealthDataRepository, mock_table: MagicMock
+    ) -> None:
+        """Test cursors resume the query from the encoded sort key."""
+        user_id = "user-123"
+        cursor = create_cursor(CursorInfo(sort_key="HEALTH#2024-01-15T10:00:00"))
+        mock_table.query.return_value = {"Items": []}
+
+        result = await dynamodb_repository.get_user_health_data(
+            user_id=user_id, limit=5, cursor=cursor
+        )
+
+        call_args = mock_table.query.call_args[1]
+        assert call_args["ExclusiveStartKey"] == {
+            "pk": f"USER#{user_id}",
+            "sk": "HEALTH#2024-01-15T10:00:00",
+        }
+        assert result["pagination"]["has_more"] is False
+        assert result["pagination"]["next_cursor"] is None
+
+    @pytest.mark.asyncio
+    async def test_get_user_health_data_rejects_foreign_cursor(
+        self, dynamodb_repository: DynamoDBHealthDataRepository, mock_table: MagicMock
+    ) -> None:
+        """Test cursors that do not point at health data are rejected."""
+        cursor = create_cursor(CursorInfo(sort_key="USER#someone-else"))
+
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            await dynamodb_repository.get_user_health_data(
+                user_id="user-123", cursor=cursor
+            )
+        mock_table.query.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_get_user_health_data_client_error(
@@ -0,0 +1,115 @@
+"""Tests for the columnar raw health data archive format."""
+
+from __future__ import annotations
+
+import gzip
+import io
+import json
+from typing import Any
+
+import pytest
+
+from clarity.storage.raw_data_archive import (
+    ARCHIVE_SUFFIX,
+    RawDataArchiveError,
+    encode_raw_data,
+    is_archive_key,
+    read_raw_data,
+)
+
+
+def _raw_document(count: int = 60) -> dict[str, Any]:
+    metrics: list[dict[str, Any]] = []
+    for index in range(count):
+        if index % 3 == 0:
+            metrics.append({
+                "metric_id": f"m-{index}",
+                "metric_type": "activity_level",
+                "created_at": f"2024-01-01T00:{index % 60:02d}:00+00:00",
+                "device_id": "watch",
+                "biometric_data": None,
+                "activity_data": {"steps": index * 10, "distance": None},
+                "sleep_data": None,
+                "mental_health_data": None,
+            })
+        else:
+            metrics.append({
+                "metric_id": f"m-{index}",
+                "metric_type": "heart_rate",
+                "created_at": f"2024-01-01T00:{index % 60:02d}:00+00:00",
+                "device_id": "unknown" if index % 5 == 0 else "watch",
+                # Nested data missing in some rows of the same metric type
+                "biometric_data": (
+                    None if index % 7 == 0 else {"heart_rate": 60.0 + index}
+                ),
+                "activity_data": None,
+                "sleep_data": None,
+                "mental_health_data": None,
+            })
+    return {
+        "user_id": "user-1",
+        "processing_id": "proc-1",
+        "upload_source": "apple_health",
+        "client_timestamp": "2024-01-01T00:00:00+00:00",
+        "server_timestamp": "2024-01-01T00:01:00+00:00",
+        "sync_token": None,
+        "metrics_count": count,
+        "data_schema_version": "1.0",
+        "metrics": metrics,
+    }
+
+
+class TestRawDataArchive:
+    """Round trips and compatibility of the archive format."""
+
+    @staticmethod
+    def test_round_trip_preserves_document() -> None:
+        document = _raw_document()
+
+        decoded = read_raw_data(io.BytesIO(encode_raw_data(document)))
+
+        assert decoded == document
+
+    @staticmethod
+    def test_round_trip_empty_upload() -> None:
+        document = _raw_document(count=0)
+
+        assert read_raw_data(io.BytesIO(encode_raw_data(document))) == document
+
+    @staticmethod
+    def test_archive_is_smaller_than_json() -> None:
+        document = _raw_document(count=600)
+
+        archive = encode_raw_data(document)
+
+        assert len(archive) < len(json.dumps(document, indent=2)) / 10
+
+    @staticmethod
+    def test_reads_legacy_json() -> None:
+        document = _raw_document(count=4)
+        payload = json.dumps(document, indent=2).encode()
+
+        assert read_raw_data(io.BytesIO(payload)) == document
+
+    @staticmethod
+    def test_rejects_unknown_version() -> None:
+        lines = json.dumps({
+            "archive_format": "clarity-columnar",
+            "archive_version": 99,
+        })
+        payload = gzip.compress(lines.encode() + b"\n")
+
+        with pytest.raises(RawDataArchiveError, match="version"):
+            read_raw_data(io.BytesIO(payload))
+
+    @staticmethod
+    def test_rejects_truncated_archive() -> None:
+        archive = encode_raw_data(_raw_document())
+
+        with pytest.raises(RawDataArchiveError):
+            read_raw_data(io.BytesIO(archive[: len(archive) // 2]))
+
+    @staticmethod
+    def test_is_archive_key() -> None:
+        assert is_archive_key(f"raw_data/2024/01/01/user-1/proc-1{ARCHIVE_SUFFIX}")
+        assert not is_archive_key("raw_data/2024/01/01/user-1/proc-1.json")